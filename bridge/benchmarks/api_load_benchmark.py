@@ -0,0 +1,171 @@
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from flask import Flask
+from symbolchain.CryptoTypes import Hash256
+from symbolchain.nem.Network import Address
+
+# BenchmarkUtils is shared with lightapi, so run with PYTHONPATH=.:../lightapi/python (as in scripts/ci/lint.sh)
+from benchmarks.BenchmarkUtils import add_result_arguments, report_results, summarize_rounds
+from bridge.api import add_wrap_routes
+from bridge.db.Databases import Databases
+from bridge.db.DatabasesPool import DatabasesPool
+from bridge.models.WrapRequest import WrapError, WrapRequest
+from tests.test.BridgeTestUtils import NEM_ADDRESSES, SYMBOL_ADDRESSES
+from tests.test.MockNetworkFacade import MockNemNetworkFacade, MockSymbolNetworkFacade
+
+ENDPOINTS = ('/wrap/requests', '/wrap/errors')
+
+
+# region seeding
+
+def _seed_databases(database_directory, request_count):
+	with Databases(database_directory, MockNemNetworkFacade(), MockSymbolNetworkFacade()) as databases:
+		databases.create_tables()
+
+		requests = []
+		errors = []
+		for index in range(request_count):
+			height = 1 + index // 4
+			transaction_hash = Hash256(index.to_bytes(32, 'big'))
+			address = Address(NEM_ADDRESSES[index % len(NEM_ADDRESSES)])
+			if index % 10:
+				requests.append(WrapRequest(height, transaction_hash, 0, address, 1000 + index, SYMBOL_ADDRESSES[index % len(SYMBOL_ADDRESSES)]))
+			else:
+				errors.append(WrapError(height, transaction_hash, 0, address, f'error {index}'))
+
+		max_height = 1 + request_count // 4
+		databases.wrap_request.add_batch(errors, requests, max_height)
+		databases.wrap_request.set_block_timestamps([(height, height * 15) for height in range(1, max_height + 1)])
+
+# endregion
+
+
+# region contexts
+
+class PerRequestDatabasesPool:
+	"""Stand-in pool that opens and closes read-only databases for every request."""
+
+	def __init__(self, database_directory):
+		"""Creates a stand-in pool."""
+
+		self.database_directory = database_directory
+
+	@contextmanager
+	def acquire(self):
+		"""Opens read-only databases."""
+
+		with Databases(self.database_directory, MockNemNetworkFacade(), MockSymbolNetworkFacade(), True) as databases:
+			yield databases
+
+	def close(self):
+		"""Does nothing."""
+
+
+class BenchmarkContext:
+	"""Stand-in for BridgeContext that is loaded upfront."""
+
+	def __init__(self, databases_pool):
+		"""Creates a context."""
+
+		self.native_facade = MockNemNetworkFacade()
+		self.wrapped_facade = MockSymbolNetworkFacade()
+		self.databases_pool = databases_pool
+
+	async def load(self):
+		"""Does nothing because context is loaded upfront."""
+
+
+def _create_app(databases_pool):
+	app = Flask(__name__)
+	add_wrap_routes(app, BenchmarkContext(databases_pool))
+	return app
+
+# endregion
+
+
+# region runner
+
+def _run_load(app, settings):
+	def issue_requests(thread_index):
+		client = app.test_client()
+		for request_index in range(thread_index, settings['requests'], settings['concurrency']):
+			endpoint = ENDPOINTS[request_index % len(ENDPOINTS)]
+			response = client.get(f'{endpoint}?offset={(request_index * 25) % settings["max_offset"]}&limit=25')
+			if 200 != response.status_code:
+				raise RuntimeError(f'{endpoint} failed with status {response.status_code}')
+
+	with ThreadPoolExecutor(max_workers=settings['concurrency']) as executor:
+		for future in [executor.submit(issue_requests, thread_index) for thread_index in range(settings['concurrency'])]:
+			future.result()
+
+
+def _run_benchmark(name, create_pool, settings):
+	databases_pool = create_pool()
+	try:
+		app = _create_app(databases_pool)
+		_run_load(app, {**settings, 'requests': settings['concurrency'] * 2})  # warm up
+
+		round_seconds = []
+		for _ in range(settings['rounds']):
+			start_time = time.perf_counter()
+			_run_load(app, settings)
+			round_seconds.append(time.perf_counter() - start_time)
+	finally:
+		databases_pool.close()
+
+	return summarize_rounds(name, 'requests', settings['requests'], round_seconds)
+
+
+def main():
+	parser = argparse.ArgumentParser(description='measures request listing throughput of the bridge API with per request and pooled databases')
+	parser.add_argument('--seed-requests', help='number of wrap requests and errors in the database', type=int, default=20000)
+	parser.add_argument('--requests', help='number of API requests per round', type=int, default=2000)
+	parser.add_argument('--concurrency', help='number of concurrent clients', type=int, default=8)
+	parser.add_argument('--pool-size', help='maximum number of pooled databases', type=int, default=8)
+	parser.add_argument('--mmap-size', help='memory map size of pooled connections (in bytes)', type=int, default=256 * 1024 * 1024)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=3)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	settings = {
+		'requests': args.requests,
+		'concurrency': args.concurrency,
+		'rounds': args.rounds,
+		'max_offset': max(25, args.seed_requests // 2)
+	}
+
+	benchmark_results = []
+	with tempfile.TemporaryDirectory() as temp_directory:
+		_seed_databases(temp_directory, args.seed_requests)
+
+		benchmarks = {
+			'api_request_listing_per_request_databases': lambda: PerRequestDatabasesPool(temp_directory),
+			'api_request_listing_pooled_databases': lambda: DatabasesPool(
+				temp_directory,
+				MockNemNetworkFacade(),
+				MockSymbolNetworkFacade(),
+				args.pool_size,
+				args.mmap_size)
+		}
+		for (name, create_pool) in benchmarks.items():
+			if args.filter in name:
+				benchmark_results.append(_run_benchmark(name, create_pool, settings))
+
+	report_results(args, {
+		'seed_requests': args.seed_requests,
+		'requests': args.requests,
+		'concurrency': args.concurrency,
+		'pool_size': args.pool_size,
+		'mmap_size': args.mmap_size,
+		'rounds': args.rounds
+	}, benchmark_results)
+
+# endregion
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,166 @@
+import argparse
+import asyncio
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+
+from symbolchain.CryptoTypes import Hash256
+
+# BenchmarkUtils is shared with lightapi, so run with PYTHONPATH=.:../lightapi/python (as in scripts/ci/lint.sh)
+from benchmarks.BenchmarkUtils import add_result_arguments, report_results, summarize_rounds
+from bridge.db.BalanceChangeDatabase import BalanceChangeDatabase
+from bridge.NetworkUtils import BalanceChange
+from bridge.WindowedHeightScheduler import WindowedHeightScheduler
+
+BRIDGE_ADDRESS = 'TDSSDPIPAJHVRZTQUARR6OQU6O7SUWAOAODXGRA'
+OTHER_ADDRESS = 'TBPXHAX3IB3TBQ3WZLSH5ITAYQUZU6N5ZF3XBQQ'
+START_HEIGHT = 1
+
+
+# region balance changes
+
+def _make_balance_changes(height, balance_change_count, matching_count):
+	return [
+		BalanceChange(
+			BRIDGE_ADDRESS if index < matching_count else OTHER_ADDRESS,
+			'nem:xem',
+			height * 1000 + index,
+			Hash256(((height << 16) + index).to_bytes(32, 'big')))
+		for index in range(balance_change_count)
+	]
+
+
+class BlockSource:
+	"""Stand-in for a rosetta node that returns precomputed balance changes after an artificial latency."""
+
+	def __init__(self, height_count, balance_change_count, matching_count, latency_seconds):
+		"""Creates a source of height_count blocks."""
+
+		self.height_to_balance_changes = {
+			height: _make_balance_changes(height, balance_change_count, matching_count)
+			for height in range(START_HEIGHT, START_HEIGHT + height_count)
+		}
+		self.latency_seconds = latency_seconds
+
+	async def balance_changes(self, height):
+		"""Gets the balance changes in a block."""
+
+		await asyncio.sleep(self.latency_seconds)
+		return self.height_to_balance_changes[height]
+
+# endregion
+
+
+# region benchmarks
+
+def _open_database(database_filepath):
+	connection = sqlite3.connect(database_filepath)
+	database = BalanceChangeDatabase(connection)
+	database.create_tables()
+	return database
+
+
+async def _ingest(context, add_transfers, checkpoint):
+	source = context['source']
+	scheduler = WindowedHeightScheduler(START_HEIGHT, context['end_height'], context['window_size'], context['checkpoint_interval'])
+	counts = []
+
+	async def process_height(height):
+		counts.append(add_transfers(height, await source.balance_changes(height)))
+
+	await scheduler.run(process_height, checkpoint)
+	return sum(counts)
+
+
+async def _benchmark_per_call_commit(context, database_filepath):
+	database = _open_database(database_filepath)
+	with closing(database.connection):
+		count = await _ingest(
+			context,
+			lambda height, balance_changes: database.add_transfers_filtered_by_address(height, balance_changes, BRIDGE_ADDRESS),
+			database.set_max_processed_height)
+		database.set_max_processed_height(context['end_height'] - 1)
+		return count
+
+
+async def _benchmark_batched(context, database_filepath):
+	database = _open_database(database_filepath)
+	with closing(database.connection):
+		async with database.create_batch_writer(BRIDGE_ADDRESS, context['batch_size'], context['flush_interval_seconds']) as batch_writer:
+			count = await _ingest(context, batch_writer.add_transfers_filtered_by_address, batch_writer.flush)
+			batch_writer.flush(context['end_height'] - 1)
+			return count
+
+
+BENCHMARKS = {
+	'balance_change_ingest_per_call_commit': _benchmark_per_call_commit,
+	'balance_change_ingest_batched': _benchmark_batched
+}
+
+# endregion
+
+
+# region runner
+
+async def _run_benchmark(name, context, round_count):
+	round_seconds = []
+	row_count = 0
+	with tempfile.TemporaryDirectory() as temp_directory:
+		for round_index in range(round_count + 1):
+			database_filepath = Path(temp_directory) / f'{name}_{round_index}.db'
+
+			start_time = time.perf_counter()
+			row_count = await BENCHMARKS[name](context, database_filepath)
+			if round_index:  # first round is a warm up
+				round_seconds.append(time.perf_counter() - start_time)
+
+	return summarize_rounds(name, 'rows', row_count, round_seconds)
+
+
+async def main():
+	parser = argparse.ArgumentParser(description='measures balance change ingest throughput of per call commits and batched writes')
+	parser.add_argument('--heights', help='number of blocks to ingest', type=int, default=2000)
+	parser.add_argument('--balance-changes', help='number of balance changes per block', type=int, default=20)
+	parser.add_argument('--matching', help='number of balance changes per block involving the bridge address', type=int, default=5)
+	parser.add_argument('--latency', help='artificial latency of each block download (in milliseconds)', type=float, default=0)
+	parser.add_argument('--window', help='number of blocks downloaded concurrently', type=int, default=20)
+	parser.add_argument('--checkpoint-interval', help='number of blocks between checkpoints', type=int, default=1000)
+	parser.add_argument('--batch-size', help='number of rows per batched write', type=int, default=1000)
+	parser.add_argument('--flush-interval', help='maximum time rows are buffered (in milliseconds)', type=float, default=1000)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=3)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	context = {
+		'source': BlockSource(args.heights, args.balance_changes, args.matching, args.latency / 1000),
+		'end_height': START_HEIGHT + args.heights,
+		'window_size': args.window,
+		'checkpoint_interval': args.checkpoint_interval,
+		'batch_size': args.batch_size,
+		'flush_interval_seconds': args.flush_interval / 1000
+	}
+
+	benchmark_results = []
+	for name in BENCHMARKS:
+		if args.filter in name:
+			benchmark_results.append(await _run_benchmark(name, context, args.rounds))
+
+	report_results(args, {
+		'heights': args.heights,
+		'balance_changes': args.balance_changes,
+		'matching': args.matching,
+		'latency_milliseconds': args.latency,
+		'window': args.window,
+		'checkpoint_interval': args.checkpoint_interval,
+		'batch_size': args.batch_size,
+		'flush_interval_milliseconds': args.flush_interval,
+		'rounds': args.rounds
+	}, benchmark_results)
+
+# endregion
+
+
+if '__main__' == __name__:
+	asyncio.run(main())
@@ -0,0 +1,187 @@
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+
+from symbolchain.CryptoTypes import Hash256
+
+# BenchmarkUtils is shared with lightapi, so run with PYTHONPATH=.:../lightapi/python (as in scripts/ci/lint.sh)
+from benchmarks.BenchmarkUtils import add_result_arguments, report_results, summarize_rounds
+from bridge.db.WrapRequestDatabase import RequestCursor, WrapRequestDatabase
+from tests.test.BridgeTestUtils import SYMBOL_ADDRESSES
+from tests.test.MockNetworkFacade import MockNemNetworkFacade, MockSymbolNetworkFacade
+
+PAGE_SIZE = 25
+
+# find_requests query before keyset pagination and per filter branches
+LEGACY_FIND_REQUESTS_QUERY = '''
+	SELECT
+		wrap_request.request_transaction_height,
+		wrap_request.request_transaction_hash,
+		wrap_request.request_transaction_subindex,
+		wrap_request.address,
+		wrap_request.amount,
+		wrap_request.destination_address,
+		wrap_request.payout_status,
+		wrap_request.payout_transaction_hash,
+		wrap_request.payout_sent_timestamp,
+		block_metadata.timestamp,
+		payout_transaction.height,
+		payout_transaction.net_amount,
+		payout_transaction.total_fee,
+		payout_transaction.conversion_rate,
+		payout_block_metadata.timestamp,
+		wrap_error.message
+	FROM wrap_request
+	LEFT JOIN block_metadata ON wrap_request.request_transaction_height = block_metadata.height
+	LEFT JOIN payout_transaction ON wrap_request.payout_transaction_hash = payout_transaction.transaction_hash
+	LEFT JOIN payout_block_metadata ON payout_transaction.height = payout_block_metadata.height
+	LEFT JOIN wrap_error ON wrap_request.request_transaction_hash = wrap_error.request_transaction_hash
+		AND wrap_request.request_transaction_subindex = wrap_error.request_transaction_subindex
+	WHERE (?1 IS NULL OR wrap_request.address = ?1 OR wrap_request.destination_address = ?1)
+		AND (?2 IS NULL OR wrap_request.request_transaction_hash = ?2 OR wrap_request.payout_transaction_hash = ?2)
+		AND (?3 IS NULL OR wrap_request.payout_status = ?3)
+	ORDER BY wrap_request.request_transaction_height ASC
+	LIMIT ? OFFSET ?
+'''
+
+
+# region synthetic table
+
+def _make_address(address_index):
+	return bytes([0x98]) + address_index.to_bytes(24, 'big')
+
+
+def _make_key(row_index):
+	# rows are inserted in request key order, so the position of a row in the table is its index
+	return RequestCursor(1 + row_index // 4, Hash256(row_index.to_bytes(Hash256.SIZE, 'big')), 0)
+
+
+def _make_row(row_index, address_count):
+	key = _make_key(row_index)
+	payout_status = row_index % 4
+	payout_transaction_hash = ((1 << 128) + row_index).to_bytes(Hash256.SIZE, 'big') if payout_status in (1, 2) else None
+	return (
+		key.height,
+		key.transaction_hash.bytes,
+		key.subindex,
+		_make_address(row_index % address_count),
+		1000 + row_index,
+		SYMBOL_ADDRESSES[row_index % len(SYMBOL_ADDRESSES)],
+		payout_status,
+		payout_transaction_hash,
+		None,
+		0)
+
+
+def _seed_database(database_filepath, row_count, address_count):
+	with closing(sqlite3.connect(database_filepath)) as connection:
+		WrapRequestDatabase(connection, MockNemNetworkFacade(), MockSymbolNetworkFacade()).create_tables()
+
+		batch_size = 100000
+		for start_index in range(0, row_count, batch_size):
+			rows = (_make_row(row_index, address_count) for row_index in range(start_index, min(row_count, start_index + batch_size)))
+			connection.executemany('INSERT INTO wrap_request VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+			connection.commit()
+
+		max_height = _make_key(row_count - 1).height
+		connection.executemany('INSERT INTO block_metadata VALUES (?, ?)', ((height, height * 15) for height in range(1, max_height + 1)))
+		connection.commit()
+
+# endregion
+
+
+# region benchmarks
+
+def _find_legacy_offset(database, page, address):
+	cursor = database.connection.cursor()
+	cursor.execute(LEGACY_FIND_REQUESTS_QUERY, (address, None, None, PAGE_SIZE, page['offset']))
+	return len(cursor.fetchall())
+
+
+def _find_offset(database, page, address):
+	return len(list(database.find_requests(address, None, page['offset'], PAGE_SIZE)))
+
+
+def _find_cursor(database, page, address):
+	return len(list(database.find_requests(address, None, 0, PAGE_SIZE, True, None, page['page_cursor'])))
+
+
+BENCHMARKS = {
+	'find_requests_legacy_offset': (_find_legacy_offset, False),
+	'find_requests_offset': (_find_offset, False),
+	'find_requests_cursor': (_find_cursor, False),
+	'find_requests_by_address_legacy_offset': (_find_legacy_offset, True),
+	'find_requests_by_address_offset': (_find_offset, True),
+	'find_requests_by_address_cursor': (_find_cursor, True)
+}
+
+
+def _make_pages(settings, is_address_filter):
+	# pages start at random positions, so deep pages are as likely as shallow ones
+	page_rng = random.Random(settings['seed'])
+	row_count = settings['rows'] // settings['addresses'] if is_address_filter else settings['rows']
+	pages = []
+	for _ in range(settings['queries']):
+		offset = page_rng.randrange(1, row_count - PAGE_SIZE)
+		previous_row_index = (offset - 1) * settings['addresses'] if is_address_filter else offset - 1
+		pages.append({'offset': offset, 'page_cursor': _make_key(previous_row_index)})
+
+	return pages
+
+# endregion
+
+
+# region runner
+
+def _run_benchmark(name, database_filepath, settings):
+	(find, is_address_filter) = BENCHMARKS[name]
+	address = _make_address(0) if is_address_filter else None
+	pages = _make_pages(settings, is_address_filter)
+
+	round_seconds = []
+	with closing(sqlite3.connect(database_filepath)) as connection:
+		database = WrapRequestDatabase(connection, MockNemNetworkFacade(), MockSymbolNetworkFacade())
+		for round_index in range(settings['rounds'] + 1):
+			start_time = time.perf_counter()
+			for page in pages:
+				if PAGE_SIZE != find(database, page, address):
+					raise RuntimeError(f'{name} returned an incomplete page at offset {page["offset"]}')
+
+			if round_index:  # first round is a warm up
+				round_seconds.append(time.perf_counter() - start_time)
+
+	return summarize_rounds(name, 'queries', settings['queries'], round_seconds)
+
+
+def main():
+	parser = argparse.ArgumentParser(description='measures wrap request paging throughput of legacy offset, offset and cursor queries')
+	parser.add_argument('--rows', help='number of wrap requests in the synthetic table', type=int, default=1000000)
+	parser.add_argument('--addresses', help='number of distinct sender addresses', type=int, default=100)
+	parser.add_argument('--queries', help='number of page queries per round', type=int, default=50)
+	parser.add_argument('--seed', help='seed of random page positions', type=int, default=1)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=3)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	settings = {'rows': args.rows, 'addresses': args.addresses, 'queries': args.queries, 'seed': args.seed, 'rounds': args.rounds}
+
+	benchmark_results = []
+	with tempfile.TemporaryDirectory() as temp_directory:
+		database_filepath = Path(temp_directory) / 'wrap_request.db'
+		_seed_database(database_filepath, args.rows, args.addresses)
+
+		for name in BENCHMARKS:
+			if args.filter in name:
+				benchmark_results.append(_run_benchmark(name, database_filepath, settings))
+
+	report_results(args, settings, benchmark_results)
+
+# endregion
+
+
+if '__main__' == __name__:
+	main()
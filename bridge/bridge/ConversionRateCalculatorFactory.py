@@ -52,6 +52,9 @@ class ConversionRateCalculatorFactory:
 		# only the lookups for the network corresponding to `height` should be adjusted
 		self._native_adjustment = 0 if self._is_unwrap_mode else -1
 
+		# payouts are processed in height order, so calculators at a native height are not affected by payouts sent while they are reused
+		self._native_height_to_calculator = {}
+
 	def _lookup_native_balance(self, native_height):
 		return self._databases.balance_change.balance_at(native_height + self._native_adjustment, self._mosaic_id)
 
@@ -60,21 +63,17 @@ class ConversionRateCalculatorFactory:
 		return self._databases.wrap_request.cumulative_gross_amount_at(adjusted_timestamp)
 
 	def _lookup_unwrapped_balance(self, native_height, timestamp):
-		transaction_hashes = list(self._databases.unwrap_request.payout_transaction_hashes_at(timestamp))
-		filtered_transaction_hashes = list(self._databases.balance_change.filter_transactions_if_present(
-			native_height + self._native_adjustment,
-			self._mosaic_id,
-			transaction_hashes))
-		amount = self._databases.unwrap_request.sum_payout_transaction_amounts(filtered_transaction_hashes)
-		return amount
-
-	def _try_create_calculator(self, height):
-		native_height = height
-		if self._is_unwrap_mode:
-			# height is from wrapped blockchain: (1) get wrapped block timestamp, (2) find last native block prior to timestamp
-			timestamp = self._databases.unwrap_request.lookup_block_timestamp(height)
-			native_height = self._databases.wrap_request.lookup_block_height(timestamp)
+		return self._databases.unwrapped_balance_at(native_height + self._native_adjustment, self._mosaic_id, timestamp)
+
+	def _lookup_native_height(self, height):
+		if not self._is_unwrap_mode:
+			return height
 
+		# height is from wrapped blockchain: (1) get wrapped block timestamp, (2) find last native block prior to timestamp
+		timestamp = self._databases.unwrap_request.lookup_block_timestamp(height)
+		return self._databases.wrap_request.lookup_block_height(timestamp)
+
+	def _try_create_calculator_at_native_height(self, native_height):
 		# use the timestamp of the native block in calculations
 		timestamp = self._databases.wrap_request.lookup_block_timestamp(native_height)
 		if not timestamp:
@@ -95,12 +94,22 @@ class ConversionRateCalculatorFactory:
 		return ConversionRateCalculator(native_balance, wrapped_balance, unwrapped_balance)
 
 	def try_create_calculator(self, height):
-		"""Tries to create a conversion rate calculator at a specified height."""
+		"""
+		Tries to create a conversion rate calculator at a specified height.
+		Calculators are reused for all heights corresponding to the same native height.
+		"""
+
+		native_height = self._lookup_native_height(height)
+		calculator = self._native_height_to_calculator.get(native_height, None)
+		if calculator:
+			return calculator
 
-		calculator = self._try_create_calculator(height)
+		calculator = self._try_create_calculator_at_native_height(native_height)
 		if not calculator:
 			return None
 
+		self._native_height_to_calculator[native_height] = calculator
+
 		logger = logging.getLogger(__name__)
 		logger.debug(''.join([
 			f'height {height}:',
@@ -111,22 +120,39 @@ class ConversionRateCalculatorFactory:
 
 		return calculator
 
-	def create_best_calculator(self):
-		"""Creates a conversion rate calculator based on latest information."""
+	def _find_best_height(self):
+		# all sync conditions only depend on (native) block heights and timestamps, which both increase along each blockchain,
+		# so the last height at which all databases are synced can be looked up directly instead of probing heights one at a time
+		native_height_bound = self._databases.balance_change.max_processed_height()
+		timestamp_bound = min(
+			self._databases.wrap_request.max_processed_timestamp(),
+			self._databases.unwrap_request.max_processed_timestamp())
 
-		if self._is_unwrap_mode:
-			max_processed_height = self._databases.unwrap_request.max_processed_height()
-		else:
+		if not self._is_unwrap_mode:
 			max_processed_height = self._databases.wrap_request.max_processed_height()
+			return self._databases.wrap_request.lookup_last_block_height(min(max_processed_height, native_height_bound), timestamp_bound)
+
+		# a wrapped block is synced when its native height (the last native block at or before its timestamp) is synced,
+		# which is the case when its timestamp is before the first native block that is not synced
+		native_height = self._databases.wrap_request.lookup_last_block_height(native_height_bound, timestamp_bound)
+		unsynced_native_timestamp = self._databases.wrap_request.lookup_block_timestamp_after(native_height)
 
-		while max_processed_height:
-			calculator = self._try_create_calculator(max_processed_height)
-			if calculator:
-				calculator.height = max_processed_height  # pylint: disable=attribute-defined-outside-init
-				return calculator
+		max_processed_height = self._databases.unwrap_request.max_processed_height()
+		if unsynced_native_timestamp is None:
+			return self._databases.unwrap_request.lookup_last_block_height(
+				max_processed_height,
+				self._databases.unwrap_request.max_processed_timestamp())
 
-			max_processed_height -= 1
+		return self._databases.unwrap_request.lookup_last_block_height(max_processed_height, unsynced_native_timestamp, False)
+
+	def create_best_calculator(self):
+		"""Creates a conversion rate calculator based on latest information."""
+
+		height = self._find_best_height()
+		calculator = self._try_create_calculator_at_native_height(self._lookup_native_height(height)) if height else None
+		if not calculator:
+			calculator = ConversionRateCalculator(0, 0, 0)
+			height = 0
 
-		calculator = ConversionRateCalculator(0, 0, 0)
-		calculator.height = 0  # pylint: disable=attribute-defined-outside-init
+		calculator.height = height  # pylint: disable=attribute-defined-outside-init
 		return calculator
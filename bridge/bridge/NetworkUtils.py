@@ -1,8 +1,10 @@
 import inspect
+import logging
 from collections import namedtuple
 from decimal import ROUND_UP, Decimal
 
 from symbolchain.CryptoTypes import Hash256, PrivateKey
+from symbollightapi.connector.NodeSelector import NodeSelector
 from symbollightapi.model.Constants import TimeoutSettings, TransactionStatus
 from symbollightapi.model.Exceptions import HttpException, InsufficientBalanceException, NodeException, NodeTransientException
 
@@ -52,6 +54,7 @@ class TransactionSender:
 		self.unconfirmed_wait_time_seconds = network_facade.config.extensions.get('unconfirmed_wait_time_seconds', 60)
 		self.sender_key_pair = None
 		self.timestamp = None
+		self.transaction_listener = None
 
 	async def init(self, vault_connector=None):
 		"""Initializes the sender."""
@@ -69,6 +72,29 @@ class TransactionSender:
 		connector = self.network_facade.create_connector()
 		self.timestamp = await connector.network_time()
 
+		create_transaction_listener = getattr(self.network_facade, 'create_transaction_listener', None)
+		if create_transaction_listener:
+			self.transaction_listener = create_transaction_listener(self.sender_key_pair.public_key)
+
+		if self.transaction_listener:
+			try:
+				await self.transaction_listener.open()
+			except NodeException as ex:
+				# listener falls back to polling when not connected
+				logging.getLogger(__name__).warning('unable to open transaction listener, polling instead: %s', ex)
+
+	async def close(self):
+		"""Closes the sender."""
+
+		if self.transaction_listener:
+			await self.transaction_listener.close()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.close()
+
 	async def try_send_transfer(self, destination_address, fee_multiplier, amount, messsage=None):
 		"""Sends a transfer to the network."""
 
@@ -104,7 +130,9 @@ class TransactionSender:
 		transaction_hash = facade.hash_transaction(transaction)
 		await connector.announce_transaction(transaction)
 
-		is_unconfirmed = await connector.try_wait_for_announced_transaction(
+		# listener is notified when transaction is added to the unconfirmed pool, so polling is mostly avoided
+		waiter = self.transaction_listener or connector
+		is_unconfirmed = await waiter.try_wait_for_announced_transaction(
 			transaction_hash,
 			TransactionStatus.UNCONFIRMED,
 			TimeoutSettings(self.unconfirmed_wait_time_seconds, 1))
@@ -129,7 +157,7 @@ async def download_rosetta_block_balance_changes(connector, blockchain, network,
 	response_json = await connector.post('block', {
 		'network_identifier': {'blockchain': blockchain, 'network': network},
 		'block_identifier': {'index': str(height)}
-	})
+	}, is_idempotent=True)
 
 	balance_changes = []
 	for transaction_json in response_json['block']['transactions']:
@@ -165,3 +193,21 @@ def is_transient_error(error):
 	return False
 
 # endregion
+
+
+# region create_node_selector
+
+def create_node_selector(config):
+	"""
+	Creates a node selector across the configured endpoint and any (comma separated) additional endpoints.
+	Returns None when no additional endpoints are configured.
+	"""
+
+	additional_endpoints = [endpoint.strip() for endpoint in config.extensions.get('additional_endpoints', '').split(',')]
+	additional_endpoints = [endpoint for endpoint in additional_endpoints if endpoint]
+	if not additional_endpoints:
+		return None
+
+	return NodeSelector([config.endpoint, *additional_endpoints])
+
+# endregion
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import time
+from collections import namedtuple
+
+DEFAULT_WINDOW_SIZE = 100
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+SchedulerProgress = namedtuple('SchedulerProgress', [
+	'completed_height', 'completed_count', 'total_count', 'blocks_per_second', 'eta_seconds'
+])
+
+
+class WindowedHeightScheduler:
+	"""
+	Processes a range of heights with a bounded number of heights in flight.
+
+	Heights are only scheduled within window_size of the first incomplete height, so memory is bounded by the window regardless of the
+	size of the range. The completed prefix of the range is checkpointed every checkpoint_interval heights.
+	"""
+
+	def __init__(self, start_height, end_height, window_size=DEFAULT_WINDOW_SIZE, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+		"""Creates a scheduler for heights in [start_height, end_height)."""
+
+		if window_size < 1:
+			raise ValueError('window_size must be positive')
+
+		self.start_height = start_height
+		self.end_height = end_height
+		self.window_size = window_size
+		self.checkpoint_interval = checkpoint_interval
+
+		self.completed_height = start_height - 1
+		self._start_time = None
+
+		self._logger = logging.getLogger(__name__)
+
+	def progress(self):
+		"""Gets the progress of the contiguous completed prefix, including throughput (blocks/s) and estimated remaining seconds."""
+
+		total_count = max(0, self.end_height - self.start_height)
+		completed_count = self.completed_height - self.start_height + 1
+
+		elapsed_seconds = time.monotonic() - self._start_time if self._start_time is not None else 0
+		blocks_per_second = completed_count / elapsed_seconds if elapsed_seconds > 0 else 0
+		eta_seconds = (total_count - completed_count) / blocks_per_second if blocks_per_second else None
+		return SchedulerProgress(self.completed_height, completed_count, total_count, blocks_per_second, eta_seconds)
+
+	def _log_progress(self):
+		progress = self.progress()
+		self._logger.info(
+			'processed through height %s (%s/%s blocks) at %.1f blocks/s, ETA %s',
+			progress.completed_height,
+			progress.completed_count,
+			progress.total_count,
+			progress.blocks_per_second,
+			'unknown' if progress.eta_seconds is None else f'{progress.eta_seconds:.0f}s')
+
+	async def run(self, process_height, checkpoint):
+		"""
+		Processes all heights in the range by awaiting process_height(height) for each one.
+		checkpoint(height) is called every checkpoint_interval heights with the last height of the contiguous completed prefix.
+		If any height fails, all heights in flight are cancelled and the error is raised without checkpointing past the failure.
+		"""
+
+		self._start_time = time.monotonic()
+
+		completed_heights = set()
+		task_to_height = {}
+		next_height = self.start_height
+		last_checkpoint_height = self.completed_height
+
+		try:
+			while self.completed_height < self.end_height - 1:
+				while next_height < self.end_height and next_height <= self.completed_height + self.window_size:
+					task_to_height[asyncio.create_task(process_height(next_height))] = next_height
+					next_height += 1
+
+				(done_tasks, _) = await asyncio.wait(task_to_height.keys(), return_when=asyncio.FIRST_COMPLETED)
+				for task in done_tasks:
+					height = task_to_height.pop(task)
+					task.result()
+					completed_heights.add(height)
+
+				while self.completed_height + 1 in completed_heights:
+					self.completed_height += 1
+					completed_heights.remove(self.completed_height)
+
+				if self.completed_height - last_checkpoint_height >= self.checkpoint_interval:
+					checkpoint(self.completed_height)
+					last_checkpoint_height = self.completed_height
+					self._log_progress()
+		finally:
+			for task in task_to_height:
+				task.cancel()
+
+			if task_to_height:
+				await asyncio.gather(*task_to_height.keys(), return_exceptions=True)
+
+		self._log_progress()
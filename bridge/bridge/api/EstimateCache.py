@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import namedtuple
+
+DEFAULT_MAX_AGE_SECONDS = 60
+DEFAULT_FEE_TTL_SECONDS = 15
+DEFAULT_MAX_FEE_ENTRY_COUNT = 1000
+
+EstimateCacheEntry = namedtuple('EstimateCacheEntry', ['key', 'creation_time', 'value'])
+
+
+class EstimateCache:
+	"""
+	Cache of the expensive parts of transfer estimates.
+
+	Values derived from the databases (conversion rate calculators and daily transfer amounts) are keyed by the max processed heights
+	of all databases, the payout states of the request databases and the fee multiplier, so they are only recalculated when one of those
+	changes or they reach max_age_seconds.
+	Fee estimates are keyed by all transfer properties and reused for fee_ttl_seconds.
+	"""
+
+	def __init__(
+		self,
+		max_age_seconds=DEFAULT_MAX_AGE_SECONDS,
+		fee_ttl_seconds=DEFAULT_FEE_TTL_SECONDS,
+		max_fee_entry_count=DEFAULT_MAX_FEE_ENTRY_COUNT,
+		time_provider=time.monotonic
+	):
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+		"""Creates an estimate cache."""
+
+		self.max_age_seconds = max_age_seconds
+		self.fee_ttl_seconds = fee_ttl_seconds
+		self.max_fee_entry_count = max_fee_entry_count
+		self._time_provider = time_provider
+
+		self._lock = threading.Lock()
+		self._mode_to_entry = {}
+		self._fee_key_to_entry = {}
+
+	@staticmethod
+	def _make_key(databases, fee_multiplier):
+		return (
+			databases.balance_change.max_processed_height(),
+			databases.wrap_request.max_processed_height(),
+			databases.unwrap_request.max_processed_height(),
+			databases.wrap_request.payout_state_id(),
+			databases.unwrap_request.payout_state_id(),
+			fee_multiplier)
+
+	@staticmethod
+	def _is_fresh(entry, max_age_seconds, now):
+		return entry is not None and now - entry.creation_time < max_age_seconds
+
+	def get_or_create(self, is_unwrap_mode, databases, fee_multiplier, create):
+		"""
+		Gets the cached value for a mode, calling create() to recalculate it when the max processed height of any database, the
+		payout state of any request database or the fee multiplier changed since it was created.
+		"""
+
+		key = self._make_key(databases, fee_multiplier)
+		now = self._time_provider()
+		with self._lock:
+			entry = self._mode_to_entry.get(is_unwrap_mode, None)
+			if self._is_fresh(entry, self.max_age_seconds, now) and key == entry.key:
+				return entry.value
+
+		value = create()
+		with self._lock:
+			self._mode_to_entry[is_unwrap_mode] = EstimateCacheEntry(key, now, value)
+
+		return value
+
+	async def get_or_estimate_fee(self, fee_key, estimate):
+		"""Gets the cached fee estimate for a transfer, awaiting estimate() when it is missing or expired."""
+
+		now = self._time_provider()
+		with self._lock:
+			entry = self._fee_key_to_entry.get(fee_key, None)
+			if self._is_fresh(entry, self.fee_ttl_seconds, now):
+				return entry.value
+
+		value = await estimate()
+		with self._lock:
+			# reinsert the entry so that entries are ordered by creation time and the oldest ones are evicted first
+			self._fee_key_to_entry.pop(fee_key, None)
+			self._fee_key_to_entry[fee_key] = EstimateCacheEntry(fee_key, now, value)
+			while len(self._fee_key_to_entry) > self.max_fee_entry_count:
+				del self._fee_key_to_entry[next(iter(self._fee_key_to_entry))]
+
+		return value
@@ -9,18 +9,26 @@ from symbolchain.CryptoTypes import Hash256
 from symbollightapi.model.Exceptions import NodeException
 
 from ..ConversionRateCalculatorFactory import ConversionRateCalculatorFactory
-from ..db.Databases import Databases
+from ..db.DatabasesPool import DEFAULT_MAX_SIZE, DEFAULT_MMAP_SIZE, DatabasesPool
+from ..db.WrapRequestDatabase import RequestCursor
 from ..models.BridgeConfiguration import parse_bridge_configuration
 from ..models.Constants import ExecutionContext
 from ..NetworkFacadeLoader import load_network_facade
 from ..NetworkUtils import BalanceTransfer, estimate_balance_transfer_fees
 from ..price_oracle.PriceOracleLoader import load_price_oracle
 from ..price_oracle.PriceOracleThrottle import make_throttled_conversion_rate_lookup
-from ..WorkflowUtils import create_conversion_rate_calculator_factory, is_daily_limit_exceeded, is_native_to_native_conversion
+from ..WorkflowUtils import (
+	create_conversion_rate_calculator_factory,
+	is_daily_limit_exceeded,
+	is_native_to_native_conversion,
+	lookup_daily_transfer_amount
+)
+from .EstimateCache import DEFAULT_FEE_TTL_SECONDS, DEFAULT_MAX_AGE_SECONDS, EstimateCache
 from .Validators import is_valid_address_string, is_valid_decimal_string, is_valid_hash_string
 
-FilterOptions = namedtuple('FilterOptions', ['address', 'transaction_hash', 'offset', 'limit', 'sort', 'payout_status'])
+FilterOptions = namedtuple('FilterOptions', ['address', 'transaction_hash', 'offset', 'limit', 'sort', 'payout_status', 'page_cursor'])
 EstimateOptions = namedtuple('EstimateOptions', ['recipient_address', 'amount'])
+EstimateInputs = namedtuple('EstimateInputs', ['calculator', 'daily_transfer_amount'])
 
 # region handler implementations
 
@@ -36,12 +44,30 @@ def _network_config_to_dict(config):
 	}
 
 
+def _parse_page_cursor(page_cursor):
+	# cursor is composed of the request key of the last returned item: '<height>:<transaction hash>:<subindex>'
+	parts = page_cursor.split(':')
+	if 3 != len(parts) or not all(parts):
+		return None
+
+	(height, transaction_hash, subindex) = parts
+	unsigned_subindex = subindex[1:] if subindex.startswith('-') else subindex  # subindex is -1 for top level transactions
+	if not unsigned_subindex or not is_valid_decimal_string(unsigned_subindex):
+		return None
+
+	if not is_valid_decimal_string(height) or not is_valid_hash_string(transaction_hash):
+		return None
+
+	return RequestCursor(int(height), Hash256(transaction_hash), int(subindex))
+
+
 def _parse_filter_parameters(context, address, transaction_hash, is_unwrap_mode):
 	# pylint: disable=too-many-return-statements, too-many-branches
 	offset = request.args.get('offset', '0')
 	limit = request.args.get('limit', '25')
 	sort = request.args.get('sort', '1')
 	payout_status = request.args.get('payout_status', None)
+	page_cursor = request.args.get('cursor', None)
 
 	if address:
 		if is_valid_address_string(context.native_facade, address):
@@ -84,7 +110,12 @@ def _parse_filter_parameters(context, address, transaction_hash, is_unwrap_mode)
 
 		payout_status = int(payout_status)
 
-	return (FilterOptions(address, transaction_hash, offset, limit, sort, payout_status), None)
+	if page_cursor:
+		page_cursor = _parse_page_cursor(page_cursor)
+		if not page_cursor:
+			return (None, 'cursor')
+
+	return (FilterOptions(address, transaction_hash, offset, limit, sort, payout_status, page_cursor), None)
 
 
 def _make_bad_request_response(parse_failure_identifier):
@@ -97,7 +128,7 @@ def _handle_wrap_requests(context, address, transaction_hash, database_name):
 	if parse_failure_identifier:
 		return _make_bad_request_response(parse_failure_identifier)
 
-	with Databases(*context.database_params) as databases:
+	with context.databases_pool.acquire() as databases:
 		views = getattr(databases, database_name).find_requests(*filter_options)
 		return jsonify([
 			{
@@ -132,8 +163,10 @@ def _handle_wrap_errors(context, address, transaction_hash, database_name):
 	if parse_failure_identifier:
 		return _make_bad_request_response(parse_failure_identifier)
 
-	with Databases(*context.database_params) as databases:
-		views = getattr(databases, database_name).find_errors(*([*filter_options][:-1]))  # strip payout_status filter option
+	with context.databases_pool.acquire() as databases:
+		views = getattr(databases, database_name).find_errors(
+			*([*filter_options][:-2]),  # strip payout_status and page_cursor filter options
+			page_cursor=filter_options.page_cursor)
 		return jsonify([
 			{
 				'requestTransactionHeight': str(view.request_transaction_height),
@@ -168,13 +201,13 @@ def _make_estimate_error(code, message):
 	return jsonify({'errorCode': code, 'error': message})
 
 
-def _check_limits(gross_amount, network_facade, database):
+def _check_limits(gross_amount, network_facade, database, daily_transfer_amount):
 	max_transfer_amount = int(network_facade.config.extensions.get('max_transfer_amount', 0))
 	if max_transfer_amount and gross_amount > max_transfer_amount:
 		error_message = f'gross transfer amount {gross_amount} exceeds max transfer amount {max_transfer_amount}'
 		return _make_estimate_error('REQUEST_LIMIT_EXCEEDED', error_message), 400
 
-	(is_exceeded, amount_remaining) = is_daily_limit_exceeded(network_facade, database, gross_amount)
+	(is_exceeded, amount_remaining) = is_daily_limit_exceeded(network_facade, database, gross_amount, daily_transfer_amount)
 	if is_exceeded:
 		error_message = f'daily transfer limit is exceeded ({amount_remaining} remaining), please try again later'
 		return _make_estimate_error('DAILY_LIMIT_EXCEEDED', error_message), 400
@@ -190,58 +223,71 @@ async def _handle_wrap_estimate(is_unwrap_mode, context, fee_multiplier, databas
 	if parse_failure_identifier:
 		return _make_bad_request_response(parse_failure_identifier)
 
-	with Databases(*context.database_params) as databases:
-		conversion_rate_calculator_factory = create_conversion_rate_calculator_factory(
-			ExecutionContext(is_unwrap_mode, context.strategy_mode),
+	with context.databases_pool.acquire() as databases:
+		def create_estimate_inputs():
+			conversion_rate_calculator_factory = create_conversion_rate_calculator_factory(
+				ExecutionContext(is_unwrap_mode, context.strategy_mode),
+				databases,
+				context.native_facade,
+				context.wrapped_facade,
+				fee_multiplier)
+			return EstimateInputs(
+				conversion_rate_calculator_factory.create_best_calculator(),
+				lookup_daily_transfer_amount(getattr(databases, database_name)))
+
+		(calculator, daily_transfer_amount) = context.estimate_cache.get_or_create(
+			is_unwrap_mode,
 			databases,
-			context.native_facade,
-			context.wrapped_facade,
-			fee_multiplier)
-		calculator = conversion_rate_calculator_factory.create_best_calculator()
+			fee_multiplier,
+			create_estimate_inputs)
 		calculator_func = calculator.to_native_amount if is_unwrap_mode else calculator.to_wrapped_amount
 		gross_amount = calculator_func(estimate_options.amount)
 
-		check_limits_result = _check_limits(gross_amount, network_facade, getattr(databases, database_name))
+		check_limits_result = _check_limits(gross_amount, network_facade, getattr(databases, database_name), daily_transfer_amount)
 		if check_limits_result:
 			return check_limits_result
 
-		if fee_multiplier:
-			fee_multiplier *= Decimal(calculator_func(10 ** 12)) / Decimal(10 ** 12)
-
-		balance_transfer = BalanceTransfer(
-			network_facade.make_public_key(network_facade.config.extensions['signer_public_key']),
-			estimate_options.recipient_address,
-			gross_amount,
-			None)
-
-		if is_native_to_native_conversion(context.wrapped_facade):
-			fee_multiplier = None
-
-		try:
-			fee_information = await estimate_balance_transfer_fees(network_facade, balance_transfer, fee_multiplier or Decimal('1'))
-		except NodeException as ex:
-			return _make_estimate_error('UNEXPECTED_ERROR', str(ex)), 500
-
-		result = {
-			'grossAmount': str(gross_amount),
-			'transactionFee': fee_information.transaction.quantize(Decimal('0.0001')),
-			'conversionFee': fee_information.conversion.quantize(Decimal('0.0001')),
-			'totalFee': str(fee_information.total),
-			'netAmount': str(gross_amount - fee_information.total),
-
-			'diagnostics': {
-				'height': str(calculator.height),
-				'nativeBalance': calculator.native_balance,
-				'wrappedBalance': calculator.wrapped_balance,
-				'unwrappedBalance': calculator.unwrapped_balance,
-			}
+	# databases are returned to the pool before the (network bound) fee estimate
+	if fee_multiplier:
+		fee_multiplier *= Decimal(calculator_func(10 ** 12)) / Decimal(10 ** 12)
+
+	balance_transfer = BalanceTransfer(
+		network_facade.make_public_key(network_facade.config.extensions['signer_public_key']),
+		estimate_options.recipient_address,
+		gross_amount,
+		None)
+
+	if is_native_to_native_conversion(context.wrapped_facade):
+		fee_multiplier = None
+
+	fee_key = (is_unwrap_mode, str(balance_transfer.recipient_address), balance_transfer.amount, fee_multiplier)
+	try:
+		fee_information = await context.estimate_cache.get_or_estimate_fee(
+			fee_key,
+			lambda: estimate_balance_transfer_fees(network_facade, balance_transfer, fee_multiplier or Decimal('1')))
+	except NodeException as ex:
+		return _make_estimate_error('UNEXPECTED_ERROR', str(ex)), 500
+
+	result = {
+		'grossAmount': str(gross_amount),
+		'transactionFee': fee_information.transaction.quantize(Decimal('0.0001')),
+		'conversionFee': fee_information.conversion.quantize(Decimal('0.0001')),
+		'totalFee': str(fee_information.total),
+		'netAmount': str(gross_amount - fee_information.total),
+
+		'diagnostics': {
+			'height': str(calculator.height),
+			'nativeBalance': calculator.native_balance,
+			'wrappedBalance': calculator.wrapped_balance,
+			'unwrappedBalance': calculator.unwrapped_balance,
 		}
+	}
 
-		if is_native_to_native_conversion(context.wrapped_facade):
-			# clear other diagnostic calculator properties because they're not relevant
-			result['diagnostics'] = {'height': str(calculator.height)}
+	if is_native_to_native_conversion(context.wrapped_facade):
+		# clear other diagnostic calculator properties because they're not relevant
+		result['diagnostics'] = {'height': str(calculator.height)}
 
-		return jsonify(result)
+	return jsonify(result)
 
 # endregion
 
@@ -249,19 +295,30 @@ async def _handle_wrap_estimate(is_unwrap_mode, context, fee_multiplier, databas
 # region BridgeContext
 
 class BridgeContext:  # pylint: disable=too-many-instance-attributes
-	def __init__(self, config, refresh_rate_seconds):
+	def __init__(
+		self,
+		config,
+		refresh_rate_seconds,
+		database_pool_size=DEFAULT_MAX_SIZE,
+		database_mmap_size=DEFAULT_MMAP_SIZE,
+		estimate_cache=None
+	):
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
 		self._config = config
 		self._refresh_rate_seconds = refresh_rate_seconds
+		self._database_pool_size = database_pool_size
+		self._database_mmap_size = database_mmap_size
 		self._semaphore = asyncio.Semaphore(1)
 		self._is_loaded = False
 
 		self.strategy_mode = self._config.global_.mode
 		self.native_facade = None
 		self.wrapped_facade = None
-		self.database_params = None
+		self.databases_pool = None
 		self.native_mosaic_id = None
 
 		self.conversion_rate_lookup = None
+		self.estimate_cache = estimate_cache or EstimateCache()
 
 	async def load(self):
 		if not self._is_loaded:
@@ -272,7 +329,12 @@ class BridgeContext:  # pylint: disable=too-many-instance-attributes
 	async def _load(self):
 		self.native_facade = await load_network_facade(self._config.native_network)
 		self.wrapped_facade = await load_network_facade(self._config.wrapped_network)
-		self.database_params = [self._config.machine.database_directory, self.native_facade, self.wrapped_facade, True]
+		self.databases_pool = DatabasesPool(
+			self._config.machine.database_directory,
+			self.native_facade,
+			self.wrapped_facade,
+			self._database_pool_size,
+			self._database_mmap_size)
 		self.native_mosaic_id = self.native_facade.extract_mosaic_id()
 
 		price_oracle = load_price_oracle(self._config.price_oracle)
@@ -344,9 +406,14 @@ def create_app():
 
 	config_path = Path(app.config.get('CONFIG_PATH'))
 	refresh_rate_seconds = app.config.get('CONVERSION_RATE_REFRESH_SECONDS', 600)
+	database_pool_size = app.config.get('DATABASE_POOL_SIZE', DEFAULT_MAX_SIZE)
+	database_mmap_size = app.config.get('DATABASE_MMAP_SIZE', DEFAULT_MMAP_SIZE)
+	estimate_cache = EstimateCache(
+		app.config.get('ESTIMATE_CACHE_MAX_AGE_SECONDS', DEFAULT_MAX_AGE_SECONDS),
+		app.config.get('ESTIMATE_FEE_CACHE_SECONDS', DEFAULT_FEE_TTL_SECONDS))
 
 	config = parse_bridge_configuration(config_path)
-	context = BridgeContext(config, refresh_rate_seconds)
+	context = BridgeContext(config, refresh_rate_seconds, database_pool_size, database_mmap_size, estimate_cache)
 
 	@app.route('/')
 	def root():  # pylint: disable=unused-variable
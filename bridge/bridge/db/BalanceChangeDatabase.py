@@ -1,7 +1,21 @@
+import asyncio
+import sqlite3
+
 from symbolchain.CryptoTypes import Hash256
 
 from .MaxProcessedHeightMixin import MaxProcessedHeightMixin
 
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1
+
+
+def _filter_transfer_rows(height, balance_changes, target_address):
+	return [
+		(height, balance_change.currency_id, balance_change.amount, balance_change.transaction_hash.bytes)
+		for balance_change in balance_changes
+		if target_address == balance_change.address
+	]
+
 
 class BalanceChangeDatabase(MaxProcessedHeightMixin):
 	"""Database containing balance changes."""
@@ -19,44 +33,131 @@ class BalanceChangeDatabase(MaxProcessedHeightMixin):
 			transaction_hash blob
 		)''')
 
+		# running balance of each currency at every height with transfers, so balance lookups are single index seeks
+		cursor.execute('''CREATE TABLE IF NOT EXISTS transfer_balance (
+			currency text,
+			height integer,
+			balance integer,
+			PRIMARY KEY (currency, height)
+		)''')
+
 		cursor.execute('CREATE INDEX IF NOT EXISTS transfer_height ON transfer(height)')
 		cursor.execute('CREATE INDEX IF NOT EXISTS transfer_currency ON transfer(currency)')
 		cursor.execute('CREATE INDEX IF NOT EXISTS transfer_transaction_hash ON transfer(transaction_hash)')
 
+		cursor.execute('''SELECT 1 FROM transfer_balance LIMIT 1''')
+		if not cursor.fetchone():
+			self._rebuild_balances(cursor)
+			self.connection.commit()
+
+	@staticmethod
+	def _rebuild_balances(cursor):
+		cursor.execute('''DELETE FROM transfer_balance''')
+		cursor.execute('''
+			INSERT INTO transfer_balance
+			SELECT currency, height, SUM(SUM(amount)) OVER (PARTITION BY currency ORDER BY height)
+			FROM transfer
+			GROUP BY currency, height
+		''')
+
+	@staticmethod
+	def _add_transfer_rows_with_cursor(cursor, transfer_rows):
+		cursor.executemany('''INSERT INTO transfer VALUES (?, ?, ?, ?)''', transfer_rows)
+
+		currency_height_to_amount = {}
+		for (height, currency, amount, _) in transfer_rows:
+			currency_height_to_amount[(currency, height)] = currency_height_to_amount.get((currency, height), 0) + amount
+
+		for ((currency, height), amount) in currency_height_to_amount.items():
+			# transfers can be added out of height order, so all later running balances need to be adjusted too
+			cursor.execute(
+				'''UPDATE transfer_balance SET balance = balance + ? WHERE currency IS ? AND height > ?''',
+				(amount, currency, height))
+			cursor.execute(
+				'''
+					INSERT INTO transfer_balance
+					SELECT ?1, ?2, ?3 + COALESCE(
+						(SELECT balance FROM transfer_balance WHERE currency IS ?1 AND height < ?2 ORDER BY height DESC LIMIT 1),
+						0)
+					WHERE true
+					ON CONFLICT(currency, height)
+					DO UPDATE SET balance = balance + ?3
+				''',
+				(currency, height, amount))
+
 	def add_transfer(self, height, currency, amount, transaction_hash):
 		"""Adds a transfer to the transfer table."""
 
 		cursor = self.connection.cursor()
-		cursor.execute('''INSERT INTO transfer VALUES (?, ?, ?, ?)''', (height, currency, amount, transaction_hash.bytes))
+		self._add_transfer_rows_with_cursor(cursor, [(height, currency, amount, transaction_hash.bytes)])
 		self.connection.commit()
 
 	def add_transfers_filtered_by_address(self, height, balance_changes, target_address):
 		"""Adds multiple transfers to the transfer table, filtered by address."""
 
+		transfer_rows = _filter_transfer_rows(height, balance_changes, str(target_address))
+		self.add_transfer_rows(transfer_rows)
+		return len(transfer_rows)
+
+	def add_transfer_rows(self, transfer_rows, max_processed_height=None):
+		"""
+		Adds (height, currency, amount, transaction hash bytes) rows to the transfer table in a single transaction.
+		When max_processed_height is set, it is advanced in the same transaction, so it is only durable along with all rows.
+		"""
+
 		cursor = self.connection.cursor()
+		try:
+			self._add_transfer_rows_with_cursor(cursor, transfer_rows)
 
-		count = 0
-		for balance_change in balance_changes:
-			if str(target_address) == balance_change.address:
-				cursor.execute(
-					'''INSERT INTO transfer VALUES (?, ?, ?, ?)''',
-					(height, balance_change.currency_id, balance_change.amount, balance_change.transaction_hash.bytes))
-				count += 1
+			if max_processed_height is not None:
+				self._set_max_processed_height_with_cursor(cursor, max_processed_height)
+		except sqlite3.Error:
+			self.connection.rollback()
+			raise
 
 		self.connection.commit()
-		return count
+
+	def create_batch_writer(self, target_address, batch_size=DEFAULT_BATCH_SIZE, flush_interval_seconds=DEFAULT_FLUSH_INTERVAL_SECONDS):
+		"""Creates a writer that buffers transfers to target_address and adds them in batches."""
+
+		return BalanceChangeBatchWriter(self, target_address, batch_size, flush_interval_seconds)
 
 	def is_synced_at_height(self, height):
 		"""Determines if the database is synced through a height."""
 
 		return height <= self.max_processed_height()
 
-	def balance_at(self, height, currency):
-		"""Calculates the balance for a currency at a height."""
-
+	def _check_synced_at_height(self, height):
 		if not self.is_synced_at_height(height):
 			raise ValueError(f'requested balance at {height} beyond current database height {self.max_processed_height()}')
 
+	def balance_at(self, height, currency):
+		"""Looks up the balance for a currency at a height."""
+
+		self._check_synced_at_height(height)
+
+		cursor = self.connection.cursor()
+		cursor.execute(
+			'''
+				SELECT balance
+				FROM transfer_balance
+				WHERE currency IS ? AND height <= ?
+				ORDER BY height DESC
+				LIMIT 1
+			''',
+			(currency, height))
+
+		fetch_result = cursor.fetchone()
+		return fetch_result[0] if fetch_result else 0
+
+	def calculate_balance_at(self, height, currency):
+		"""
+		Calculates the balance for a currency at a height by summing all transfers.
+		This is much slower than balance_at and is intended for checking the consistency of the running balances.
+		"""
+
+		self._check_synced_at_height(height)
+
 		cursor = self.connection.cursor()
 		cursor.execute(
 			'''
@@ -117,7 +218,7 @@ class BalanceChangeDatabase(MaxProcessedHeightMixin):
 			start_index += batch_size
 
 	def reset(self):
-		"""Deletes all transfer entries with heights above the max processed height."""
+		"""Deletes all transfer entries and running balances with heights above the max processed height."""
 
 		max_processed_height = self.max_processed_height()
 
@@ -128,4 +229,99 @@ class BalanceChangeDatabase(MaxProcessedHeightMixin):
 				WHERE height > ?
 			''',
 			(max_processed_height,))
+		cursor.execute(
+			'''
+				DELETE FROM transfer_balance
+				WHERE height > ?
+			''',
+			(max_processed_height,))
 		self.connection.commit()
+
+
+class BalanceChangeBatchWriter:
+	"""
+	Write-behind buffer that collects transfers to a target address from concurrent download tasks and adds them to a balance change
+	database in a single transaction every batch_size rows or flush_interval_seconds (while entered as an async context manager).
+	"""
+
+	def __init__(self, database, target_address, batch_size=DEFAULT_BATCH_SIZE, flush_interval_seconds=DEFAULT_FLUSH_INTERVAL_SECONDS):
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+		"""Creates a batch writer."""
+
+		self.database = database
+		self.target_address = str(target_address)
+		self.batch_size = batch_size
+		self.flush_interval_seconds = flush_interval_seconds
+
+		self._transfer_rows = []
+		self._flush_task = None
+		self._flush_error = None
+
+	async def __aenter__(self):
+		self._flush_task = asyncio.create_task(self._flush_periodically())
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		self._flush_task.cancel()
+		try:
+			await self._flush_task
+		except asyncio.CancelledError:
+			pass
+
+		self._flush_task = None
+
+		# on failure, buffered rows are dropped; they are above the max processed height and would be deleted by reset anyway
+		if not exc_type:
+			self.flush()
+
+	async def _flush_periodically(self):
+		try:
+			while True:
+				await asyncio.sleep(self.flush_interval_seconds)
+				self.flush()
+		except Exception as error:  # pylint: disable=broad-exception-caught
+			# surface the failure on the next add or flush so that the download stops instead of buffering rows forever
+			self._flush_error = error
+
+	def _check_flush_error(self):
+		if self._flush_error:
+			raise self._flush_error
+
+	@property
+	def pending_count(self):
+		"""Gets the number of buffered rows that have not been written."""
+
+		return len(self._transfer_rows)
+
+	def add_transfers_filtered_by_address(self, height, balance_changes):
+		"""Buffers transfers to the target address, writing the current batch when it is full, and returns the number of buffered transfers."""
+
+		self._check_flush_error()
+
+		transfer_rows = _filter_transfer_rows(height, balance_changes, self.target_address)
+		self._transfer_rows.extend(transfer_rows)
+
+		if self.pending_count >= self.batch_size:
+			self.flush()
+
+		return len(transfer_rows)
+
+	def flush(self, max_processed_height=None):
+		"""
+		Writes all buffered rows in a single transaction.
+		When max_processed_height is set, it is advanced in the same transaction, so it never points past rows that were not written.
+		On failure, nothing is written and all rows remain buffered.
+		"""
+
+		self._check_flush_error()
+
+		if not self.pending_count and max_processed_height is None:
+			return
+
+		transfer_rows = self._transfer_rows
+		self._transfer_rows = []
+		try:
+			self.database.add_transfer_rows(transfer_rows, max_processed_height)
+		except sqlite3.Error:
+			self._transfer_rows = transfer_rows + self._transfer_rows
+			raise
@@ -1,32 +1,105 @@
+import logging
 import sqlite3
+from collections import namedtuple
 from pathlib import Path
 
+from symbollightapi.connector.BlockTimestampCache import BlockTimestampCache
+
 from .BalanceChangeDatabase import BalanceChangeDatabase
 from .WrapRequestDatabase import WrapRequestDatabase
 
+DATABASE_NAMES = ('balance_change', 'unwrap_request', 'wrap_request')
+
+DatabaseConnectionOptions = namedtuple('DatabaseConnectionOptions', [
+	'mmap_size', 'cached_statements', 'is_shared_cache', 'check_same_thread'
+])
+DEFAULT_CONNECTION_OPTIONS = DatabaseConnectionOptions(0, 128, False, True)
+
 
 class Databases:  # pylint: disable=too-many-instance-attributes
 	"""Container of all databases."""
 
-	def __init__(self, database_directory, native_network, wrapped_network, is_read_only=False):
-		"""Creates a databases object."""
+	def __init__(
+		self,
+		database_directory,
+		native_network,
+		wrapped_network,
+		is_read_only=False,
+		is_attach_enabled=True,
+		connection_options=DEFAULT_CONNECTION_OPTIONS
+	):
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+		"""
+		Creates a databases object.
+		When is_attach_enabled is set, all databases are additionally attached (read only) to a single connection,
+		so that queries spanning multiple databases can be answered by sqlite directly.
+		"""
 
 		self._database_directory = Path(database_directory)
 		self._native_network = native_network
 		self._wrapped_network = wrapped_network
 		self._is_read_only = is_read_only
+		self._is_attach_enabled = is_attach_enabled
+		self._connection_options = connection_options
 
 		self._balance_change_connection = None
 		self._unwrap_request_connection = None
 		self._wrap_request_connection = None
+		self._attached_connection = None
 
 		self.balance_change = None
 		self.unwrap_request = None
 		self.wrap_request = None
 
+	def _make_connection_string(self, database_name, is_read_only):
+		query_parameters = []
+		if is_read_only:
+			query_parameters.append('mode=ro')
+
+		if self._connection_options.is_shared_cache:
+			query_parameters.append('cache=shared')
+
+		query = f'?{"&".join(query_parameters)}' if query_parameters else ''
+		return f'file:{self._database_directory / database_name}.db{query}'
+
+	def _open_connection(self, connection_string):
+		return sqlite3.connect(
+			connection_string,
+			uri=True,
+			cached_statements=self._connection_options.cached_statements,
+			check_same_thread=self._connection_options.check_same_thread)
+
+	def _set_mmap_size(self, connection, schema_name='main'):
+		if self._connection_options.mmap_size:
+			connection.execute(f'PRAGMA {schema_name}.mmap_size = {int(self._connection_options.mmap_size)}')
+
 	def _connect(self, database_name):
-		connection_string = f'file:{self._database_directory / database_name}.db{"?mode=ro" if self._is_read_only else ""}'
-		return sqlite3.connect(connection_string, uri=True)
+		connection = self._open_connection(self._make_connection_string(database_name, self._is_read_only))
+		if self._is_read_only:
+			connection.execute('PRAGMA query_only = ON')
+
+		self._set_mmap_size(connection)
+		return connection
+
+	def _connect_attached(self):
+		connection = self._open_connection('file::memory:')
+		try:
+			connection.execute('PRAGMA query_only = ON')
+			for database_name in DATABASE_NAMES:
+				connection.execute(f'ATTACH DATABASE ? AS {database_name}', (self._make_connection_string(database_name, True),))
+				self._set_mmap_size(connection, database_name)
+		except sqlite3.Error as ex:
+			connection.close()
+			logging.getLogger(__name__).warning('unable to attach databases, falling back to separate queries: %s', ex)
+			return None
+
+		return connection
+
+	@property
+	def is_attached(self):
+		"""Determines if all databases are attached to a single connection."""
+
+		return self._attached_connection is not None
 
 	def __enter__(self):
 		"""Connects to databases."""
@@ -34,6 +107,8 @@ class Databases:  # pylint: disable=too-many-instance-attributes
 		self._balance_change_connection = self._connect('balance_change')
 		self._unwrap_request_connection = self._connect('unwrap_request')
 		self._wrap_request_connection = self._connect('wrap_request')
+		if self._is_attach_enabled:
+			self._attached_connection = self._connect_attached()
 
 		self.balance_change = BalanceChangeDatabase(self._balance_change_connection)
 		self.unwrap_request = WrapRequestDatabase(self._unwrap_request_connection, self._wrapped_network, self._native_network)
@@ -46,6 +121,9 @@ class Databases:  # pylint: disable=too-many-instance-attributes
 		self._balance_change_connection.close()
 		self._unwrap_request_connection.close()
 		self._wrap_request_connection.close()
+		if self._attached_connection:
+			self._attached_connection.close()
+			self._attached_connection = None
 
 	def create_tables(self):
 		"""Creates all tables."""
@@ -53,3 +131,36 @@ class Databases:  # pylint: disable=too-many-instance-attributes
 		self.balance_change.create_tables()
 		self.unwrap_request.create_tables()
 		self.wrap_request.create_tables()
+
+	def unwrapped_balance_at(self, height, currency, timestamp):
+		"""
+		Sums the wrapped tokens of all unwrap payouts requested at or before timestamp that are present in the balance changes of currency
+		at or before height.
+		"""
+
+		if not self._attached_connection:
+			transaction_hashes = list(self.unwrap_request.payout_transaction_hashes_at(timestamp))
+			filtered_transaction_hashes = list(self.balance_change.filter_transactions_if_present(height, currency, transaction_hashes))
+			return self.unwrap_request.sum_payout_transaction_amounts(filtered_transaction_hashes)
+
+		cursor = self._attached_connection.cursor()
+		cursor.execute(
+			'''
+				SELECT SUM(wrap_request.amount)
+				FROM unwrap_request.wrap_request
+				JOIN unwrap_request.block_metadata ON wrap_request.request_transaction_height = block_metadata.height
+				JOIN unwrap_request.payout_transaction ON wrap_request.payout_transaction_hash = payout_transaction.transaction_hash
+				WHERE block_metadata.timestamp <= ? AND NOT wrap_request.is_retried AND EXISTS (
+					SELECT 1
+					FROM balance_change.transfer
+					WHERE transfer.transaction_hash = wrap_request.payout_transaction_hash AND transfer.currency IS ? AND transfer.height <= ?
+				)
+			''',
+			(timestamp, currency, height))
+		return cursor.fetchone()[0] or 0
+
+	def open_block_timestamp_cache(self, network_facade):
+		"""Opens a persistent cache of finalized block timestamps for a network."""
+
+		network_name = f'{network_facade.config.blockchain}:{network_facade.config.network}'
+		return BlockTimestampCache(network_name, database_filepath=self._database_directory / 'block_timestamp.db')
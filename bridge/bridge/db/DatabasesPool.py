@@ -0,0 +1,89 @@
+import threading
+from contextlib import contextmanager
+
+from .Databases import DatabaseConnectionOptions, Databases
+
+DEFAULT_MAX_SIZE = 8
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+class DatabasesPool:
+	"""
+	Pool of long-lived read-only databases.
+
+	Each checked out databases object is used by a single thread at a time, so at most max_size databases objects are ever opened.
+	Connections share a page cache and are kept open across checkouts, so cached pages and prepared statements are reused.
+	"""
+
+	def __init__(
+		self,
+		database_directory,
+		native_network,
+		wrapped_network,
+		max_size=DEFAULT_MAX_SIZE,
+		mmap_size=DEFAULT_MMAP_SIZE
+	):
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+		"""Creates a pool of at most max_size read-only databases objects."""
+
+		if max_size < 1:
+			raise ValueError('max_size must be positive')
+
+		self._database_params = [database_directory, native_network, wrapped_network]
+		self._connection_options = DatabaseConnectionOptions(mmap_size, DEFAULT_CACHED_STATEMENTS, True, False)
+
+		self._semaphore = threading.BoundedSemaphore(max_size)
+		self._lock = threading.Lock()
+		self._idle_databases = []  # used as a stack so that the most recently used (warmest) databases are reused first
+		self._all_databases = []
+
+		self.max_size = max_size
+
+	@property
+	def size(self):
+		"""Gets the number of opened databases objects."""
+
+		with self._lock:
+			return len(self._all_databases)
+
+	def _checkout(self):
+		with self._lock:
+			if self._idle_databases:
+				return self._idle_databases.pop()
+
+		databases = Databases(*self._database_params, True, True, self._connection_options)
+		databases.__enter__()  # pylint: disable=unnecessary-dunder-call
+
+		with self._lock:
+			self._all_databases.append(databases)
+
+		return databases
+
+	def _checkin(self, databases):
+		with self._lock:
+			self._idle_databases.append(databases)
+
+	@contextmanager
+	def acquire(self):
+		"""Checks out databases for exclusive use by the calling thread, blocking while all databases are in use."""
+
+		self._semaphore.acquire()  # pylint: disable=consider-using-with
+		try:
+			databases = self._checkout()
+			try:
+				yield databases
+			finally:
+				self._checkin(databases)
+		finally:
+			self._semaphore.release()
+
+	def close(self):
+		"""Closes all databases, which must not be checked out."""
+
+		with self._lock:
+			for databases in self._all_databases:
+				databases.__exit__(None, None, None)
+
+			self._idle_databases = []
+			self._all_databases = []
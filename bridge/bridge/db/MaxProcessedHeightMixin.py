@@ -15,10 +15,8 @@ class MaxProcessedHeightMixin:
 			marker integer UNIQUE
 		)''')
 
-	def set_max_processed_height(self, height):
-		"""Sets max processed height."""
-
-		cursor = self.connection.cursor()
+	@staticmethod
+	def _set_max_processed_height_with_cursor(cursor, height):
 		cursor.execute(
 			'''
 				INSERT INTO max_processed_height VALUES (?, ?)
@@ -26,6 +24,12 @@ class MaxProcessedHeightMixin:
 				DO UPDATE SET height=?
 			''',
 			(height, 1, height))
+
+	def set_max_processed_height(self, height):
+		"""Sets max processed height."""
+
+		cursor = self.connection.cursor()
+		self._set_max_processed_height_with_cursor(cursor, height)
 		self.connection.commit()
 
 	def max_processed_height(self):
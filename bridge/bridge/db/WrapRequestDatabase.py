@@ -1,5 +1,7 @@
 import datetime
+import itertools
 import logging
+import sqlite3
 from collections import namedtuple
 from enum import Enum
 
@@ -8,7 +10,11 @@ from symbolchain.CryptoTypes import Hash256
 from ..models.WrapRequest import WrapRequest, make_next_retry_wrap_request, make_wrap_error_result
 from .MaxProcessedHeightMixin import MaxProcessedHeightMixin
 
+DEFAULT_BATCH_SIZE = 1000
+REQUEST_KEY_COLUMNS = ('request_transaction_height', 'request_transaction_hash', 'request_transaction_subindex')
+
 PayoutDetails = namedtuple('PayoutDetails', ['transaction_hash', 'net_amount', 'total_fee', 'conversion_rate'])
+RequestCursor = namedtuple('RequestCursor', ['height', 'transaction_hash', 'subindex'])
 WrapRequestErrorView = namedtuple('WrapErrorView', [
 	'request_transaction_height', 'request_transaction_hash', 'request_transaction_subindex', 'sender_address',
 	'error_message',
@@ -91,40 +97,135 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 			height integer UNIQUE PRIMARY KEY,
 			timestamp timestamp
 		)''')
+		# running sum of the gross payout amounts of all requests at or before every request block timestamp with payouts
+		cursor.execute('''CREATE TABLE IF NOT EXISTS cumulative_gross_amount (
+			timestamp timestamp UNIQUE PRIMARY KEY,
+			amount real
+		)''')
 
-		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_error_request_transaction_height_idx ON wrap_error(request_transaction_height)')
+		# single column indexes were superseded by the composite (column, request key) indexes used for paging
+		for index_name in (
+			'wrap_error_request_transaction_height_idx',
+			'wrap_error_address_idx',
+			'wrap_request_request_transaction_height_idx',
+			'wrap_request_destination_address_idx',
+			'wrap_request_payout_status_idx'
+		):
+			cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+		key_columns = ', '.join(REQUEST_KEY_COLUMNS)
+		cursor.execute(f'CREATE INDEX IF NOT EXISTS wrap_error_request_key_idx ON wrap_error({key_columns})')
 		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_error_request_transaction_hash_idx ON wrap_error(request_transaction_hash)')
-		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_error_address_idx ON wrap_error(address)')
+		cursor.execute(f'CREATE INDEX IF NOT EXISTS wrap_error_address_request_key_idx ON wrap_error(address, {key_columns})')
 
-		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_request_request_transaction_height_idx ON wrap_request(request_transaction_height)')
+		cursor.execute(f'CREATE INDEX IF NOT EXISTS wrap_request_request_key_idx ON wrap_request({key_columns})')
 		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_request_request_transaction_hash_idx ON wrap_request(request_transaction_hash)')
-		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_request_destination_address_idx ON wrap_request(destination_address)')
-		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_request_payout_status_idx ON wrap_request(payout_status)')
+		cursor.execute(f'CREATE INDEX IF NOT EXISTS wrap_request_address_request_key_idx ON wrap_request(address, {key_columns})')
+		cursor.execute(
+			f'CREATE INDEX IF NOT EXISTS wrap_request_destination_address_request_key_idx ON wrap_request(destination_address, {key_columns})')
+		cursor.execute(f'CREATE INDEX IF NOT EXISTS wrap_request_payout_status_request_key_idx ON wrap_request(payout_status, {key_columns})')
 		cursor.execute('CREATE INDEX IF NOT EXISTS wrap_request_payout_transaction_hash_idx ON wrap_request(payout_transaction_hash)')
 
+		cursor.execute('''SELECT 1 FROM cumulative_gross_amount LIMIT 1''')
+		if not cursor.fetchone():
+			self._rebuild_cumulative_gross_amounts(cursor)
+			self.connection.commit()
+
+	# endregion
+
+	# region cumulative gross amount tracking
+
+	@staticmethod
+	def _rebuild_cumulative_gross_amounts(cursor):
+		cursor.execute('''DELETE FROM cumulative_gross_amount''')
+		cursor.execute('''
+			INSERT INTO cumulative_gross_amount
+			SELECT
+				block_metadata.timestamp,
+				SUM(SUM(payout_transaction.net_amount + payout_transaction.total_fee)) OVER (ORDER BY block_metadata.timestamp)
+			FROM wrap_request
+			JOIN block_metadata ON wrap_request.request_transaction_height = block_metadata.height
+			JOIN payout_transaction ON wrap_request.payout_transaction_hash = payout_transaction.transaction_hash
+			WHERE NOT wrap_request.is_retried
+			GROUP BY block_metadata.timestamp
+		''')
+
+	@staticmethod
+	def _gross_amounts_by_timestamp(cursor, condition, parameters):
+		cursor.execute(
+			f'''
+				SELECT block_metadata.timestamp, SUM(payout_transaction.net_amount + payout_transaction.total_fee)
+				FROM wrap_request
+				JOIN block_metadata ON wrap_request.request_transaction_height = block_metadata.height
+				JOIN payout_transaction ON wrap_request.payout_transaction_hash = payout_transaction.transaction_hash
+				WHERE NOT wrap_request.is_retried AND {condition}
+				GROUP BY block_metadata.timestamp
+			''',
+			parameters)
+		return cursor.fetchall()
+
+	@staticmethod
+	def _request_gross_amounts_by_timestamp(cursor, request):
+		return WrapRequestDatabase._gross_amounts_by_timestamp(
+			cursor,
+			'wrap_request.request_transaction_hash IS ? AND wrap_request.request_transaction_subindex IS ?',
+			(request.transaction_hash.bytes, request.transaction_subindex))
+
+	@staticmethod
+	def _gross_amounts_by_timestamp_at_heights(cursor, heights, batch_size=100):
+		timestamp_amount_pairs = []
+		for start_index in range(0, len(heights), batch_size):
+			heights_batch = heights[start_index:start_index + batch_size]
+			in_query = ','.join(['?'] * len(heights_batch))
+			timestamp_amount_pairs.extend(WrapRequestDatabase._gross_amounts_by_timestamp(
+				cursor,
+				f'wrap_request.request_transaction_height IN ({in_query})',
+				tuple(heights_batch)))
+
+		return timestamp_amount_pairs
+
+	@staticmethod
+	def _update_cumulative_gross_amounts(cursor, old_timestamp_amount_pairs, new_timestamp_amount_pairs):
+		timestamp_to_amount = {}
+		for (timestamp, amount) in old_timestamp_amount_pairs:
+			timestamp_to_amount[timestamp] = timestamp_to_amount.get(timestamp, 0) - amount
+
+		for (timestamp, amount) in new_timestamp_amount_pairs:
+			timestamp_to_amount[timestamp] = timestamp_to_amount.get(timestamp, 0) + amount
+
+		for (timestamp, amount) in timestamp_to_amount.items():
+			if not amount:
+				continue
+
+			cursor.execute('''UPDATE cumulative_gross_amount SET amount = amount + ? WHERE timestamp > ?''', (amount, timestamp))
+			cursor.execute(
+				'''
+					INSERT INTO cumulative_gross_amount
+					SELECT ?1, ?2 + COALESCE(
+						(SELECT amount FROM cumulative_gross_amount WHERE timestamp < ?1 ORDER BY timestamp DESC LIMIT 1),
+						0)
+					WHERE true
+					ON CONFLICT(timestamp)
+					DO UPDATE SET amount = amount + ?2
+				''',
+				(timestamp, amount))
+
 	# endregion
 
 	# region add_error, add_request
 
 	@staticmethod
-	def _add_error_with_cursor(cursor, error):
-		cursor.execute('''INSERT INTO wrap_error VALUES (?, ?, ?, ?, ?)''', (
+	def _to_error_row(error):
+		return (
 			error.transaction_height,
 			error.transaction_hash.bytes,
 			error.transaction_subindex,
 			error.sender_address.bytes,
-			error.message))
+			error.message)
 
-	def add_error(self, error):
-		"""Adds an error to the error table."""
-
-		cursor = self.connection.cursor()
-		self._add_error_with_cursor(cursor, error)
-		self.connection.commit()
-
-	def _add_request(self, request, payout_sent_timestamp=None):
-		cursor = self.connection.cursor()
-		cursor.execute('''INSERT INTO wrap_request VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', (
+	@staticmethod
+	def _to_request_row(request, payout_sent_timestamp=None):
+		return (
 			request.transaction_height,
 			request.transaction_hash.bytes,
 			request.transaction_subindex,
@@ -134,7 +235,22 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 			WrapRequestStatus.UNPROCESSED.value,
 			None,
 			payout_sent_timestamp,
-			False))
+			False)
+
+	@staticmethod
+	def _add_error_with_cursor(cursor, error):
+		cursor.execute('''INSERT INTO wrap_error VALUES (?, ?, ?, ?, ?)''', WrapRequestDatabase._to_error_row(error))
+
+	def add_error(self, error):
+		"""Adds an error to the error table."""
+
+		cursor = self.connection.cursor()
+		self._add_error_with_cursor(cursor, error)
+		self.connection.commit()
+
+	def _add_request(self, request, payout_sent_timestamp=None):
+		cursor = self.connection.cursor()
+		cursor.execute('''INSERT INTO wrap_request VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', self._to_request_row(request, payout_sent_timestamp))
 		self.connection.commit()
 
 	def add_request(self, request):
@@ -142,6 +258,30 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 
 		self._add_request(request)
 
+	def add_batch(self, errors, requests, max_processed_height=None):
+		"""
+		Adds errors and requests to their tables in a single transaction, which is rolled back if any row cannot be added.
+		When max_processed_height is set, it is advanced in the same transaction, so it is only durable along with all rows.
+		"""
+
+		cursor = self.connection.cursor()
+		try:
+			cursor.executemany('''INSERT INTO wrap_error VALUES (?, ?, ?, ?, ?)''', map(self._to_error_row, errors))
+			cursor.executemany('''INSERT INTO wrap_request VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', map(self._to_request_row, requests))
+
+			if max_processed_height is not None:
+				self._set_max_processed_height_with_cursor(cursor, max_processed_height)
+		except sqlite3.Error:
+			self.connection.rollback()
+			raise
+
+		self.connection.commit()
+
+	def create_batch_writer(self, batch_size=DEFAULT_BATCH_SIZE):
+		"""Creates a writer that buffers errors and requests and adds them in batches of (at least) batch_size rows."""
+
+		return WrapRequestBatchWriter(self, batch_size)
+
 	# endregion
 
 	# region requests
@@ -165,16 +305,18 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 
 	# endregion
 
-	# region is_synced_at_timestamp
+	# region max_processed_timestamp, is_synced_at_timestamp
+
+	def max_processed_timestamp(self):
+		"""Gets the timestamp of the last block at or before the max processed height."""
 
-	def _max_processed_timestamp(self):
 		max_processed_height = self.max_processed_height()
 		return self._lookup_block_timestamp_closest(max_processed_height) or 0
 
 	def is_synced_at_timestamp(self, timestamp):
 		"""Determines if the database is synced through a timestamp."""
 
-		return timestamp <= self._max_processed_timestamp()
+		return timestamp <= self.max_processed_timestamp()
 
 	# endregion
 
@@ -183,6 +325,19 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 	def cumulative_gross_amount_at(self, timestamp):
 		"""Gets cumulative gross amount of wrapped tokens issued at or before timestamp."""
 
+		cursor = self.connection.cursor()
+		cursor.execute(
+			'''SELECT amount FROM cumulative_gross_amount WHERE timestamp <= ? ORDER BY timestamp DESC LIMIT 1''',
+			(timestamp,))
+		fetch_result = cursor.fetchone()
+		return fetch_result[0] if fetch_result else 0
+
+	def calculate_cumulative_gross_amount_at(self, timestamp):
+		"""
+		Calculates cumulative gross amount of wrapped tokens issued at or before timestamp by summing all payouts.
+		This is much slower than cumulative_gross_amount_at and is intended for checking the consistency of the running sums.
+		"""
+
 		cursor = self.connection.cursor()
 		cursor.execute('''
 			SELECT SUM(payout_transaction.net_amount), SUM(payout_transaction.total_fee)
@@ -256,6 +411,20 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 
 	# endregion
 
+	# region payout_state_id
+
+	def payout_state_id(self):
+		"""
+		Gets an identifier that changes whenever a payout is sent or fails, which changes gross amounts without advancing any height.
+		This is the (max payout transaction rowid, max error rowid) pair because every sent payout and every failure adds a row.
+		"""
+
+		cursor = self.connection.cursor()
+		cursor.execute('''SELECT (SELECT MAX(rowid) FROM payout_transaction), (SELECT MAX(rowid) FROM wrap_error)''')
+		return tuple(rowid or 0 for rowid in cursor.fetchone())
+
+	# endregion
+
 	# region mark_payout_*
 
 	def mark_payout_sent(self, request, payout_details):
@@ -264,6 +433,7 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 		payout_sent_timestamp = self.payout_sent_timestamp_for_request(request)
 
 		cursor = self.connection.cursor()
+		old_gross_amounts = self._request_gross_amounts_by_timestamp(cursor, request)
 		cursor.execute(
 			'''
 				UPDATE wrap_request
@@ -288,6 +458,7 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 				0
 			))
 
+		self._update_cumulative_gross_amounts(cursor, old_gross_amounts, self._request_gross_amounts_by_timestamp(cursor, request))
 		self.connection.commit()
 
 		self._logger.info(
@@ -303,6 +474,7 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 		payout_transaction_hash = self.payout_transaction_hash_for_request(request)
 
 		cursor = self.connection.cursor()
+		old_gross_amounts = self._request_gross_amounts_by_timestamp(cursor, request)
 		cursor.execute(
 			'''
 				UPDATE wrap_request
@@ -322,6 +494,7 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 				(-1, payout_transaction_hash.bytes))
 
 		self._add_error_with_cursor(cursor, make_wrap_error_result(request, message).error)
+		self._update_cumulative_gross_amounts(cursor, old_gross_amounts, self._request_gross_amounts_by_timestamp(cursor, request))
 		self.connection.commit()
 
 		self._logger.info('R[%s:%s] marking payout failed with error: %s', request.transaction_hash, request.transaction_subindex, message)
@@ -363,11 +536,15 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 	# region reset
 
 	def reset(self):
-		"""Deletes all request and error entries with request transaction heights above the max processed height."""
+		"""Deletes all request and error entries (and their payout amounts) with request transaction heights above the max processed height."""
 
 		max_processed_height = self.max_processed_height()
 
 		cursor = self.connection.cursor()
+		self._update_cumulative_gross_amounts(
+			cursor,
+			self._gross_amounts_by_timestamp(cursor, 'wrap_request.request_transaction_height > ?', (max_processed_height,)),
+			[])
 		cursor.execute(
 			'''
 				DELETE FROM wrap_request
@@ -384,40 +561,60 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 
 	# endregion
 
-	# region set_block_timestamp, set_payout_block_timestamp
+	# region set_block_timestamp, set_block_timestamps, set_payout_block_timestamp
+
+	def _set_block_timestamps(self, height_timestamp_pairs, network_facade, table_name):
+		def to_row(height_timestamp_pair):
+			(height, raw_timestamp) = height_timestamp_pair
+			unix_timestamp = network_facade.network.to_datetime(
+				network_facade.network.network_timestamp_class(raw_timestamp)
+			).timestamp()
+			return (height, unix_timestamp, unix_timestamp)
 
-	def _set_block_timestamp(self, height, raw_timestamp, network_facade, table_name):
-		unix_timestamp = network_facade.network.to_datetime(
-			network_facade.network.network_timestamp_class(raw_timestamp)
-		).timestamp()
+		# payouts of requests are tracked at the timestamps of their blocks, so they move along when those timestamps change
+		is_request_block_metadata = 'block_metadata' == table_name
+		heights = [height for (height, _) in height_timestamp_pairs]
 
 		cursor = self.connection.cursor()
-		cursor.execute(
+		old_gross_amounts = self._gross_amounts_by_timestamp_at_heights(cursor, heights) if is_request_block_metadata else []
+		cursor.executemany(
 			f'''
 				INSERT INTO {table_name} VALUES (?, ?)
 				ON CONFLICT(height)
 				DO UPDATE SET timestamp=?
 			''',
-			(height, unix_timestamp, unix_timestamp))
+			map(to_row, height_timestamp_pairs))
+
+		if is_request_block_metadata:
+			self._update_cumulative_gross_amounts(cursor, old_gross_amounts, self._gross_amounts_by_timestamp_at_heights(cursor, heights))
+
 		self.connection.commit()
 
 	def set_block_timestamp(self, height, raw_timestamp):
 		"""Sets a block timestamp."""
 
-		self._set_block_timestamp(height, raw_timestamp, self.network_facade, 'block_metadata')
+		self._set_block_timestamps([(height, raw_timestamp)], self.network_facade, 'block_metadata')
 
 		self._logger.info('saving block %s with timestamp %s', height, raw_timestamp)
 
+	def set_block_timestamps(self, height_timestamp_pairs):
+		"""Sets multiple block timestamps in a single transaction."""
+
+		height_timestamp_pairs = list(height_timestamp_pairs)
+		self._set_block_timestamps(height_timestamp_pairs, self.network_facade, 'block_metadata')
+
+		self._logger.info('saving %s block timestamps', len(height_timestamp_pairs))
+
 	def set_payout_block_timestamp(self, height, raw_timestamp):
 		"""Sets a payout block timestamp."""
 
-		self._set_block_timestamp(height, raw_timestamp, self.payout_network_facade, 'payout_block_metadata')
+		self._set_block_timestamps([(height, raw_timestamp)], self.payout_network_facade, 'payout_block_metadata')
 
 		self._logger.info('saving payout block %s with timestamp %s', height, raw_timestamp)
 
 	# endregion
 
-	# region lookup_block_timestamp, lookup_block_height
+	# region lookup_block_timestamp, lookup_block_height, lookup_last_block_height, lookup_block_timestamp_after
 
 	def lookup_block_timestamp(self, height):
 		"""Looks up the timestamp of a block height."""
@@ -446,6 +643,30 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 			(timestamp,))
 		return cursor.fetchone()[0] or 0
 
+	def lookup_last_block_height(self, height, timestamp, is_timestamp_inclusive=True):
+		"""
+		Looks up the height of the last block at or below a height with a timestamp no greater than provided.
+		When is_timestamp_inclusive is False, the timestamp must be less than provided.
+		"""
+
+		timestamp_operator = '<=' if is_timestamp_inclusive else '<'
+		cursor = self.connection.cursor()
+		cursor.execute(
+			f'''SELECT height FROM block_metadata WHERE height <= ? AND timestamp {timestamp_operator} ? ORDER BY height DESC LIMIT 1''',
+			(height, timestamp))
+		fetch_result = cursor.fetchone()
+		return fetch_result[0] if fetch_result else 0
+
+	def lookup_block_timestamp_after(self, height):
+		"""Looks up the timestamp of the first block above a height."""
+
+		cursor = self.connection.cursor()
+		cursor.execute(
+			'''SELECT timestamp FROM block_metadata WHERE height > ? ORDER BY height LIMIT 1''',
+			(height,))
+		fetch_result = cursor.fetchone()
+		return fetch_result[0] if fetch_result else None
+
 	# endregion
 
 	# region requests_by_status, unconfirmed_payout_transaction_hashes
@@ -506,9 +727,62 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 	def _unwrap_search_parameter(value):
 		return value.bytes if hasattr(value, 'bytes') else value
 
-	def find_errors(self, address=None, transaction_hash=None, offset=0, limit=25, sort_ascending=True):
+	@staticmethod
+	def _make_page_keys_query(table_name, filters, sort_ascending, page_cursor, offset, limit):
+		# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+		# each filter is a list of alternative (column, value) conditions;
+		# instead of a single query with OR conditions, which cannot use any index, every combination of alternatives is a separate
+		# branch that scans a (column, request key) index in order and stops after offset + limit rows;
+		# only the keys of the requested page are selected, so joins are limited to the rows that are returned
+		direction = 'ASC' if sort_ascending else 'DESC'
+		key_columns = ', '.join(REQUEST_KEY_COLUMNS)
+		order_by = ', '.join(f'{column} {direction}' for column in REQUEST_KEY_COLUMNS)
+
+		branches = []
+		for conditions in itertools.product(*filters):
+			where_clauses = [f'{column} = ?' for (column, _) in conditions]
+			branch_parameters = [value for (_, value) in conditions]
+			if page_cursor:
+				where_clauses.append(f'({key_columns}) {">" if sort_ascending else "<"} (?, ?, ?)')
+				branch_parameters.extend([page_cursor.height, page_cursor.transaction_hash.bytes, page_cursor.subindex])
+
+			where = f'WHERE {" AND ".join(where_clauses)}' if where_clauses else ''
+			branches.append((f'SELECT {key_columns} FROM {table_name} {where} ORDER BY {order_by}', branch_parameters))
+
+		if 1 == len(branches):
+			(page_keys_query, parameters) = branches[0]
+		else:
+			page_keys_query = ' UNION '.join(f'SELECT * FROM ({branch_query} LIMIT ?)' for (branch_query, _) in branches)
+			page_keys_query = f'SELECT * FROM ({page_keys_query}) ORDER BY {order_by}'
+			parameters = [parameter for (_, branch_parameters) in branches for parameter in [*branch_parameters, offset + limit]]
+
+		page_keys_query += ' LIMIT ? OFFSET ?'
+		parameters.extend([limit, offset])
+
+		page_order_by = ', '.join(f'page.{column} {direction}' for column in REQUEST_KEY_COLUMNS)
+		return (page_keys_query, page_order_by, parameters)
+
+	def find_errors(self, address=None, transaction_hash=None, offset=0, limit=25, sort_ascending=True, page_cursor=None):
 		# pylint: disable=too-many-arguments,too-many-positional-arguments
-		"""Finds all errors for an address, optionally filtered by hash."""
+		"""
+		Finds all errors for an address, optionally filtered by hash.
+		When page_cursor is set, only errors after (or before, when sorted descending) the request key in page_cursor are returned.
+		"""
+
+		filters = []
+		if address is not None:
+			filters.append([('address', self._unwrap_search_parameter(address))])
+
+		if transaction_hash is not None:
+			filters.append([('request_transaction_hash', self._unwrap_search_parameter(transaction_hash))])
+
+		(page_keys_query, page_order_by, parameters) = self._make_page_keys_query(
+			'wrap_error',
+			filters,
+			sort_ascending,
+			page_cursor,
+			offset,
+			limit)
 
 		cursor = self.connection.cursor()
 		cursor.execute(
@@ -520,20 +794,52 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 					wrap_error.address,
 					wrap_error.message,
 					block_metadata.timestamp
-				FROM wrap_error
+				FROM ({page_keys_query}) AS page
+				JOIN wrap_error ON page.request_transaction_hash = wrap_error.request_transaction_hash
+					AND page.request_transaction_subindex = wrap_error.request_transaction_subindex
 				LEFT JOIN block_metadata ON wrap_error.request_transaction_height = block_metadata.height
-				WHERE (?1 IS NULL OR wrap_error.address = ?1) AND (?2 IS NULL OR wrap_error.request_transaction_hash = ?2)
-				ORDER BY wrap_error.request_transaction_height {"ASC" if sort_ascending else "DESC"}
-				LIMIT ? OFFSET ?
+				ORDER BY {page_order_by}
 			''',
-			(self._unwrap_search_parameter(address), self._unwrap_search_parameter(transaction_hash), limit, offset))
+			parameters)
 
 		for row in cursor:
 			yield WrapRequestErrorView(row[0], Hash256(row[1]), row[2], self.network_facade.make_address(row[3]), row[4], row[5])
 
-	def find_requests(self, address=None, transaction_hash=None, offset=0, limit=25, sort_ascending=True, payout_status=None):
+	def find_requests(
+		self,
+		address=None,
+		transaction_hash=None,
+		offset=0,
+		limit=25,
+		sort_ascending=True,
+		payout_status=None,
+		page_cursor=None
+	):
 		# pylint: disable=too-many-arguments,too-many-positional-arguments
-		"""Finds all requests for an address, optionally filtered by hash."""
+		"""
+		Finds all requests for an address, optionally filtered by hash.
+		When page_cursor is set, only requests after (or before, when sorted descending) the request key in page_cursor are returned.
+		"""
+
+		filters = []
+		if address is not None:
+			address = self._unwrap_search_parameter(address)
+			filters.append([('address', address), ('destination_address', address)])
+
+		if transaction_hash is not None:
+			transaction_hash = self._unwrap_search_parameter(transaction_hash)
+			filters.append([('request_transaction_hash', transaction_hash), ('payout_transaction_hash', transaction_hash)])
+
+		if payout_status is not None:
+			filters.append([('payout_status', payout_status)])
+
+		(page_keys_query, page_order_by, parameters) = self._make_page_keys_query(
+			'wrap_request',
+			filters,
+			sort_ascending,
+			page_cursor,
+			offset,
+			limit)
 
 		cursor = self.connection.cursor()
 		cursor.execute(
@@ -555,19 +861,17 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 					payout_transaction.conversion_rate,
 					payout_block_metadata.timestamp,
 					wrap_error.message
-				FROM wrap_request
+				FROM ({page_keys_query}) AS page
+				JOIN wrap_request ON page.request_transaction_hash = wrap_request.request_transaction_hash
+					AND page.request_transaction_subindex = wrap_request.request_transaction_subindex
 				LEFT JOIN block_metadata ON wrap_request.request_transaction_height = block_metadata.height
 				LEFT JOIN payout_transaction ON wrap_request.payout_transaction_hash = payout_transaction.transaction_hash
 				LEFT JOIN payout_block_metadata ON payout_transaction.height = payout_block_metadata.height
 				LEFT JOIN wrap_error ON wrap_request.request_transaction_hash = wrap_error.request_transaction_hash
 					AND wrap_request.request_transaction_subindex = wrap_error.request_transaction_subindex
-				WHERE (?1 IS NULL OR wrap_request.address = ?1 OR wrap_request.destination_address = ?1)
-					AND (?2 IS NULL OR wrap_request.request_transaction_hash = ?2 OR wrap_request.payout_transaction_hash = ?2)
-					AND (?3 IS NULL OR wrap_request.payout_status = ?3)
-				ORDER BY wrap_request.request_transaction_height {"ASC" if sort_ascending else "DESC"}
-				LIMIT ? OFFSET ?
+				ORDER BY {page_order_by}
 			''',
-			(self._unwrap_search_parameter(address), self._unwrap_search_parameter(transaction_hash), payout_status, limit, offset))
+			parameters)
 
 		for row in cursor:
 			yield WrapRequestView(
@@ -582,3 +886,51 @@ class WrapRequestDatabase(MaxProcessedHeightMixin):  # pylint: disable=too-many-
 				*row[8:])
 
 	# endregion
+
+
+class WrapRequestBatchWriter:
+	"""Buffers wrap errors and requests and adds them to a wrap request database in batches, committing once per batch."""
+
+	def __init__(self, database, batch_size=DEFAULT_BATCH_SIZE):
+		"""Creates a batch writer."""
+
+		self.database = database
+		self.batch_size = batch_size
+
+		self._errors = []
+		self._requests = []
+
+	@property
+	def pending_count(self):
+		"""Gets the number of buffered rows that have not been written."""
+
+		return len(self._errors) + len(self._requests)
+
+	def _flush_if_full(self):
+		if self.pending_count >= self.batch_size:
+			self.flush()
+
+	def add_error(self, error):
+		"""Buffers an error, writing the current batch when it is full."""
+
+		self._errors.append(error)
+		self._flush_if_full()
+
+	def add_request(self, request):
+		"""Buffers a request, writing the current batch when it is full."""
+
+		self._requests.append(request)
+		self._flush_if_full()
+
+	def flush(self, max_processed_height=None):
+		"""
+		Writes all buffered rows in a single transaction.
+		When max_processed_height is set, it is advanced in the same transaction, so it never points past rows that were not written.
+		"""
+
+		if not self.pending_count and max_processed_height is None:
+			return
+
+		self.database.add_batch(self._errors, self._requests, max_processed_height)
+		self._errors = []
+		self._requests = []
@@ -4,9 +4,8 @@ from collections import namedtuple
 from statistics import median_high
 
 import sha3
-from aiolimiter import AsyncLimiter
 from symbollightapi.connector.BasicConnector import BasicConnector
-from symbollightapi.model.Constants import DEFAULT_ASYNC_LIMITER_ARGUMENTS, TransactionStatus
+from symbollightapi.model.Constants import TransactionStatus
 from symbollightapi.model.Exceptions import InsufficientBalanceException, NodeException, NodeTransientException
 
 from .EthereumAdapters import EthereumNetworkTimestamp
@@ -47,8 +46,8 @@ class EthereumConnector(BasicConnector):
 
 	# region utils
 
-	async def _post_rpc(self, request_json):
-		response_json = await self.post('', request_json)
+	async def _post_rpc(self, request_json, is_idempotent=True):
+		response_json = await self.post('', request_json, is_idempotent=is_idempotent)
 		if 'error' in response_json:
 			error_message = f'{request_json["method"]} RPC call failed: {response_json["error"]["message"]}'
 			if 'transfer amount exceeds balance' in response_json['error']['message']:
@@ -212,15 +211,12 @@ class EthereumConnector(BasicConnector):
 
 		return (TransactionStatus.CONFIRMED, parse_rpc_response_hex_value(block_number))
 
-	async def filter_confirmed_transactions(self, transaction_hashes, async_limiter_arguments=DEFAULT_ASYNC_LIMITER_ARGUMENTS):
+	async def filter_confirmed_transactions(self, transaction_hashes):
 		"""Filters transaction hashes and returns only confirmed ones with (confirmed) heights."""
 
-		limiter = AsyncLimiter(*async_limiter_arguments)
-
 		async def get_transaction_hash_height_pair(transaction_hash):
-			async with limiter:
-				(status, height) = await self._transaction_status_and_height_by_hash(transaction_hash, False)
-				return (transaction_hash if TransactionStatus.CONFIRMED == status else None, height)
+			(status, height) = await self._transaction_status_and_height_by_hash(transaction_hash, False)
+			return (transaction_hash if TransactionStatus.CONFIRMED == status else None, height)
 
 		tasks = [get_transaction_hash_height_pair(transaction_hash) for transaction_hash in transaction_hashes]
 		transaction_hash_height_pairs = await asyncio.gather(*tasks)
@@ -274,7 +270,7 @@ class EthereumConnector(BasicConnector):
 
 		raw_transaction_hex = hexlify(transaction_payload['signature'].raw_transaction).decode('utf8')
 		request_json = make_rpc_request_json('eth_sendRawTransaction', [f'0x{raw_transaction_hex}'])
-		await self._post_rpc(request_json)
+		await self._post_rpc(request_json, False)
 
 	# endregion
 
@@ -4,6 +4,7 @@ from decimal import ROUND_UP, Decimal
 from web3 import Web3
 
 from ..models.Constants import PrintableMosaicId
+from ..NetworkUtils import create_node_selector
 from .EthereumAdapters import EthereumAddress, EthereumNetwork, EthereumPublicKey, EthereumSdkFacade
 from .EthereumConnector import EthereumConnector
 from .EthereumUtils import extract_wrap_request_from_transaction
@@ -31,6 +32,7 @@ class EthereumNetworkFacade:  # pylint: disable=too-many-instance-attributes
 		self.transaction_search_address = EthereumAddress(self.config.mosaic_id or self.config.bridge_address)
 		self.chain_id = int(self.config.extensions['chain_id'])
 		self.native_token_precision = 18
+		self.node_selector = create_node_selector(config)
 
 		self.address_to_nonce_map = {}
 
@@ -58,7 +60,9 @@ class EthereumNetworkFacade:  # pylint: disable=too-many-instance-attributes
 		"""Creates a connector to the network."""
 
 		is_finalization_supported = 'True' == self.config.extensions.get('is_finalization_supported', 'True')
-		return EthereumConnector(self.config.endpoint, is_finalization_supported)
+		connector = EthereumConnector(self.config.endpoint, is_finalization_supported)
+		connector.node_selector = self.node_selector
+		return connector
 
 	@staticmethod
 	def make_address(raw_address):
@@ -6,10 +6,11 @@ from symbollightapi.connector.NemConnector import NemConnector
 
 from ..models.AddressValidator import try_convert_network_address_to_string
 from ..models.Constants import PrintableMosaicId
+from ..NetworkUtils import create_node_selector
 from .NemUtils import calculate_transfer_transaction_fee, extract_wrap_request_from_transaction
 
 
-class NemNetworkFacade:
+class NemNetworkFacade:  # pylint: disable=too-many-instance-attributes
 	"""NEM network facade."""
 
 	def __init__(self, config):
@@ -22,6 +23,7 @@ class NemNetworkFacade:
 		self.bridge_address = Address(config.bridge_address)
 		self.transaction_search_address = self.bridge_address
 		self.native_token_precision = 6
+		self.node_selector = create_node_selector(config)
 
 		self.mosaic_id_to_fee_information_map = {}
 
@@ -59,7 +61,9 @@ class NemNetworkFacade:
 		if kwargs.get('require_rosetta', False):
 			return NemConnector(self.config.extensions['rosetta_endpoint'])
 
-		return NemConnector(self.config.endpoint)
+		connector = NemConnector(self.config.endpoint)
+		connector.node_selector = self.node_selector
+		return connector
 
 	@staticmethod
 	def make_address(raw_address):
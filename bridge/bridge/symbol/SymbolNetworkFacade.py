@@ -5,13 +5,15 @@ from symbolchain.sc import Amount
 from symbolchain.symbol.IdGenerator import generate_mosaic_alias_id
 from symbolchain.symbol.Network import Address, Network, NetworkTimestamp
 from symbollightapi.connector.SymbolConnector import SymbolConnector
+from symbollightapi.connector.SymbolTransactionListener import SymbolTransactionListener
 
 from ..models.AddressValidator import try_convert_network_address_to_string
 from ..models.Constants import PrintableMosaicId
+from ..NetworkUtils import create_node_selector
 from .SymbolUtils import extract_wrap_request_from_transaction
 
 
-class SymbolNetworkFacade:
+class SymbolNetworkFacade:  # pylint: disable=too-many-instance-attributes
 	"""Symbol network facade."""
 
 	def __init__(self, config):
@@ -24,6 +26,7 @@ class SymbolNetworkFacade:
 		self.bridge_address = Address(config.bridge_address)
 		self.transaction_search_address = self.bridge_address
 		self.native_token_precision = 6
+		self.node_selector = create_node_selector(config)
 
 		self.currency_mosaic_ids = []
 
@@ -60,13 +63,25 @@ class SymbolNetworkFacade:
 
 		is_finalization_supported = 'True' == self.config.extensions.get('is_finalization_supported', 'True')
 		if is_finalization_supported:
-			return SymbolConnector(self.config.endpoint)
+			connector = SymbolConnector(self.config.endpoint)
+		else:
+			class FinalizationDisabledSymbolConnector(SymbolConnector):
+				async def finalized_chain_height(self):
+					return await super().chain_height()
 
-		class FinalizationDisabledSymbolConnector(SymbolConnector):
-			async def finalized_chain_height(self):
-				return await super().chain_height()
+			connector = FinalizationDisabledSymbolConnector(self.config.endpoint)
 
-		return FinalizationDisabledSymbolConnector(self.config.endpoint)
+		connector.node_selector = self.node_selector
+		return connector
+
+	def create_transaction_listener(self, public_key):
+		"""Creates a listener for the transactions of an account or None if transaction listening is disabled."""
+
+		is_transaction_listener_enabled = 'True' == self.config.extensions.get('is_transaction_listener_enabled', 'False')
+		if not is_transaction_listener_enabled:
+			return None
+
+		return SymbolTransactionListener(self.create_connector(), self.network.public_key_to_address(public_key))
 
 	@staticmethod
 	def make_address(raw_address):
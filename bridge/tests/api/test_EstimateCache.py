@@ -0,0 +1,330 @@
+import sqlite3
+import unittest
+from decimal import Decimal
+
+import pytest
+from symbolchain.CryptoTypes import Hash256
+
+from bridge.api.EstimateCache import DEFAULT_FEE_TTL_SECONDS, DEFAULT_MAX_AGE_SECONDS, DEFAULT_MAX_FEE_ENTRY_COUNT, EstimateCache
+from bridge.db.WrapRequestDatabase import PayoutDetails, WrapRequestDatabase
+
+from ..test.BridgeTestUtils import HASHES, make_request
+from ..test.MockNetworkFacade import MockNemNetworkFacade, MockSymbolNetworkFacade
+
+
+class MockDatabase:
+	def __init__(self, max_processed_height, payout_state_id=None):
+		self.height = max_processed_height
+		self.payout_state = payout_state_id
+
+	def max_processed_height(self):
+		return self.height
+
+	def payout_state_id(self):
+		return self.payout_state
+
+
+class MockDatabases:
+	# pylint: disable=too-many-arguments, too-many-positional-arguments
+	def __init__(
+		self,
+		balance_change_height=100,
+		wrap_request_height=200,
+		unwrap_request_height=300,
+		wrap_request_payout_state_id=(1, 2),
+		unwrap_request_payout_state_id=(3, 4)
+	):
+		self.balance_change = MockDatabase(balance_change_height)
+		self.wrap_request = MockDatabase(wrap_request_height, wrap_request_payout_state_id)
+		self.unwrap_request = MockDatabase(unwrap_request_height, unwrap_request_payout_state_id)
+
+
+class MockTimeProvider:
+	def __init__(self):
+		self.time = 1000
+
+	def __call__(self):
+		return self.time
+
+
+def _create_cache(time_provider=None):
+	return EstimateCache(60, 15, 3, time_provider or MockTimeProvider())
+
+
+def _make_create(values):
+	def create():
+		values.append(f'value {len(values)}')
+		return values[-1]
+
+	return create
+
+
+def _make_estimate(fees):
+	async def estimate():
+		fees.append(len(fees) + 1000)
+		return fees[-1]
+
+	return estimate
+
+
+class EstimateCacheTest(unittest.TestCase):
+	# region constructor
+
+	def test_can_create_cache_with_defaults(self):
+		# Act:
+		cache = EstimateCache()
+
+		# Assert:
+		self.assertEqual(DEFAULT_MAX_AGE_SECONDS, cache.max_age_seconds)
+		self.assertEqual(DEFAULT_FEE_TTL_SECONDS, cache.fee_ttl_seconds)
+		self.assertEqual(DEFAULT_MAX_FEE_ENTRY_COUNT, cache.max_fee_entry_count)
+
+	def test_can_create_cache_with_custom_values(self):
+		# Act:
+		cache = _create_cache()
+
+		# Assert:
+		self.assertEqual(60, cache.max_age_seconds)
+		self.assertEqual(15, cache.fee_ttl_seconds)
+		self.assertEqual(3, cache.max_fee_entry_count)
+
+	# endregion
+
+	# region get_or_create
+
+	def test_get_or_create_creates_value_when_empty(self):
+		# Arrange:
+		cache = _create_cache()
+		values = []
+
+		# Act:
+		value = cache.get_or_create(False, MockDatabases(), Decimal('1.5'), _make_create(values))
+
+		# Assert:
+		self.assertEqual('value 0', value)
+		self.assertEqual(['value 0'], values)
+
+	def test_get_or_create_reuses_value_when_heights_and_fee_multiplier_are_unchanged(self):
+		# Arrange:
+		time_provider = MockTimeProvider()
+		cache = _create_cache(time_provider)
+		values = []
+		cache.get_or_create(False, MockDatabases(), Decimal('1.5'), _make_create(values))
+
+		# Act:
+		time_provider.time += 59
+		value = cache.get_or_create(False, MockDatabases(), Decimal('1.5'), _make_create(values))
+
+		# Assert:
+		self.assertEqual('value 0', value)
+		self.assertEqual(['value 0'], values)
+
+	def test_get_or_create_keeps_separate_values_per_mode(self):
+		# Arrange:
+		cache = _create_cache()
+		values = []
+
+		# Act:
+		value_1 = cache.get_or_create(False, MockDatabases(), None, _make_create(values))
+		value_2 = cache.get_or_create(True, MockDatabases(), None, _make_create(values))
+		value_3 = cache.get_or_create(False, MockDatabases(), None, _make_create(values))
+		value_4 = cache.get_or_create(True, MockDatabases(), None, _make_create(values))
+
+		# Assert:
+		self.assertEqual(['value 0', 'value 1', 'value 0', 'value 1'], [value_1, value_2, value_3, value_4])
+		self.assertEqual(['value 0', 'value 1'], values)
+
+	def _assert_get_or_create_recreates_value_when_key_changes(self, databases, fee_multiplier):
+		# Arrange:
+		cache = _create_cache()
+		values = []
+		cache.get_or_create(False, MockDatabases(), Decimal('1.5'), _make_create(values))
+
+		# Act:
+		value_1 = cache.get_or_create(False, databases, fee_multiplier, _make_create(values))
+		value_2 = cache.get_or_create(False, databases, fee_multiplier, _make_create(values))
+
+		# Assert:
+		self.assertEqual(['value 1', 'value 1'], [value_1, value_2])
+		self.assertEqual(['value 0', 'value 1'], values)
+
+	def test_get_or_create_recreates_value_when_balance_change_height_changes(self):
+		self._assert_get_or_create_recreates_value_when_key_changes(MockDatabases(balance_change_height=101), Decimal('1.5'))
+
+	def test_get_or_create_recreates_value_when_wrap_request_height_changes(self):
+		self._assert_get_or_create_recreates_value_when_key_changes(MockDatabases(wrap_request_height=201), Decimal('1.5'))
+
+	def test_get_or_create_recreates_value_when_unwrap_request_height_changes(self):
+		self._assert_get_or_create_recreates_value_when_key_changes(MockDatabases(unwrap_request_height=301), Decimal('1.5'))
+
+	def test_get_or_create_recreates_value_when_wrap_request_payout_state_changes(self):
+		self._assert_get_or_create_recreates_value_when_key_changes(MockDatabases(wrap_request_payout_state_id=(2, 2)), Decimal('1.5'))
+
+	def test_get_or_create_recreates_value_when_unwrap_request_payout_state_changes(self):
+		self._assert_get_or_create_recreates_value_when_key_changes(MockDatabases(unwrap_request_payout_state_id=(3, 5)), Decimal('1.5'))
+
+	def test_get_or_create_recreates_value_when_fee_multiplier_changes(self):
+		self._assert_get_or_create_recreates_value_when_key_changes(MockDatabases(), Decimal('2.5'))
+
+	def test_get_or_create_recreates_value_when_payout_is_sent(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			wrap_request_database = WrapRequestDatabase(connection, MockNemNetworkFacade(), MockSymbolNetworkFacade())
+			wrap_request_database.create_tables()
+			wrap_request_database.add_request(make_request(0))
+
+			databases = MockDatabases()
+			databases.wrap_request = wrap_request_database
+
+			cache = _create_cache()
+			values = []
+			cache.get_or_create(False, databases, Decimal('1.5'), _make_create(values))
+
+			# Act: sending a payout changes the gross amounts but not the max processed height
+			wrap_request_database.mark_payout_sent(make_request(0), PayoutDetails(Hash256(HASHES[1]), 1100, 300, 12))
+			value = cache.get_or_create(False, databases, Decimal('1.5'), _make_create(values))
+
+			# Assert:
+			self.assertEqual('value 1', value)
+			self.assertEqual(['value 0', 'value 1'], values)
+
+	def test_get_or_create_recreates_value_when_max_age_is_reached(self):
+		# Arrange:
+		time_provider = MockTimeProvider()
+		cache = _create_cache(time_provider)
+		values = []
+		cache.get_or_create(False, MockDatabases(), Decimal('1.5'), _make_create(values))
+
+		# Act:
+		time_provider.time += 60
+		value = cache.get_or_create(False, MockDatabases(), Decimal('1.5'), _make_create(values))
+
+		# Assert:
+		self.assertEqual('value 1', value)
+		self.assertEqual(['value 0', 'value 1'], values)
+
+	def test_get_or_create_does_not_cache_value_when_create_raises(self):
+		# Arrange:
+		cache = _create_cache()
+		values = []
+
+		def create_failure():
+			raise RuntimeError('create failed')
+
+		# Act:
+		with self.assertRaises(RuntimeError):
+			cache.get_or_create(False, MockDatabases(), Decimal('1.5'), create_failure)
+
+		value = cache.get_or_create(False, MockDatabases(), Decimal('1.5'), _make_create(values))
+
+		# Assert:
+		self.assertEqual('value 0', value)
+		self.assertEqual(['value 0'], values)
+
+	# endregion
+
+
+# region get_or_estimate_fee
+
+async def test_get_or_estimate_fee_estimates_fee_when_empty():
+	# Arrange:
+	cache = _create_cache()
+	fees = []
+
+	# Act:
+	fee = await cache.get_or_estimate_fee(('foo', 1234), _make_estimate(fees))
+
+	# Assert:
+	assert 1000 == fee
+	assert [1000] == fees
+
+
+async def test_get_or_estimate_fee_reuses_fee_within_ttl():
+	# Arrange:
+	time_provider = MockTimeProvider()
+	cache = _create_cache(time_provider)
+	fees = []
+	estimate = _make_estimate(fees)
+	await cache.get_or_estimate_fee(('foo', 1234), estimate)
+
+	# Act:
+	time_provider.time += 14
+	fee = await cache.get_or_estimate_fee(('foo', 1234), estimate)
+
+	# Assert:
+	assert 1000 == fee
+	assert [1000] == fees
+
+
+async def test_get_or_estimate_fee_estimates_fee_for_different_key():
+	# Arrange:
+	cache = _create_cache()
+	fees = []
+	estimate = _make_estimate(fees)
+	await cache.get_or_estimate_fee(('foo', 1234), estimate)
+
+	# Act:
+	fee_1 = await cache.get_or_estimate_fee(('foo', 1235), estimate)
+	fee_2 = await cache.get_or_estimate_fee(('bar', 1234), estimate)
+
+	# Assert:
+	assert [1001, 1002] == [fee_1, fee_2]
+	assert [1000, 1001, 1002] == fees
+
+
+async def test_get_or_estimate_fee_estimates_fee_when_ttl_is_reached():
+	# Arrange:
+	time_provider = MockTimeProvider()
+	cache = _create_cache(time_provider)
+	fees = []
+	estimate = _make_estimate(fees)
+	await cache.get_or_estimate_fee(('foo', 1234), estimate)
+
+	# Act:
+	time_provider.time += 15
+	fee = await cache.get_or_estimate_fee(('foo', 1234), estimate)
+
+	# Assert:
+	assert 1001 == fee
+	assert [1000, 1001] == fees
+
+
+async def test_get_or_estimate_fee_evicts_oldest_fees_when_full():
+	# Arrange:
+	time_provider = MockTimeProvider()
+	cache = _create_cache(time_provider)
+	fees = []
+	estimate = _make_estimate(fees)
+	for key in ('a', 'b', 'c', 'd'):
+		await cache.get_or_estimate_fee(key, estimate)
+		time_provider.time += 1
+
+	# Act:
+	fee_b = await cache.get_or_estimate_fee('b', estimate)
+	fee_a = await cache.get_or_estimate_fee('a', estimate)
+
+	# Assert: only 'a' was evicted (and re-estimated) because cache holds at most three fees
+	assert 1001 == fee_b
+	assert 1004 == fee_a
+	assert [1000, 1001, 1002, 1003, 1004] == fees
+
+
+async def test_get_or_estimate_fee_does_not_cache_fee_when_estimate_raises():
+	# Arrange:
+	cache = _create_cache()
+	fees = []
+
+	async def estimate_failure():
+		raise RuntimeError('estimate failed')
+
+	# Act:
+	with pytest.raises(RuntimeError):
+		await cache.get_or_estimate_fee(('foo', 1234), estimate_failure)
+
+	fee = await cache.get_or_estimate_fee(('foo', 1234), _make_estimate(fees))
+
+	# Assert:
+	assert 1000 == fee
+	assert [1000] == fees
+
+# endregion
@@ -9,8 +9,10 @@ from pathlib import Path
 
 import pytest
 
+import bridge.api
 from bridge.api import create_app
 from bridge.db.Databases import Databases
+from bridge.db.DatabasesPool import DatabasesPool
 
 from ..test.BridgeTestUtils import HASHES, NEM_ADDRESSES, SYMBOL_ADDRESSES, assert_timestamp_within_last_second
 from ..test.DatabaseTestUtils import (
@@ -360,6 +362,10 @@ async def _assert_filtering_route_validates_parameters(client, is_unwrap, base_p
 		await _assert_is_bad_request_get(client, f'{filter_base_path}?offset=5&limit=7&sort=z', {
 			'errorCode': 'INVALID_REQUEST_PARAMS', 'error': 'sort parameter is invalid'
 		})
+		for page_cursor in (f'12:{HASHES[0]}', f'12:{HASHES[0][:-1]}:0', f'12:{HASHES[0]}:-', f'z:{HASHES[0]}:0', f'12:{HASHES[0]}:1:2'):
+			await _assert_is_bad_request_get(client, f'{filter_base_path}?offset=5&limit=7&cursor={page_cursor}', {
+				'errorCode': 'INVALID_REQUEST_PARAMS', 'error': 'cursor parameter is invalid'
+			})
 
 	# Act + Assert:
 	# - address filter
@@ -616,6 +622,40 @@ async def _assert_can_filter_by_address_with_custom_offset_and_limit_and_custom_
 	await loop.run_in_executor(None, test_impl)
 
 
+async def _assert_can_filter_by_address_with_cursor(client, base_path, is_unwrap, sort):
+	# pylint: disable=redefined-outer-name
+	def test_impl():
+		# Arrange:
+		test_params = get_default_filtering_test_parameters()
+		address_filter = (SYMBOL_ADDRESSES if is_unwrap else NEM_ADDRESSES)[test_params.address_index]
+		_seed_multiple_requests(client.database_directory, is_unwrap)
+
+		def get_page(query):
+			response = client.get(f'{base_path}{address_filter}?limit=4&sort={sort}{query}')
+			_assert_json_response_success(response)
+			return json.loads(response.data)
+
+		# Act: build each cursor from the request key of the last item of the previous page
+		heights = []
+		page_cursor = None
+		for _ in range(3):
+			response_json = get_page(f'&cursor={page_cursor}' if page_cursor else '')
+			heights.extend(int(view_json['requestTransactionHeight']) for view_json in response_json)
+
+			last_view_json = response_json[-1]
+			page_cursor = ':'.join([
+				last_view_json['requestTransactionHeight'],
+				last_view_json['requestTransactionHash'],
+				str(last_view_json['requestTransactionSubindex'])
+			])
+
+		# Assert:
+		expected_heights = test_params.expected_address_filter if sort else list(reversed(test_params.expected_address_filter))
+		assert expected_heights[:12] == heights
+
+	loop = asyncio.get_running_loop()
+	await loop.run_in_executor(None, test_impl)
+
 # endregion
 
 
@@ -787,6 +827,14 @@ async def test_can_query_wrap_requests_with_custom_offset_and_limit_and_custom_s
 	await _assert_can_filter_by_address_with_custom_offset_and_limit_and_custom_sort(client, '/wrap/requests/', False)
 
 
+async def test_can_query_wrap_requests_with_cursor(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/wrap/requests/', False, 1)
+
+
+async def test_can_query_wrap_requests_with_cursor_and_custom_sort(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/wrap/requests/', False, 0)
+
+
 async def test_can_query_wrap_requests_n2n(client_n2n):  # pylint: disable=redefined-outer-name
 	await _assert_is_route_accessible_get(client_n2n, f'/wrap/requests/{NEM_ADDRESSES[2]}')
 
@@ -880,6 +928,14 @@ async def test_can_query_unwrap_requests_with_custom_offset_and_limit_and_custom
 	await _assert_can_filter_by_address_with_custom_offset_and_limit_and_custom_sort(client, '/unwrap/requests/', True)
 
 
+async def test_can_query_unwrap_requests_with_cursor(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/unwrap/requests/', True, 1)
+
+
+async def test_can_query_unwrap_requests_with_cursor_and_custom_sort(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/unwrap/requests/', True, 0)
+
+
 async def test_cannot_query_unwrap_requests_n2n(client_n2n):  # pylint: disable=redefined-outer-name
 	await _assert_not_is_route_accessible_get(client_n2n, '/unwrap/requests/0x4838b106fce9647bdf1e7877bf73ce8b0bad5f97')
 
@@ -944,6 +1000,14 @@ async def test_can_query_wrap_errors_with_custom_offset_and_limit_and_custom_sor
 	await _assert_can_filter_by_address_with_custom_offset_and_limit_and_custom_sort(client, '/wrap/errors/', False)
 
 
+async def test_can_query_wrap_errors_with_cursor(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/wrap/errors/', False, 1)
+
+
+async def test_can_query_wrap_errors_with_cursor_and_custom_sort(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/wrap/errors/', False, 0)
+
+
 async def test_can_query_wrap_errors_n2n(client_n2n):  # pylint: disable=redefined-outer-name
 	await _assert_is_route_accessible_get(client_n2n, f'/wrap/errors/{NEM_ADDRESSES[2]}')
 
@@ -1008,6 +1072,14 @@ async def test_can_query_unwrap_errors_with_custom_offset_and_limit_and_custom_s
 	await _assert_can_filter_by_address_with_custom_offset_and_limit_and_custom_sort(client, '/unwrap/errors/', True)
 
 
+async def test_can_query_unwrap_errors_with_cursor(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/unwrap/errors/', True, 1)
+
+
+async def test_can_query_unwrap_errors_with_cursor_and_custom_sort(client):  # pylint: disable=redefined-outer-name
+	await _assert_can_filter_by_address_with_cursor(client, '/unwrap/errors/', True, 0)
+
+
 async def test_cannot_query_unwrap_errors_n2n(client_n2n):  # pylint: disable=redefined-outer-name
 	await _assert_not_is_route_accessible_get(client_n2n, '/unwrap/errors/0x4838b106fce9647bdf1e7877bf73ce8b0bad5f97')
 
@@ -1114,6 +1186,37 @@ async def test_can_estimate_wrap(client):  # pylint: disable=redefined-outer-nam
 	await loop.run_in_executor(None, test_impl)
 
 
+async def test_estimate_wrap_returns_databases_to_pool_before_estimating_fees(client, monkeypatch):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	events = []
+	checkin = DatabasesPool._checkin  # pylint: disable=protected-access
+	estimate_balance_transfer_fees = bridge.api.estimate_balance_transfer_fees
+
+	def checkin_and_record(pool, databases):
+		events.append('checkin')
+		checkin(pool, databases)
+
+	async def estimate_and_record(*args):
+		events.append('estimate')
+		return await estimate_balance_transfer_fees(*args)
+
+	monkeypatch.setattr(DatabasesPool, '_checkin', checkin_and_record)
+	monkeypatch.setattr(bridge.api, 'estimate_balance_transfer_fees', estimate_and_record)
+
+	def test_impl():
+		_seed_database_for_estimate_tests(client.database_directory)
+
+		# Act:
+		response = client.post('/wrap/estimate', json={'amount': '1234000000', 'recipientAddress': SYMBOL_ADDRESSES[2]})
+
+		# Assert:
+		_assert_json_response_success(response)
+		assert ['checkin', 'estimate'] == events
+
+	loop = asyncio.get_running_loop()
+	await loop.run_in_executor(None, test_impl)
+
+
 async def test_can_estimate_wrap_n2n(client_n2n):  # pylint: disable=redefined-outer-name
 	def test_impl():
 		# Arrange:
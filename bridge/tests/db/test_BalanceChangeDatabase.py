@@ -1,6 +1,8 @@
+import asyncio
 import sqlite3
 import unittest
 
+import pytest
 from symbolchain.CryptoTypes import Hash256
 
 from bridge.db.BalanceChangeDatabase import BalanceChangeDatabase
@@ -16,10 +18,21 @@ def make_transfer_tuple(height, currency, amount, transaction_hash_index, use_ty
 	transaction_hash = Hash256(HASHES[transaction_hash_index])
 	return (height, currency, amount, transaction_hash if use_typed_hash else transaction_hash.bytes)
 
+
+_BALANCE_CHANGES = [
+	BalanceChange('1111', 'foo.bar', 1111, Hash256(HASHES[0])),
+	BalanceChange('1111', 'alpha.beta', 1234, Hash256(HASHES[2])),
+	BalanceChange('2222', 'foo.bar', 2222, Hash256(HASHES[1])),
+	BalanceChange('2222', 'alpha.beta', 9876, Hash256(HASHES[3])),
+	BalanceChange('1111', 'foo.bar', 5533, Hash256(HASHES[4]))
+]
+
 # endregion
 
 
 class BalanceChangeDatabaseTest(unittest.TestCase):
+	# pylint: disable=too-many-public-methods
+
 	# region shared test utils
 
 	@staticmethod
@@ -52,7 +65,7 @@ class BalanceChangeDatabaseTest(unittest.TestCase):
 		table_names = get_all_table_names(BalanceChangeDatabase)
 
 		# Assert:
-		self.assertEqual(set(['transfer', 'max_processed_height']), table_names)
+		self.assertEqual(set(['transfer', 'transfer_balance', 'max_processed_height']), table_names)
 
 	# endregion
 
@@ -80,13 +93,7 @@ class BalanceChangeDatabaseTest(unittest.TestCase):
 			database.create_tables()
 
 			# Act:
-			add_count = database.add_transfers_filtered_by_address(1234, [
-				BalanceChange('1111', 'foo.bar', 1111, Hash256(HASHES[0])),
-				BalanceChange('1111', 'alpha.beta', 1234, Hash256(HASHES[2])),
-				BalanceChange('2222', 'foo.bar', 2222, Hash256(HASHES[1])),
-				BalanceChange('2222', 'alpha.beta', 9876, Hash256(HASHES[3])),
-				BalanceChange('1111', 'foo.bar', 5533, Hash256(HASHES[4]))
-			], target_address)
+			add_count = database.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES, target_address)
 
 			# Assert:
 			cursor = connection.cursor()
@@ -110,6 +117,155 @@ class BalanceChangeDatabaseTest(unittest.TestCase):
 
 	# endregion
 
+	# region add_transfer_rows
+
+	def test_can_add_transfer_rows(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			database.set_max_processed_height(1000)
+
+			# Act:
+			database.add_transfer_rows([make_transfer_tuple(1111, 'foo.bar', 123, 0), make_transfer_tuple(2345, 'foo.bar', 222, 1)])
+
+			# Assert:
+			self.assertEqual(
+				[make_transfer_tuple(2345, 'foo.bar', 222, 1), make_transfer_tuple(1111, 'foo.bar', 123, 0)],
+				self._query_all_transfers(connection.cursor()))
+			self.assertEqual(1000, database.max_processed_height())
+
+	def test_can_add_transfer_rows_with_max_processed_height(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			database.set_max_processed_height(1000)
+
+			# Act:
+			database.add_transfer_rows([make_transfer_tuple(1111, 'foo.bar', 123, 0)], 2000)
+
+			# Assert:
+			self.assertEqual([make_transfer_tuple(1111, 'foo.bar', 123, 0)], self._query_all_transfers(connection.cursor()))
+			self.assertEqual(2000, database.max_processed_height())
+
+	def test_add_transfer_rows_failure_writes_nothing(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			database.set_max_processed_height(1000)
+
+			# Act: second row is malformed
+			with self.assertRaises(sqlite3.Error):
+				database.add_transfer_rows([make_transfer_tuple(1111, 'foo.bar', 123, 0), (2345, 'foo.bar', 222)], 2000)
+
+			# Assert: first row and running balance were rolled back
+			self.assertEqual([], self._query_all_transfers(connection.cursor()))
+			self.assertEqual(0, database.balance_at(1000, 'foo.bar'))
+			self.assertEqual(1000, database.max_processed_height())
+
+			# - a later transaction does not commit any partial writes
+			database.set_max_processed_height(3000)
+			self.assertEqual([], self._query_all_transfers(connection.cursor()))
+
+	# endregion
+
+	# region create_batch_writer
+
+	def test_batch_writer_buffers_filtered_transfers_until_batch_is_full(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			batch_writer = database.create_batch_writer(1111, 3)
+
+			# Act:
+			add_count = batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:3])
+
+			# Assert:
+			self.assertEqual(2, add_count)
+			self.assertEqual(2, batch_writer.pending_count)
+			self.assertEqual([], self._query_all_transfers(connection.cursor()))
+
+	def test_batch_writer_writes_filtered_transfers_when_batch_is_full(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			batch_writer = database.create_batch_writer(1111, 3)
+
+			# Act:
+			add_count1 = batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:3])
+			add_count2 = batch_writer.add_transfers_filtered_by_address(1235, _BALANCE_CHANGES[3:])
+
+			# Assert:
+			self.assertEqual((2, 1), (add_count1, add_count2))
+			self.assertEqual(0, batch_writer.pending_count)
+			self.assertEqual([
+				make_transfer_tuple(1235, 'foo.bar', 5533, 4),
+				make_transfer_tuple(1234, 'foo.bar', 1111, 0),
+				make_transfer_tuple(1234, 'alpha.beta', 1234, 2)
+			], self._query_all_transfers(connection.cursor()))
+			self.assertEqual(0, database.max_processed_height())
+
+	def test_batch_writer_flush_writes_pending_transfers_and_max_processed_height(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			batch_writer = database.create_batch_writer(1111)
+			batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:3])
+
+			# Act:
+			batch_writer.flush(1240)
+
+			# Assert:
+			self.assertEqual(1000, batch_writer.batch_size)
+			self.assertEqual(0, batch_writer.pending_count)
+			self.assertEqual([
+				make_transfer_tuple(1234, 'foo.bar', 1111, 0),
+				make_transfer_tuple(1234, 'alpha.beta', 1234, 2)
+			], self._query_all_transfers(connection.cursor()))
+			self.assertEqual(1240, database.max_processed_height())
+
+	def test_batch_writer_flush_failure_keeps_pending_transfers(self):
+		# Arrange: reject all transfers at height 1235
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			connection.execute('''
+				CREATE TRIGGER reject_transfer BEFORE INSERT ON transfer WHEN NEW.height = 1235
+				BEGIN SELECT RAISE(ABORT, 'rejected'); END
+			''')
+
+			batch_writer = database.create_batch_writer(1111)
+			batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:3])
+			batch_writer.add_transfers_filtered_by_address(1235, _BALANCE_CHANGES[3:])
+
+			# Act:
+			with self.assertRaises(sqlite3.Error):
+				batch_writer.flush(1240)
+
+			# Assert: nothing was written and all transfers are still buffered
+			self.assertEqual(3, batch_writer.pending_count)
+			self.assertEqual([], self._query_all_transfers(connection.cursor()))
+			self.assertEqual(0, database.max_processed_height())
+
+			# - a retry writes all transfers once the failure is resolved
+			connection.execute('''DROP TRIGGER reject_transfer''')
+			batch_writer.flush(1240)
+
+			self.assertEqual(0, batch_writer.pending_count)
+			self.assertEqual([
+				make_transfer_tuple(1235, 'foo.bar', 5533, 4),
+				make_transfer_tuple(1234, 'foo.bar', 1111, 0),
+				make_transfer_tuple(1234, 'alpha.beta', 1234, 2)
+			], self._query_all_transfers(connection.cursor()))
+			self.assertEqual(1240, database.max_processed_height())
+
+	# endregion
+
 	# region is_synced_at_height / balance_at
 
 	@staticmethod
@@ -153,9 +309,11 @@ class BalanceChangeDatabaseTest(unittest.TestCase):
 
 			# Act:
 			balance = database.balance_at(height, currency)
+			calculated_balance = database.calculate_balance_at(height, currency)
 
 			# Assert:
 			self.assertEqual(expected_balance, balance)
+			self.assertEqual(expected_balance, calculated_balance)
 
 	def test_balance_at_fails_when_empty(self):
 		# Arrange:
@@ -181,6 +339,50 @@ class BalanceChangeDatabaseTest(unittest.TestCase):
 		self._assert_balance_at('foo.bar', 7777, 344)
 		self._assert_balance_at('foo.bar', 8888, 344)
 
+	def test_balance_at_returns_zero_for_unknown_currency(self):
+		self._assert_balance_at('gamma.delta', 8888, 0)
+
+	def test_balance_at_is_isolated_by_currency(self):
+		self._assert_balance_at('alpha.beta', 5554, 0)
+		self._assert_balance_at('alpha.beta', 5555, 123)
+		self._assert_balance_at('alpha.beta', 7777, 345)
+
+	def test_balance_at_is_consistent_with_calculated_balance_when_transfers_are_added_out_of_order(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = BalanceChangeDatabase(connection)
+			database.create_tables()
+			database.set_max_processed_height(100)
+
+			# Act: add transfers individually and in batches with repeated heights
+			database.add_transfer(50, 'foo.bar', 5, Hash256(HASHES[0]))
+			database.add_transfer_rows([
+				make_transfer_tuple(20, 'foo.bar', 7, 1),
+				make_transfer_tuple(80, 'foo.bar', -3, 2),
+				make_transfer_tuple(20, 'foo.bar', 11, 3)
+			])
+			database.add_transfer(50, 'foo.bar', 13, Hash256(HASHES[4]))
+			database.add_transfer(10, 'foo.bar', 17, Hash256(HASHES[0]))
+
+			# Assert:
+			for height in range(0, 101):
+				self.assertEqual(database.calculate_balance_at(height, 'foo.bar'), database.balance_at(height, 'foo.bar'), f'at {height}')
+
+			self.assertEqual(50, database.balance_at(100, 'foo.bar'))
+
+	def test_balances_are_rebuilt_when_missing(self):
+		# Arrange: simulate a database created before running balances were tracked
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database_for_balance_at_tests(connection)
+			connection.execute('''DROP TABLE transfer_balance''')
+
+			# Act:
+			database.create_tables()
+
+			# Assert:
+			for (currency, height, expected_balance) in [('foo.bar', 2345, 444), ('foo.bar', 8888, 344), ('alpha.beta', 7777, 345)]:
+				self.assertEqual(expected_balance, database.balance_at(height, currency))
+
 	def test_balance_at_fails_for_queries_past_max_processed_height(self):
 		# Arrange:
 		for height in [8889, 10000]:
@@ -190,6 +392,10 @@ class BalanceChangeDatabaseTest(unittest.TestCase):
 				# Act + Assert:
 				with self.assertRaisesRegex(ValueError, f'requested balance at {height} beyond current database height 8888'):
 					database.balance_at(height, 'foo.bar')
+
+				with self.assertRaisesRegex(ValueError, f'requested balance at {height} beyond current database height 8888'):
+					database.calculate_balance_at(height, 'foo.bar')
+
 	# endregion
 
 	# region partial_balance_at
@@ -344,4 +550,95 @@ class BalanceChangeDatabaseTest(unittest.TestCase):
 				[(12345678900 + delta, 'foo.bar', delta, Hash256(HASHES[delta % len(HASHES)]).bytes) for delta in (4, 3, 2)],
 				actual_transfers)
 
+			cursor.execute('''SELECT * FROM transfer_balance ORDER BY height''')
+			self.assertEqual([('foo.bar', 12345678902, 2), ('foo.bar', 12345678903, 5), ('foo.bar', 12345678904, 9)], cursor.fetchall())
+
+			# - running balances continue from the last balance that was kept
+			database.add_transfer(12345678906, 'foo.bar', 6, Hash256(HASHES[0]))
+			database.set_max_processed_height(12345678906)
+			self.assertEqual(15, database.balance_at(12345678906, 'foo.bar'))
+
 	# endregion
+
+
+# region create_batch_writer (async)
+
+def _query_all_transfer_heights(connection):
+	cursor = connection.cursor()
+	cursor.execute('''SELECT height FROM transfer ORDER BY height''')
+	return [row[0] for row in cursor]
+
+
+async def test_batch_writer_flushes_periodically():
+	# Arrange:
+	with sqlite3.connect(':memory:') as connection:
+		database = BalanceChangeDatabase(connection)
+		database.create_tables()
+
+		async with database.create_batch_writer(1111, flush_interval_seconds=0.01) as batch_writer:
+			batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:1])
+
+			# Act:
+			await asyncio.sleep(0.05)
+
+			# Assert:
+			assert 0 == batch_writer.pending_count
+			assert [1234] == _query_all_transfer_heights(connection)
+
+
+async def test_batch_writer_flushes_pending_transfers_on_exit():
+	# Arrange:
+	with sqlite3.connect(':memory:') as connection:
+		database = BalanceChangeDatabase(connection)
+		database.create_tables()
+
+		# Act:
+		async with database.create_batch_writer(1111, flush_interval_seconds=60) as batch_writer:
+			batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:1])
+
+		# Assert:
+		assert 0 == batch_writer.pending_count
+		assert [1234] == _query_all_transfer_heights(connection)
+		assert 0 == database.max_processed_height()
+
+
+async def test_batch_writer_drops_pending_transfers_on_failure():
+	# Arrange:
+	with sqlite3.connect(':memory:') as connection:
+		database = BalanceChangeDatabase(connection)
+		database.create_tables()
+
+		# Act:
+		with pytest.raises(RuntimeError):
+			async with database.create_batch_writer(1111, flush_interval_seconds=60) as batch_writer:
+				batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:1])
+				raise RuntimeError('download failed')
+
+		# Assert:
+		assert [] == _query_all_transfer_heights(connection)
+
+
+async def test_batch_writer_periodic_flush_failure_stops_writer():
+	# Arrange: reject all transfers at height 1234
+	with sqlite3.connect(':memory:') as connection:
+		database = BalanceChangeDatabase(connection)
+		database.create_tables()
+		connection.execute('''
+			CREATE TRIGGER reject_transfer BEFORE INSERT ON transfer WHEN NEW.height = 1234
+			BEGIN SELECT RAISE(ABORT, 'rejected'); END
+		''')
+
+		with pytest.raises(sqlite3.Error):
+			async with database.create_batch_writer(1111, flush_interval_seconds=0.01) as batch_writer:
+				batch_writer.add_transfers_filtered_by_address(1234, _BALANCE_CHANGES[:1])
+				await asyncio.sleep(0.05)
+
+				# Act:
+				batch_writer.add_transfers_filtered_by_address(1235, _BALANCE_CHANGES[1:])
+
+		# Assert: the failed transfer is still buffered and nothing was written
+		assert 1 == batch_writer.pending_count
+		assert [] == _query_all_transfer_heights(connection)
+		assert 0 == database.max_processed_height()
+
+# endregion
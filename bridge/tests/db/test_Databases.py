@@ -1,18 +1,23 @@
+import datetime
 import sqlite3
 import tempfile
 import unittest
+from collections import namedtuple
 
 from symbolchain.CryptoTypes import Hash256
 
 from bridge.db.Databases import Databases
+from bridge.models.BridgeConfiguration import NetworkConfiguration
 
+from ..test.BridgeTestUtils import HASHES
+from ..test.DatabaseTestUtils import add_requests_unwrap, add_transfers
 from ..test.MockNetworkFacade import MockNemNetworkFacade, MockSymbolNetworkFacade
 
 
 class DatabasesTest(unittest.TestCase):
 	@staticmethod
-	def _create_databases(database_directory, is_read_only=False):
-		return Databases(database_directory, MockNemNetworkFacade(), MockSymbolNetworkFacade(), is_read_only)
+	def _create_databases(database_directory, is_read_only=False, is_attach_enabled=True):
+		return Databases(database_directory, MockNemNetworkFacade(), MockSymbolNetworkFacade(), is_read_only, is_attach_enabled)
 
 	def test_can_create(self):
 		# Arrange:
@@ -70,3 +75,128 @@ class DatabasesTest(unittest.TestCase):
 					# - ro database cannot make changes
 					with self.assertRaises(sqlite3.OperationalError):
 						read_only_databases.balance_change.add_transfer(2345, 'foo.bar', 9999, Hash256.zero())
+
+	def test_can_connect_attached(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			# Act:
+			with self._create_databases(temp_directory) as databases:
+				# Assert:
+				self.assertTrue(databases.is_attached)
+
+	def test_can_connect_without_attaching(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			# Act:
+			with self._create_databases(temp_directory, is_attach_enabled=False) as databases:
+				# Assert:
+				self.assertFalse(databases.is_attached)
+
+	def test_can_connect_without_attaching_when_attach_fails(self):
+		# Arrange: corrupt one database so that it cannot be attached
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with open(f'{temp_directory}/balance_change.db', 'wb') as outfile:
+				outfile.write(b'not a database' * 100)
+
+			# Act:
+			with self._create_databases(temp_directory) as databases:
+				# Assert:
+				self.assertFalse(databases.is_attached)
+
+	@staticmethod
+	def _prepare_databases_for_unwrapped_balance_tests(databases):
+		databases.create_tables()
+		add_transfers(databases.balance_change, [
+			(1100, 1000, None),
+			(1500, -100, HASHES[0]),
+			(1500, -200, HASHES[1]),
+			(2200, -300, HASHES[2]),
+			(2300, -400, HASHES[3])
+		])
+
+		add_requests_unwrap(databases.unwrap_request, [
+			(800, 100, HASHES[0]),
+			(800, 200, HASHES[1]),
+			(900, 300, HASHES[2]),
+			(950, 400, HASHES[3]),
+			(990, 500, None)  # not sent
+		])
+		databases.unwrap_request.set_block_timestamp(800, 9500)
+		databases.unwrap_request.set_block_timestamp(900, 10500)
+		databases.unwrap_request.set_block_timestamp(950, 10600)
+		databases.unwrap_request.set_block_timestamp(990, 10700)
+
+	@staticmethod
+	def _nem_to_unix_timestamp(timestamp):
+		return int(datetime.datetime(2015, 3, 29, 0, 6, 25, tzinfo=datetime.timezone.utc).timestamp()) + timestamp
+
+	def _assert_unwrapped_balances(self, is_attach_enabled):
+		# Arrange: use same native and wrapped networks so that network timestamps can be used directly
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with Databases(temp_directory, MockNemNetworkFacade(), MockNemNetworkFacade(), False, is_attach_enabled) as databases:
+				self._prepare_databases_for_unwrapped_balance_tests(databases)
+
+				for (height, timestamp, expected_balance) in [
+					(1499, 20000, 0),  # no payouts confirmed
+					(1500, 9499, 0),  # no payouts requested
+					(1500, 9500, 300),
+					(1500, 20000, 300),
+					(2200, 10499, 300),  # payout confirmed but requested after timestamp
+					(2200, 10500, 600),
+					(2300, 10599, 600),
+					(2300, 20000, 1000)
+				]:
+					# Act:
+					balance = databases.unwrapped_balance_at(height, 'foo:bar', self._nem_to_unix_timestamp(timestamp))
+
+					# Assert:
+					self.assertEqual(is_attach_enabled, databases.is_attached)
+					self.assertEqual(expected_balance, balance, f'at height {height} and timestamp {timestamp}')
+
+				# - balance changes of other currencies are ignored
+				self.assertEqual(0, databases.unwrapped_balance_at(2300, 'foo:baz', self._nem_to_unix_timestamp(20000)))
+
+	def test_can_calculate_unwrapped_balance_at_attached(self):
+		self._assert_unwrapped_balances(True)
+
+	def test_can_calculate_unwrapped_balance_at_not_attached(self):
+		self._assert_unwrapped_balances(False)
+
+	def test_unwrapped_balance_at_uses_indexes_when_attached(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with self._create_databases(temp_directory) as databases:
+				databases.create_tables()
+
+				# Act:
+				cursor = databases._attached_connection.cursor()  # pylint: disable=protected-access
+				cursor.execute('''
+					EXPLAIN QUERY PLAN
+					SELECT 1 FROM balance_change.transfer WHERE transaction_hash = ? AND currency IS ? AND height <= ?
+				''', (b'', 'foo:bar', 0))
+				query_plan = ' '.join(row[-1] for row in cursor)
+
+				# Assert:
+				self.assertIn('USING INDEX transfer_transaction_hash', query_plan)
+
+	def test_can_open_block_timestamp_cache(self):
+		# Arrange:
+		MockNetworkFacadeWithConfig = namedtuple('MockNetworkFacadeWithConfig', ['config'])  # pylint: disable=invalid-name
+		nem_facade = MockNetworkFacadeWithConfig(NetworkConfiguration('nem', 'testnet', None, None, None, {}))
+		symbol_facade = MockNetworkFacadeWithConfig(NetworkConfiguration('symbol', 'testnet', None, None, None, {}))
+
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with self._create_databases(temp_directory) as databases:
+				with databases.open_block_timestamp_cache(nem_facade) as cache:
+					cache.add_all([(100, 1000)], 100)
+
+				# Act:
+				with databases.open_block_timestamp_cache(nem_facade) as cache:
+					nem_timestamp = cache.timestamp(100)
+
+				with databases.open_block_timestamp_cache(symbol_facade) as cache:
+					symbol_timestamp = cache.timestamp(100)
+
+			# Assert: timestamps are persisted per network
+			self.assertEqual(1000, nem_timestamp)
+			self.assertIsNone(symbol_timestamp)
@@ -0,0 +1,204 @@
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from symbolchain.CryptoTypes import Hash256
+
+from bridge.db.Databases import Databases
+from bridge.db.DatabasesPool import DatabasesPool
+
+from ..test.MockNetworkFacade import MockNemNetworkFacade, MockSymbolNetworkFacade
+
+
+class DatabasesPoolTest(unittest.TestCase):
+	@staticmethod
+	def _create_tables(database_directory):
+		with Databases(database_directory, MockNemNetworkFacade(), MockSymbolNetworkFacade()) as databases:
+			databases.create_tables()
+
+	@staticmethod
+	def _create_pool(database_directory, max_size=2, mmap_size=1024 * 1024):
+		return DatabasesPool(database_directory, MockNemNetworkFacade(), MockSymbolNetworkFacade(), max_size, mmap_size)
+
+	def _run_in_thread(self, action):
+		results = []
+		thread = threading.Thread(target=lambda: results.append(action()))
+		thread.start()
+		thread.join()
+
+		self.assertEqual(1, len(results))
+		return results[0]
+
+	# region constructor
+
+	def test_can_create_pool(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			# Act:
+			pool = self._create_pool(temp_directory, 3)
+
+			# Assert: databases are opened lazily
+			self.assertEqual(3, pool.max_size)
+			self.assertEqual(0, pool.size)
+
+	def test_cannot_create_pool_with_non_positive_max_size(self):
+		for max_size in (0, -1):
+			with self.assertRaises(ValueError):
+				self._create_pool('foo', max_size)
+
+	# endregion
+
+	# region acquire
+
+	def test_can_acquire_read_only_databases(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			self._create_tables(temp_directory)
+			pool = self._create_pool(temp_directory)
+
+			# Act:
+			with pool.acquire() as databases:
+				# Assert:
+				self.assertEqual(0, databases.wrap_request.max_processed_height())
+				self.assertTrue(databases.is_attached)
+
+				for connection in (databases.balance_change.connection, databases.wrap_request.connection):
+					self.assertEqual(1, connection.execute('PRAGMA query_only').fetchone()[0])
+					self.assertEqual(1024 * 1024, connection.execute('PRAGMA mmap_size').fetchone()[0])
+
+				with self.assertRaises(sqlite3.OperationalError):
+					databases.wrap_request.set_max_processed_height(1234)
+
+			self.assertEqual(1, pool.size)
+			pool.close()
+
+	def test_acquire_reuses_databases(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			self._create_tables(temp_directory)
+			pool = self._create_pool(temp_directory)
+
+			# Act:
+			with pool.acquire() as databases_1:
+				pass
+
+			with pool.acquire() as databases_2:
+				pass
+
+			# Assert:
+			self.assertIs(databases_1, databases_2)
+			self.assertEqual(1, pool.size)
+			pool.close()
+
+	def test_acquire_reuses_databases_across_threads(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			self._create_tables(temp_directory)
+			pool = self._create_pool(temp_directory)
+
+			def acquire_and_query():
+				with pool.acquire() as databases:
+					return (databases, databases.wrap_request.max_processed_height())
+
+			# Act:
+			(databases_1, height_1) = self._run_in_thread(acquire_and_query)
+			(databases_2, height_2) = self._run_in_thread(acquire_and_query)
+
+			# Assert:
+			self.assertIs(databases_1, databases_2)
+			self.assertEqual([0, 0], [height_1, height_2])
+			pool.close()
+
+	def test_acquire_sees_changes_made_after_databases_are_opened(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with Databases(temp_directory, MockNemNetworkFacade(), MockSymbolNetworkFacade()) as writable_databases:
+				writable_databases.create_tables()
+				pool = self._create_pool(temp_directory)
+
+				with pool.acquire() as databases:
+					databases.balance_change.max_processed_height()
+
+				writable_databases.balance_change.add_transfer(1234, 'foo:bar', 8888, Hash256.zero())
+				writable_databases.balance_change.set_max_processed_height(1234)
+
+				# Act:
+				with pool.acquire() as databases:
+					balance = databases.balance_change.balance_at(1234, 'foo:bar')
+
+				# Assert:
+				self.assertEqual(8888, balance)
+				pool.close()
+
+	def test_acquire_opens_distinct_databases_for_concurrent_users_up_to_max_size(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			self._create_tables(temp_directory)
+			pool = self._create_pool(temp_directory)
+
+			is_third_acquired = threading.Event()
+
+			def acquire_third():
+				with pool.acquire() as databases:
+					is_third_acquired.set()
+					return databases
+
+			# Act:
+			with pool.acquire() as databases_1:
+				with pool.acquire() as databases_2:
+					thread = threading.Thread(target=acquire_third)
+					thread.start()
+
+					# Assert: third acquire blocks until one of the databases is returned
+					self.assertFalse(is_third_acquired.wait(0.1))
+					self.assertIsNot(databases_1, databases_2)
+
+			thread.join()
+
+			self.assertTrue(is_third_acquired.is_set())
+			self.assertEqual(2, pool.size)
+			pool.close()
+
+	def test_acquire_returns_databases_when_user_raises(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			self._create_tables(temp_directory)
+			pool = self._create_pool(temp_directory, 1)
+
+			# Act:
+			with self.assertRaises(RuntimeError):
+				with pool.acquire():
+					raise RuntimeError('request failed')
+
+			with pool.acquire() as databases:
+				height = databases.wrap_request.max_processed_height()
+
+			# Assert:
+			self.assertEqual(0, height)
+			self.assertEqual(1, pool.size)
+			pool.close()
+
+	# endregion
+
+	# region close
+
+	def test_can_close_all_databases(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			self._create_tables(temp_directory)
+			pool = self._create_pool(temp_directory)
+
+			with pool.acquire() as databases_1:
+				with pool.acquire():
+					pass
+
+			# Act:
+			pool.close()
+
+			# Assert:
+			self.assertEqual(0, pool.size)
+			with self.assertRaises(sqlite3.ProgrammingError):
+				databases_1.wrap_request.max_processed_height()
+
+	# endregion
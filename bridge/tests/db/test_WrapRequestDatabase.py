@@ -8,7 +8,14 @@ from symbolchain.CryptoTypes import Hash256, PublicKey
 from symbolchain.nem.Network import Address
 from symbolchain.symbol.Network import Address as SymbolAddress
 
-from bridge.db.WrapRequestDatabase import PayoutDetails, WrapRequestDatabase, WrapRequestErrorView, WrapRequestStatus, WrapRequestView
+from bridge.db.WrapRequestDatabase import (
+	PayoutDetails,
+	RequestCursor,
+	WrapRequestDatabase,
+	WrapRequestErrorView,
+	WrapRequestStatus,
+	WrapRequestView
+)
 from bridge.models.WrapRequest import make_next_retry_wrap_request
 
 from ..test.BridgeTestUtils import (
@@ -195,7 +202,8 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 
 		# Assert:
 		self.assertEqual(set([
-			'wrap_error', 'wrap_request', 'payout_transaction', 'block_metadata', 'payout_block_metadata', 'max_processed_height'
+			'wrap_error', 'wrap_request', 'payout_transaction', 'block_metadata', 'payout_block_metadata', 'cumulative_gross_amount',
+			'max_processed_height'
 		]), table_names)
 
 	# endregion
@@ -300,6 +308,136 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 
 	# endregion
 
+	# region add_batch
+
+	def test_can_add_batch(self):
+		# Arrange:
+		def post_insert_action(database):
+			database.add_batch([make_request_error(0, 'error message')], [make_request(1), make_request(2)])
+
+		# Act + Assert:
+		self._assert_can_insert_rows(
+			{'errors': [], 'requests': []},
+			{
+				'errors': [make_request_error_tuple(0, 'error message')],
+				'requests': [make_request_tuple(index) for index in [1, 2]]
+			},
+			post_insert_action)
+
+	def test_can_add_batch_with_max_processed_height(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+
+			# Act:
+			database.add_batch([make_request_error(0, 'error message')], [make_request(1)], 1234)
+
+			# Assert:
+			cursor = connection.cursor()
+			self.assertEqual([make_request_error_tuple(0, 'error message')], self._query_all_errors(cursor))
+			self._assert_equal_requests([make_request_tuple(1)], self._query_all_requests(cursor))
+			self.assertEqual(1234, database.max_processed_height())
+
+	def test_cannot_add_batch_with_duplicate_request(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			database.set_max_processed_height(1000)
+
+			# Act + Assert:
+			with self.assertRaises(sqlite3.IntegrityError):
+				database.add_batch([make_request_error(0, 'error message')], [make_request(1), make_request(2, hash_index=1)], 1234)
+
+			# - nothing from the failed batch is committed
+			connection.commit()
+			cursor = connection.cursor()
+			self.assertEqual([], self._query_all_errors(cursor))
+			self.assertEqual([], self._query_all_requests(cursor))
+			self.assertEqual(1000, database.max_processed_height())
+
+	# endregion
+
+	# region create_batch_writer
+
+	def test_batch_writer_buffers_rows_until_batch_is_full(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			batch_writer = database.create_batch_writer(3)
+
+			# Act:
+			batch_writer.add_request(make_request(0))
+			batch_writer.add_error(make_request_error(1, 'error message'))
+
+			# Assert:
+			self.assertEqual(3, batch_writer.batch_size)
+			self.assertEqual(2, batch_writer.pending_count)
+
+			cursor = connection.cursor()
+			self.assertEqual([], self._query_all_errors(cursor))
+			self.assertEqual([], self._query_all_requests(cursor))
+
+	def test_batch_writer_writes_rows_when_batch_is_full(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			batch_writer = database.create_batch_writer(3)
+
+			# Act:
+			batch_writer.add_request(make_request(0))
+			batch_writer.add_error(make_request_error(1, 'error message'))
+			batch_writer.add_request(make_request(2))
+			batch_writer.add_request(make_request(3))
+
+			# Assert:
+			self.assertEqual(1, batch_writer.pending_count)
+
+			cursor = connection.cursor()
+			self.assertEqual([make_request_error_tuple(1, 'error message')], self._query_all_errors(cursor))
+			self._assert_equal_requests([make_request_tuple(index) for index in [0, 2]], self._query_all_requests(cursor))
+			self.assertEqual(0, database.max_processed_height())
+
+	def test_batch_writer_flush_writes_pending_rows_and_max_processed_height(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			batch_writer = database.create_batch_writer(3)
+
+			batch_writer.add_request(make_request(0))
+			batch_writer.add_error(make_request_error(1, 'error message'))
+
+			# Act:
+			batch_writer.flush(1234)
+
+			# Assert:
+			self.assertEqual(0, batch_writer.pending_count)
+
+			cursor = connection.cursor()
+			self.assertEqual([make_request_error_tuple(1, 'error message')], self._query_all_errors(cursor))
+			self._assert_equal_requests([make_request_tuple(0)], self._query_all_requests(cursor))
+			self.assertEqual(1234, database.max_processed_height())
+
+	def test_batch_writer_flush_can_set_max_processed_height_without_pending_rows(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			batch_writer = database.create_batch_writer()
+
+			# Act:
+			batch_writer.flush(1234)
+
+			# Assert:
+			self.assertEqual(1000, batch_writer.batch_size)
+			self.assertEqual(1234, database.max_processed_height())
+
+	# endregion
+
 	# region requests
 
 	@staticmethod
@@ -342,7 +480,7 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 
 	# endregion
 
-	# region is_synced_at_timestamp
+	# region max_processed_timestamp, is_synced_at_timestamp
 
 	@staticmethod
 	def _create_database_for_is_synced_at_timestamp_tests(connection):
@@ -362,6 +500,31 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 		database.set_max_processed_height(444)
 		return database
 
+	def test_can_get_max_processed_timestamp(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database_for_is_synced_at_timestamp_tests(connection)
+
+			# Act:
+			max_processed_timestamp = database.max_processed_timestamp()
+
+			# Assert:
+			self.assertEqual(self._nem_to_unix_timestamp(5000), max_processed_timestamp)
+
+	def test_max_processed_timestamp_is_zero_when_no_blocks_are_processed(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+
+			database.set_block_timestamp(111, 1000)
+
+			# Act:
+			max_processed_timestamp = database.max_processed_timestamp()
+
+			# Assert:
+			self.assertEqual(0, max_processed_timestamp)
+
 	def test_is_synced_at_timestamp_is_only_true_when_timestamp_is_not_greater_than_max_processed_timestamp(self):
 		# Arrange:
 		with sqlite3.connect(':memory:') as connection:
@@ -398,9 +561,18 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 		return (database, requests)
 
 	@staticmethod
-	def _prepare_database_for_batch_tests(connection, payout_descriptor_tuples, retry_index=2):
+	def _set_batch_tests_block_timestamps(database):
+		database.set_block_timestamp(111, 1000)
+		database.set_block_timestamp(222, 2000)
+		database.set_block_timestamp(333, 4000)
+
+	@staticmethod
+	def _prepare_database_for_batch_tests(connection, payout_descriptor_tuples, retry_index=2, set_timestamps_first=False):
 		(database, requests) = WrapRequestDatabaseTest._prepare_database_for_batch_tests_requests_only(connection)
 
+		if set_timestamps_first:
+			WrapRequestDatabaseTest._set_batch_tests_block_timestamps(database)
+
 		for index, extra_params in payout_descriptor_tuples:
 			database.mark_payout_sent(requests[index], _make_payout_details(Hash256(HASHES[index]), **extra_params))
 
@@ -410,9 +582,9 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 					make_next_retry_wrap_request(requests[retry_index]),
 					_make_payout_details(Hash256(HASHES[-1]), **extra_params))
 
-		database.set_block_timestamp(111, 1000)
-		database.set_block_timestamp(222, 2000)
-		database.set_block_timestamp(333, 4000)
+		if not set_timestamps_first:
+			WrapRequestDatabaseTest._set_batch_tests_block_timestamps(database)
+
 		return database
 
 	def test_cumulative_gross_amount_at_is_zero_when_empty(self):
@@ -427,37 +599,107 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 			# Assert:
 			self.assertEqual(0, amount)
 
-	def _assert_cumulative_gross_amount_at_is_calculated_correctly_at_timestamps(self, timestamp_amount_pairs):
+	_BATCH_TESTS_PAYOUT_DESCRIPTOR_TUPLES = [
+		(0, {'net_amount': 100, 'total_fee': 43}),
+		(1, {'net_amount': 300, 'total_fee': 21}),
+		(2, {'net_amount': 200, 'total_fee': 32}),
+		(3, {'net_amount': 400, 'total_fee': 10})
+	]
+
+	_BATCH_TESTS_TIMESTAMP_AMOUNT_PAIRS = [
+		(999, 0),
+		(1000, 100 + 43),
+		(1001, 100 + 43),
+
+		(1999, 100 + 43),
+		(2000, 700 + 85),
+		(2001, 700 + 85),
+
+		(3999, 700 + 85),
+		(4000, 1000 + 106),
+		(4001, 1000 + 106)
+	]
+
+	def _assert_cumulative_gross_amounts_at_timestamps(self, database, timestamp_amount_pairs):
+		for (timestamp, expected_amount) in timestamp_amount_pairs:
+			# Act:
+			amount = database.cumulative_gross_amount_at(self._nem_to_unix_timestamp(timestamp))
+			calculated_amount = database.calculate_cumulative_gross_amount_at(self._nem_to_unix_timestamp(timestamp))
+
+			# Assert:
+			self.assertEqual(expected_amount, amount, f'at timestamp {timestamp}')
+			self.assertEqual(expected_amount, calculated_amount, f'at timestamp {timestamp}')
+
+	def _assert_cumulative_gross_amount_at_is_calculated_correctly_at_timestamps(self, timestamp_amount_pairs, **kwargs):
 		# Arrange:
 		with sqlite3.connect(':memory:') as connection:
-			database = self._prepare_database_for_batch_tests(connection, [
-				(0, {'net_amount': 100, 'total_fee': 43}),
-				(1, {'net_amount': 300, 'total_fee': 21}),
-				(2, {'net_amount': 200, 'total_fee': 32}),
-				(3, {'net_amount': 400, 'total_fee': 10})
+			database = self._prepare_database_for_batch_tests(connection, self._BATCH_TESTS_PAYOUT_DESCRIPTOR_TUPLES, **kwargs)
+
+			# Act + Assert:
+			self._assert_cumulative_gross_amounts_at_timestamps(database, timestamp_amount_pairs)
+
+	def test_cumulative_gross_amount_at_is_calculated_correctly_when_requests_present(self):
+		self._assert_cumulative_gross_amount_at_is_calculated_correctly_at_timestamps(self._BATCH_TESTS_TIMESTAMP_AMOUNT_PAIRS)
+
+	def test_cumulative_gross_amount_at_is_calculated_correctly_when_block_timestamps_are_set_before_payouts(self):
+		self._assert_cumulative_gross_amount_at_is_calculated_correctly_at_timestamps(
+			self._BATCH_TESTS_TIMESTAMP_AMOUNT_PAIRS,
+			set_timestamps_first=True)
+
+	def test_cumulative_gross_amount_at_includes_failed_payouts_that_are_not_retried(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._prepare_database_for_batch_tests(connection, self._BATCH_TESTS_PAYOUT_DESCRIPTOR_TUPLES)
+
+			# Act:
+			database.mark_payout_failed(make_request(1, amount=3333, height=333), 'permanent failure')
+
+			# Assert:
+			self._assert_cumulative_gross_amounts_at_timestamps(database, self._BATCH_TESTS_TIMESTAMP_AMOUNT_PAIRS)
+
+	def test_cumulative_gross_amount_at_moves_amounts_when_block_timestamp_changes(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._prepare_database_for_batch_tests(connection, self._BATCH_TESTS_PAYOUT_DESCRIPTOR_TUPLES)
+
+			# Act:
+			database.set_block_timestamps([(222, 3000), (444, 5000)])
+
+			# Assert:
+			self._assert_cumulative_gross_amounts_at_timestamps(database, [
+				(1000, 100 + 43),
+				(2000, 100 + 43),
+				(3000, 700 + 85),
+				(4000, 1000 + 106)
 			])
 
-			for (timestamp, expected_amount) in timestamp_amount_pairs:
-				# Act:
-				amount = database.cumulative_gross_amount_at(self._nem_to_unix_timestamp(timestamp))
+	def test_cumulative_gross_amount_at_excludes_requests_deleted_by_reset(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._prepare_database_for_batch_tests(connection, self._BATCH_TESTS_PAYOUT_DESCRIPTOR_TUPLES)
+			database.set_max_processed_height(222)
 
-				# Assert:
-				self.assertEqual(expected_amount, amount, f'at timestamp {timestamp}')
+			# Act:
+			database.reset()
 
-	def test_cumulative_gross_amount_at_is_calculated_correctly_when_requests_present(self):
-		self._assert_cumulative_gross_amount_at_is_calculated_correctly_at_timestamps([
-			(999, 0),
-			(1000, 100 + 43),
-			(1001, 100 + 43),
+			# Assert:
+			self._assert_cumulative_gross_amounts_at_timestamps(database, [
+				(1000, 100 + 43),
+				(2000, 700 + 85),
+				(4000, 700 + 85)
+			])
 
-			(1999, 100 + 43),
-			(2000, 700 + 85),
-			(2001, 700 + 85),
+	def test_cumulative_gross_amounts_are_rebuilt_when_missing(self):
+		# Arrange: simulate a database created before cumulative gross amounts were tracked
+		with sqlite3.connect(':memory:') as connection:
+			database = self._prepare_database_for_batch_tests(connection, self._BATCH_TESTS_PAYOUT_DESCRIPTOR_TUPLES)
+			connection.execute('''DROP TABLE cumulative_gross_amount''')
 
-			(3999, 700 + 85),
-			(4000, 1000 + 106),
-			(4001, 1000 + 106)
-		])
+			# Act:
+			database.create_tables()
+
+			# Assert:
+			self._assert_cumulative_gross_amounts_at_timestamps(database, self._BATCH_TESTS_TIMESTAMP_AMOUNT_PAIRS)
 
 	# endregion
 
@@ -614,6 +856,57 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 
 	# endregion
 
+	# region payout_state_id
+
+	def _assert_payout_state_id_changes(self, seed_requests, update_payouts):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+
+			for seed_request in seed_requests:
+				database.add_request(seed_request)
+
+			payout_state_id_before = database.payout_state_id()
+
+			# Act:
+			update_payouts(database)
+			payout_state_id_after = database.payout_state_id()
+
+			# Assert:
+			self.assertNotEqual(payout_state_id_before, payout_state_id_after)
+			self.assertEqual(payout_state_id_after, database.payout_state_id())
+
+	def test_payout_state_id_is_zero_when_empty(self):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+
+			# Act:
+			payout_state_id = database.payout_state_id()
+
+			# Assert:
+			self.assertEqual((0, 0), payout_state_id)
+
+	def test_payout_state_id_changes_when_payout_is_sent(self):
+		payout_transaction_hash = Hash256(HASHES[3])
+		self._assert_payout_state_id_changes(
+			[make_request(index) for index in range(0, 3)],
+			lambda database: database.mark_payout_sent(make_request(1), _make_payout_details(payout_transaction_hash, 1100, 300)))
+
+	def test_payout_state_id_changes_when_payout_fails(self):
+		self._assert_payout_state_id_changes(
+			[make_request(index) for index in range(0, 3)],
+			lambda database: database.mark_payout_failed(make_request(1), 'failed to send payout'))
+
+	def test_payout_state_id_changes_when_payout_fails_transiently(self):
+		self._assert_payout_state_id_changes(
+			[make_request(index) for index in range(0, 3)],
+			lambda database: database.mark_payout_failed_transient(make_request(1), 'failed to send payout'))
+
+	# endregion
+
 	# region mark_payout_sent
 
 	def test_can_mark_payout_sent_single(self):
@@ -983,7 +1276,7 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 
 	# endregion
 
-	# region set_block_timestamp / lookup_block_timestamp / lookup_block_height
+	# region set_block_timestamp / lookup_block_timestamp / lookup_block_height / lookup_last_block_height
 
 	def test_can_set_block_timestamp(self):
 		# Arrange:
@@ -1006,6 +1299,18 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 			(1122, self._nem_to_unix_timestamp(77553))
 		], post_insert_action=post_insert_action)
 
+	def test_can_set_block_timestamps(self):
+		# Arrange:
+		def post_insert_action(database):
+			database.set_block_timestamp(1122, 98765)
+			database.set_block_timestamps([(1133, 88776), (1122, 77553)])
+
+		# Act + Assert:
+		self._assert_can_insert_requests([], [], expected_block_metadatas=[
+			(1133, self._nem_to_unix_timestamp(88776)),
+			(1122, self._nem_to_unix_timestamp(77553))
+		], post_insert_action=post_insert_action)
+
 	@staticmethod
 	def _create_database_for_block_metadata_lookup_tests(connection):
 		database = WrapRequestDatabaseTest._create_database(connection)
@@ -1063,6 +1368,70 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 			(4001, 333)
 		])
 
+	def _assert_lookup_last_block_heights(self, height_timestamp_height_tuples, is_timestamp_inclusive=True):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database_for_block_metadata_lookup_tests(connection)
+
+			for (height, timestamp, expected_height) in height_timestamp_height_tuples:
+				# Act:
+				last_height = database.lookup_last_block_height(height, self._nem_to_unix_timestamp(timestamp), is_timestamp_inclusive)
+
+				# Assert:
+				self.assertEqual(expected_height, last_height, f'at height {height} and timestamp {timestamp}')
+
+	def test_can_lookup_last_block_height_bounded_by_height(self):
+		self._assert_lookup_last_block_heights([
+			(110, 9000, 0),
+			(111, 9000, 111),
+			(221, 9000, 111),
+			(222, 9000, 222),
+			(1000, 9000, 333)
+		])
+
+	def test_can_lookup_last_block_height_bounded_by_timestamp(self):
+		self._assert_lookup_last_block_heights([
+			(1000, 999, 0),
+			(1000, 1000, 111),
+			(1000, 3999, 222),
+			(1000, 4000, 333)
+		])
+
+	def test_can_lookup_last_block_height_bounded_by_height_and_timestamp(self):
+		self._assert_lookup_last_block_heights([
+			(221, 4000, 111),
+			(333, 2000, 222),
+			(110, 4000, 0)
+		])
+
+	def test_can_lookup_last_block_height_bounded_by_exclusive_timestamp(self):
+		self._assert_lookup_last_block_heights([
+			(1000, 1000, 0),
+			(1000, 1001, 111),
+			(1000, 4000, 222),
+			(1000, 4001, 333),
+			(221, 4001, 111)
+		], is_timestamp_inclusive=False)
+
+	def _assert_lookup_block_timestamp_after(self, height, expected_timestamp):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database_for_block_metadata_lookup_tests(connection)
+
+			# Act:
+			timestamp = database.lookup_block_timestamp_after(height)
+
+			# Assert:
+			self.assertEqual(expected_timestamp, timestamp)
+
+	def test_can_lookup_block_timestamp_after_when_present(self):
+		self._assert_lookup_block_timestamp_after(0, self._nem_to_unix_timestamp(1000))
+		self._assert_lookup_block_timestamp_after(111, self._nem_to_unix_timestamp(2000))
+		self._assert_lookup_block_timestamp_after(300, self._nem_to_unix_timestamp(4000))
+
+	def test_cannot_lookup_block_timestamp_after_last_block(self):
+		self._assert_lookup_block_timestamp_after(333, None)
+
 	# endregion
 
 	# region set_payout_block_metadata
@@ -1498,3 +1867,182 @@ class WrapRequestDatabaseTest(unittest.TestCase):
 		], test_params.expected_custom_offset_and_limit_desc)
 
 	# endregion
+
+	# region find_errors, find_requests - page cursor
+
+	@staticmethod
+	def _to_page_cursor(view):
+		return RequestCursor(view.request_transaction_height, view.request_transaction_hash, view.request_transaction_subindex)
+
+	def _assert_can_find_with_page_cursor(self, seed, find, expected_heights):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			seed(database)
+
+			# Act: build each cursor from the last view of the previous page
+			heights = []
+			page_cursor = None
+			for _ in range(3):
+				views = list(find(database, page_cursor))
+				heights.extend(view.request_transaction_height for view in views)
+				page_cursor = self._to_page_cursor(views[-1])
+
+			# Assert:
+			self.assertEqual(expected_heights, heights)
+
+	def test_can_find_errors_with_page_cursor(self):
+		test_params = get_default_filtering_test_parameters()
+		address = Address(NEM_ADDRESSES[test_params.address_index])
+		self._assert_can_find_with_page_cursor(
+			seed_database_with_many_errors,
+			lambda database, page_cursor: database.find_errors(address, None, 0, 3, True, page_cursor),
+			test_params.expected_address_filter[:9])
+
+	def test_can_find_errors_with_page_cursor_and_custom_sort(self):
+		test_params = get_default_filtering_test_parameters()
+		address = Address(NEM_ADDRESSES[test_params.address_index])
+		self._assert_can_find_with_page_cursor(
+			seed_database_with_many_errors,
+			lambda database, page_cursor: database.find_errors(address, None, 0, 3, False, page_cursor),
+			list(reversed(test_params.expected_address_filter))[:9])
+
+	def test_can_find_requests_with_page_cursor(self):
+		test_params = get_default_filtering_test_parameters()
+		address = Address(NEM_ADDRESSES[test_params.address_index])
+		self._assert_can_find_with_page_cursor(
+			seed_database_with_many_requests,
+			lambda database, page_cursor: database.find_requests(address, None, 0, 3, True, None, page_cursor),
+			test_params.expected_address_filter[:9])
+
+	def test_can_find_requests_with_page_cursor_and_custom_sort(self):
+		test_params = get_default_filtering_test_parameters()
+		address = Address(NEM_ADDRESSES[test_params.address_index])
+		self._assert_can_find_with_page_cursor(
+			seed_database_with_many_requests,
+			lambda database, page_cursor: database.find_requests(address, None, 0, 3, False, None, page_cursor),
+			list(reversed(test_params.expected_address_filter))[:9])
+
+	def test_can_find_requests_with_page_cursor_and_payout_status(self):
+		test_params = get_default_filtering_test_parameters()
+		self._assert_can_find_with_page_cursor(
+			seed_database_with_many_requests,
+			lambda database, page_cursor: database.find_requests(None, None, 0, 2, True, test_params.payout_status, page_cursor),
+			test_params.expected_payout_status_filter)
+
+	def test_can_find_requests_with_page_cursor_and_offset(self):
+		# Arrange:
+		test_params = get_default_filtering_test_parameters()
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			seed_database_with_many_requests(database)
+
+			page_cursor = self._to_page_cursor(list(database.find_requests(None, None, 0, 3))[-1])
+
+			# Act: offset is applied after cursor
+			views = list(database.find_requests(None, None, 2, 4, True, None, page_cursor))
+			heights = [view.request_transaction_height for view in views]
+
+			# Assert:
+			self.assertEqual(test_params.expected_all[5:9], heights)
+
+	def test_can_find_requests_with_page_cursor_within_same_height(self):
+		# Arrange: requests at same height are ordered by transaction hash and subindex
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			for (hash_index, transaction_subindex) in ((1, 0), (3, 1), (2, 0), (3, 0), (0, 0)):
+				database.add_request(make_request(
+					0,
+					height=1234,
+					hash_index=hash_index,
+					transaction_subindex=transaction_subindex,
+					destination_address=SYMBOL_ADDRESSES[0]))
+
+			# Act:
+			page_keys = []
+			page_cursor = None
+			for _ in range(3):
+				views = list(database.find_requests(None, None, 0, 2, True, None, page_cursor))
+				page_keys.extend((str(view.request_transaction_hash), view.request_transaction_subindex) for view in views)
+				page_cursor = self._to_page_cursor(views[-1])
+
+			# Assert: HASHES are sorted descending
+			self.assertEqual([(HASHES[3], 0), (HASHES[3], 1), (HASHES[2], 0), (HASHES[1], 0), (HASHES[0], 0)], page_keys)
+
+	# endregion
+
+	# region find_errors, find_requests - query plans
+
+	def _get_query_plan(self, find):
+		# Arrange:
+		with sqlite3.connect(':memory:') as connection:
+			database = self._create_database(connection)
+			database.create_tables()
+			seed_database_with_many_requests(database)
+			seed_database_with_many_errors(database)
+
+			statements = []
+			connection.set_trace_callback(statements.append)
+			list(find(database))
+			connection.set_trace_callback(None)
+
+			# Act:
+			self.assertEqual(1, len(statements))
+			cursor = connection.cursor()
+			cursor.execute(f'EXPLAIN QUERY PLAN {statements[0]}')
+			return [row[-1] for row in cursor]
+
+	def _assert_query_plan_uses_indexes(self, find, table_name, expected_index_names):
+		# Act:
+		query_plan = self._get_query_plan(find)
+
+		# Assert: table is never scanned and every filter uses its own index
+		self.assertNotIn(f'SCAN {table_name}', query_plan)
+		for index_name in expected_index_names:
+			self.assertTrue(any(index_name in detail for detail in query_plan), f'{index_name} is not used by {query_plan}')
+
+	def test_find_errors_uses_request_key_index(self):
+		page_cursor = RequestCursor(10, Hash256(HASHES[0]), 0)
+		self._assert_query_plan_uses_indexes(
+			lambda database: database.find_errors(None, None, 0, 25, True, page_cursor),
+			'wrap_error',
+			['wrap_error_request_key_idx'])
+
+	def test_find_errors_by_address_uses_address_index(self):
+		page_cursor = RequestCursor(10, Hash256(HASHES[0]), 0)
+		self._assert_query_plan_uses_indexes(
+			lambda database: database.find_errors(Address(NEM_ADDRESSES[1]), None, 0, 25, False, page_cursor),
+			'wrap_error',
+			['wrap_error_address_request_key_idx'])
+
+	def test_find_requests_uses_request_key_index(self):
+		page_cursor = RequestCursor(10, Hash256(HASHES[0]), 0)
+		self._assert_query_plan_uses_indexes(
+			lambda database: database.find_requests(None, None, 0, 25, True, None, page_cursor),
+			'wrap_request',
+			['wrap_request_request_key_idx'])
+
+	def test_find_requests_by_address_uses_address_and_destination_address_indexes(self):
+		page_cursor = RequestCursor(10, Hash256(HASHES[0]), 0)
+		self._assert_query_plan_uses_indexes(
+			lambda database: database.find_requests(Address(NEM_ADDRESSES[1]), None, 0, 25, False, None, page_cursor),
+			'wrap_request',
+			['wrap_request_address_request_key_idx', 'wrap_request_destination_address_request_key_idx'])
+
+	def test_find_requests_by_transaction_hash_uses_transaction_hash_indexes(self):
+		self._assert_query_plan_uses_indexes(
+			lambda database: database.find_requests(None, Hash256(HASHES[0])),
+			'wrap_request',
+			['(request_transaction_hash=?)', '(payout_transaction_hash=?)'])
+
+	def test_find_requests_by_payout_status_uses_payout_status_index(self):
+		page_cursor = RequestCursor(10, Hash256(HASHES[0]), 0)
+		self._assert_query_plan_uses_indexes(
+			lambda database: database.find_requests(None, None, 0, 25, True, WrapRequestStatus.SENT.value, page_cursor),
+			'wrap_request',
+			['wrap_request_payout_status_request_key_idx'])
+
+	# endregion
@@ -50,6 +50,7 @@ def test_can_create_facade():
 	assert EthereumAddress('0x0D8775F648430679A709E98d2b0Cb6250d2887EF') == facade.transaction_search_address
 	assert 8876 == facade.chain_id
 	assert 18 == facade.native_token_precision
+	assert facade.node_selector is None
 
 
 def test_can_create_facade_for_native_eth():
@@ -64,6 +65,7 @@ def test_can_create_facade_for_native_eth():
 	assert EthereumAddress('0x67b1d87101671b127f5f8714789C7192f7ad340e') == facade.transaction_search_address
 	assert 8876 == facade.chain_id
 	assert 18 == facade.native_token_precision
+	assert facade.node_selector is None
 
 
 async def test_can_initialize_facade(server):  # pylint: disable=redefined-outer-name
@@ -121,6 +123,24 @@ def test_can_create_connector():
 	assert isinstance(connector, EthereumConnector)
 	assert 'http://foo.bar:1234' == connector.endpoint
 	assert connector.is_finalization_supported
+	assert connector.node_selector is None
+
+
+def test_can_create_connector_with_additional_endpoints():
+	# Arrange:
+	config = _create_config(config_extensions={'additional_endpoints': 'http://foo.baz:1234, http://foo.qux:1234'})
+	facade = EthereumNetworkFacade(config)
+
+	# Act:
+	connector1 = facade.create_connector()
+	connector2 = facade.create_connector()
+
+	# Assert: node statistics are shared by all connectors
+	assert isinstance(connector1, EthereumConnector)
+	assert 'http://foo.bar:1234' == connector1.endpoint
+	assert ['http://foo.bar:1234', 'http://foo.baz:1234', 'http://foo.qux:1234'] == connector1.node_selector.endpoints
+	assert facade.node_selector is connector1.node_selector
+	assert facade.node_selector is connector2.node_selector
 
 
 def test_can_create_connector_with_finalization_disabled():
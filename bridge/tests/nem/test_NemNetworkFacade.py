@@ -44,6 +44,7 @@ def test_can_create_facade():
 	assert Address('TCYIHED7HZQ3IPBY5WRDPDLV5CCMMOOVSOMSPD6B') == facade.bridge_address
 	assert Address('TCYIHED7HZQ3IPBY5WRDPDLV5CCMMOOVSOMSPD6B') == facade.transaction_search_address
 	assert 6 == facade.native_token_precision
+	assert facade.node_selector is None
 
 
 async def test_can_initialize_facade(server):  # pylint: disable=redefined-outer-name
@@ -116,20 +117,38 @@ def test_can_create_connector():
 	# Assert:
 	assert isinstance(connector, NemConnector)
 	assert 'http://foo.bar:1234' == connector.endpoint
+	assert connector.node_selector is None
+
+
+def test_can_create_connector_with_additional_endpoints():
+	# Arrange:
+	config = _create_config(config_extensions={'additional_endpoints': 'http://foo.baz:1234'})
+	config.extensions['rosetta_endpoint'] = 'http://rosetta.api:9988'
+	facade = NemNetworkFacade(config)
+
+	# Act:
+	connector = facade.create_connector()
+
+	# Assert:
+	assert isinstance(connector, NemConnector)
+	assert 'http://foo.bar:1234' == connector.endpoint
+	assert ['http://foo.bar:1234', 'http://foo.baz:1234'] == connector.node_selector.endpoints
+	assert facade.node_selector is connector.node_selector
 
 
 def test_can_create_connector_rosetta():
 	# Arrange:
-	config = _create_config()
+	config = _create_config(config_extensions={'additional_endpoints': 'http://foo.baz:1234'})
 	config.extensions['rosetta_endpoint'] = 'http://rosetta.api:9988'
 	facade = NemNetworkFacade(config)
 
 	# Act:
 	connector = facade.create_connector(require_rosetta=True)
 
-	# Assert:
+	# Assert: additional endpoints are not applied to rosetta endpoint
 	assert isinstance(connector, NemConnector)
 	assert 'http://rosetta.api:9988' == connector.endpoint
+	assert connector.node_selector is None
 
 # endregion
 
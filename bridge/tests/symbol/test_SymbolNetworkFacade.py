@@ -5,6 +5,7 @@ from symbolchain import sc
 from symbolchain.CryptoTypes import Hash256, PublicKey
 from symbolchain.symbol.Network import Address, NetworkTimestamp
 from symbollightapi.connector.SymbolConnector import SymbolConnector
+from symbollightapi.connector.SymbolTransactionListener import SymbolTransactionListener
 
 from bridge.models.BridgeConfiguration import NetworkConfiguration
 from bridge.models.WrapRequest import WrapError, WrapRequest
@@ -50,6 +51,7 @@ def test_can_create_facade():
 	assert Address('TDDRDLK5QL2LJPZOF26QFXB24TJ5HGB4NDTF6SI') == facade.bridge_address
 	assert Address('TDDRDLK5QL2LJPZOF26QFXB24TJ5HGB4NDTF6SI') == facade.transaction_search_address
 	assert 6 == facade.native_token_precision
+	assert facade.node_selector is None
 
 
 async def test_can_initialize_facade(server):  # pylint: disable=redefined-outer-name
@@ -146,6 +148,7 @@ async def test_can_create_connector_with_finalization_disabled(server):  # pylin
 	# Assert:
 	assert isinstance(connector, SymbolConnector)
 	assert server.make_url('') == connector.endpoint
+	assert connector.node_selector is None
 
 	# - finalized chain height is NOT used
 	chain_height = await connector.chain_height()
@@ -154,6 +157,42 @@ async def test_can_create_connector_with_finalization_disabled(server):  # pylin
 	assert 1234 == finalized_chain_height
 
 
+async def test_can_create_connector_with_additional_endpoints(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	config = _create_config(server, config_extensions={'additional_endpoints': 'http://localhost:1234'})
+	facade = SymbolNetworkFacade(config)
+
+	# Act:
+	connector = facade.create_connector()
+
+	# Assert:
+	assert isinstance(connector, SymbolConnector)
+	assert server.make_url('') == connector.endpoint
+	assert [server.make_url(''), 'http://localhost:1234'] == connector.node_selector.endpoints
+	assert facade.node_selector is connector.node_selector
+
+	# - requests are answered by the available node
+	chain_height = await connector.chain_height()
+	assert 1234 == chain_height
+
+
+async def test_can_create_connector_with_additional_endpoints_and_finalization_disabled(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	config = _create_config(server, config_extensions={'additional_endpoints': 'http://localhost:1234', 'is_finalization_supported': 'False'})
+	facade = SymbolNetworkFacade(config)
+
+	# Act:
+	connector = facade.create_connector()
+
+	# Assert:
+	assert isinstance(connector, SymbolConnector)
+	assert facade.node_selector is connector.node_selector
+
+	# - finalized chain height is NOT used
+	finalized_chain_height = await connector.finalized_chain_height()
+	assert 1234 == finalized_chain_height
+
+
 async def test_can_create_connector_rosetta(server):  # pylint: disable=redefined-outer-name
 	# Arrange:
 	config = _create_config(server)
@@ -176,6 +215,42 @@ async def test_can_create_connector_rosetta(server):  # pylint: disable=redefine
 # endregion
 
 
+# region create_transaction_listener
+
+SIGNER_PUBLIC_KEY = PublicKey('E94F195D3D88F6FE46CC12C88E6135D21E67826D385966CC67E67AC4960762C9')
+
+
+def test_cannot_create_transaction_listener_by_default():
+	# Arrange:
+	facade = SymbolNetworkFacade(_create_config())
+
+	# Act:
+	listener = facade.create_transaction_listener(SIGNER_PUBLIC_KEY)
+
+	# Assert:
+	assert listener is None
+
+
+def test_can_create_transaction_listener_when_enabled():
+	# Arrange:
+	facade = SymbolNetworkFacade(_create_config(config_extensions={
+		'is_transaction_listener_enabled': 'True',
+		'additional_endpoints': 'http://localhost:1234'
+	}))
+
+	# Act:
+	listener = facade.create_transaction_listener(SIGNER_PUBLIC_KEY)
+
+	# Assert:
+	assert isinstance(listener, SymbolTransactionListener)
+	assert facade.network.public_key_to_address(SIGNER_PUBLIC_KEY) == listener.address
+	assert 'http://foo.bar:1234' == listener.connector.endpoint
+	assert facade.node_selector is listener.connector.node_selector
+	assert not listener.is_connected
+
+# endregion
+
+
 # region make_address, make_public_key
 
 def test_can_make_address():
@@ -1,6 +1,9 @@
 import json
+from binascii import unhexlify
 
 from aiohttp import web
+from symbolchain.facade.SymbolFacade import SymbolFacade
+from symbolchain.sc import TransactionFactory
 
 
 async def create_simple_symbol_client(aiohttp_client, currency_mosaic_id, address_to_balance_map=None):  # pylint: disable=invalid-name
@@ -11,8 +14,13 @@ async def create_simple_symbol_client(aiohttp_client, currency_mosaic_id, addres
 			self.status_group = 'unconfirmed'
 
 			self.request_json_payloads = []
+			self.transaction_status_request_count = 0
 			self.simulate_transaction_status_not_found = False  # pylint: disable=invalid-name
 
+			self.websockets = []
+			self.subscribe_messages = []
+			self.simulate_websocket_unavailable = False
+
 		@staticmethod
 		async def network_properties(request):
 			return await MockSymbolServer._process(request, {
@@ -56,6 +64,7 @@ async def create_simple_symbol_client(aiohttp_client, currency_mosaic_id, addres
 			})
 
 		async def transaction_status(self, request):
+			self.transaction_status_request_count += 1
 			if self.simulate_transaction_status_not_found:
 				return await self._process(request, {'code': 'ResourceNotFound', 'message': 'no resource exists with id'}, 404)
 
@@ -65,8 +74,34 @@ async def create_simple_symbol_client(aiohttp_client, currency_mosaic_id, addres
 		async def announce_transaction(self, request):
 			request_json = await request.json()
 			self.request_json_payloads.append(request_json)
+
+			if not self.simulate_transaction_status_not_found:
+				# notify subscribers that the transaction was added
+				transaction = TransactionFactory.deserialize(unhexlify(request_json['payload']))
+				transaction_hash = SymbolFacade('testnet').hash_transaction(transaction)
+				for subscribe_message in self.subscribe_messages:
+					(channel, address) = subscribe_message['subscribe'].split('/')
+					if f'{self.status_group}Added' == channel:
+						notification_json = {'topic': f'{channel}/{address}', 'data': {'transaction': {}, 'meta': {'hash': str(transaction_hash)}}}
+						for websocket in self.websockets:
+							await websocket.send_json(notification_json)
+
 			return await self._process(request, {'message': 'packet 9 was pushed to the network via /transactions'})
 
+		async def websocket(self, request):
+			if self.simulate_websocket_unavailable:
+				return await self._process(request, {'code': 'ResourceNotFound', 'message': 'no resource exists with id'}, 404)
+
+			websocket = web.WebSocketResponse()
+			await websocket.prepare(request)
+			self.websockets.append(websocket)
+
+			await websocket.send_json({'uid': 'test_uid'})
+			async for message in websocket:
+				self.subscribe_messages.append(message.json())
+
+			return websocket
+
 		@staticmethod
 		async def _process(_request, response_body, status_code=200):
 			return web.Response(body=json.dumps(response_body), headers={'Content-Type': 'application/json'}, status=status_code)
@@ -82,6 +117,7 @@ async def create_simple_symbol_client(aiohttp_client, currency_mosaic_id, addres
 	app.router.add_get(r'/accounts/{account_id}', mock_server.accounts_by_id)
 	app.router.add_get(r'/transactionStatus/{transaction_hash}', mock_server.transaction_status)
 	app.router.add_put('/transactions', mock_server.announce_transaction)
+	app.router.add_get('/ws', mock_server.websocket)
 	server = await aiohttp_client(app)  # pylint: disable=redefined-outer-name
 
 	server.mock = mock_server
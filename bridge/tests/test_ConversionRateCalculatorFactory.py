@@ -598,6 +598,144 @@ class ConversionRateCalculatorFactoryTest(unittest.TestCase):  # pylint: disable
 
 	# endregion
 
+	# region try_create_calculator - reuse
+
+	@staticmethod
+	def _prepare_databases_for_reuse_tests(databases):
+		databases.create_tables()
+		add_transfers(databases.balance_change, [
+			(1111, 300, None),
+			(2222, 200, None)
+		])
+		databases.balance_change.set_max_processed_height(2222)
+
+		add_requests_wrap(databases.wrap_request, [
+			(1111, 297, 3),
+			(2222, 198, 2)
+		])
+		databases.wrap_request.set_max_processed_height(3333)
+		databases.wrap_request.set_block_timestamp(1111, 9000)
+		databases.wrap_request.set_block_timestamp(2222, 10000)
+		databases.wrap_request.set_block_timestamp(3333, 11000)
+
+		databases.unwrap_request.set_max_processed_height(900)
+		databases.unwrap_request.set_block_timestamp(700, 10100)
+		databases.unwrap_request.set_block_timestamp(800, 10500)
+		databases.unwrap_request.set_block_timestamp(900, 11500)
+
+	def test_try_create_calculator_reuses_calculator_at_same_height_wrap_mode(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with _create_databases(temp_directory) as databases:
+				self._prepare_databases_for_reuse_tests(databases)
+				factory = ConversionRateCalculatorFactory(databases, 'foo:bar', False)
+
+				# Act:
+				calculator_1 = factory.try_create_calculator(2222)
+				calculator_2 = factory.try_create_calculator(2222)
+				calculator_3 = factory.try_create_calculator(1111)
+
+				# Assert:
+				self.assertIs(calculator_1, calculator_2)
+				self.assertIsNot(calculator_1, calculator_3)
+
+				self.assertEqual(300, calculator_1.native_balance)
+				self.assertEqual(1, calculator_3.native_balance)
+
+	def test_try_create_calculator_reuses_calculator_at_same_native_height_unwrap_mode(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with _create_databases(temp_directory) as databases:
+				self._prepare_databases_for_reuse_tests(databases)
+				factory = ConversionRateCalculatorFactory(databases, 'foo:bar', True)
+
+				# Act: wrapped heights 700 and 800 both correspond to native height 2222
+				calculator_1 = factory.try_create_calculator(700)
+				calculator_2 = factory.try_create_calculator(800)
+
+				# Assert:
+				self.assertIs(calculator_1, calculator_2)
+				self.assertEqual(500, calculator_1.native_balance)
+
+	def test_try_create_calculator_does_not_reuse_missing_calculator(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with _create_databases(temp_directory) as databases:
+				self._prepare_databases_for_reuse_tests(databases)
+				factory = ConversionRateCalculatorFactory(databases, 'foo:bar', False)
+
+				# Act:
+				calculator_1 = factory.try_create_calculator(3333)
+				databases.balance_change.set_max_processed_height(3333)
+				calculator_2 = factory.try_create_calculator(3333)
+
+				# Assert:
+				self.assertIsNone(calculator_1)
+				self.assertIsNotNone(calculator_2)
+				self.assertEqual(500, calculator_2.native_balance)
+
+	# endregion
+
+	# region create_best_calculator - far behind
+
+	@staticmethod
+	def _count_queries(databases):
+		query_counter = {'count': 0}
+
+		def on_query(_query):
+			query_counter['count'] += 1
+
+		for database in (databases.balance_change, databases.wrap_request, databases.unwrap_request):
+			database.connection.set_trace_callback(on_query)
+
+		return query_counter
+
+	def _assert_can_create_best_calculator_when_balance_change_is_far_behind(self, is_unwrap_mode, expected_height):
+		# Arrange: wrap_request has timestamps for 1000 native blocks but balance_change is only synced through native height 1400
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with _create_databases(temp_directory) as databases:
+				databases.create_tables()
+				add_transfers(databases.balance_change, [
+					(1100, 300, None),
+					(1200, 100, None)
+				])
+				databases.balance_change.set_max_processed_height(1400)
+
+				add_requests_wrap(databases.wrap_request, [
+					(1100, 297, 3)
+				])
+				databases.wrap_request.set_max_processed_height(1999)
+				databases.wrap_request.set_block_timestamps([(height, height * 10) for height in range(1000, 2000)])
+
+				# each wrapped block is produced at the same time as a native block
+				databases.unwrap_request.set_max_processed_height(1999)
+				databases.unwrap_request.set_block_timestamps([(height, height * 20) for height in range(500, 1000)])
+
+				factory = ConversionRateCalculatorFactory(databases, 'foo:bar', is_unwrap_mode)
+				query_counter = self._count_queries(databases)
+
+				# Act:
+				calculator = factory.create_best_calculator()
+
+				# Assert:
+				self.assertEqual(expected_height, calculator.height)
+				self.assertEqual(400, calculator.native_balance)
+				self.assertEqual(300, calculator.wrapped_balance)
+				self.assertEqual(0, calculator.unwrapped_balance)
+
+				self.assertGreater(25, query_counter['count'])  # instead of thousands when probing one height at a time
+
+				# Sanity:
+				self.assertIsNone(factory.try_create_calculator(expected_height + 1))
+
+	def test_can_create_best_calculator_when_balance_change_is_far_behind_wrap_mode(self):
+		self._assert_can_create_best_calculator_when_balance_change_is_far_behind(False, 1400)
+
+	def test_can_create_best_calculator_when_balance_change_is_far_behind_unwrap_mode(self):
+		self._assert_can_create_best_calculator_when_balance_change_is_far_behind(True, 700)
+
+	# endregion
+
 	# region integration - wrap/unwrap
 
 	def test_can_create_calculator_for_wrap_unwrap_integration_1(self):
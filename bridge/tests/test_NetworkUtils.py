@@ -1,3 +1,4 @@
+import asyncio
 from binascii import unhexlify
 from decimal import Decimal
 
@@ -14,6 +15,7 @@ from bridge.NetworkUtils import (
 	BalanceTransfer,
 	FeeInformation,
 	TransactionSender,
+	create_node_selector,
 	download_rosetta_block_balance_changes,
 	estimate_balance_transfer_fees,
 	is_transient_error
@@ -351,6 +353,104 @@ async def test_cannot_send_transaction_that_does_not_transition_to_unconfirmed(s
 # endregion
 
 
+# region TransactionSender - transaction listener
+
+def _create_namespace_registration_transaction():
+	return SymbolFacade(Network.TESTNET).transaction_factory.create({
+		'type': 'namespace_registration_transaction_v1',
+		'signer_public_key': 'E94F195D3D88F6FE46CC12C88E6135D21E67826D385966CC67E67AC4960762C9',
+		'registration_type': 'root',
+		'duration': 123,
+		'name': 'roger'
+	})
+
+
+async def _create_transaction_sender_with_listener(server):  # pylint: disable=redefined-outer-name
+	sender = TransactionSender(SymbolNetworkFacade(_create_config(server, config_extensions={
+		'is_transaction_listener_enabled': 'True'
+	})))
+	await sender.init()
+	return sender
+
+
+async def test_transaction_listener_is_not_created_by_default(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	sender = TransactionSender(SymbolNetworkFacade(_create_config(server)))
+
+	# Act:
+	await sender.init()
+	await sender.close()
+
+	# Assert:
+	assert sender.transaction_listener is None
+	assert [] == server.mock.websockets
+
+
+async def test_can_initialize_transaction_sender_with_transaction_listener(server):  # pylint: disable=redefined-outer-name
+	# Act:
+	sender = await _create_transaction_sender_with_listener(server)
+	is_connected = sender.transaction_listener.is_connected
+	await sender.close()
+
+	# Assert:
+	assert is_connected
+	assert not sender.transaction_listener.is_connected
+	assert 1 == len(server.mock.websockets)
+	assert Address('TA3HQRT33ZVSGTMN3ZTTSFFEA6VLOKD7EREDLXY') == sender.transaction_listener.address
+
+
+async def test_transaction_listener_is_closed_when_leaving_sender_context_with_exception(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	sender = TransactionSender(SymbolNetworkFacade(_create_config(server, config_extensions={
+		'is_transaction_listener_enabled': 'True'
+	})))
+
+	# Act:
+	with pytest.raises(RuntimeError):
+		async with sender:
+			await sender.init()
+			assert sender.transaction_listener.is_connected
+			raise RuntimeError('payout failed')
+
+	# Assert:
+	assert not sender.transaction_listener.is_connected
+
+
+async def test_can_send_transaction_with_transaction_listener(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	sender = await _create_transaction_sender_with_listener(server)
+	while 3 > len(server.mock.subscribe_messages):
+		await asyncio.sleep(0.001)
+
+	# Act:
+	transaction_hash = await sender.send_transaction(_create_namespace_registration_transaction())
+	await sender.close()
+
+	# Assert: unconfirmed notification is received, so status is not polled
+	assert 1 == len(server.mock.request_json_payloads)
+	_decode_and_check_announce_payload(server.mock.request_json_payloads[0], transaction_hash)
+	assert 0 == server.mock.transaction_status_request_count
+	assert 1 == sender.transaction_listener.notification_count
+
+
+async def test_can_send_transaction_with_transaction_listener_when_websocket_is_unavailable(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.mock.simulate_websocket_unavailable = True
+	sender = await _create_transaction_sender_with_listener(server)
+
+	# Act:
+	transaction_hash = await sender.send_transaction(_create_namespace_registration_transaction())
+	await sender.close()
+
+	# Assert: status is polled
+	assert 1 == len(server.mock.request_json_payloads)
+	_decode_and_check_announce_payload(server.mock.request_json_payloads[0], transaction_hash)
+	assert 1 == server.mock.transaction_status_request_count
+	assert 1 == sender.transaction_listener.fallback_count
+
+# endregion
+
+
 # region download_rosetta_block_balance_changes
 
 class MockRosettaConnector:
@@ -358,8 +458,8 @@ class MockRosettaConnector:
 		self.post_requests = []
 		self.post_response = {}
 
-	async def post(self, url_path, request_payload):
-		self.post_requests.append((url_path, request_payload))
+	async def post(self, url_path, request_payload, is_idempotent=False):
+		self.post_requests.append((url_path, request_payload, is_idempotent))
 		return self.post_response
 
 
@@ -401,7 +501,7 @@ def _assert_single_post_request(connector):
 		('block', {
 			'network_identifier': {'blockchain': 'foo', 'network': 'barnet'},
 			'block_identifier': {'index': '1001'}
-		})
+		}, True)
 	] == connector.post_requests
 
 
@@ -570,3 +670,27 @@ def test_is_transient_error_returns_false_for_other_non_transient_errors():
 	assert not is_transient_error(NodeException('some error'))
 
 # endregion
+
+
+# region create_node_selector
+
+def _create_network_configuration(config_extensions):
+	return NetworkConfiguration('symbol', 'testnet', 'http://foo.bar:1234', 'TDDRDLK5QL2LJPZOF26QFXB24TJ5HGB4NDTF6SI', None, config_extensions)
+
+
+def test_create_node_selector_returns_none_without_additional_endpoints():
+	for config_extensions in ({}, {'additional_endpoints': ''}, {'additional_endpoints': ' , '}):
+		assert create_node_selector(_create_network_configuration(config_extensions)) is None, config_extensions
+
+
+def test_create_node_selector_returns_selector_across_all_endpoints():
+	# Arrange:
+	config = _create_network_configuration({'additional_endpoints': 'http://foo.baz:1234, http://foo.qux:1234,'})
+
+	# Act:
+	node_selector = create_node_selector(config)
+
+	# Assert:
+	assert ['http://foo.bar:1234', 'http://foo.baz:1234', 'http://foo.qux:1234'] == node_selector.endpoints
+
+# endregion
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from bridge.WindowedHeightScheduler import WindowedHeightScheduler
+
+# pylint: disable=invalid-name
+
+
+# region MockHeightProcessor
+
+class MockHeightProcessor:
+	def __init__(self, height_to_delay=None, failed_height=None):
+		self.height_to_delay = height_to_delay or {}
+		self.failed_height = failed_height
+
+		self.processed_heights = []
+		self.cancelled_heights = []
+		self.checkpoint_heights = []
+
+		self.active_count = 0
+		self.max_active_count = 0
+
+	async def process(self, height):
+		self.active_count += 1
+		self.max_active_count = max(self.max_active_count, self.active_count)
+		try:
+			await asyncio.sleep(self.height_to_delay.get(height, 0))
+			if self.failed_height == height:
+				raise RuntimeError(f'failed at {height}')
+
+			self.processed_heights.append(height)
+		except asyncio.CancelledError:
+			self.cancelled_heights.append(height)
+			raise
+		finally:
+			self.active_count -= 1
+
+	def checkpoint(self, height):
+		self.checkpoint_heights.append(height)
+
+# endregion
+
+
+# region constructor
+
+def test_can_create_scheduler_with_defaults():
+	# Act:
+	scheduler = WindowedHeightScheduler(100, 200)
+
+	# Assert:
+	assert 100 == scheduler.start_height
+	assert 200 == scheduler.end_height
+	assert 100 == scheduler.window_size
+	assert 1000 == scheduler.checkpoint_interval
+	assert 99 == scheduler.completed_height
+
+
+def test_cannot_create_scheduler_with_non_positive_window_size():
+	for window_size in (0, -1):
+		with pytest.raises(ValueError):
+			WindowedHeightScheduler(100, 200, window_size)
+
+# endregion
+
+
+# region run
+
+async def test_can_process_all_heights_in_range():
+	# Arrange:
+	processor = MockHeightProcessor()
+	scheduler = WindowedHeightScheduler(100, 125, 4, 10)
+
+	# Act:
+	await scheduler.run(processor.process, processor.checkpoint)
+
+	# Assert: heights complete in groups of (window) four, so checkpoints are made once at least ten heights are completed
+	assert list(range(100, 125)) == sorted(processor.processed_heights)
+	assert [111, 123] == processor.checkpoint_heights
+	assert 124 == scheduler.completed_height
+	assert 4 == processor.max_active_count
+
+
+async def test_can_process_empty_range():
+	# Arrange:
+	processor = MockHeightProcessor()
+	scheduler = WindowedHeightScheduler(100, 100, 4, 10)
+
+	# Act:
+	await scheduler.run(processor.process, processor.checkpoint)
+
+	# Assert:
+	assert [] == processor.processed_heights
+	assert [] == processor.checkpoint_heights
+	assert 99 == scheduler.completed_height
+
+
+async def test_slow_height_holds_back_window_and_checkpoints():
+	# Arrange: height 101 completes long after all other heights in the window
+	processor = MockHeightProcessor({101: 0.05})
+	scheduler = WindowedHeightScheduler(100, 120, 4, 2)
+
+	# Act:
+	await scheduler.run(processor.process, processor.checkpoint)
+
+	# Assert: no height beyond the window of the slow height is started before it completes
+	assert [100, 102, 103, 104, 101] == processor.processed_heights[:5]
+	assert 104 == processor.checkpoint_heights[0]
+	assert list(range(100, 120)) == sorted(processor.processed_heights)
+
+
+async def test_failure_cancels_heights_in_flight_and_does_not_checkpoint_past_failure():
+	# Arrange:
+	processor = MockHeightProcessor({height: 0.05 for height in range(113, 120)}, failed_height=112)
+	scheduler = WindowedHeightScheduler(100, 120, 4, 5)
+
+	# Act:
+	with pytest.raises(RuntimeError, match='failed at 112'):
+		await scheduler.run(processor.process, processor.checkpoint)
+
+	# Assert:
+	assert list(range(100, 112)) == sorted(processor.processed_heights)
+	assert [107] == processor.checkpoint_heights
+	assert 111 == scheduler.completed_height
+	assert [113, 114, 115] == sorted(processor.cancelled_heights)
+
+# endregion
+
+
+# region progress
+
+def test_progress_is_empty_before_run():
+	# Arrange:
+	scheduler = WindowedHeightScheduler(100, 200)
+
+	# Act:
+	progress = scheduler.progress()
+
+	# Assert:
+	assert (99, 0, 100, 0, None) == progress
+
+
+async def test_progress_reports_throughput_and_eta():
+	# Arrange:
+	processor = MockHeightProcessor()
+	scheduler = WindowedHeightScheduler(100, 120, 4, 10)
+	progress_snapshots = []
+
+	def checkpoint(height):
+		processor.checkpoint(height)
+		progress_snapshots.append(scheduler.progress())
+
+	# Act:
+	await scheduler.run(processor.process, checkpoint)
+
+	# Assert:
+	assert 1 == len(progress_snapshots)
+	assert (111, 12, 20) == progress_snapshots[0][:3]
+	assert 0 < progress_snapshots[0].blocks_per_second
+	assert 8 / progress_snapshots[0].blocks_per_second == pytest.approx(progress_snapshots[0].eta_seconds)
+
+	progress = scheduler.progress()
+	assert (119, 20, 20) == progress[:3]
+	assert 0 == progress.eta_seconds
+
+# endregion
@@ -23,6 +23,7 @@ from bridge.WorkflowUtils import (
 	create_conversion_rate_calculator_factory,
 	is_daily_limit_exceeded,
 	is_native_to_native_conversion,
+	lookup_daily_transfer_amount,
 	prepare_send,
 	validate_global_configuration
 )
@@ -415,7 +416,7 @@ def test_cannot_prepare_send_with_greater_than_max_transfer_amount():
 # endregion
 
 
-# region is_daily_limit_exceeded
+# region lookup_daily_transfer_amount / is_daily_limit_exceeded
 
 def run_is_daily_limit_exceeded_test(config_extensions, amount_from_database, transfer_amount):
 	# Arrange:
@@ -456,6 +457,40 @@ def test_is_daily_limit_exceeded_true_when_cumulative_and_transfer_greater_than_
 	assert (True, 90) == run_is_daily_limit_exceeded_test({'max_daily_transfer_amount': '200'}, 110, 100)
 	assert (True, 0) == run_is_daily_limit_exceeded_test({'max_daily_transfer_amount': '200'}, 200, 1)
 
+
+def test_is_daily_limit_exceeded_uses_provided_daily_transfer_amount():
+	# Arrange:
+	network = _make_network_facade_from_config_extensions({'max_daily_transfer_amount': '200'})
+
+	# Act: database should not be accessed
+	results = [is_daily_limit_exceeded(network, None, transfer_amount, 110) for transfer_amount in (90, 91)]
+
+	# Assert:
+	assert [(False, 90), (True, 90)] == results
+
+
+def test_can_lookup_daily_transfer_amount():
+	# Arrange:
+	class MockDailyLimitDatabase:
+		def __init__(self):
+			self.timestamps = []
+
+		def cumulative_gross_amount_sent_since(self, timestamp):
+			self.timestamps.append(timestamp)
+			return 110
+
+	database = MockDailyLimitDatabase()
+
+	# Act:
+	amount = lookup_daily_transfer_amount(database)
+
+	# Assert:
+	assert 110 == amount
+	assert 1 == len(database.timestamps)
+
+	timestamp_datetime = datetime.datetime.fromtimestamp(database.timestamps[0], tz=datetime.timezone.utc)
+	assert_timestamp_within_last_second((timestamp_datetime + datetime.timedelta(days=1)).timestamp())
+
 # endregion
 
 
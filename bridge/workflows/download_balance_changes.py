@@ -1,48 +1,44 @@
 import asyncio
 import logging
 
-from aiolimiter import AsyncLimiter
-from symbollightapi.model.Constants import DEFAULT_ASYNC_LIMITER_ARGUMENTS
 from symbollightapi.model.Exceptions import NodeException
 
+from bridge.db.BalanceChangeDatabase import DEFAULT_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL_SECONDS
 from bridge.NetworkUtils import download_rosetta_block_balance_changes
+from bridge.WindowedHeightScheduler import DEFAULT_CHECKPOINT_INTERVAL, DEFAULT_WINDOW_SIZE, WindowedHeightScheduler
 from bridge.WorkflowUtils import calculate_search_range
 
 from .main_impl import main_bootstrapper, print_banner
 
-MAX_CONCURRENT_CONNECTION_COUNT = 20
 MAX_RETRY_COUNT = 10
 
 
 class BalanceChangesDownloader:
-	def __init__(self, database, network):
-		self.database = database
+	def __init__(self, batch_writer, network):
+		self.batch_writer = batch_writer
 		self.network = network
-		self.connector = self.network.create_connector(require_rosetta=True)
-
-		self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTION_COUNT)  # limit concurrent connections
-		self.limiter = AsyncLimiter(*DEFAULT_ASYNC_LIMITER_ARGUMENTS)  # limit connection bursts
+		self.connector = self.network.create_connector(require_rosetta=True)  # requests are throttled by the adaptive limiter of the connector
+		self.count = 0
 
 	async def download(self, height):
-		async with self.semaphore:
-			async with self.limiter:
-				for _ in range(MAX_RETRY_COUNT):
-					try:
-						count = await self._download(height)
-						print('.', end='', flush=True)
-						return count
-					except NodeException:
-						print('x', end='', flush=True)
-						await asyncio.sleep(1)
-
-				raise NodeException(f'all attempts to query height {height} failed')
+		for _ in range(MAX_RETRY_COUNT):
+			try:
+				count = await self._download(height)
+				self.count += count
+				print('.', end='', flush=True)
+				return
+			except NodeException:
+				print('x', end='', flush=True)
+				await asyncio.sleep(1)
+
+		raise NodeException(f'all attempts to query height {height} failed')
 
 	async def _download(self, height):
 		balance_changes = await download_rosetta_block_balance_changes(
 			self.connector,
 			*self.network.rosetta_network_id,
 			height)
-		return self.database.add_transfers_filtered_by_address(height, balance_changes, self.network.bridge_address)
+		return self.batch_writer.add_transfers_filtered_by_address(height, balance_changes)
 
 
 async def download_balance_changes(database, network):
@@ -56,18 +52,30 @@ async def download_balance_changes(database, network):
 
 	database.reset()
 
-	downloader = BalanceChangesDownloader(database, network)
+	scheduler = WindowedHeightScheduler(
+		start_height,
+		end_height,
+		int(config_extensions.get('balance_change_download_window_size', DEFAULT_WINDOW_SIZE)),
+		int(config_extensions.get('balance_change_checkpoint_interval', DEFAULT_CHECKPOINT_INTERVAL)))
+
+	async with database.create_batch_writer(
+		network.bridge_address,
+		int(config_extensions.get('balance_change_batch_size', DEFAULT_BATCH_SIZE)),
+		float(config_extensions.get('balance_change_flush_interval_seconds', DEFAULT_FLUSH_INTERVAL_SECONDS))
+	) as batch_writer:
+		downloader = BalanceChangesDownloader(batch_writer, network)
 
-	tasks = [downloader.download(height) for height in range(start_height, end_height)]
-	counts = await asyncio.gather(*tasks)
+		# periodically checkpoint the contiguous downloaded prefix so that a restart resumes close to where it stopped;
+		# each checkpoint is written in the same transaction as all buffered transfers, which include all transfers at or below it
+		await scheduler.run(downloader.download, batch_writer.flush)
 
-	# add marker in database to indicate last height processed
-	database.set_max_processed_height(end_height - 1)
+		# add marker in database to indicate last height processed
+		batch_writer.flush(end_height - 1)
 
 	print_banner([
 		'\n',
 		f'==> last processed transaction height: {database.max_processed_height()}',
-		f'==>   total balance changes processed: {sum(counts)}'
+		f'==>   total balance changes processed: {downloader.count}'
 	])
 
 
@@ -3,13 +3,14 @@ import logging
 
 from symbollightapi.connector.ConnectorExtensions import get_incoming_transactions_from, query_block_timestamps
 
+from bridge.db.WrapRequestDatabase import DEFAULT_BATCH_SIZE
 from bridge.models.WrapRequest import coerce_zero_balance_wrap_request_to_error
 from bridge.WorkflowUtils import calculate_search_range
 
 from .main_impl import main_bootstrapper, print_banner
 
 
-async def _download_requests(database, connector, network, is_valid_address):
+async def _download_requests(database, connector, network, is_valid_address):  # pylint: disable=too-many-locals
 	logger = logging.getLogger(__name__)
 
 	(start_height, end_height) = await calculate_search_range(connector, database, network.config.extensions)
@@ -23,24 +24,33 @@ async def _download_requests(database, connector, network, is_valid_address):
 
 	database.reset()
 
+	batch_writer = database.create_batch_writer(int(network.config.extensions.get('download_batch_size', DEFAULT_BATCH_SIZE)))
+
 	count = 0
 	error_count = 0
 	heights = set()
-	async for transaction in get_incoming_transactions_from(connector, network.transaction_search_address, start_height, end_height):
+	shard_count = int(network.config.extensions.get('incoming_transactions_shard_count', 0))
+	async for transaction in get_incoming_transactions_from(
+		connector,
+		network.transaction_search_address,
+		start_height,
+		end_height,
+		shard_count=shard_count
+	):
 		results = network.extract_wrap_request_from_transaction(is_valid_address, transaction, mosaic_id.id)
 		for result in results:
 			result = coerce_zero_balance_wrap_request_to_error(result)
 			if result.is_error:
-				database.add_error(result.error)
+				batch_writer.add_error(result.error)
 				heights.add(result.error.transaction_height)
 				error_count += 1
 			else:
-				database.add_request(result.request)
+				batch_writer.add_request(result.request)
 				heights.add(result.request.transaction_height)
 				count += 1
 
-	# add marker in database to indicate last height processed
-	database.set_max_processed_height(end_height - 1)
+	# write remaining rows and add marker in database to indicate last height processed (in the same transaction)
+	batch_writer.flush(end_height - 1)
 	heights.add(end_height - 1)
 
 	print_banner([
@@ -52,26 +62,28 @@ async def _download_requests(database, connector, network, is_valid_address):
 	return heights
 
 
-async def _download_block_timestamps(database, connector, heights):
+async def _download_block_timestamps(database, connector, heights, timestamp_cache):
 	logger = logging.getLogger(__name__)
 
 	logger.info('detected transactions in %s blocks, looking up timestamps...', len(heights))
-	block_height_timestamp_pairs = await query_block_timestamps(connector, heights)
-	for height_timestamp_pair in block_height_timestamp_pairs:
-		database.set_block_timestamp(*height_timestamp_pair)
+	block_height_timestamp_pairs = await query_block_timestamps(connector, heights, timestamp_cache=timestamp_cache)
+	database.set_block_timestamps(block_height_timestamp_pairs)
+
+	logger.info('block timestamp cache hits: %s, misses: %s', timestamp_cache.hit_count, timestamp_cache.miss_count)
 
 
-async def _download_all(database, network, is_valid_address):
+async def _download_all(databases, database, network, is_valid_address):
 	connector = network.create_connector()
 	heights = await _download_requests(database, connector, network, is_valid_address)
-	await _download_block_timestamps(database, connector, heights)
+	with databases.open_block_timestamp_cache(network) as timestamp_cache:
+		await _download_block_timestamps(database, connector, heights, timestamp_cache)
 
 
 async def main_impl(execution_context, databases, native_facade, wrapped_facade, _external_services):
 	if execution_context.is_unwrap_mode:
-		await _download_all(databases.unwrap_request, wrapped_facade, native_facade.is_valid_address)
+		await _download_all(databases, databases.unwrap_request, wrapped_facade, native_facade.is_valid_address)
 	else:
-		await _download_all(databases.wrap_request, native_facade, wrapped_facade.is_valid_address)
+		await _download_all(databases, databases.wrap_request, native_facade, wrapped_facade.is_valid_address)
 
 
 if '__main__' == __name__:
@@ -62,56 +62,56 @@ async def send_payouts(conversion_rate_calculator_factory, execution_context, va
 		database.mark_payout_failed(request, error_message)
 		counts.errored += 1
 
-	sender = TransactionSender(network)
-	await sender.init(vault_connector)
-
-	# in stake mode, requests must be processed in order to ensure stake attribution is always correct
-	can_skip = StrategyMode.STAKE != execution_context.strategy_mode
-
-	for request in requests_to_send:
-		conversion_rate_calculator = conversion_rate_calculator_factory.try_create_calculator(request.transaction_height)
-		if not conversion_rate_calculator:
-			mark_skipped(request, f'missing data at height {request.transaction_height}')
-			continue
-
-		logger.info('processing payout: %s:%s', request.transaction_hash, request.transaction_subindex)
-		conversion_function = conversion_rate_calculator.to_conversion_function(execution_context.is_unwrap_mode)
-		send_result = None
-		try:
-			prepare_send_result = prepare_send(network, request, conversion_function, fee_multiplier)
-			if prepare_send_result.error_message:
-				send_result = TrySendResult(True, None, None, None, prepare_send_result.error_message)
-			else:
-				(is_exceeded, amount_remaining) = is_daily_limit_exceeded(network, database, prepare_send_result.transfer_amount)
-				if is_exceeded:
-					mark_skipped(request, f'daily limit exceeded ({amount_remaining} < {prepare_send_result.transfer_amount})')
+	async with TransactionSender(network) as sender:
+		await sender.init(vault_connector)
+
+		# in stake mode, requests must be processed in order to ensure stake attribution is always correct
+		can_skip = StrategyMode.STAKE != execution_context.strategy_mode
+
+		for request in requests_to_send:
+			conversion_rate_calculator = conversion_rate_calculator_factory.try_create_calculator(request.transaction_height)
+			if not conversion_rate_calculator:
+				mark_skipped(request, f'missing data at height {request.transaction_height}')
+				continue
+
+			logger.info('processing payout: %s:%s', request.transaction_hash, request.transaction_subindex)
+			conversion_function = conversion_rate_calculator.to_conversion_function(execution_context.is_unwrap_mode)
+			send_result = None
+			try:
+				prepare_send_result = prepare_send(network, request, conversion_function, fee_multiplier)
+				if prepare_send_result.error_message:
+					send_result = TrySendResult(True, None, None, None, prepare_send_result.error_message)
+				else:
+					(is_exceeded, amount_remaining) = is_daily_limit_exceeded(network, database, prepare_send_result.transfer_amount)
+					if is_exceeded:
+						mark_skipped(request, f'daily limit exceeded ({amount_remaining} < {prepare_send_result.transfer_amount})')
+						if not can_skip:
+							break
+
+						continue
+
+					send_result = await _send_payout(sender, network, request, prepare_send_result)
+			except NodeException as ex:
+				if is_transient_error(ex):
+					mark_skipped(request, f'transient failure {ex}')
 					if not can_skip:
 						break
+				else:
+					mark_permanent_failure(request, str(ex))
 
-					continue
+				continue
 
-				send_result = await _send_payout(sender, network, request, prepare_send_result)
-		except NodeException as ex:
-			if is_transient_error(ex):
-				mark_skipped(request, f'transient failure {ex}')
-				if not can_skip:
-					break
+			if send_result.is_error:
+				mark_permanent_failure(request, send_result.error_message)
 			else:
-				mark_permanent_failure(request, str(ex))
-
-			continue
-
-		if send_result.is_error:
-			mark_permanent_failure(request, send_result.error_message)
-		else:
-			conversion_rate = conversion_function(1000000)
-			payout_details = PayoutDetails(
-				send_result.transaction_hash,
-				send_result.net_amount,
-				send_result.total_fee,
-				conversion_rate)
-			database.mark_payout_sent(request, payout_details)
-			counts.sent += 1
+				conversion_rate = conversion_function(1000000)
+				payout_details = PayoutDetails(
+					send_result.transaction_hash,
+					send_result.net_amount,
+					send_result.total_fee,
+					conversion_rate)
+				database.mark_payout_sent(request, payout_details)
+				counts.sent += 1
 
 	print_banner([
 		f'==>      total payouts sent: {counts.sent}',
@@ -0,0 +1,67 @@
+import json
+import platform
+import statistics
+import sys
+
+
+def load_json(filepath):
+	"""Loads a JSON file."""
+
+	with open(filepath, 'rt', encoding='utf8') as infile:
+		return json.load(infile)
+
+
+def add_result_arguments(parser):
+	"""Adds arguments for selecting benchmarks and writing and comparing their results."""
+
+	parser.add_argument('--filter', help='only run benchmarks containing this text', default='')
+	parser.add_argument('--output', help='file to write JSON results to (default: stdout)')
+	parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+
+
+def summarize_rounds(name, unit, count, round_seconds):
+	"""Summarizes the measured round times of a benchmark that processes count units (e.g. operations) per round."""
+
+	median_seconds = statistics.median(round_seconds)
+	return {
+		'name': name,
+		'unit': unit,
+		'count': count,
+		'round_count': len(round_seconds),
+		'seconds': {
+			'min': min(round_seconds),
+			'median': median_seconds,
+			'mean': statistics.mean(round_seconds),
+			'max': max(round_seconds),
+			'stddev': statistics.stdev(round_seconds) if 1 < len(round_seconds) else 0
+		},
+		'per_second': count / median_seconds
+	}
+
+
+def _print_comparison(results, baseline_results):
+	name_to_baseline = {benchmark['name']: benchmark for benchmark in baseline_results['benchmarks']}
+	for benchmark in results['benchmarks']:
+		baseline = name_to_baseline.get(benchmark['name'], None)
+		ratio = f'{benchmark["per_second"] / baseline["per_second"]:6.2f}x' if baseline else '   new'
+		print(f'{benchmark["name"]:>48}: {benchmark["per_second"]:12.1f} {benchmark["unit"]}/s {ratio}', file=sys.stderr)
+
+
+def report_results(args, settings, benchmark_results):
+	"""Writes benchmark results as JSON and prints a comparison with previous results, if requested."""
+
+	results = {
+		'environment': {'python': platform.python_version(), 'implementation': platform.python_implementation(), 'machine': platform.machine()},
+		'settings': settings,
+		'benchmarks': benchmark_results
+	}
+
+	results_json = json.dumps(results, indent=2)
+	if args.output:
+		with open(args.output, 'wt', encoding='utf8') as outfile:
+			outfile.write(results_json)
+	else:
+		print(results_json)
+
+	if args.compare:
+		_print_comparison(results, load_json(args.compare))
@@ -0,0 +1,228 @@
+import argparse
+import asyncio
+import copy
+import time
+from pathlib import Path
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from benchmarks.BenchmarkUtils import add_result_arguments, load_json, report_results, summarize_rounds
+from symbollightapi.connector.BasicConnector import BasicConnector
+from symbollightapi.connector.ConnectorExtensions import get_incoming_transactions_from, query_block_timestamps
+from symbollightapi.connector.NemConnector import NemConnector
+from symbollightapi.connector.SymbolConnector import SymbolConnector
+from symbollightapi.connector.SymbolPeerConnector import SymbolPeerConnector
+from tests.test.PeerTestUtils import locate_certificate_directory, start_mock_peer_nodes
+
+RESOURCES_DIRECTORY = Path(__file__).parent / 'resources'
+SYMBOL_ADDRESS = 'TDSSDPIPAJHVRZTQUARR6OQU6O7SUWAOAODXGRA'
+PAGE_SIZE = 100
+
+
+# region recorded node stand-in
+
+class RecordedNodeServer:
+	"""Serves recorded NEM, Symbol and Ethereum (JSON-RPC) responses with artificial latency."""
+
+	def __init__(self, recorded_responses, nem_blocks_after, transaction_count, latency_seconds):
+		"""Creates a stand-in node serving transaction_count incoming Symbol transactions."""
+
+		self.recorded_responses = recorded_responses
+		self.nem_blocks_after = nem_blocks_after
+		self.transaction_count = transaction_count
+		self.latency_seconds = latency_seconds
+
+	def create_app(self):
+		"""Creates an aiohttp application with all stand-in routes."""
+
+		app = web.Application()
+		app.router.add_get('/transactions/confirmed', self.transactions_confirmed)
+		app.router.add_get(r'/blocks/{height}', self.block)
+		app.router.add_post('/transactionStatus', self.transaction_statuses)
+		app.router.add_post('/local/chain/blocks-after', self.blocks_after)
+		app.router.add_post('/rpc', self.json_rpc)
+		return app
+
+	async def _respond(self, response_json):
+		await asyncio.sleep(self.latency_seconds)
+		return web.json_response(response_json)
+
+	async def transactions_confirmed(self, request):
+		offset = int(request.query.get('offset', self.transaction_count))
+		transactions_json = []
+		for transaction_id in range(offset - 1, max(-1, offset - 1 - PAGE_SIZE), -1):
+			transaction_json = copy.deepcopy(self.recorded_responses['symbol_transaction'])
+			transaction_json['id'] = str(transaction_id)
+			transaction_json['meta']['height'] = str(1000 + transaction_id)
+			transactions_json.append(transaction_json)
+
+		return await self._respond({'data': transactions_json})
+
+	async def block(self, request):
+		height = int(request.match_info['height'])
+		block_json = copy.deepcopy(self.recorded_responses['symbol_block'])
+		block_json['block']['height'] = str(height)
+		block_json['block']['timestamp'] = str(85426407163 + height * 30000)
+		return await self._respond(block_json)
+
+	async def transaction_statuses(self, request):
+		request_json = await request.json()
+		return await self._respond([
+			{'group': 'confirmed', 'code': 'Success', 'hash': transaction_hash, 'deadline': '85433587000', 'height': '2408187'}
+			for transaction_hash in request_json['hashes']
+		])
+
+	async def blocks_after(self, _request):
+		return await self._respond(self.nem_blocks_after)
+
+	async def json_rpc(self, request):
+		request_json = await request.json()
+		block_json = copy.deepcopy(self.recorded_responses['ethereum_block'])
+		block_json['number'] = request_json['params'][0]
+		return await self._respond({'jsonrpc': '2.0', 'id': request_json['id'], 'result': block_json})
+
+
+class JsonRpcBlockConnector(BasicConnector):
+	"""Minimal Ethereum JSON-RPC connector that supports query_block_timestamps."""
+
+	@staticmethod
+	def extract_block_timestamp(block):
+		"""Extracts the block timestamp from a JSON-RPC block object."""
+
+		return int(block['timestamp'], 16)
+
+	async def block_headers(self, height):
+		"""Gets block headers."""
+
+		request_json = {'jsonrpc': '2.0', 'method': 'eth_getBlockByNumber', 'params': [hex(height), False], 'id': height}
+		return await self.post('rpc', request_json, 'result')
+
+# endregion
+
+
+# region benchmarks
+
+async def _benchmark_get_incoming_transactions_from(context, prefetch_page_count):
+	connector = SymbolConnector(context['endpoint'])
+	transactions = [
+		transaction async for transaction in get_incoming_transactions_from(
+			connector,
+			SYMBOL_ADDRESS,
+			prefetch_page_count=prefetch_page_count)
+	]
+	return len(transactions)
+
+
+async def _benchmark_query_block_timestamps(context, connector_class):
+	connector = connector_class(context['endpoint'])
+	block_height_timestamp_pairs = await query_block_timestamps(connector, range(1, context['block_count'] + 1))
+	return len(block_height_timestamp_pairs)
+
+
+async def _benchmark_filter_confirmed_transactions(context):
+	connector = SymbolConnector(context['endpoint'])
+	transaction_hashes = [f'{index:064X}' for index in range(context['transaction_count'])]
+	transaction_hash_height_pairs = []
+	for start_index in range(0, len(transaction_hashes), PAGE_SIZE):
+		chunk = transaction_hashes[start_index:start_index + PAGE_SIZE]
+		transaction_hash_height_pairs.extend(await connector.filter_confirmed_transactions(chunk))
+
+	return len(transaction_hash_height_pairs)
+
+
+async def _benchmark_nem_get_blocks_after(context):
+	connector = NemConnector(context['endpoint'])
+	block_count = 0
+	for height in range(context['round_trip_count']):
+		block_count += len(await connector.get_blocks_after(height))
+
+	return block_count
+
+
+async def _benchmark_symbol_peer_round_trips(context, keep_alive_seconds):
+	node = context['peer_node']
+	async with SymbolPeerConnector('127.0.0.1', node.port, locate_certificate_directory(2)) as connector:
+		connector.keep_alive_seconds = keep_alive_seconds
+		for _ in range(context['round_trip_count']):
+			await connector.chain_height()
+
+	return context['round_trip_count']
+
+
+BENCHMARKS = {
+	'symbol_get_incoming_transactions_from': lambda context: _benchmark_get_incoming_transactions_from(context, 0),
+	'symbol_get_incoming_transactions_from_prefetched': lambda context: _benchmark_get_incoming_transactions_from(context, 4),
+	'symbol_query_block_timestamps': lambda context: _benchmark_query_block_timestamps(context, SymbolConnector),
+	'ethereum_query_block_timestamps': lambda context: _benchmark_query_block_timestamps(context, JsonRpcBlockConnector),
+	'symbol_filter_confirmed_transactions': _benchmark_filter_confirmed_transactions,
+	'nem_get_blocks_after': _benchmark_nem_get_blocks_after,
+	'symbol_peer_round_trips': lambda context: _benchmark_symbol_peer_round_trips(context, None),
+	'symbol_peer_round_trips_kept_alive': lambda context: _benchmark_symbol_peer_round_trips(context, 60)
+}
+
+# endregion
+
+
+# region runner
+
+async def _run_benchmark(name, context, round_count):
+	await BENCHMARKS[name](context)  # warm up
+
+	round_seconds = []
+	operation_count = 0
+	for _ in range(round_count):
+		start_time = time.perf_counter()
+		operation_count = await BENCHMARKS[name](context)
+		round_seconds.append(time.perf_counter() - start_time)
+
+	return summarize_rounds(name, 'operations', operation_count, round_seconds)
+
+
+async def main():
+	parser = argparse.ArgumentParser(description='measures connector throughput against a stand-in node serving recorded responses')
+	parser.add_argument('--latency', help='artificial latency of each response (in milliseconds)', type=float, default=5)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=5)
+	parser.add_argument('--transactions', help='number of incoming transactions and transaction hashes', type=int, default=1000)
+	parser.add_argument('--blocks', help='number of block timestamps to query', type=int, default=200)
+	parser.add_argument('--round-trips', help='number of sequential round trips', type=int, default=50)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	node_server = RecordedNodeServer(
+		load_json(RESOURCES_DIRECTORY / 'recorded_responses.json'),
+		load_json(RESOURCES_DIRECTORY / 'nem_blocks_after.json'),
+		args.transactions,
+		args.latency / 1000)
+	peer_nodes = await start_mock_peer_nodes(1, 0, response_delay_seconds=args.latency / 1000)
+	try:
+		async with TestServer(node_server.create_app()) as server:
+			context = {
+				'endpoint': str(server.make_url('')).rstrip('/'),
+				'peer_node': peer_nodes[0],
+				'transaction_count': args.transactions,
+				'block_count': args.blocks,
+				'round_trip_count': args.round_trips
+			}
+
+			benchmark_results = []
+			for name in BENCHMARKS:
+				if args.filter in name:
+					benchmark_results.append(await _run_benchmark(name, context, args.rounds))
+	finally:
+		for node in peer_nodes:
+			await node.stop()
+
+	report_results(args, {
+		'latency_milliseconds': args.latency,
+		'rounds': args.rounds,
+		'transactions': args.transactions,
+		'blocks': args.blocks,
+		'round_trips': args.round_trips
+	}, benchmark_results)
+
+# endregion
+
+
+if '__main__' == __name__:
+	asyncio.run(main())
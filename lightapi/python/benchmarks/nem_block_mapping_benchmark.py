@@ -0,0 +1,81 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.BenchmarkUtils import add_result_arguments, load_json, report_results, summarize_rounds
+from symbollightapi.connector.NemConnector import NemConnector
+
+DEFAULT_RESOURCE_FILEPATH = Path(__file__).parent / 'resources' / 'nem_blocks_after.json'
+
+
+def _decode_keys(block):
+	keys = [block.beneficiary, block.signer]
+	for transaction in block.transactions:
+		keys.append(transaction.sender)
+		for name in ('recipient', 'remote_account', 'rental_fee_sink', 'creation_fee_sink', 'creator'):
+			if hasattr(transaction, name):
+				keys.append(getattr(transaction, name))
+
+	return keys
+
+
+def _map_blocks(connector, block_jsons, decode_keys):
+	blocks = [connector._map_to_block(block_json) for block_json in block_jsons]  # pylint: disable=protected-access
+	if decode_keys:
+		for block in blocks:
+			_decode_keys(block)
+
+	return blocks
+
+
+def _time_mapping(connector, block_jsons, decode_keys):
+	gc.collect()
+	start_time = time.perf_counter()
+	_map_blocks(connector, block_jsons, decode_keys)
+	return time.perf_counter() - start_time
+
+
+def _measure_retained_size(connector, block_jsons, decode_keys):
+	gc.collect()
+	tracemalloc.start()
+	blocks = _map_blocks(connector, block_jsons, decode_keys)
+	(retained_size, _) = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del blocks
+
+	return retained_size
+
+
+BENCHMARKS = {
+	'lazy_keys': False,
+	'decoded_keys': True
+}
+
+
+def main():
+	parser = argparse.ArgumentParser(description='measures NEM block mapping throughput and retained model memory')
+	parser.add_argument('--input', help='blocks-after response containing recorded blocks', default=str(DEFAULT_RESOURCE_FILEPATH))
+	parser.add_argument('--blocks', help='number of blocks held in flight', type=int, default=10000)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=3)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	recorded_block_jsons = load_json(args.input)['data']
+	block_jsons = [recorded_block_jsons[i % len(recorded_block_jsons)] for i in range(args.blocks)]
+	connector = NemConnector('http://localhost:7890')
+
+	benchmark_results = []
+	for (name, decode_keys) in BENCHMARKS.items():
+		if args.filter in name:
+			round_seconds = [_time_mapping(connector, block_jsons, decode_keys) for _ in range(args.rounds)]
+			benchmark_result = summarize_rounds(name, 'blocks', len(block_jsons), round_seconds)
+			benchmark_result['retained_bytes_per_block'] = _measure_retained_size(connector, block_jsons, decode_keys) / len(block_jsons)
+			benchmark_results.append(benchmark_result)
+
+	report_results(args, {'blocks': len(block_jsons), 'rounds': args.rounds}, benchmark_results)
+
+
+if '__main__' == __name__:
+	main()
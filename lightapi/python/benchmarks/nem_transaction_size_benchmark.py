@@ -0,0 +1,58 @@
+import argparse
+import time
+from pathlib import Path
+
+from benchmarks.BenchmarkUtils import add_result_arguments, load_json, report_results, summarize_rounds
+from symbollightapi.connector.NemBlockCalculator import NemBlockCalculator
+
+DEFAULT_RESOURCE_FILEPATH = Path(__file__).parent / 'resources' / 'nem_blocks_after.json'
+
+
+def _time_sizing(transactions, iteration_count, calculate_size):
+	start_time = time.perf_counter()
+	for _ in range(iteration_count):
+		for tx_json in transactions:
+			calculate_size(tx_json)
+
+	return time.perf_counter() - start_time
+
+
+def main():
+	parser = argparse.ArgumentParser(description='compares arithmetic NEM transaction sizing with sizing via the sdk transaction builders')
+	parser.add_argument('--input', help='blocks-after response containing recorded blocks', default=str(DEFAULT_RESOURCE_FILEPATH))
+	parser.add_argument('--iterations', help='number of passes over all recorded transactions per round', type=int, default=2000)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=3)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	blocks = load_json(args.input)['data']
+	transactions = [tx_entry['tx'] for block in blocks for tx_entry in block['txes']]
+	calculator = NemBlockCalculator()
+
+	for tx_json in transactions:
+		arithmetic_size = calculator.calculate_transaction_size(tx_json)
+		builder_size = calculator.build_transaction(tx_json).size
+		if arithmetic_size != builder_size:
+			raise RuntimeError(f'size mismatch for transaction type {tx_json["type"]}: {arithmetic_size} != {builder_size}')
+
+	benchmarks = {
+		'builder': lambda tx_json: calculator.build_transaction(tx_json).size,
+		'arithmetic': calculator.calculate_transaction_size
+	}
+
+	benchmark_results = []
+	for (name, calculate_size) in benchmarks.items():
+		if args.filter in name:
+			round_seconds = [_time_sizing(transactions, args.iterations, calculate_size) for _ in range(args.rounds)]
+			benchmark_results.append(summarize_rounds(name, 'transactions', args.iterations * len(transactions), round_seconds))
+
+	report_results(args, {
+		'blocks': len(blocks),
+		'transactions': len(transactions),
+		'iterations': args.iterations,
+		'rounds': args.rounds
+	}, benchmark_results)
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+import time
+
+from benchmarks.BenchmarkUtils import add_result_arguments, report_results, summarize_rounds
+from symbollightapi.connector.CertificateInfoCache import CertificateInfoCache
+from symbollightapi.connector.SymbolPeerCrawler import SymbolPeerCrawler
+from tests.test.PeerTestUtils import locate_certificate_directory, start_mock_peer_nodes
+
+
+async def _crawl(nodes, max_concurrency, certificate_info_cache):
+	crawler = SymbolPeerCrawler(
+		locate_certificate_directory(2),
+		max_concurrency=max_concurrency,
+		certificate_info_cache=certificate_info_cache)
+
+	start_time = time.perf_counter()
+	results = [result async for result in crawler.crawl([('127.0.0.1', nodes[0].port)])]
+	elapsed_seconds = time.perf_counter() - start_time
+
+	failure_count = sum(1 for result in results if result.error)
+	if len(nodes) != len(results) or failure_count:
+		raise RuntimeError(f'crawl visited {len(results)} nodes with {failure_count} failures, expected {len(nodes)} nodes')
+
+	return elapsed_seconds
+
+
+async def _run_benchmark(name, nodes, max_concurrency, certificate_info_cache_factory, round_count):
+	# pylint: disable=too-many-arguments, too-many-positional-arguments
+	certificate_info_cache = certificate_info_cache_factory()
+	round_seconds = [await _crawl(nodes, max_concurrency, certificate_info_cache) for _ in range(round_count)]
+
+	benchmark_result = summarize_rounds(name, 'nodes', len(nodes), round_seconds)
+	benchmark_result['certificate_cache'] = {'hits': certificate_info_cache.hit_count, 'misses': certificate_info_cache.miss_count}
+	return benchmark_result
+
+
+async def main():
+	parser = argparse.ArgumentParser(description='measures peer crawler throughput against simulated local TLS peers')
+	parser.add_argument('--nodes', help='number of simulated peers', type=int, default=300)
+	parser.add_argument('--peers', help='number of peers returned by each simulated peer', type=int, default=8)
+	parser.add_argument('--concurrency', help='number of concurrent node queries', type=int, default=32)
+	parser.add_argument('--latency', help='simulated response latency of each peer (in milliseconds)', type=int, default=20)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=3)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	benchmarks = {
+		'sequential': (1, lambda: CertificateInfoCache(max_size=0)),
+		'concurrent': (args.concurrency, lambda: CertificateInfoCache(max_size=0)),
+		'concurrent_certificate_cache': (args.concurrency, CertificateInfoCache)
+	}
+
+	nodes = await start_mock_peer_nodes(args.nodes, args.peers, response_delay_seconds=args.latency / 1000)
+	try:
+		benchmark_results = []
+		for (name, (max_concurrency, certificate_info_cache_factory)) in benchmarks.items():
+			if args.filter in name:
+				benchmark_results.append(await _run_benchmark(name, nodes, max_concurrency, certificate_info_cache_factory, args.rounds))
+	finally:
+		for node in nodes:
+			await node.stop()
+
+	report_results(args, {
+		'nodes': args.nodes,
+		'peers': args.peers,
+		'concurrency': args.concurrency,
+		'latency_milliseconds': args.latency,
+		'rounds': args.rounds
+	}, benchmark_results)
+
+
+if '__main__' == __name__:
+	asyncio.run(main())
@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from benchmarks.BenchmarkUtils import add_result_arguments, report_results, summarize_rounds
+from symbollightapi.connector.BasicConnector import BasicConnector
+from symbollightapi.connector.HttpSessionPool import HttpSessionPool
+
+
+async def _run_requests(endpoint, request_count, concurrency, session_pool):
+	semaphore = asyncio.Semaphore(concurrency)
+	connector = BasicConnector(endpoint)
+	connector.session_pool = session_pool
+
+	async def issue_request():
+		async with semaphore:
+			await connector.get('chain/info')
+
+	start_time = time.perf_counter()
+	await asyncio.gather(*(issue_request() for _ in range(request_count)))
+	return time.perf_counter() - start_time
+
+
+async def _run_unpooled(endpoint, args):
+	return await _run_requests(endpoint, args.requests, args.concurrency, None)
+
+
+async def _run_pooled(endpoint, args):
+	async with HttpSessionPool(connection_limit_per_host=args.concurrency) as session_pool:
+		return await _run_requests(endpoint, args.requests, args.concurrency, session_pool)
+
+
+BENCHMARKS = {
+	'unpooled': _run_unpooled,
+	'pooled': _run_pooled
+}
+
+
+async def main():
+	parser = argparse.ArgumentParser(description='compares BasicConnector throughput with and without a shared session pool')
+	parser.add_argument('--requests', help='number of requests to issue', type=int, default=5000)
+	parser.add_argument('--concurrency', help='number of concurrent requests', type=int, default=20)
+	parser.add_argument('--rounds', help='number of measured rounds per benchmark', type=int, default=3)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	async def chain_info(_request):
+		return web.json_response({'height': '1234', 'scoreHigh': '0', 'scoreLow': '0'})
+
+	app = web.Application()
+	app.router.add_get('/chain/info', chain_info)
+
+	benchmark_results = []
+	async with TestServer(app) as server:
+		endpoint = str(server.make_url('')).rstrip('/')
+
+		for (name, run) in BENCHMARKS.items():
+			if args.filter in name:
+				round_seconds = [await run(endpoint, args) for _ in range(args.rounds)]
+				benchmark_results.append(summarize_rounds(name, 'requests', args.requests, round_seconds))
+
+	report_results(args, {'requests': args.requests, 'concurrency': args.concurrency, 'rounds': args.rounds}, benchmark_results)
+
+
+if '__main__' == __name__:
+	asyncio.run(main())
@@ -67,6 +67,9 @@ ffi_builder.cdef('''
 	int BIO_free(BIO *a);
 	long BIO_get_mem_data(BIO *b, char **pp);
 
+	// EVP_MD
+	const EVP_MD *EVP_sha256(void);
+
 	// EVP_PKEY
 	EVP_PKEY *EVP_PKEY_new_raw_private_key(int type, ENGINE *e, const unsigned char *key, size_t keylen);
 	void EVP_PKEY_free(EVP_PKEY *key);
@@ -85,6 +88,7 @@ ffi_builder.cdef('''
 	int X509_set_pubkey(X509 *x, EVP_PKEY *pkey);
 	int X509_set_version(X509 *x, long version);
 	int X509_sign(X509 *x, EVP_PKEY *pkey, const EVP_MD *md);
+	int X509_digest(const X509 *data, const EVP_MD *type, unsigned char *md, unsigned int *len);
 
 	// STACK_OF(X509)
 	Cryptography_STACK_OF_X509 *sk_X509_new_null(void);
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from collections import deque, namedtuple
+from contextlib import asynccontextmanager
+
+from ..model.Exceptions import HttpException, NodeException
+
+DEFAULT_INITIAL_LIMIT = 20
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 256
+DEFAULT_BACKOFF_RATIO = 0.5
+DEFAULT_LATENCY_TOLERANCE = 4
+DEFAULT_MIN_CONGESTION_LATENCY_SECONDS = 0.5
+DEFAULT_THROTTLE_EVENT_HISTORY_SIZE = 100
+
+THROTTLE_HTTP_STATUS_CODES = (408, 429, 503)
+
+ThrottleEvent = namedtuple('ThrottleEvent', ['timestamp', 'reason', 'limit'])
+
+
+class AdaptiveLimiter:  # pylint: disable=too-many-instance-attributes
+	"""
+	Limits the number of concurrent requests sent to a single endpoint using AIMD (additive increase, multiplicative decrease).
+
+	The limit grows by one after (about) limit requests complete without congestion. It is multiplied by backoff_ratio when a request
+	is throttled (HTTP 408, 429 or 503), times out or when its latency exceeds both latency_tolerance times the lowest observed latency and
+	min_congestion_latency_seconds. Only requests started after the last decrease can decrease the limit again, so a burst of
+	throttled requests backs off once.
+	"""
+
+	def __init__(
+		self,
+		initial_limit=DEFAULT_INITIAL_LIMIT,
+		min_limit=DEFAULT_MIN_LIMIT,
+		max_limit=DEFAULT_MAX_LIMIT,
+		backoff_ratio=DEFAULT_BACKOFF_RATIO,
+		latency_tolerance=DEFAULT_LATENCY_TOLERANCE,
+		min_congestion_latency_seconds=DEFAULT_MIN_CONGESTION_LATENCY_SECONDS,
+		throttle_event_history_size=DEFAULT_THROTTLE_EVENT_HISTORY_SIZE
+	):
+		"""Creates an adaptive limiter."""
+
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+
+		self.min_limit = min_limit
+		self.max_limit = max_limit
+		self.backoff_ratio = backoff_ratio
+		self.latency_tolerance = latency_tolerance
+		self.min_congestion_latency_seconds = min_congestion_latency_seconds
+
+		self.request_count = 0
+		self.throttle_count = 0
+		self.throttle_events = deque(maxlen=throttle_event_history_size)
+
+		self._limit = float(initial_limit)
+		self._active_count = 0
+		self._waiters = deque()
+		self._generation = 0
+		self._min_latency_seconds = None
+
+	@property
+	def limit(self):
+		"""Gets the current maximum number of concurrent requests."""
+
+		return int(self._limit)
+
+	@property
+	def active_count(self):
+		"""Gets the number of requests currently in flight."""
+
+		return self._active_count
+
+	@property
+	def waiting_count(self):
+		"""Gets the number of requests waiting for a free slot."""
+
+		return sum(1 for waiter in self._waiters if not waiter.done())
+
+	@asynccontextmanager
+	async def request(self):
+		"""Waits for a free request slot and adjusts the limit based on the outcome of the request."""
+
+		await self._acquire()
+		generation = self._generation
+		start_time = time.perf_counter()
+		try:
+			yield
+		except (asyncio.TimeoutError, NodeException) as ex:
+			congestion_reason = self._find_congestion_reason(ex)
+			if congestion_reason:
+				self._decrease(generation, congestion_reason)
+
+			raise
+		else:
+			self._complete(generation, time.perf_counter() - start_time)
+		finally:
+			self.request_count += 1
+			self._release()
+
+	@staticmethod
+	def _find_congestion_reason(ex):
+		if isinstance(ex, HttpException):
+			return f'HTTP {ex.http_status_code}' if ex.http_status_code in THROTTLE_HTTP_STATUS_CODES else None
+
+		# stalled nodes surface as timeouts, which connectors wrap in NodeException
+		if isinstance(ex, asyncio.TimeoutError) or isinstance(ex.__cause__, asyncio.TimeoutError):
+			return 'timeout'
+
+		return None
+
+	async def _acquire(self):
+		if not self._waiters and self._active_count < self.limit:
+			self._active_count += 1
+			return
+
+		waiter = asyncio.get_running_loop().create_future()
+		self._waiters.append(waiter)
+		try:
+			await waiter
+		except asyncio.CancelledError:
+			if waiter.cancelled():
+				if waiter in self._waiters:
+					self._waiters.remove(waiter)
+			else:
+				# slot was handed over just before cancellation, so pass it on
+				self._release()
+
+			raise
+
+	def _release(self):
+		self._active_count -= 1
+		while self._waiters and self._active_count < self.limit:
+			waiter = self._waiters.popleft()
+			if not waiter.done():
+				self._active_count += 1
+				waiter.set_result(None)
+
+	def _complete(self, generation, latency_seconds):
+		if self._min_latency_seconds is None or latency_seconds < self._min_latency_seconds:
+			self._min_latency_seconds = latency_seconds
+
+		congestion_latency_seconds = max(self._min_latency_seconds * self.latency_tolerance, self.min_congestion_latency_seconds)
+		if latency_seconds > congestion_latency_seconds:
+			self._decrease(generation, 'latency')
+			return
+
+		self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+	def _decrease(self, generation, reason):
+		if generation != self._generation:
+			return
+
+		self._generation += 1
+		self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+		self.throttle_count += 1
+		self.throttle_events.append(ThrottleEvent(time.time(), reason, self.limit))
+
+
+class AdaptiveLimiterPool:
+	"""Pool of adaptive limiters that can be shared by multiple connectors (one limiter per endpoint)."""
+
+	def __init__(self, **kwargs):
+		"""Creates a limiter pool, forwarding any arguments to each created AdaptiveLimiter."""
+
+		self.limiter_kwargs = kwargs
+
+		self._limiters = {}
+
+	@property
+	def size(self):
+		"""Gets the number of limiters in the pool."""
+
+		return len(self._limiters)
+
+	def limiter(self, endpoint):
+		"""Gets the (shared) limiter for an endpoint, creating it if needed."""
+
+		limiter_key = str(endpoint)
+		limiter = self._limiters.get(limiter_key, None)
+		if limiter is None:
+			limiter = AdaptiveLimiter(**self.limiter_kwargs)
+			self._limiters[limiter_key] = limiter
+
+		return limiter
+
+	def throttle_events(self):
+		"""Gets (endpoint, throttle event) pairs for all limiters ordered by time."""
+
+		return sorted(
+			((endpoint, event) for (endpoint, limiter) in self._limiters.items() for event in limiter.throttle_events),
+			key=lambda endpoint_event_pair: endpoint_event_pair[1].timestamp)
+
+
+DEFAULT_ADAPTIVE_LIMITER_POOL = AdaptiveLimiterPool()
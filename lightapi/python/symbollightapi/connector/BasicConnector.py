@@ -1,9 +1,13 @@
 import asyncio
 import json
+import time
 
 from aiohttp import ClientSession, ClientTimeout, client_exceptions
 
 from ..model.Exceptions import HttpException, NodeException
+from .AdaptiveLimiter import DEFAULT_ADAPTIVE_LIMITER_POOL
+from .NodeSelector import NodeSelector
+from .RequestMetrics import ResponseSample, make_path_template
 
 
 class BasicConnector:
@@ -14,49 +18,245 @@ class BasicConnector:
 
 		self.endpoint = endpoint
 		self.timeout_seconds = None
+		self.session_pool = None
+		self.limiter_pool = DEFAULT_ADAPTIVE_LIMITER_POOL
+		self.node_selector = None
+		self.metrics = None
+		self.response_cache = None
 
-	async def _dispatch(self, action, url_path, property_name, not_found_as_error, **kwargs):
+	@property
+	def limiter(self):
+		"""Gets the adaptive limiter shared by all connectors to the same endpoint or None if requests are not limited."""
+
+		return None if self.limiter_pool is None else self.limiter_pool.limiter(self.endpoint)
+
+	async def finalized_chain_height(self):
+		"""
+		Gets the finalized chain height, which determines whether responses tied to a chain height can be cached.
+		Connectors to networks with finality override this; by default, no height is finalized.
+		"""
+
+		return 0
+
+	async def _dispatch_cached(self, cache_policy, action, url_path, property_name, not_found_as_error, is_idempotent, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		if self.response_cache is None or cache_policy is None:
+			return await self._dispatch(action, url_path, property_name, not_found_as_error, is_idempotent, **kwargs)
+
+		cache_key = json.dumps([action, url_path, property_name, kwargs.get('json', None)])
+		(is_cached, response) = self.response_cache.lookup(cache_key)
+		if is_cached:
+			return response
+
+		response = await self._dispatch(action, url_path, property_name, not_found_as_error, is_idempotent, **kwargs)
+		try:
+			height = cache_policy.response_height(response)
+		except ValueError:
+			return response  # response is not cacheable (e.g. not found)
+
+		if height is not None and self.response_cache.is_finalized_height_stale(height):
+			finalized_chain_height = await self.finalized_chain_height()
+			self.response_cache.update_finalized_chain_height(finalized_chain_height)
+
+		self.response_cache.add(cache_key, response, cache_policy, height)
+		return response
+
+	async def _dispatch(self, action, url_path, property_name, not_found_as_error, is_idempotent=True, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		if self.node_selector and is_idempotent:
+			return await self._dispatch_hedged(action, url_path, property_name, not_found_as_error, **kwargs)
+
+		# non-idempotent requests (e.g. transaction announcements) are never hedged, failed over or used as probes,
+		# so they are sent exactly once to the primary endpoint
+		return await self._dispatch_to(self.endpoint, action, url_path, property_name, not_found_as_error, **kwargs)
+
+	async def _dispatch_hedged(self, action, url_path, property_name, not_found_as_error, **kwargs):  # pylint: disable=too-many-locals
+		node_selector = self.node_selector
+		dispatch_args = (action, url_path, property_name, not_found_as_error)
+
+		probe_endpoint = node_selector.try_begin_probe()
+		if probe_endpoint:
+			probe_task = asyncio.create_task(self._dispatch_probe(probe_endpoint, *dispatch_args, **kwargs))
+			node_selector.probe_tasks.add(probe_task)
+			probe_task.add_done_callback(node_selector.probe_tasks.discard)
+
+		endpoints = node_selector.ranked_endpoints()
+		pending_tasks = set()
+		is_hedged = False
+		last_exception = None
+
+		def start_next_attempt():
+			endpoint = endpoints.pop(0)
+			pending_tasks.add(asyncio.create_task(self._dispatch_attempt(endpoint, *dispatch_args, **kwargs)))
+			return endpoint
+
+		primary_endpoint = start_next_attempt()
+		try:
+			while pending_tasks:
+				hedge_delay_seconds = None
+				if endpoints and not is_hedged:
+					hedge_delay_seconds = node_selector.hedge_delay_seconds(primary_endpoint)
+
+				(done_tasks, _) = await asyncio.wait(pending_tasks, timeout=hedge_delay_seconds, return_when=asyncio.FIRST_COMPLETED)
+				if not done_tasks:
+					# primary node is slower than usual, so send a duplicate request to the next best node
+					start_next_attempt()
+					is_hedged = True
+					node_selector.hedge_count += 1
+					continue
+
+				for task in done_tasks:
+					pending_tasks.remove(task)
+					exception = task.exception()
+					if not exception:
+						return task.result()
+
+					if not NodeSelector.is_node_failure(exception):
+						raise exception
+
+					last_exception = exception
+
+				if not pending_tasks and endpoints:
+					# all outstanding attempts failed, so fail over to the next best node
+					start_next_attempt()
+
+			raise last_exception
+		finally:
+			for task in pending_tasks:
+				task.cancel()
+
+			await asyncio.gather(*pending_tasks, return_exceptions=True)
+
+	async def _dispatch_attempt(self, endpoint, action, url_path, property_name, not_found_as_error, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		start_time = time.perf_counter()
+		try:
+			result = await self._dispatch_to(endpoint, action, url_path, property_name, not_found_as_error, **kwargs)
+		except asyncio.CancelledError:
+			# abandoned (hedged) attempt took at least this long
+			self.node_selector.record_latency(endpoint, time.perf_counter() - start_time)
+			raise
+		except NodeException as ex:
+			if NodeSelector.is_node_failure(ex):
+				self.node_selector.record_failure(endpoint)
+			else:
+				self.node_selector.record_success(endpoint, time.perf_counter() - start_time)
+
+			raise
+
+		self.node_selector.record_success(endpoint, time.perf_counter() - start_time)
+		return result
+
+	async def _dispatch_probe(self, endpoint, action, url_path, property_name, not_found_as_error, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		try:
+			await self._dispatch_attempt(endpoint, action, url_path, property_name, not_found_as_error, **kwargs)
+		except NodeException:
+			pass  # outcome is recorded by _dispatch_attempt
+		finally:
+			self.node_selector.end_probe(endpoint)
+
+	async def _dispatch_to(self, endpoint, action, url_path, property_name, not_found_as_error, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		if self.limiter_pool is None:
+			return await self._dispatch_unlimited(endpoint, action, url_path, property_name, not_found_as_error, **kwargs)
+
+		async with self.limiter_pool.limiter(endpoint).request():
+			return await self._dispatch_unlimited(endpoint, action, url_path, property_name, not_found_as_error, **kwargs)
+
+	async def _dispatch_unlimited(self, endpoint, action, url_path, property_name, not_found_as_error, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		if self.metrics is None:
+			return await self._dispatch_unmeasured(endpoint, action, url_path, property_name, not_found_as_error, None, **kwargs)
+
+		operation = f'{action.upper()} /{make_path_template(url_path)}'
+		response_sample = ResponseSample()
+		start_time = time.perf_counter()
+		try:
+			result = await self._dispatch_unmeasured(endpoint, action, url_path, property_name, not_found_as_error, response_sample, **kwargs)
+		except Exception as ex:
+			self.metrics.record_request(endpoint, operation, time.perf_counter() - start_time, response_sample, ex)
+			raise
+
+		self.metrics.record_request(endpoint, operation, time.perf_counter() - start_time, response_sample)
+		return result
+
+	async def _dispatch_unmeasured(self, endpoint, action, url_path, property_name, not_found_as_error, response_sample, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
 		try:
 			timeout = ClientTimeout(total=self.timeout_seconds)
+			url = f'{endpoint}/{url_path}'
+			dispatch_args = (action, url, property_name, not_found_as_error, timeout, response_sample)
+			if self.session_pool:
+				# reuse keep-alive connections from the shared pool
+				session = self.session_pool.session(endpoint)
+				return await self._dispatch_with_session(session, *dispatch_args, **kwargs)
+
 			async with ClientSession(timeout=timeout) as session:
-				async with getattr(session, action)(f'{self.endpoint}/{url_path}', **kwargs) as response:
-					try:
-						response_json = await response.json()
-					except (client_exceptions.ContentTypeError, json.decoder.JSONDecodeError) as ex:
-						raise NodeException from ex
-
-					if 400 <= response.status and (404 != response.status or not_found_as_error):
-						error_message = f'HTTP request failed with code {response.status}'
-						for key in ('code', 'message'):
-							if key in response_json:
-								error_message += f'\n{response_json[key]}'
-
-						raise HttpException(error_message, response.status)
-
-					return response_json if property_name is None else response_json[property_name]
-		except (asyncio.TimeoutError, client_exceptions.ClientConnectorError) as ex:
+				return await self._dispatch_with_session(session, *dispatch_args, **kwargs)
+		except (asyncio.TimeoutError, client_exceptions.ClientConnectorError, client_exceptions.ServerDisconnectedError) as ex:
 			raise NodeException from ex
 
-	async def get(self, url_path, property_name=None, not_found_as_error=True):
+	@staticmethod
+	async def _dispatch_with_session(session, action, url, property_name, not_found_as_error, timeout, response_sample, **kwargs):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		async with getattr(session, action)(url, timeout=timeout, **kwargs) as response:
+			try:
+				if response_sample is None:
+					response_json = await response.json()
+				else:
+					# read body first, so that only decoding is timed
+					response_sample.byte_count = len(await response.read())
+					start_time = time.perf_counter()
+					response_json = await response.json()
+					response_sample.decode_seconds = time.perf_counter() - start_time
+			except (client_exceptions.ContentTypeError, json.decoder.JSONDecodeError) as ex:
+				raise NodeException from ex
+
+			if 400 <= response.status and (404 != response.status or not_found_as_error):
+				error_message = f'HTTP request failed with code {response.status}'
+				for key in ('code', 'message'):
+					if key in response_json:
+						error_message += f'\n{response_json[key]}'
+
+				raise HttpException(error_message, response.status)
+
+			return response_json if property_name is None else response_json[property_name]
+
+	async def get(self, url_path, property_name=None, not_found_as_error=True, cache_policy=None, is_idempotent=True):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
 		"""
 		Initiates a GET to the specified path and returns the desired property.
+		Responses are served from and added to the response cache according to cache_policy, if any.
+		Only idempotent requests are hedged and failed over to other nodes when a node selector is set.
 		Raises NodeException on connection or content failure.
 		"""
 
-		return await self._dispatch('get', url_path, property_name, not_found_as_error)
+		return await self._dispatch_cached(cache_policy, 'get', url_path, property_name, not_found_as_error, is_idempotent)
 
-	async def post(self, url_path, request_payload, property_name=None, not_found_as_error=True):
+	async def post(self, url_path, request_payload, property_name=None, not_found_as_error=True, cache_policy=None, is_idempotent=False):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
 		"""
 		Initiates a POST to the specified path and returns the desired property.
+		Responses are served from and added to the response cache according to cache_policy, if any.
+		Only idempotent requests (e.g. queries) are hedged and failed over to other nodes when a node selector is set.
 		Raises NodeException on connection or content failure.
 		"""
 
-		return await self._dispatch('post', url_path, property_name, not_found_as_error, json=request_payload)
+		return await self._dispatch_cached(
+			cache_policy,
+			'post',
+			url_path,
+			property_name,
+			not_found_as_error,
+			is_idempotent,
+			json=request_payload)
 
 	async def put(self, url_path, request_payload, property_name=None, not_found_as_error=True):
 		"""
 		Initiates a PUT to the specified path and returns the desired property.
+		PUTs are never hedged or failed over to other nodes.
 		Raises NodeException on connection or content failure.
 		"""
 
-		return await self._dispatch('put', url_path, property_name, not_found_as_error, json=request_payload)
+		return await self._dispatch('put', url_path, property_name, not_found_as_error, False, json=request_payload)
@@ -0,0 +1,56 @@
+from .LruStore import LruStore, LruStoreTable
+
+DEFAULT_MAX_CACHED_BLOCK_COUNT = 10000
+
+BLOCK_TIMESTAMP_TABLE = LruStoreTable('block_timestamp', ('height', 'integer'), ('timestamp', 'integer'))
+
+
+class BlockTimestampCache:
+	"""
+	Caches the timestamps of finalized blocks keyed by (network, height).
+	Timestamps are kept in an in-memory LRU and, optionally, in an on-disk SQLite store.
+	"""
+
+	def __init__(self, network_name, max_size=DEFAULT_MAX_CACHED_BLOCK_COUNT, database_filepath=None):
+		"""Creates a block timestamp cache."""
+
+		self.network_name = network_name
+		self.max_size = max_size
+
+		self.hit_count = 0
+		self.miss_count = 0
+
+		self._store = LruStore(network_name, max_size, BLOCK_TIMESTAMP_TABLE, database_filepath)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		"""Closes the on-disk store, if any."""
+
+		self._store.close()
+
+	def timestamp(self, height):
+		"""Gets the cached timestamp of the block at a height or None if it is not cached."""
+
+		timestamp = self._store.get(height)
+		if timestamp is None:
+			self.miss_count += 1
+			return None
+
+		self.hit_count += 1
+		return timestamp
+
+	def add_all(self, height_timestamp_pairs, finalized_chain_height):
+		"""Adds block timestamps to the cache, skipping blocks that are not finalized. Returns the number of added blocks."""
+
+		finalized_height_timestamp_pairs = [
+			(height, timestamp) for (height, timestamp) in height_timestamp_pairs
+			if height <= finalized_chain_height
+		]
+
+		self._store.add_all(finalized_height_timestamp_pairs)
+		return len(finalized_height_timestamp_pairs)
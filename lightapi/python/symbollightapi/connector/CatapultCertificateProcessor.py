@@ -7,11 +7,17 @@ from .CertificateUtils import try_parse_certificate, verify_self_signed
 class CatapultCertificateProcessor:
 	"""Catapult-specific certificate processor."""
 
-	def __init__(self):
-		"""Creates a new certificate processor."""
+	def __init__(self, certificate_info_cache=None):
+		"""Creates a new certificate processor, optionally using a (shared) certificate info cache."""
 
 		self.certificate_infos = []
 
+		(self._try_parse_certificate, self._verify_self_signed) = (try_parse_certificate, verify_self_signed)
+		if certificate_info_cache is not None:
+			(self._try_parse_certificate, self._verify_self_signed) = (
+				certificate_info_cache.try_parse_certificate,
+				certificate_info_cache.verify_self_signed)
+
 	@property
 	def size(self):
 		"""Gets the number of certificates in the chain."""
@@ -60,14 +66,14 @@ class CatapultCertificateProcessor:
 			log.warning(f'rejecting certificate chain with unverified unexpected error {error_code}')
 			return False
 
-		if not verify_self_signed(certificate):
+		if not self._verify_self_signed(certificate):
 			log.warning('rejecting certificate chain with improperly self-signed root certificate')
 			return False
 
 		return True
 
 	def _push(self, certificate):
-		certificate_info = try_parse_certificate(certificate)
+		certificate_info = self._try_parse_certificate(certificate)
 		if not certificate_info:
 			log.warning('rejecting certificate chain due to certificate parse failure')
 			return False
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+from .CertificateUtils import calculate_certificate_digest, try_parse_certificate, verify_self_signed
+
+DEFAULT_MAX_CACHED_CERTIFICATE_COUNT = 10000
+
+
+class CertificateInfoCache:
+	"""
+	Caches parsed certificate information and self-signed verification results keyed by certificate (DER) digest.
+	Can be shared by certificate processors of many connections.
+	"""
+
+	def __init__(self, max_size=DEFAULT_MAX_CACHED_CERTIFICATE_COUNT):
+		"""Creates a certificate info cache."""
+
+		self.max_size = max_size
+
+		self.hit_count = 0
+		self.miss_count = 0
+
+		self._digest_to_result = OrderedDict()
+
+	def __len__(self):
+		return len(self._digest_to_result)
+
+	def _get_or_add(self, certificate, operation_name, operation):
+		digest = calculate_certificate_digest(certificate)
+		if not digest:
+			return operation(certificate)
+
+		key = (operation_name, digest)
+		if key in self._digest_to_result:
+			self.hit_count += 1
+			self._digest_to_result.move_to_end(key)
+			return self._digest_to_result[key]
+
+		self.miss_count += 1
+		result = operation(certificate)
+		self._digest_to_result[key] = result
+		if len(self._digest_to_result) > self.max_size:
+			self._digest_to_result.popitem(last=False)
+
+		return result
+
+	def try_parse_certificate(self, certificate):
+		"""Tries to extract information about certificate, using the cached result when available."""
+
+		return self._get_or_add(certificate, 'parse', try_parse_certificate)
+
+	def verify_self_signed(self, certificate):
+		"""Returns True if self-signed certificate signature is correct, using the cached result when available."""
+
+		return self._get_or_add(certificate, 'verify', verify_self_signed)
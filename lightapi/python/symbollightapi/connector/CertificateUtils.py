@@ -47,6 +47,21 @@ def try_parse_certificate(certificate):
 # endregion
 
 
+# region calculate_certificate_digest
+
+def calculate_certificate_digest(certificate):
+	"""Calculates the SHA-256 digest of the DER encoding of a certificate."""
+
+	digest = ffi.new('unsigned char[]', 32)
+	digest_size_pointer = ffi.new('unsigned int *')
+	if not lib.X509_digest(certificate, lib.EVP_sha256(), digest, digest_size_pointer):
+		return None
+
+	return ffi.buffer(digest, digest_size_pointer[0])[:]
+
+# endregion
+
+
 # region verify_self_signed
 
 def verify_self_signed(certificate):
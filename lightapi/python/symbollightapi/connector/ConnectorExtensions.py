@@ -1,65 +1,319 @@
 import asyncio
+import time
+from contextlib import aclosing
 
-from aiolimiter import AsyncLimiter
+DEFAULT_TRANSACTION_HASH_CHUNK_SIZE = 100
+DEFAULT_MAX_CONCURRENT_CHUNK_COUNT = 4
+
+
+def _record_operation(connector, name, fan_out, start_time):
+	if connector.metrics is not None:
+		connector.metrics.record_operation(name, fan_out, time.perf_counter() - start_time)
 
-from ..model.Constants import DEFAULT_ASYNC_LIMITER_ARGUMENTS
 
 # region get_incoming_transactions_from
 
 
-async def get_incoming_transactions_from(connector, address, start_height=None, end_height=None):
-	"""Uses the specified connector to retrieve all transactions sent to an account in the range [start_height, end_height)."""
+def _filter_transactions_by_height(transactions_json, start_height, end_height):
+	"""Filters (descending) transactions to the range [start_height, end_height) and indicates if the search is complete."""
+
+	filtered_transactions_json = []
+	for transaction_json in transactions_json:
+		transaction_height = int(transaction_json['meta']['height'])
+		if start_height and transaction_height < start_height:
+			return (filtered_transactions_json, True)
+
+		if end_height and transaction_height >= end_height:
+			continue
+
+		filtered_transactions_json.append(transaction_json)
+
+	return (filtered_transactions_json, False)
+
+
+async def _produce_pages(connector, fetch_page, start_height, page_queue):
+	try:
+		start_id = None
+		while True:
+			transactions_json = await fetch_page(start_id)
+			if not transactions_json:
+				break
+
+			await page_queue.put(transactions_json)
+			if start_height and int(transactions_json[-1]['meta']['height']) < start_height:
+				break
 
-	start_id = None
+			start_id = connector.extract_transaction_id(transactions_json[-1])
+	except Exception as ex:  # pylint: disable=broad-exception-caught
+		await page_queue.put(ex)
+		return
+
+	await page_queue.put(None)
+
+
+async def _consume_pages(page_queue, start_height, end_height):
 	while True:
-		transactions_json = await connector.incoming_transactions(address, start_id)
-		if not transactions_json:
+		transactions_json = await page_queue.get()
+		if transactions_json is None:
+			return
+
+		if isinstance(transactions_json, Exception):
+			raise transactions_json
+
+		(filtered_transactions_json, is_complete) = _filter_transactions_by_height(transactions_json, start_height, end_height)
+		for transaction_json in filtered_transactions_json:
+			yield transaction_json
+
+		if is_complete:
+			return
+
+
+def _split_height_range(start_height, end_height, shard_count):
+	"""Splits [start_height, end_height) into at most shard_count contiguous ranges ordered from highest to lowest."""
+
+	shard_size = max(1, -(-(end_height - start_height) // shard_count))
+	shard_start_heights = range(start_height, end_height, shard_size)
+	return [
+		(shard_start_height, min(shard_start_height + shard_size, end_height))
+		for shard_start_height in reversed(shard_start_heights)
+	]
+
+
+async def get_incoming_transactions_from(connector, address, start_height=None, end_height=None, prefetch_page_count=0, shard_count=0):
+	# pylint: disable=too-many-arguments, too-many-positional-arguments
+	"""
+	Uses the specified connector to retrieve all transactions sent to an account in the range [start_height, end_height).
+	When prefetch_page_count is nonzero, up to that many pages are fetched ahead of the caller.
+	When shard_count is greater than one and the connector supports height filtering (incoming_transactions_in_range),
+	the range is split into shards that are paged concurrently and returned in descending height order.
+	Otherwise, sharding falls back to prefetching.
+	"""
+
+	if shard_count > 1:
+		prefetch_page_count = max(1, prefetch_page_count)
+
+	fan_out = 1
+	start_time = time.perf_counter()
+	try:
+		if shard_count > 1 and start_height and end_height and hasattr(connector, 'incoming_transactions_in_range'):
+			height_ranges = _split_height_range(start_height, end_height, shard_count)
+			fan_out = len(height_ranges)
+			# close the shard iterator explicitly so that its producers are stopped before this generator finishes closing
+			async with aclosing(_get_incoming_transactions_from_sharded(connector, address, height_ranges, prefetch_page_count)) as shards:
+				async for transaction_json in shards:
+					yield transaction_json
+
+			return
+
+		if prefetch_page_count:
+			async def fetch_page(start_id):
+				return await connector.incoming_transactions(address, start_id)
+
+			page_queue = asyncio.Queue(prefetch_page_count)
+			producer_task = asyncio.create_task(_produce_pages(connector, fetch_page, start_height, page_queue))
+			try:
+				async for transaction_json in _consume_pages(page_queue, start_height, end_height):
+					yield transaction_json
+			finally:
+				producer_task.cancel()
+				await asyncio.gather(producer_task, return_exceptions=True)
+
 			return
 
-		for transaction_json in transactions_json:
-			transaction_height = int(transaction_json['meta']['height'])
-			if start_height and transaction_height < start_height:
+		start_id = None
+		while True:
+			transactions_json = await connector.incoming_transactions(address, start_id)
+			if not transactions_json:
 				return
 
-			if end_height and transaction_height >= end_height:
-				continue
+			(filtered_transactions_json, is_complete) = _filter_transactions_by_height(transactions_json, start_height, end_height)
+			for transaction_json in filtered_transactions_json:
+				yield transaction_json
 
-			yield transaction_json
+			if is_complete:
+				return
+
+			start_id = connector.extract_transaction_id(transactions_json[-1])
+	finally:
+		_record_operation(connector, 'get_incoming_transactions_from', fan_out, start_time)
+
+
+async def _get_incoming_transactions_from_sharded(connector, address, height_ranges, prefetch_page_count):
+	def make_fetch_page(shard_start_height, shard_end_height):
+		async def fetch_page(start_id):
+			return await connector.incoming_transactions_in_range(address, shard_start_height, shard_end_height, start_id)
+
+		return fetch_page
 
-		start_id = connector.extract_transaction_id(transactions_json[-1])
+	shard_page_queues = []
+	producer_tasks = []
+	for (shard_start_height, shard_end_height) in height_ranges:
+		page_queue = asyncio.Queue(prefetch_page_count)
+		fetch_page = make_fetch_page(shard_start_height, shard_end_height)
+		producer_tasks.append(asyncio.create_task(_produce_pages(connector, fetch_page, shard_start_height, page_queue)))
+		shard_page_queues.append((page_queue, shard_start_height, shard_end_height))
+
+	try:
+		# shards are ordered from highest to lowest, so draining them in order preserves descending height order
+		for (page_queue, shard_start_height, shard_end_height) in shard_page_queues:
+			async for transaction_json in _consume_pages(page_queue, shard_start_height, shard_end_height):
+				yield transaction_json
+	finally:
+		for producer_task in producer_tasks:
+			producer_task.cancel()
+
+		await asyncio.gather(*producer_tasks, return_exceptions=True)
+
+# endregion
+
+
+# region FinalizedTransactionCache
+
+class FinalizedTransactionCache:
+	"""Caches the heights of transactions known to be confirmed at or below the finalized chain height."""
+
+	def __init__(self):
+		"""Creates an empty cache."""
+
+		self._transaction_hash_to_height = {}
+
+	def __len__(self):
+		return len(self._transaction_hash_to_height)
+
+	def __contains__(self, transaction_hash):
+		return transaction_hash in self._transaction_hash_to_height
+
+	def height(self, transaction_hash):
+		"""Gets the (finalized) height of a cached transaction or None if it is not cached."""
+
+		return self._transaction_hash_to_height.get(transaction_hash, None)
+
+	def add(self, transaction_hash, height, finalized_chain_height):
+		"""Adds a confirmed transaction to the cache if and only if it is finalized."""
+
+		if height > finalized_chain_height:
+			return False
+
+		self._transaction_hash_to_height[transaction_hash] = height
+		return True
+
+# endregion
+
+
+# region resolve_confirmed_transactions
+
+async def resolve_confirmed_transactions(
+	connector,
+	transaction_hashes,
+	chunk_size=DEFAULT_TRANSACTION_HASH_CHUNK_SIZE,
+	max_concurrent_chunk_count=DEFAULT_MAX_CONCURRENT_CHUNK_COUNT,
+	finalized_cache=None
+):
+	"""
+	Filters transaction hashes and returns only confirmed ones with (confirmed) heights.
+	Duplicate hashes are removed and the remaining hashes are split into chunks that are queried concurrently.
+	Hashes present in finalized_cache are not queried.
+	"""
+
+	start_time = time.perf_counter()
+	unique_transaction_hashes = list(dict.fromkeys(transaction_hashes))
+
+	cached_transaction_hash_height_pairs = []
+	pending_transaction_hashes = []
+	for transaction_hash in unique_transaction_hashes:
+		height = finalized_cache.height(transaction_hash) if finalized_cache is not None else None
+		if height is None:
+			pending_transaction_hashes.append(transaction_hash)
+		else:
+			cached_transaction_hash_height_pairs.append((transaction_hash, height))
+
+	semaphore = asyncio.Semaphore(max_concurrent_chunk_count)
+
+	async def filter_confirmed_transactions_chunk(chunk_transaction_hashes):
+		async with semaphore:
+			return await connector.filter_confirmed_transactions(chunk_transaction_hashes)
+
+	tasks = [
+		filter_confirmed_transactions_chunk(pending_transaction_hashes[i:i + chunk_size])
+		for i in range(0, len(pending_transaction_hashes), chunk_size)
+	]
+	chunk_transaction_hash_height_pairs = await asyncio.gather(*tasks)
+	_record_operation(connector, 'resolve_confirmed_transactions', len(tasks), start_time)
+
+	return cached_transaction_hash_height_pairs + [
+		transaction_hash_height_pair
+		for transaction_hash_height_pairs in chunk_transaction_hash_height_pairs
+		for transaction_hash_height_pair in transaction_hash_height_pairs
+	]
 
 # endregion
 
 
 # region filter_finalized_transactions
 
-async def filter_finalized_transactions(connector, transaction_hashes):
+async def filter_finalized_transactions(connector, transaction_hashes, finalized_cache=None):
 	"""Filters transaction hashes and returns only finalized ones with heights."""
 
+	start_time = time.perf_counter()
 	finalized_chain_height = await connector.finalized_chain_height()
-	transaction_hash_height_pairs = await connector.filter_confirmed_transactions(transaction_hashes)
-	return list(filter(
+	transaction_hash_height_pairs = await resolve_confirmed_transactions(
+		connector,
+		transaction_hashes,
+		finalized_cache=finalized_cache)
+
+	finalized_transaction_hash_height_pairs = list(filter(
 		lambda transaction_hash_height_pair: transaction_hash_height_pair[1] <= finalized_chain_height,
 		transaction_hash_height_pairs))
 
+	if finalized_cache is not None:
+		for (transaction_hash, height) in finalized_transaction_hash_height_pairs:
+			finalized_cache.add(transaction_hash, height, finalized_chain_height)
+
+	# confirmed transactions are resolved by a nested (and separately recorded) operation
+	_record_operation(connector, 'filter_finalized_transactions', 1, start_time)
+	return finalized_transaction_hash_height_pairs
+
 # endregion
 
 
 # region query_block_timestamps
 
-async def query_block_timestamps(connector, heights, async_limiter_arguments=DEFAULT_ASYNC_LIMITER_ARGUMENTS):
-	"""Finds the timestamps for all blocks with the specified heights."""
-
-	limiter = AsyncLimiter(*async_limiter_arguments)
+async def query_block_timestamps(connector, heights, timestamp_cache=None):
+	"""
+	Finds the timestamps for all blocks with the specified heights.
+	Concurrent requests are throttled by the adaptive limiter of the connector.
+	When timestamp_cache is specified, cached timestamps are reused and newly queried finalized timestamps are cached.
+	"""
 
 	async def get_block_height_timestamp_pair(height):
-		async with limiter:
-			block_json = await connector.block_headers(height)
-			timestamp = connector.extract_block_timestamp(block_json)
-			return (height, timestamp)
-
-	tasks = [get_block_height_timestamp_pair(height) for height in heights]
-	block_height_timestamp_pairs = await asyncio.gather(*tasks)
-	return block_height_timestamp_pairs
+		block_json = await connector.block_headers(height)
+		timestamp = connector.extract_block_timestamp(block_json)
+		return (height, timestamp)
+
+	start_time = time.perf_counter()
+	if timestamp_cache is None:
+		tasks = [get_block_height_timestamp_pair(height) for height in heights]
+		block_height_timestamp_pairs = await asyncio.gather(*tasks)
+		_record_operation(connector, 'query_block_timestamps', len(tasks), start_time)
+		return block_height_timestamp_pairs
+
+	height_to_timestamp = {}
+	missing_heights = []
+	for height in heights:
+		timestamp = timestamp_cache.timestamp(height)
+		if timestamp is None:
+			missing_heights.append(height)
+		else:
+			height_to_timestamp[height] = timestamp
+
+	if missing_heights:
+		finalized_chain_height = await connector.finalized_chain_height()
+		tasks = [get_block_height_timestamp_pair(height) for height in missing_heights]
+		queried_block_height_timestamp_pairs = await asyncio.gather(*tasks)
+		timestamp_cache.add_all(queried_block_height_timestamp_pairs, finalized_chain_height)
+		height_to_timestamp.update(queried_block_height_timestamp_pairs)
+
+	_record_operation(connector, 'query_block_timestamps', len(missing_heights), start_time)
+	return [(height, height_to_timestamp[height]) for height in heights]
 
 # endregion
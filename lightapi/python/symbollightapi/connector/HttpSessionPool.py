@@ -0,0 +1,61 @@
+import asyncio
+
+from aiohttp import ClientSession, TCPConnector
+
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 20
+DEFAULT_DNS_CACHE_TTL_SECONDS = 300
+DEFAULT_KEEPALIVE_TIMEOUT_SECONDS = 15
+
+
+class HttpSessionPool:
+	"""Pool of keep-alive HTTP sessions that can be shared by multiple connectors (one session per endpoint)."""
+
+	def __init__(
+		self,
+		connection_limit_per_host=DEFAULT_CONNECTION_LIMIT_PER_HOST,
+		dns_cache_ttl_seconds=DEFAULT_DNS_CACHE_TTL_SECONDS,
+		keepalive_timeout_seconds=DEFAULT_KEEPALIVE_TIMEOUT_SECONDS
+	):
+		"""Creates a session pool."""
+
+		self.connection_limit_per_host = connection_limit_per_host
+		self.dns_cache_ttl_seconds = dns_cache_ttl_seconds
+		self.keepalive_timeout_seconds = keepalive_timeout_seconds
+
+		self._sessions = {}
+
+	@property
+	def size(self):
+		"""Gets the number of open sessions."""
+
+		return len(self._sessions)
+
+	def session(self, endpoint):
+		"""Gets the (shared) session for an endpoint, creating it if needed."""
+
+		session_key = str(endpoint)
+		session = self._sessions.get(session_key, None)
+		if not session or session.closed:
+			connector = TCPConnector(
+				limit=0,
+				limit_per_host=self.connection_limit_per_host,
+				use_dns_cache=True,
+				ttl_dns_cache=self.dns_cache_ttl_seconds,
+				keepalive_timeout=self.keepalive_timeout_seconds)
+			session = ClientSession(connector=connector)
+			self._sessions[session_key] = session
+
+		return session
+
+	async def close(self):
+		"""Closes all sessions in the pool."""
+
+		sessions = list(self._sessions.values())
+		self._sessions = {}
+		await asyncio.gather(*(session.close() for session in sessions))
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.close()
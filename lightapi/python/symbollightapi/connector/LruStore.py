@@ -0,0 +1,110 @@
+import sqlite3
+import time
+from collections import OrderedDict, namedtuple
+
+LruStoreTable = namedtuple('LruStoreTable', ['name', 'key_column', 'value_column'])
+
+
+class LruStore:
+	"""
+	Stores values of a single network keyed by a key in an in-memory LRU and, optionally, permanent values in an on-disk SQLite store.
+
+	Values added with an expiry time are only kept in memory until that time.
+	Permanent values are also written to the on-disk store, if any, so they can be read back after they are evicted from memory.
+	"""
+
+	def __init__(self, network_name, max_size, table, database_filepath=None):
+		"""
+		Creates a store.
+		The on-disk table is described by table, where key_column and value_column are (name, type) tuples.
+		"""
+
+		self.network_name = network_name
+		self.max_size = max_size
+		self.eviction_count = 0
+
+		self._table = table
+		self._key_to_entry = OrderedDict()
+		self._connection = None
+
+		if database_filepath:
+			self._connection = sqlite3.connect(database_filepath)
+			self._connection.execute(f'''CREATE TABLE IF NOT EXISTS {table.name} (
+				network text,
+				{table.key_column[0]} {table.key_column[1]},
+				{table.value_column[0]} {table.value_column[1]},
+				PRIMARY KEY (network, {table.key_column[0]})
+			)''')
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def __len__(self):
+		return len(self._key_to_entry)
+
+	def close(self):
+		"""Closes the on-disk store, if any."""
+
+		if self._connection:
+			self._connection.close()
+			self._connection = None
+
+	def _remember(self, key, value, expiry_time):
+		self._key_to_entry[key] = (value, expiry_time)
+		self._key_to_entry.move_to_end(key)
+		if len(self._key_to_entry) > self.max_size:
+			self._key_to_entry.popitem(last=False)
+			self.eviction_count += 1
+
+	def _lookup_persisted(self, key):
+		if not self._connection:
+			return None
+
+		cursor = self._connection.execute(
+			f'''SELECT {self._table.value_column[0]} FROM {self._table.name} WHERE network = ? AND {self._table.key_column[0]} = ?''',
+			(self.network_name, key))
+		row = cursor.fetchone()
+		return row[0] if row else None
+
+	def get(self, key):
+		"""Gets the value for a key, marking it most recently used, or None if it is not stored (or is expired)."""
+
+		entry = self._key_to_entry.get(key, None)
+		if entry:
+			(value, expiry_time) = entry
+			if expiry_time is not None and time.monotonic() >= expiry_time:
+				del self._key_to_entry[key]
+				return None
+
+			self._key_to_entry.move_to_end(key)
+			return value
+
+		value = self._lookup_persisted(key)
+		if value is not None:
+			self._remember(key, value, None)
+
+		return value
+
+	def add(self, key, value, expiry_time=None):
+		"""Adds a value that expires at expiry_time (relative to time.monotonic) or a permanent value when expiry_time is None."""
+
+		if expiry_time is not None:
+			self._remember(key, value, expiry_time)
+			return
+
+		self.add_all([(key, value)])
+
+	def add_all(self, key_value_pairs):
+		"""Adds permanent values in a single on-disk transaction."""
+
+		for (key, value) in key_value_pairs:
+			self._remember(key, value, None)
+
+		if self._connection and key_value_pairs:
+			self._connection.executemany(
+				f'''INSERT OR REPLACE INTO {self._table.name} VALUES (?, ?, ?)''',
+				[(self.network_name, key, value) for (key, value) in key_value_pairs])
+			self._connection.commit()
@@ -1,4 +1,5 @@
 from binascii import unhexlify
+from functools import lru_cache
 
 from symbolchain.facade.NemFacade import NemFacade
 from symbolchain.nc import MultisigAccountModificationType, TransactionType
@@ -23,16 +24,156 @@ PREVIOUS_BLOCK_HASH_VALUE = 32
 HEIGHT_SIZE = 8
 TRANSACTION_COUNT_SIZE = 4
 
+SIZE_PREFIX_SIZE = 4
+TRANSACTION_TYPE_SIZE = 4
+TRANSACTION_VERSION_SIZE = 4  # version, reserved padding and network
+ADDRESS_FIELD_SIZE = SIZE_PREFIX_SIZE + 40
+PUBLIC_KEY_FIELD_SIZE = SIZE_PREFIX_SIZE + 32
+HASH_FIELD_SIZE = SIZE_PREFIX_SIZE + 32
+SIGNATURE_FIELD_SIZE = SIZE_PREFIX_SIZE + SIGNATURE_SIZE
+AMOUNT_SIZE = 8
+ENUM_SIZE = 4
+COUNT_SIZE = 4
+NON_VERIFIABLE_TRANSACTION_HEADER_SIZE = sum([
+	TRANSACTION_TYPE_SIZE,
+	TRANSACTION_VERSION_SIZE,
+	TIMESTAMP_SIZE,
+	PUBLIC_KEY_FIELD_SIZE,
+	AMOUNT_SIZE,  # fee
+	TIMESTAMP_SIZE  # deadline
+])
+TRANSACTION_HEADER_SIZE = NON_VERIFIABLE_TRANSACTION_HEADER_SIZE + SIGNATURE_FIELD_SIZE
+
+
+# region transaction body size calculators
+
+def _string_field_size(value):
+	return SIZE_PREFIX_SIZE + len(value.encode('utf8'))
+
+
+def _mosaic_id_field_size(mosaic_id_json):
+	return SIZE_PREFIX_SIZE + _string_field_size(mosaic_id_json['namespaceId']) + _string_field_size(mosaic_id_json['name'])
+
+
+def _calculate_transfer_body_size(tx_json):
+	size = ADDRESS_FIELD_SIZE + AMOUNT_SIZE + SIZE_PREFIX_SIZE  # recipient, amount, message envelope size
+
+	message_json = tx_json.get('message')
+	if message_json and message_json.get('payload'):
+		size += ENUM_SIZE + SIZE_PREFIX_SIZE + len(message_json['payload']) // 2
+
+	if 2 <= tx_json['version'] & 0xFF:
+		size += COUNT_SIZE + sum(
+			SIZE_PREFIX_SIZE + _mosaic_id_field_size(mosaic_json['mosaicId']) + AMOUNT_SIZE
+			for mosaic_json in tx_json.get('mosaics') or []
+		)
+
+	return size
+
+
+def _calculate_account_key_link_body_size(_tx_json):
+	return ENUM_SIZE + PUBLIC_KEY_FIELD_SIZE  # mode, remote public key
+
+
+def _calculate_multisig_account_modification_body_size(tx_json):
+	modification_size = SIZE_PREFIX_SIZE + ENUM_SIZE + PUBLIC_KEY_FIELD_SIZE
+	size = COUNT_SIZE + modification_size * len(tx_json.get('modifications', []))
+
+	if 2 == tx_json['version'] & 0xFF:
+		size += SIZE_PREFIX_SIZE + 4  # min approval delta
+
+	return size
+
+
+def _calculate_namespace_registration_body_size(tx_json):
+	size = ADDRESS_FIELD_SIZE + AMOUNT_SIZE + _string_field_size(tx_json['newPart']) + SIZE_PREFIX_SIZE
+
+	parent_name = tx_json.get('parent')
+	if parent_name:
+		size += len(parent_name.encode('utf8'))
+
+	return size
+
+
+def _calculate_mosaic_definition_body_size(tx_json):
+	mosaic_definition_json = tx_json['mosaicDefinition']
+
+	mosaic_definition_size = sum([
+		PUBLIC_KEY_FIELD_SIZE,  # owner public key
+		_mosaic_id_field_size(mosaic_definition_json['id']),
+		_string_field_size(mosaic_definition_json['description']),
+		COUNT_SIZE,
+		sum(
+			SIZE_PREFIX_SIZE + _string_field_size(property_json['name']) + _string_field_size(property_json['value'])
+			for property_json in mosaic_definition_json['properties']
+		),
+		SIZE_PREFIX_SIZE  # levy size
+	])
+
+	levy_json = mosaic_definition_json.get('levy')
+	if levy_json:
+		mosaic_definition_size += ENUM_SIZE + ADDRESS_FIELD_SIZE + _mosaic_id_field_size(levy_json['mosaicId']) + AMOUNT_SIZE
+
+	return SIZE_PREFIX_SIZE + mosaic_definition_size + ADDRESS_FIELD_SIZE + AMOUNT_SIZE  # definition, rental fee sink, rental fee
+
+
+def _calculate_mosaic_supply_change_body_size(tx_json):
+	return _mosaic_id_field_size(tx_json['mosaicId']) + ENUM_SIZE + AMOUNT_SIZE  # mosaic id, action, delta
+
+
+def _calculate_cosignature_body_size(_tx_json):
+	return SIZE_PREFIX_SIZE + HASH_FIELD_SIZE + ADDRESS_FIELD_SIZE  # multisig transaction hash, multisig account address
+
+
+def _calculate_multisig_body_size(tx_json):
+	inner_transaction_size = _calculate_transaction_size(tx_json['otherTrans'], NON_VERIFIABLE_TRANSACTION_HEADER_SIZE)
+	cosignatures_size = sum(
+		SIZE_PREFIX_SIZE + _calculate_transaction_size(cosignature_json, TRANSACTION_HEADER_SIZE)
+		for cosignature_json in tx_json.get('signatures', [])
+	)
+	return SIZE_PREFIX_SIZE + inner_transaction_size + COUNT_SIZE + cosignatures_size
+
+
+TRANSACTION_BODY_SIZE_CALCULATORS = {
+	TransactionType.TRANSFER.value: _calculate_transfer_body_size,
+	TransactionType.ACCOUNT_KEY_LINK.value: _calculate_account_key_link_body_size,
+	TransactionType.MULTISIG_ACCOUNT_MODIFICATION.value: _calculate_multisig_account_modification_body_size,
+	TransactionType.NAMESPACE_REGISTRATION.value: _calculate_namespace_registration_body_size,
+	TransactionType.MOSAIC_DEFINITION.value: _calculate_mosaic_definition_body_size,
+	TransactionType.MOSAIC_SUPPLY_CHANGE.value: _calculate_mosaic_supply_change_body_size,
+	TransactionType.MULTISIG.value: _calculate_multisig_body_size,
+	TransactionType.MULTISIG_COSIGNATURE.value: _calculate_cosignature_body_size
+}
+
+
+def _calculate_transaction_size(tx_json, header_size):
+	body_size_calculator = TRANSACTION_BODY_SIZE_CALCULATORS.get(tx_json['type'])
+	if not body_size_calculator:
+		raise NodeException(f'Unsupported transaction type {tx_json.get("type", "unknown")}')
+
+	return header_size + body_size_calculator(tx_json)
+
+# endregion
+
+
+@lru_cache(maxsize=None)
+def _find_nem_facade(network_id):
+	return NemFacade(NetworkLocator.find_by_identifier(Network.NETWORKS, network_id))
+
 
 class NemBlockCalculator:
 	"""
 	Handles NEM block size calculations and transaction building.
 
+	Sizes are calculated arithmetically from the JSON field lengths. Building SDK transactions is much slower
+	and is only needed when a transaction object is required.
+
 	Only populate variable-length fields for each descriptor, the SDK automatically fills in
 	and validates the fixed-width header fields.
 	"""
 
-	def calculate_block_size(self, block_json):  # pylint: disable=too-many-locals
+	@staticmethod
+	def calculate_block_size(block_json):
 		"""Calculates the serialized size of a NEM block."""
 
 		# Block structure components:
@@ -54,18 +195,18 @@ class NemBlockCalculator:
 		])
 
 		transactions_size = sum(
-			self.calculate_transaction_size(tx_entry['tx'])
+			NemBlockCalculator.calculate_transaction_size(tx_entry['tx'])
 			for tx_entry in block_json.get('txes', [])
 		)
 
 		return block_size + transactions_size
 
-	def calculate_transaction_size(self, tx_json):
-		"""Calculates the serialized size of a transaction."""
+	@staticmethod
+	def calculate_transaction_size(tx_json):
+		"""Calculates the serialized size of a transaction directly from the field lengths of its JSON."""
 
 		try:
-			transaction = self.build_transaction(tx_json)
-			return transaction.size
+			return _calculate_transaction_size(tx_json, TRANSACTION_HEADER_SIZE)
 		except Exception as exc:
 			raise NodeException(f'Failed to calculate transaction size for type {tx_json.get("type", "unknown")}: {exc}') from exc
 
@@ -73,9 +214,7 @@ class NemBlockCalculator:
 		"""Builds a transaction object from JSON data."""
 
 		network_id = (tx_json['version'] >> 24) & 0xFF
-		network = NetworkLocator.find_by_identifier(Network.NETWORKS, network_id)
-
-		facade = NemFacade(network)
+		facade = _find_nem_facade(network_id)
 
 		transaction_descriptor = self._build_transaction_descriptor(tx_json)
 
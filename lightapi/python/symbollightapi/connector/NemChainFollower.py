@@ -0,0 +1,162 @@
+import asyncio
+from collections import OrderedDict, namedtuple
+
+from ..model.Exceptions import NodeException
+
+ChainRollback = namedtuple('ChainRollback', ['height'])
+
+DEFAULT_WINDOW_COUNT = 4
+DEFAULT_WINDOW_SIZE = 10
+DEFAULT_QUEUE_SIZE = 100
+DEFAULT_POLL_INTERVAL_SECONDS = 15
+DEFAULT_MAX_ROLLBACK_DEPTH = 360
+
+
+class NemChainFollower:  # pylint: disable=too-many-instance-attributes
+	"""
+	Follows a NEM chain and delivers blocks in strict height order.
+
+	While catching up, several `local/chain/blocks-after` windows are kept in flight; once the tip is reached,
+	the chain is polled. Every block is checked against the height and hash of the previously delivered block.
+	Iterating yields Block models and, when the chain is reorganized, a ChainRollback with the height of the
+	common ancestor before the replacement blocks.
+	"""
+
+	def __init__(
+		self,
+		connector,
+		checkpoint_height,
+		checkpoint_block_hash=None,
+		window_count=DEFAULT_WINDOW_COUNT,
+		window_size=DEFAULT_WINDOW_SIZE,
+		queue_size=DEFAULT_QUEUE_SIZE,
+		poll_interval_seconds=DEFAULT_POLL_INTERVAL_SECONDS,
+		max_rollback_depth=DEFAULT_MAX_ROLLBACK_DEPTH
+	):
+		"""Creates a follower that delivers blocks above a checkpoint height."""
+
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+
+		self.connector = connector
+		self.window_count = window_count
+		self.window_size = window_size
+		self.queue_size = queue_size
+		self.poll_interval_seconds = poll_interval_seconds
+		self.max_rollback_depth = max_rollback_depth
+
+		self._checkpoint_height = checkpoint_height
+		self._height_to_block_hash = OrderedDict()
+		if checkpoint_block_hash:
+			self._height_to_block_hash[checkpoint_height] = checkpoint_block_hash
+
+	@property
+	def checkpoint_height(self):
+		"""Gets the height of the last block processed by the consumer (or of the last rollback)."""
+
+		return self._checkpoint_height
+
+	def __aiter__(self):
+		return self._follow()
+
+	async def _follow(self):
+		queue = asyncio.Queue(self.queue_size)
+		producer_task = asyncio.create_task(self._produce(queue))
+
+		try:
+			while True:
+				item = await queue.get()
+				if isinstance(item, Exception):
+					raise item
+
+				yield item
+				self._checkpoint_height = item.height
+		finally:
+			producer_task.cancel()
+			await asyncio.gather(producer_task, return_exceptions=True)
+
+	async def _produce(self, queue):
+		pending_windows = {}
+		next_height = self._checkpoint_height + 1
+		is_following_tip = False
+
+		try:
+			while True:
+				if is_following_tip:
+					await asyncio.sleep(self.poll_interval_seconds)
+					(next_height, is_following_tip) = await self._poll_tip(queue, next_height)
+				else:
+					(next_height, is_following_tip) = await self._catch_up(queue, pending_windows, next_height)
+		except Exception as exception:  # pylint: disable=broad-exception-caught
+			await queue.put(exception)
+		finally:
+			self._cancel_windows(pending_windows, None)
+
+	async def _catch_up(self, queue, pending_windows, next_height):
+		start_height = next_height - 1
+		self._cancel_windows(pending_windows, start_height)
+		for i in range(self.window_count):
+			window_start_height = start_height + i * self.window_size
+			if window_start_height not in pending_windows:
+				pending_windows[window_start_height] = asyncio.create_task(self.connector.get_blocks_after(window_start_height))
+
+		blocks = await pending_windows.pop(start_height)
+		return await self._process_window(queue, pending_windows, blocks, next_height)
+
+	async def _poll_tip(self, queue, next_height):
+		blocks = await self.connector.get_blocks_after(next_height - 1)
+		return await self._process_window(queue, {}, blocks, next_height)
+
+	async def _process_window(self, queue, pending_windows, blocks, next_height):
+		for block in blocks:
+			if block.height != next_height or not self._is_linked(block):
+				self._cancel_windows(pending_windows, None)
+				return (await self._roll_back(queue, next_height - 1), False)
+
+			self._height_to_block_hash[block.height] = block.block_hash
+			if len(self._height_to_block_hash) > self.max_rollback_depth:
+				self._height_to_block_hash.popitem(last=False)
+
+			await queue.put(block)
+			next_height += 1
+
+		if len(blocks) < self.window_size:
+			# windows after a short (or empty) window are misaligned
+			self._cancel_windows(pending_windows, None)
+
+		return (next_height, not blocks)
+
+	def _is_linked(self, block):
+		previous_block_hash = self._height_to_block_hash.get(block.height - 1, None)
+		return not previous_block_hash or not block.previous_block_hash or previous_block_hash == block.previous_block_hash
+
+	async def _roll_back(self, queue, height):
+		common_height = await self._find_common_ancestor(height)
+		if common_height == height:
+			raise NodeException(f'blocks after height {height} do not extend the chain of the node')
+
+		for rolled_back_height in [known_height for known_height in self._height_to_block_hash if known_height > common_height]:
+			del self._height_to_block_hash[rolled_back_height]
+
+		await queue.put(ChainRollback(common_height))
+		return common_height + 1
+
+	async def _find_common_ancestor(self, height):
+		for known_height in reversed(self._height_to_block_hash):
+			if known_height > height:
+				continue
+
+			block = await self.connector.get_block(known_height)
+			if block.block_hash == self._height_to_block_hash[known_height]:
+				return known_height
+
+		raise NodeException(f'unable to find common ancestor at or below height {height} within rollback window')
+
+	@staticmethod
+	def _cancel_windows(pending_windows, start_height):
+		for window_start_height in list(pending_windows):
+			if start_height is None or window_start_height < start_height:
+				window = pending_windows.pop(window_start_height)
+				window.cancel()
+
+				# retrieve results of windows that already failed so they are not reported as unhandled
+				window.add_done_callback(lambda window: window.cancelled() or window.exception())
@@ -3,26 +3,73 @@ import random
 from binascii import hexlify
 from collections import namedtuple
 
-from aiolimiter import AsyncLimiter
 from symbolchain.CryptoTypes import Hash256, PublicKey, Signature
 from symbolchain.facade.NemFacade import NemFacade
-from symbolchain.nc import TransactionType
-from symbolchain.nem.Network import Address, NetworkTimestamp
+from symbolchain.nc import MessageType, TransactionType
+from symbolchain.nem.Network import Address, Network, NetworkTimestamp
 
 from ..model.Block import Block
-from ..model.Constants import DEFAULT_ASYNC_LIMITER_ARGUMENTS, TransactionStatus
+from ..model.Constants import TransactionStatus
 from ..model.Endpoint import Endpoint
 from ..model.Exceptions import InsufficientBalanceException, NodeException
+from ..model.LazyField import Encoded
 from ..model.NodeInfo import NodeInfo
-from ..model.Transaction import TransactionFactory, TransactionHandler
+from ..model.Transaction import TRANSACTION_ARGS_MAPPERS, TransactionFactory
 from .BasicConnector import BasicConnector
 from .NemBlockCalculator import NemBlockCalculator
+from .ResponseCache import CachePolicy
 
 MosaicFeeInformation = namedtuple('MosaicFeeInformation', ['supply', 'divisibility'])
 AccountMosaic = namedtuple('AccountMosaic', ['mosaic_id', 'quantity'])
 
 MICROXEM_PER_XEM = 1000000
 
+TRANSACTION_CACHE_POLICY = CachePolicy.immutable(height_of=lambda transaction_json: transaction_json['meta']['height'])
+
+NEM_FACADES = {network.identifier: NemFacade(network) for network in (Network.MAINNET, Network.TESTNET)}
+
+
+def calculate_transaction_hash(tx_json):
+	"""
+	Calculates the hash of a transfer transaction JSON object, which unconfirmed transactions are returned without.
+	Returns None for all other transaction types.
+	"""
+
+	facade = NEM_FACADES.get((tx_json['version'] >> 24) & 0xFF, None)
+	if not facade or TransactionType.TRANSFER.value != tx_json['type']:
+		return None
+
+	transaction_descriptor = {
+		'type': f'transfer_transaction_v{tx_json["version"] & 0xFF}',
+		'signer_public_key': tx_json['signer'],
+		'fee': tx_json['fee'],
+		'timestamp': tx_json['timeStamp'],
+		'deadline': tx_json['deadline'],
+		'recipient_address': tx_json['recipient'],
+		'amount': tx_json['amount']
+	}
+
+	message = tx_json.get('message', None)
+	if message:
+		transaction_descriptor['message'] = {'message_type': MessageType(message['type']), 'message': bytes.fromhex(message['payload'])}
+
+	if 'mosaics' in tx_json:
+		transaction_descriptor['mosaics'] = [
+			{
+				'mosaic': {
+					'mosaic_id': {
+						'namespace_id': {'name': mosaic['mosaicId']['namespaceId'].encode('utf8')},
+						'name': mosaic['mosaicId']['name'].encode('utf8')
+					},
+					'amount': mosaic['quantity']
+				}
+			}
+			for mosaic in tx_json['mosaics']
+		]
+
+	transaction = facade.transaction_factory.create(transaction_descriptor)
+	return hexlify(facade.hash_transaction(transaction).bytes).decode('utf8')
+
 
 # region NemAccountInfo
 
@@ -102,7 +149,7 @@ class NemConnector(BasicConnector):
 		"""Gets block headers."""
 
 		url_path = 'block/at/public'
-		block = await self.post(url_path, {'height': height})
+		block = await self.post(url_path, {'height': height}, cache_policy=CachePolicy.immutable(height), is_idempotent=True)
 		del block['transactions']
 		return block
 
@@ -212,9 +259,12 @@ class NemConnector(BasicConnector):
 		"""Gets the information required to calculate the fee of the specified mosaic."""
 
 		formatted_mosaic_id = f'{mosaic_id[0]}:{mosaic_id[1]}'
-		supply = await self.get(f'mosaic/supply?mosaicId={formatted_mosaic_id}', 'supply')
+		supply = await self.get(f'mosaic/supply?mosaicId={formatted_mosaic_id}', 'supply', cache_policy=CachePolicy.time_to_live())
 
-		properties_json = await self.get(f'mosaic/definition?mosaicId={formatted_mosaic_id}', 'properties')
+		properties_json = await self.get(
+			f'mosaic/definition?mosaicId={formatted_mosaic_id}',
+			'properties',
+			cache_policy=CachePolicy.time_to_live())
 		divisibility_property_json = next(
 			(property_json for property_json in properties_json if 'divisibility' == property_json['name']),
 			None)
@@ -226,20 +276,17 @@ class NemConnector(BasicConnector):
 
 	# region GET (filter_confirmed_transactions)
 
-	async def filter_confirmed_transactions(self, transaction_hashes, async_limiter_arguments=DEFAULT_ASYNC_LIMITER_ARGUMENTS):
+	async def filter_confirmed_transactions(self, transaction_hashes):
 		"""Filters transaction hashes and returns only confirmed ones with (confirmed) heights."""
 
-		limiter = AsyncLimiter(*async_limiter_arguments)
-
 		async def get_transaction_hash_height_pair(transaction_hash):
-			async with limiter:
-				try:
-					transaction_meta_json = await self.transaction_confirmed(transaction_hash)
-					meta_json = transaction_meta_json['meta']
-					return (Hash256(meta_json['hash']['data']), meta_json['height'])
-				except NodeException:
-					# not found is mapped to 400, so need to catch (and ignore) error
-					return (None, 0)
+			try:
+				transaction_meta_json = await self.transaction_confirmed(transaction_hash)
+				meta_json = transaction_meta_json['meta']
+				return (Hash256(meta_json['hash']['data']), meta_json['height'])
+			except NodeException:
+				# not found is mapped to 400, so need to catch (and ignore) error
+				return (None, 0)
 
 		tasks = [get_transaction_hash_height_pair(transaction_hash) for transaction_hash in transaction_hashes]
 		transaction_hash_height_pairs = await asyncio.gather(*tasks)
@@ -258,7 +305,7 @@ class NemConnector(BasicConnector):
 		"""Gets a confirmed transaction by hash."""
 
 		url_path = f'transaction/get?hash={transaction_hash}'
-		return await self.get(url_path, None)
+		return await self.get(url_path, None, cache_policy=TRANSACTION_CACHE_POLICY)
 
 	# endregion
 
@@ -336,21 +383,20 @@ class NemConnector(BasicConnector):
 	async def get_blocks_after(self, height):
 		""""Gets Blocks data"""
 
-		blocks = await self.post('local/chain/blocks-after', {'height': height})
+		blocks = await self.post('local/chain/blocks-after', {'height': height}, is_idempotent=True)
 
 		return [self._map_to_block(block) for block in blocks['data']]
 
 	async def get_block(self, height):
 		""""Gets Block data"""
 
-		block = await self.post('local/block/at', {'height': height})
+		block = await self.post('local/block/at', {'height': height}, is_idempotent=True)
 
 		return self._map_to_block(block)
 
 	def _map_to_block(self, block_json):
 		block = block_json['block']
-		nem_calculator = NemBlockCalculator()
-		size = nem_calculator.calculate_block_size(block_json)
+		size = NemBlockCalculator.calculate_block_size(block_json)
 
 		return Block(
 			block['height'],
@@ -362,10 +408,11 @@ class NemConnector(BasicConnector):
 			block_json['difficulty'],
 			block_json['hash'],
 			block_json['totalFee'],
-			Address(block_json['beneficiary']),
-			PublicKey(block['signer']),
+			Encoded(block_json['beneficiary']),
+			Encoded(block['signer']),
 			block['signature'],
-			size
+			size,
+			block['prevBlockHash']['data']
 		)
 
 	@staticmethod
@@ -379,19 +426,17 @@ class NemConnector(BasicConnector):
 		common_args = {
 			'transaction_hash': transaction['hash'],
 			'height': block_height,
-			'sender': PublicKey(tx_json['signer']),
+			'sender': Encoded(tx_json['signer']),
 			'fee': tx_json['fee'],
 			'timestamp': tx_json['timeStamp'],
 			'deadline': tx_json['deadline'],
 			'signature': tx_json['signature'],
 		}
 
-		specific_args = {}
-
 		if TransactionType.MULTISIG.value == tx_type:
-			specific_args = TransactionHandler().map[tx_type](tx_json, transaction['innerHash'])
+			specific_args = TRANSACTION_ARGS_MAPPERS[tx_type](tx_json, transaction['innerHash'])
 		else:
-			specific_args = TransactionHandler().map[tx_type](tx_json)
+			specific_args = TRANSACTION_ARGS_MAPPERS[tx_type](tx_json)
 
 		return TransactionFactory.create_transaction(tx_type, common_args, specific_args)
 
@@ -399,8 +444,11 @@ class NemConnector(BasicConnector):
 
 	# region POST (get_unconfirmed_transactions)
 
-	async def get_unconfirmed_transactions(self):
-		"""Gets unconfirmed transactions."""
+	async def get_unconfirmed_transactions(self, known_hash_short_ids=None):
+		"""
+		Gets unconfirmed transactions.
+		Transactions with hash short ids in known_hash_short_ids are already known by the caller and are not returned.
+		"""
 
 		characters = '0123456789abcdef'
 		random_challenge = ''.join(random.choices(characters, k=64))
@@ -409,19 +457,20 @@ class NemConnector(BasicConnector):
 			'transactions/unconfirmed',
 			{
 				'entity': {
-					'hashShortIds': []
+					'hashShortIds': [{'id': hash_short_id} for hash_short_id in (known_hash_short_ids or [])]
 				},
 				'challenge': {
 					'data': random_challenge
 				}
 			},
-			property_name='entity'
+			property_name='entity',
+			is_idempotent=True
 		)
 
 		return [
 			self._map_to_transaction({
 				'tx': tx,
-				'hash': None,
+				'hash': calculate_transaction_hash(tx),
 				'innerHash': None
 			}, 0) for tx in unconfirmed_transactions['data']
 		]
@@ -0,0 +1,101 @@
+import asyncio
+from collections import namedtuple
+
+from symbolchain.CryptoTypes import Hash256
+
+UnconfirmedPoolChanges = namedtuple('UnconfirmedPoolChanges', ['added', 'removed'])
+
+DEFAULT_FULL_SYNC_INTERVAL = 20
+DEFAULT_POLL_INTERVAL_SECONDS = 5
+
+
+def make_hash_short_id(transaction_hash):
+	"""Gets the short id of a transaction hash (its first eight bytes as a signed big endian integer), as used by NIS."""
+
+	return int.from_bytes(Hash256(transaction_hash).bytes[:8], 'big', signed=True)
+
+
+class NemUnconfirmedTransactionPool:
+	"""
+	Mirrors the unconfirmed transactions pool of a NEM node.
+
+	The short ids of all tracked transaction hashes are sent with every sync, so the node only returns new transactions.
+	Transactions are dropped when their deadlines pass, when they are reported as confirmed or, because the node never reports
+	removals, when they are missing from a full sync, which is made every full_sync_interval syncs.
+
+	Hashes are only calculated for transfer transactions. All other transactions are returned by every sync and are
+	dropped as soon as they are missing from one.
+	"""
+
+	def __init__(self, connector, full_sync_interval=DEFAULT_FULL_SYNC_INTERVAL, poll_interval_seconds=DEFAULT_POLL_INTERVAL_SECONDS):
+		"""Creates an empty pool around a NEM connector."""
+
+		self.connector = connector
+		self.full_sync_interval = full_sync_interval
+		self.poll_interval_seconds = poll_interval_seconds
+
+		self.sync_count = 0
+
+		self._signature_to_transaction = {}
+
+	@property
+	def transactions(self):
+		"""Gets all tracked unconfirmed transactions in order of arrival."""
+
+		return list(self._signature_to_transaction.values())
+
+	def __len__(self):
+		return len(self._signature_to_transaction)
+
+	def __aiter__(self):
+		return self._follow()
+
+	async def _follow(self):
+		while True:
+			changes = await self.sync()
+			if changes.added or changes.removed:
+				yield changes
+
+			await asyncio.sleep(self.poll_interval_seconds)
+
+	async def sync(self):
+		"""Syncs the pool with the node, returning the added and removed transactions."""
+
+		is_full_sync = 0 == self.sync_count % self.full_sync_interval
+		self.sync_count += 1
+
+		known_hash_short_ids = [] if is_full_sync else [
+			make_hash_short_id(transaction.transaction_hash)
+			for transaction in self._signature_to_transaction.values()
+			if transaction.transaction_hash
+		]
+		(network_time, unconfirmed_transactions) = await asyncio.gather(
+			self.connector.network_time(),
+			self.connector.get_unconfirmed_transactions(known_hash_short_ids))
+
+		returned_signatures = set()
+		added = []
+		for transaction in unconfirmed_transactions:
+			returned_signatures.add(transaction.signature)
+			if transaction.signature not in self._signature_to_transaction:
+				self._signature_to_transaction[transaction.signature] = transaction
+				added.append(transaction)
+
+		removed = self._remove(lambda transaction: any([
+			transaction.deadline < network_time.timestamp,
+			transaction.signature not in returned_signatures and (is_full_sync or not transaction.transaction_hash)
+		]))
+		return UnconfirmedPoolChanges(added, removed)
+
+	def remove_confirmed(self, transaction_hashes):
+		"""Drops transactions that were confirmed in a block, returning the removed transactions."""
+
+		confirmed_hashes = {Hash256(transaction_hash) for transaction_hash in transaction_hashes}
+		return self._remove(lambda transaction: bool(transaction.transaction_hash) and Hash256(transaction.transaction_hash) in confirmed_hashes)
+
+	def _remove(self, predicate):
+		removed = [transaction for transaction in self._signature_to_transaction.values() if predicate(transaction)]
+		for transaction in removed:
+			del self._signature_to_transaction[transaction.signature]
+
+		return removed
@@ -0,0 +1,173 @@
+import time
+from collections import deque
+
+from ..model.Exceptions import HttpException, NodeException
+
+DEFAULT_LATENCY_SMOOTHING_FACTOR = 0.3
+DEFAULT_ERROR_SMOOTHING_FACTOR = 0.3
+DEFAULT_MAX_ERROR_RATE = 0.5
+DEFAULT_HEDGE_PERCENTILE = 0.95
+DEFAULT_INITIAL_HEDGE_DELAY_SECONDS = 1
+DEFAULT_MIN_HEDGE_DELAY_SECONDS = 0.05
+DEFAULT_PROBE_INTERVAL_SECONDS = 30
+DEFAULT_LATENCY_HISTORY_SIZE = 100
+
+MIN_HEDGE_LATENCY_SAMPLE_COUNT = 10
+RETRYABLE_HTTP_STATUS_CODES = (408, 429)
+
+
+class NodeStatistics:  # pylint: disable=too-many-instance-attributes
+	"""Latency and error statistics of a single node."""
+
+	def __init__(self, latency_history_size):
+		"""Creates empty statistics."""
+
+		self.latency_seconds = None
+		self.error_rate = 0.0
+		self.request_count = 0
+		self.failure_count = 0
+		self.is_healthy = True
+		self.next_probe_time = None
+		self.is_probing = False
+
+		self.latency_history = deque(maxlen=latency_history_size)
+
+	@property
+	def score(self):
+		"""Gets the expected latency including retries of failed requests (lower is better); unmeasured nodes are tried first."""
+
+		return (self.latency_seconds or 0) / (1 - min(self.error_rate, 0.99))
+
+
+class NodeSelector:  # pylint: disable=too-many-instance-attributes
+	"""
+	Selects the best nodes of a network based on an EWMA of their latencies and error rates.
+
+	Nodes with an error rate above max_error_rate are taken out of rotation. Every probe_interval_seconds, one request
+	is additionally sent to an unhealthy node as a probe and the node rejoins the rotation when it answers the probe.
+	"""
+
+	def __init__(
+		self,
+		endpoints,
+		latency_smoothing_factor=DEFAULT_LATENCY_SMOOTHING_FACTOR,
+		error_smoothing_factor=DEFAULT_ERROR_SMOOTHING_FACTOR,
+		max_error_rate=DEFAULT_MAX_ERROR_RATE,
+		hedge_percentile=DEFAULT_HEDGE_PERCENTILE,
+		initial_hedge_delay_seconds=DEFAULT_INITIAL_HEDGE_DELAY_SECONDS,
+		min_hedge_delay_seconds=DEFAULT_MIN_HEDGE_DELAY_SECONDS,
+		probe_interval_seconds=DEFAULT_PROBE_INTERVAL_SECONDS,
+		latency_history_size=DEFAULT_LATENCY_HISTORY_SIZE
+	):
+		"""Creates a selector around the endpoints of nodes in the same network."""
+
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+
+		if not endpoints:
+			raise ValueError('at least one endpoint is required')
+
+		self.endpoints = list(endpoints)
+		self.latency_smoothing_factor = latency_smoothing_factor
+		self.error_smoothing_factor = error_smoothing_factor
+		self.max_error_rate = max_error_rate
+		self.hedge_percentile = hedge_percentile
+		self.initial_hedge_delay_seconds = initial_hedge_delay_seconds
+		self.min_hedge_delay_seconds = min_hedge_delay_seconds
+		self.probe_interval_seconds = probe_interval_seconds
+
+		self.hedge_count = 0
+		self.probe_tasks = set()
+
+		self._endpoint_statistics = {str(endpoint): NodeStatistics(latency_history_size) for endpoint in self.endpoints}
+
+	def statistics(self, endpoint):
+		"""Gets the statistics of the node with the specified endpoint."""
+
+		return self._endpoint_statistics[str(endpoint)]
+
+	@property
+	def healthy_endpoints(self):
+		"""Gets the endpoints of all nodes in rotation."""
+
+		return [endpoint for endpoint in self.endpoints if self.statistics(endpoint).is_healthy]
+
+	def ranked_endpoints(self):
+		"""Gets the endpoints of all nodes in rotation ordered from best to worst (or of all nodes when none are healthy)."""
+
+		endpoints = self.healthy_endpoints or self.endpoints
+		return sorted(endpoints, key=lambda endpoint: self.statistics(endpoint).score)
+
+	def hedge_delay_seconds(self, endpoint):
+		"""Gets the time after which a request to the specified node should be hedged to another node."""
+
+		latency_history = self.statistics(endpoint).latency_history
+		if len(latency_history) < MIN_HEDGE_LATENCY_SAMPLE_COUNT:
+			return self.initial_hedge_delay_seconds
+
+		sorted_latencies = sorted(latency_history)
+		percentile_index = min(len(sorted_latencies) - 1, int(self.hedge_percentile * len(sorted_latencies)))
+		return max(self.min_hedge_delay_seconds, sorted_latencies[percentile_index])
+
+	def try_begin_probe(self):
+		"""Gets the endpoint of an unhealthy node that is due for a probe or None when no probe is due."""
+
+		now = time.monotonic()
+		for endpoint in self.endpoints:
+			node_statistics = self.statistics(endpoint)
+			if not node_statistics.is_healthy and not node_statistics.is_probing and now >= node_statistics.next_probe_time:
+				node_statistics.is_probing = True
+				return endpoint
+
+		return None
+
+	def end_probe(self, endpoint):
+		"""Completes a probe of a node, scheduling the next probe when the node is still unhealthy."""
+
+		node_statistics = self.statistics(endpoint)
+		node_statistics.is_probing = False
+		if not node_statistics.is_healthy:
+			node_statistics.next_probe_time = time.monotonic() + self.probe_interval_seconds
+
+	def record_latency(self, endpoint, latency_seconds):
+		"""Records the latency of a request that completed (or was abandoned) without a node failure."""
+
+		node_statistics = self.statistics(endpoint)
+		node_statistics.latency_history.append(latency_seconds)
+		node_statistics.latency_seconds = latency_seconds if node_statistics.latency_seconds is None else (
+			self.latency_smoothing_factor * latency_seconds + (1 - self.latency_smoothing_factor) * node_statistics.latency_seconds)
+
+	def record_success(self, endpoint, latency_seconds):
+		"""Records a request that was answered by a node, returning an unhealthy node to rotation."""
+
+		self.record_latency(endpoint, latency_seconds)
+		self._record_outcome(endpoint, 0)
+
+		node_statistics = self.statistics(endpoint)
+		if not node_statistics.is_healthy:
+			node_statistics.is_healthy = True
+			node_statistics.error_rate = 0.0
+
+	def record_failure(self, endpoint):
+		"""Records a request that failed because of a node failure."""
+
+		node_statistics = self.statistics(endpoint)
+		node_statistics.failure_count += 1
+		self._record_outcome(endpoint, 1)
+
+		if node_statistics.is_healthy and node_statistics.error_rate > self.max_error_rate:
+			node_statistics.is_healthy = False
+			node_statistics.next_probe_time = time.monotonic() + self.probe_interval_seconds
+
+	def _record_outcome(self, endpoint, error_value):
+		node_statistics = self.statistics(endpoint)
+		node_statistics.request_count += 1
+		node_statistics.error_rate = self.error_smoothing_factor * error_value + (1 - self.error_smoothing_factor) * node_statistics.error_rate
+
+	@staticmethod
+	def is_node_failure(exception):
+		"""Determines if an exception indicates a node failure (rather than a valid error response) that should be retried elsewhere."""
+
+		if isinstance(exception, HttpException):
+			return 500 <= exception.http_status_code or exception.http_status_code in RETRYABLE_HTTP_STATUS_CODES
+
+		return isinstance(exception, NodeException)
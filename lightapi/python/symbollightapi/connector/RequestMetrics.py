@@ -0,0 +1,232 @@
+import bisect
+import json
+import re
+
+DEFAULT_LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+DEFAULT_METRIC_NAME_PREFIX = 'lightapi'
+
+PATH_IDENTIFIER_SEGMENT_PATTERN = re.compile(r'^(\d+|[0-9A-Fa-f]{16,}|[A-Z2-7]{39,40})$')
+
+
+def make_path_template(url_path):
+	"""Strips the query string from a URL path and replaces its identifier segments (heights, hashes, keys and addresses) with {id}."""
+
+	path = url_path.split('?', 1)[0]
+	return '/'.join('{id}' if PATH_IDENTIFIER_SEGMENT_PATTERN.match(segment) else segment for segment in path.split('/'))
+
+
+class ResponseSample:
+	"""Size and decode time of a single response."""
+
+	def __init__(self):
+		"""Creates an empty sample."""
+
+		self.byte_count = 0
+		self.decode_seconds = 0
+
+
+class RequestStatistics:
+	"""Aggregated statistics of all requests sent to a single endpoint for a single operation."""
+
+	def __init__(self, latency_bucket_count):
+		"""Creates empty statistics."""
+
+		self.request_count = 0
+		self.latency_bucket_counts = [0] * latency_bucket_count
+		self.latency_seconds = 0
+		self.response_byte_count = 0
+		self.decode_seconds = 0
+		self.error_counts = {}
+
+
+class OperationStatistics:
+	"""Aggregated statistics of all calls of a single multi-request operation."""
+
+	def __init__(self):
+		"""Creates empty statistics."""
+
+		self.call_count = 0
+		self.fan_out = 0
+		self.max_fan_out = 0
+		self.wall_seconds = 0
+
+
+class RequestMetrics:
+	"""
+	Collects request metrics per (endpoint, operation) and fan-out metrics per multi-request operation.
+
+	Connectors only record metrics when their metrics attribute is set, so there is no overhead when metrics are disabled.
+	The collected metrics can be exported as a Prometheus text exposition or as a JSON snapshot.
+	"""
+
+	def __init__(self, latency_buckets_seconds=DEFAULT_LATENCY_BUCKETS_SECONDS):
+		"""Creates empty metrics with the specified (upper bounds of) latency histogram buckets."""
+
+		self.latency_buckets_seconds = tuple(sorted(latency_buckets_seconds))
+
+		self._request_statistics = {}
+		self._operation_statistics = {}
+
+	def request_statistics(self, endpoint, operation):
+		"""Gets the statistics of requests sent to an endpoint for an operation or None if no such request was recorded."""
+
+		return self._request_statistics.get((str(endpoint), operation), None)
+
+	def operation_statistics(self, name):
+		"""Gets the statistics of a multi-request operation or None if no such operation was recorded."""
+
+		return self._operation_statistics.get(name, None)
+
+	def record_request(self, endpoint, operation, latency_seconds, response_sample=None, exception=None):
+		# pylint: disable=too-many-arguments, too-many-positional-arguments
+		"""Records a request sent to an endpoint, optionally with its response sample or the exception it raised."""
+
+		key = (str(endpoint), operation)
+		statistics = self._request_statistics.get(key, None)
+		if statistics is None:
+			statistics = RequestStatistics(len(self.latency_buckets_seconds))
+			self._request_statistics[key] = statistics
+
+		statistics.request_count += 1
+		statistics.latency_seconds += latency_seconds
+
+		bucket_index = bisect.bisect_left(self.latency_buckets_seconds, latency_seconds)
+		if bucket_index < len(self.latency_buckets_seconds):
+			statistics.latency_bucket_counts[bucket_index] += 1
+
+		if response_sample:
+			statistics.response_byte_count += response_sample.byte_count
+			statistics.decode_seconds += response_sample.decode_seconds
+
+		if exception is not None:
+			exception_name = type(exception).__name__
+			statistics.error_counts[exception_name] = statistics.error_counts.get(exception_name, 0) + 1
+
+	def record_operation(self, name, fan_out, wall_seconds):
+		"""Records a call of a multi-request operation that fanned out to the specified number of concurrent requests."""
+
+		statistics = self._operation_statistics.get(name, None)
+		if statistics is None:
+			statistics = OperationStatistics()
+			self._operation_statistics[name] = statistics
+
+		statistics.call_count += 1
+		statistics.fan_out += fan_out
+		statistics.max_fan_out = max(statistics.max_fan_out, fan_out)
+		statistics.wall_seconds += wall_seconds
+
+	def _cumulative_latency_bucket_counts(self, statistics):
+		cumulative_count = 0
+		for (bound, count) in zip(self.latency_buckets_seconds, statistics.latency_bucket_counts):
+			cumulative_count += count
+			yield (str(bound), cumulative_count)
+
+		yield ('+Inf', statistics.request_count)
+
+	def snapshot(self):
+		"""Gets a JSON serializable snapshot of all metrics."""
+
+		return {
+			'requests': [
+				{
+					'endpoint': endpoint,
+					'operation': operation,
+					'request_count': statistics.request_count,
+					'latency_seconds': statistics.latency_seconds,
+					'latency_buckets': dict(self._cumulative_latency_bucket_counts(statistics)),
+					'response_byte_count': statistics.response_byte_count,
+					'decode_seconds': statistics.decode_seconds,
+					'error_counts': dict(statistics.error_counts)
+				}
+				for ((endpoint, operation), statistics) in self._request_statistics.items()
+			],
+			'operations': [
+				{
+					'name': name,
+					'call_count': statistics.call_count,
+					'fan_out': statistics.fan_out,
+					'max_fan_out': statistics.max_fan_out,
+					'wall_seconds': statistics.wall_seconds
+				}
+				for (name, statistics) in self._operation_statistics.items()
+			]
+		}
+
+	def to_json(self):
+		"""Gets a JSON snapshot of all metrics."""
+
+		return json.dumps(self.snapshot())
+
+	def to_prometheus_text(self, prefix=DEFAULT_METRIC_NAME_PREFIX):
+		"""Gets all metrics formatted as a Prometheus text exposition with metric names starting with prefix."""
+
+		writer = _PrometheusTextWriter(prefix)
+
+		request_items = list(self._request_statistics.items())
+		writer.write_family('requests_total', 'counter', 'Number of requests sent to nodes.', [
+			({'endpoint': endpoint, 'operation': operation}, statistics.request_count)
+			for ((endpoint, operation), statistics) in request_items
+		])
+
+		writer.write_header('request_latency_seconds', 'histogram', 'Latency of requests sent to nodes.')
+		for ((endpoint, operation), statistics) in request_items:
+			labels = {'endpoint': endpoint, 'operation': operation}
+			for (bound, cumulative_count) in self._cumulative_latency_bucket_counts(statistics):
+				writer.write_sample('request_latency_seconds_bucket', {**labels, 'le': bound}, cumulative_count)
+
+			writer.write_sample('request_latency_seconds_sum', labels, statistics.latency_seconds)
+			writer.write_sample('request_latency_seconds_count', labels, statistics.request_count)
+
+		writer.write_family('response_bytes_total', 'counter', 'Number of response bytes received from nodes.', [
+			({'endpoint': endpoint, 'operation': operation}, statistics.response_byte_count)
+			for ((endpoint, operation), statistics) in request_items
+		])
+		writer.write_family('response_decode_seconds_total', 'counter', 'Time spent decoding responses received from nodes.', [
+			({'endpoint': endpoint, 'operation': operation}, statistics.decode_seconds)
+			for ((endpoint, operation), statistics) in request_items
+		])
+		writer.write_family('request_errors_total', 'counter', 'Number of failed requests by exception type.', [
+			({'endpoint': endpoint, 'operation': operation, 'exception': exception_name}, count)
+			for ((endpoint, operation), statistics) in request_items
+			for (exception_name, count) in statistics.error_counts.items()
+		])
+
+		operation_items = list(self._operation_statistics.items())
+		writer.write_family('operations_total', 'counter', 'Number of multi-request operation calls.', [
+			({'operation': name}, statistics.call_count) for (name, statistics) in operation_items
+		])
+		writer.write_family('operation_fan_out_total', 'counter', 'Number of concurrent requests issued by multi-request operations.', [
+			({'operation': name}, statistics.fan_out) for (name, statistics) in operation_items
+		])
+		writer.write_family('operation_wall_seconds_total', 'counter', 'Wall time spent in multi-request operations.', [
+			({'operation': name}, statistics.wall_seconds) for (name, statistics) in operation_items
+		])
+
+		return writer.text
+
+
+class _PrometheusTextWriter:
+	def __init__(self, prefix):
+		self.prefix = prefix
+		self.lines = []
+
+	@property
+	def text(self):
+		return ''.join(f'{line}\n' for line in self.lines)
+
+	def write_header(self, name, metric_type, description):
+		self.lines.append(f'# HELP {self.prefix}_{name} {description}')
+		self.lines.append(f'# TYPE {self.prefix}_{name} {metric_type}')
+
+	def write_sample(self, name, labels, value):
+		formatted_labels = ','.join(f'{key}="{self._escape_label_value(label_value)}"' for (key, label_value) in labels.items())
+		self.lines.append(f'{self.prefix}_{name}{{{formatted_labels}}} {value}')
+
+	def write_family(self, name, metric_type, description, labels_value_pairs):
+		self.write_header(name, metric_type, description)
+		for (labels, value) in labels_value_pairs:
+			self.write_sample(name, labels, value)
+
+	@staticmethod
+	def _escape_label_value(value):
+		return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
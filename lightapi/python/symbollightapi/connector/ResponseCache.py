@@ -0,0 +1,166 @@
+import json
+import time
+
+from .LruStore import LruStore, LruStoreTable
+
+DEFAULT_MAX_CACHED_RESPONSE_COUNT = 10000
+DEFAULT_FINALIZED_HEIGHT_REFRESH_SECONDS = 10
+DEFAULT_TTL_SECONDS = 60
+
+RESPONSE_CACHE_TABLE = LruStoreTable('response_cache', ('key', 'text'), ('response', 'text'))
+
+
+class CachePolicy:
+	"""
+	Determines if and for how long a response can be cached; requests without a policy are never cached.
+
+	Immutable responses are cached forever, but responses tied to a chain height are only cached once that height is finalized.
+	All other responses are cached for ttl_seconds.
+	"""
+
+	def __init__(self, ttl_seconds=None, height=None, height_of=None):
+		"""Creates a cache policy."""
+
+		self.ttl_seconds = ttl_seconds
+		self.height = height
+		self.height_of = height_of
+
+	@property
+	def is_immutable(self):
+		"""Determines if responses never change (once finalized)."""
+
+		return self.ttl_seconds is None
+
+	def response_height(self, response):
+		"""
+		Gets the chain height a response is tied to or None if it is not tied to any height.
+		Raises ValueError if the height cannot be extracted from the response.
+		"""
+
+		if self.height is not None:
+			return int(self.height)
+
+		if not self.height_of:
+			return None
+
+		try:
+			return int(self.height_of(response))
+		except (KeyError, TypeError) as ex:
+			raise ValueError('response does not contain height') from ex
+
+	@staticmethod
+	def immutable(height=None, height_of=None):
+		"""Creates a policy for responses that never change once the block at height (or extracted by height_of) is finalized."""
+
+		return CachePolicy(height=height, height_of=height_of)
+
+	@staticmethod
+	def time_to_live(ttl_seconds=DEFAULT_TTL_SECONDS):
+		"""Creates a policy for responses that can be reused for ttl_seconds."""
+
+		return CachePolicy(ttl_seconds=ttl_seconds)
+
+
+class ResponseCache:  # pylint: disable=too-many-instance-attributes
+	"""
+	Caches node responses of a single network keyed by request.
+	Responses are kept in an in-memory LRU and, optionally, immutable responses in an on-disk SQLite store.
+
+	Responses are stored as JSON text, so every lookup returns a fresh object that callers are free to modify.
+	"""
+
+	def __init__(
+		self,
+		network_name,
+		max_size=DEFAULT_MAX_CACHED_RESPONSE_COUNT,
+		database_filepath=None,
+		finalized_height_refresh_seconds=DEFAULT_FINALIZED_HEIGHT_REFRESH_SECONDS
+	):
+		"""Creates a response cache."""
+
+		self.network_name = network_name
+		self.max_size = max_size
+		self.finalized_height_refresh_seconds = finalized_height_refresh_seconds
+
+		self.hit_count = 0
+		self.miss_count = 0
+		self.unfinalized_count = 0
+
+		self.finalized_chain_height = 0
+		self._finalized_chain_height_update_time = None
+
+		self._store = LruStore(network_name, max_size, RESPONSE_CACHE_TABLE, database_filepath)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def __len__(self):
+		return len(self._store)
+
+	@property
+	def eviction_count(self):
+		"""Gets the number of responses evicted from memory."""
+
+		return self._store.eviction_count
+
+	def close(self):
+		"""Closes the on-disk store, if any."""
+
+		self._store.close()
+
+	def statistics(self):
+		"""Gets a JSON serializable snapshot of the cache statistics."""
+
+		return {
+			'size': len(self),
+			'hit_count': self.hit_count,
+			'miss_count': self.miss_count,
+			'unfinalized_count': self.unfinalized_count,
+			'eviction_count': self.eviction_count,
+			'finalized_chain_height': self.finalized_chain_height
+		}
+
+	def lookup(self, key):
+		"""Gets a (found, response) tuple for a request key, where response is None when it is not cached (or is expired)."""
+
+		response_text = self._store.get(key)
+		if response_text is None:
+			self.miss_count += 1
+			return (False, None)
+
+		self.hit_count += 1
+		return (True, json.loads(response_text))
+
+	def is_finalized_height_stale(self, height):
+		"""Determines if a height is above the known finalized chain height, which has not been refreshed recently."""
+
+		if height <= self.finalized_chain_height:
+			return False
+
+		if self._finalized_chain_height_update_time is None:
+			return True
+
+		return time.monotonic() - self._finalized_chain_height_update_time >= self.finalized_height_refresh_seconds
+
+	def update_finalized_chain_height(self, finalized_chain_height):
+		"""Updates the known finalized chain height, which never decreases."""
+
+		self.finalized_chain_height = max(self.finalized_chain_height, finalized_chain_height)
+		self._finalized_chain_height_update_time = time.monotonic()
+
+	def add(self, key, response, cache_policy, height=None):
+		"""
+		Adds a response to the cache according to its policy, skipping responses tied to blocks that are not finalized.
+		Returns True if the response was added.
+		"""
+
+		if height is not None and height > self.finalized_chain_height:
+			self.unfinalized_count += 1
+			return False
+
+		expiry_time = None if cache_policy.is_immutable else time.monotonic() + cache_policy.ttl_seconds
+		self._store.add(key, json.dumps(response), expiry_time)
+		return True
@@ -10,17 +10,40 @@ from ..model.Endpoint import Endpoint
 from ..model.Exceptions import InsufficientBalanceException, NodeException
 from ..model.NodeInfo import NodeInfo
 from .BasicConnector import BasicConnector
+from .ResponseCache import CachePolicy
 
 ChainStatistics = namedtuple('ChainStatistics', ['height', 'score_high', 'score_low'])
 FinalizationStatistics = namedtuple('FinalizationStatistics', ['epoch', 'point', 'height', 'hash'])
 MultisigInfo = namedtuple('MultisigInfo', ['min_approval', 'min_removal', 'cosignatory_addresses', 'multisig_addresses'])
 VotingPublicKey = namedtuple('VotingPublicKey', ['start_epoch', 'end_epoch', 'public_key'])
 
+TRANSACTION_CACHE_POLICY = CachePolicy.immutable(height_of=lambda transaction_json: transaction_json['meta']['height'])
+
 
 def _is_not_found(response_json):
 	return 'code' in response_json and 'ResourceNotFound' == response_json['code']
 
 
+def get_desired_status_groups(desired_status):
+	"""Gets the transaction status groups that satisfy a desired transaction status."""
+
+	desired_status_groups = ['confirmed']
+	if TransactionStatus.UNCONFIRMED == desired_status:
+		desired_status_groups.append('unconfirmed')
+
+	return desired_status_groups
+
+
+def make_rejected_transaction_exception(code):
+	"""Creates the exception raised when a transaction is rejected with a status code."""
+
+	error_message = f'transaction was rejected with error {code}'
+	if 'Failure_Core_Insufficient_Balance' == code:
+		return InsufficientBalanceException(error_message)
+
+	return NodeException(error_message)
+
+
 # region LinkedPublicKeys
 
 class LinkedPublicKeys:
@@ -65,7 +88,7 @@ class SymbolConnector(BasicConnector):  # pylint: disable=too-many-public-method
 		"""Gets the currency mosaic id from the network."""
 
 		if not self._network_properties:
-			self._network_properties = await self.get('network/properties')
+			self._network_properties = await self.get('network/properties', cache_policy=CachePolicy.immutable())
 
 		formatted_currency_mosaic_id = self._network_properties['chain']['currencyMosaicId']
 		return int(formatted_currency_mosaic_id.replace('\'', ''), 16)
@@ -113,7 +136,7 @@ class SymbolConnector(BasicConnector):  # pylint: disable=too-many-public-method
 	async def block_headers(self, height):
 		"""Gets block headers."""
 
-		block = await self.get(f'blocks/{height}')
+		block = await self.get(f'blocks/{height}', cache_policy=CachePolicy.immutable(height))
 		return block
 
 	# endregion
@@ -230,7 +253,7 @@ class SymbolConnector(BasicConnector):  # pylint: disable=too-many-public-method
 		"""Gets the statuses of the specified transactions."""
 
 		request = {'hashes': [str(transaction_hash) for transaction_hash in transaction_hashes]}
-		return await self.post('transactionStatus', request)
+		return await self.post('transactionStatus', request, is_idempotent=True)
 
 	async def filter_confirmed_transactions(self, transaction_hashes):
 		"""Filters transaction hashes and returns only confirmed ones with (confirmed) heights."""
@@ -260,17 +283,22 @@ class SymbolConnector(BasicConnector):  # pylint: disable=too-many-public-method
 		"""Gets a confirmed transaction by hash."""
 
 		url_path = f'transactions/confirmed/{transaction_hash}'
-		return await self.get(url_path, None)
+		return await self.get(url_path, None, cache_policy=TRANSACTION_CACHE_POLICY)
 
 	# endregion
 
-	# region GET (incoming_transactions)
+	# region GET (incoming_transactions, incoming_transactions_in_range)
 
 	async def incoming_transactions(self, address, start_id=None):
 		"""Gets incoming transactions for the specified account."""
 
 		return await self._transactions(f'recipientAddress={address}', start_id)
 
+	async def incoming_transactions_in_range(self, address, start_height, end_height, start_id=None):
+		"""Gets incoming transactions for the specified account in the range [start_height, end_height)."""
+
+		return await self._transactions(f'recipientAddress={address}&fromHeight={start_height}&toHeight={end_height - 1}', start_id)
+
 	async def _transactions(self, query_filter, start_id=None):
 		url_path = f'transactions/confirmed?{query_filter}&embedded=true&pageSize=100&order=desc'
 		if start_id:
@@ -313,9 +341,7 @@ class SymbolConnector(BasicConnector):  # pylint: disable=too-many-public-method
 	async def try_wait_for_announced_transaction(self, transaction_hash, desired_status, timeout_settings):
 		"""Tries to wait for a previously announced transaction to transition to a desired status."""
 
-		desired_status_strings = ['confirmed']
-		if TransactionStatus.UNCONFIRMED == desired_status:
-			desired_status_strings.append('unconfirmed')
+		desired_status_strings = get_desired_status_groups(desired_status)
 
 		for _ in range(timeout_settings.retry_count):
 			response_json = await self.get(f'transactionStatus/{transaction_hash}', not_found_as_error=False)
@@ -326,11 +352,7 @@ class SymbolConnector(BasicConnector):  # pylint: disable=too-many-public-method
 					return True
 
 				if 'failed' == status:
-					error_message = f'transaction was rejected with error {response_json["code"]}'
-					if 'Failure_Core_Insufficient_Balance' == response_json['code']:
-						raise InsufficientBalanceException(error_message)
-
-					raise NodeException(error_message)
+					raise make_rejected_transaction_exception(response_json['code'])
 
 			await asyncio.sleep(timeout_settings.interval)
 
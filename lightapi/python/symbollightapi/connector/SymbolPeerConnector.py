@@ -1,6 +1,7 @@
 import asyncio
 import ctypes
 import ssl
+import time
 
 from symbolchain.BufferReader import BufferReader
 from symbolchain.CryptoTypes import Hash256, PublicKey
@@ -12,10 +13,11 @@ from ..model.NodeInfo import NodeInfo
 from ..model.PacketHeader import PacketHeader, PacketType
 from .BasicConnector import NodeException
 from .CatapultCertificateProcessor import CatapultCertificateProcessor
+from .RequestMetrics import ResponseSample
 from .SymbolConnector import ChainStatistics, FinalizationStatistics
 
 
-class SymbolPeerConnector:
+class SymbolPeerConnector:  # pylint: disable=too-many-instance-attributes
 	"""Async connector for interacting with a Symbol peer node."""
 
 	def __init__(self, host, port, certificate_directory):
@@ -23,8 +25,19 @@ class SymbolPeerConnector:
 
 		(self.node_host, self.node_port) = (host, port)
 		self.timeout_seconds = None
+		self.keep_alive_seconds = None
+		self.certificate_info_cache = None
 		self.certificate_processor = None
 		self.node_public_key = None
+		self.metrics = None
+
+		self.handshake_count = 0
+		self.handshake_seconds = 0
+		self.reused_request_count = 0
+
+		self._connection = None
+		self._connection_lock = asyncio.Lock()
+		self._idle_expiration_handle = None
 
 		self.ssl_context = ssl.create_default_context()
 		self.ssl_context.verify_flags &= ~ssl.VERIFY_X509_STRICT
@@ -44,6 +57,27 @@ class SymbolPeerConnector:
 			lib.SSL_VERIFY_PEER | lib.SSL_VERIFY_FAIL_IF_NO_PEER_CERT,
 			self._verify_callback_wrapper)
 
+	@property
+	def saved_handshake_seconds(self):
+		"""Gets the estimated time saved by sending requests over kept alive connections instead of new connections."""
+
+		if not self.handshake_count:
+			return 0
+
+		return self.reused_request_count * self.handshake_seconds / self.handshake_count
+
+	async def close(self):
+		"""Closes the kept alive connection, if any."""
+
+		async with self._connection_lock:
+			self._close_connection()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.close()
+
 	async def chain_height(self):
 		"""Gets chain height."""
 
@@ -85,23 +119,112 @@ class SymbolPeerConnector:
 
 		return True
 
-	async def _send_socket_request(self, packet_type, parser):
-		writer = None
-		self.certificate_processor = CatapultCertificateProcessor()  # due to structure of this connector, handshake is done each request
+	async def _open_connection(self):
+		self.certificate_processor = CatapultCertificateProcessor(self.certificate_info_cache)
 		try:
-			reader, writer = await asyncio.open_connection(
+			start_time = time.perf_counter()
+			connection = await asyncio.open_connection(
 				self.node_host,
 				self.node_port,
 				ssl=self.ssl_context,
 				ssl_handshake_timeout=self.timeout_seconds)
-			return await asyncio.wait_for(self._process_write_read(reader, writer, packet_type, parser), timeout=self.timeout_seconds)
+
+			self.handshake_count += 1
+			self.handshake_seconds += time.perf_counter() - start_time
+			return connection
+		finally:
+			self.certificate_processor = None
+
+	async def _write_read(self, connection, packet_type, parser):
+		(reader, writer) = connection
+		return await asyncio.wait_for(self._process_write_read(reader, writer, packet_type, parser), timeout=self.timeout_seconds)
+
+	async def _send_socket_request(self, packet_type, parser):
+		if self.metrics is None:
+			return await self._send_unmeasured_socket_request(packet_type, parser)
+
+		response_sample = ResponseSample()
+
+		def measured_parser(reader):
+			response_sample.byte_count = 8 + len(reader.buffer)  # including packet header
+			start_time = time.perf_counter()
+			try:
+				return parser(reader)
+			finally:
+				response_sample.decode_seconds = time.perf_counter() - start_time
+
+		endpoint = f'{self.node_host}:{self.node_port}'
+		operation = f'PACKET {packet_type.name}'
+		start_time = time.perf_counter()
+		try:
+			result = await self._send_unmeasured_socket_request(packet_type, measured_parser)
+		except Exception as ex:
+			self.metrics.record_request(endpoint, operation, time.perf_counter() - start_time, response_sample, ex)
+			raise
+
+		self.metrics.record_request(endpoint, operation, time.perf_counter() - start_time, response_sample)
+		return result
+
+	async def _send_unmeasured_socket_request(self, packet_type, parser):
+		if not self.keep_alive_seconds:
+			return await self._send_socket_request_over_new_connection(packet_type, parser)
+
+		async with self._connection_lock:
+			if self._idle_expiration_handle:
+				self._idle_expiration_handle.cancel()
+
+			try:
+				return await self._send_socket_request_over_kept_alive_connection(packet_type, parser)
+			finally:
+				if self._connection:
+					self._idle_expiration_handle = asyncio.get_running_loop().call_later(self.keep_alive_seconds, self._close_connection)
+
+	async def _send_socket_request_over_new_connection(self, packet_type, parser):
+		writer = None
+		try:
+			connection = await self._open_connection()
+			writer = connection[1]
+			return await self._write_read(connection, packet_type, parser)
 		except (ConnectionRefusedError, OSError, asyncio.exceptions.IncompleteReadError, asyncio.exceptions.TimeoutError) as ex:
 			raise NodeException from ex
 		finally:
 			if writer:
 				writer.close()
 
-			self.certificate_processor = None
+	async def _send_socket_request_over_kept_alive_connection(self, packet_type, parser):
+		if self._connection:
+			try:
+				result = await self._write_read(self._connection, packet_type, parser)
+				self.reused_request_count += 1
+				return result
+			except (ConnectionResetError, BrokenPipeError, asyncio.exceptions.IncompleteReadError):
+				# node closed the kept alive connection, so reconnect
+				self._close_connection()
+			except (OSError, asyncio.exceptions.TimeoutError) as ex:
+				self._close_connection()
+				raise NodeException from ex
+			except NodeException:
+				self._close_connection()
+				raise
+
+		try:
+			self._connection = await self._open_connection()
+			return await self._write_read(self._connection, packet_type, parser)
+		except (ConnectionRefusedError, OSError, asyncio.exceptions.IncompleteReadError, asyncio.exceptions.TimeoutError) as ex:
+			self._close_connection()
+			raise NodeException from ex
+		except NodeException:
+			self._close_connection()
+			raise
+
+	def _close_connection(self):
+		if self._idle_expiration_handle:
+			self._idle_expiration_handle.cancel()
+			self._idle_expiration_handle = None
+
+		if self._connection:
+			self._connection[1].close()
+			self._connection = None
 
 	@staticmethod
 	async def _process_write_read(reader, writer, packet_type, parser):
@@ -0,0 +1,138 @@
+import asyncio
+from collections import namedtuple
+
+from ..model.Exceptions import NodeException
+from .CertificateInfoCache import CertificateInfoCache
+from .SymbolPeerConnector import SymbolPeerConnector
+
+PeerCrawlResult = namedtuple('PeerCrawlResult', ['host', 'port', 'depth', 'node_info', 'chain_statistics', 'peers', 'error'])
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_TIMEOUT_SECONDS = 10
+
+
+class SymbolPeerCrawler:  # pylint: disable=too-many-instance-attributes
+	"""
+	Crawls Symbol peer nodes over the binary protocol.
+
+	Each node is asked for its node information, chain statistics and peers over a single connection.
+	Discovered peers are followed breadth-first and results are yielded as soon as they are available.
+	"""
+
+	def __init__(
+		self,
+		certificate_directory,
+		max_concurrency=DEFAULT_MAX_CONCURRENCY,
+		max_depth=None,
+		max_node_count=None,
+		timeout_seconds=DEFAULT_TIMEOUT_SECONDS,
+		certificate_info_cache=None
+	):
+		"""Creates a crawler."""
+
+		# pylint: disable=too-many-arguments,too-many-positional-arguments
+
+		self.certificate_directory = certificate_directory
+		self.max_concurrency = max_concurrency
+		self.max_depth = max_depth
+		self.max_node_count = max_node_count
+		self.timeout_seconds = timeout_seconds
+		self.certificate_info_cache = CertificateInfoCache() if certificate_info_cache is None else certificate_info_cache
+
+	async def crawl(self, endpoints):
+		"""Crawls peers starting with seed endpoints, specified as (host, port) pairs, and yields PeerCrawlResult for each visited node."""
+
+		endpoint_queue = asyncio.Queue()
+		result_queue = asyncio.Queue()
+		visited_endpoints = set()
+
+		for (host, port) in endpoints:
+			self._try_enqueue(endpoint_queue, visited_endpoints, host, port, 0)
+
+		async def signal_completion():
+			await endpoint_queue.join()
+			await result_queue.put(None)
+
+		# connectors are created up front, so configuration errors (e.g. a bad certificate directory) are raised immediately
+		connectors = [self._create_connector() for _ in range(self.max_concurrency)]
+		worker_tasks = [
+			asyncio.create_task(self._crawl_worker(connector, endpoint_queue, result_queue, visited_endpoints))
+			for connector in connectors
+		]
+		tasks = [*worker_tasks, asyncio.create_task(signal_completion())]
+
+		try:
+			while True:
+				result = await self._next_result(result_queue, worker_tasks)
+				if result is None:
+					break
+
+				yield result
+		finally:
+			for task in tasks:
+				task.cancel()
+
+			await asyncio.gather(*tasks, return_exceptions=True)
+
+	@staticmethod
+	async def _next_result(result_queue, worker_tasks):
+		# workers only exit by failing, so a finished worker aborts the crawl instead of leaving its endpoints unprocessed forever
+		get_task = asyncio.create_task(result_queue.get())
+		try:
+			await asyncio.wait([get_task, *worker_tasks], return_when=asyncio.FIRST_COMPLETED)
+		finally:
+			if not get_task.done():
+				get_task.cancel()
+
+		for task in worker_tasks:
+			if task.done():
+				return task.result()
+
+		return get_task.result()
+
+	def _create_connector(self):
+		connector = SymbolPeerConnector(None, None, self.certificate_directory)
+		connector.timeout_seconds = self.timeout_seconds
+		connector.keep_alive_seconds = self.timeout_seconds
+		connector.certificate_info_cache = self.certificate_info_cache
+		return connector
+
+	def _try_enqueue(self, endpoint_queue, visited_endpoints, host, port, depth):
+		if not host or (host, port) in visited_endpoints:
+			return
+
+		if self.max_node_count is not None and len(visited_endpoints) >= self.max_node_count:
+			return
+
+		visited_endpoints.add((host, port))
+		endpoint_queue.put_nowait((host, port, depth))
+
+	async def _crawl_worker(self, connector, endpoint_queue, result_queue, visited_endpoints):
+		# each worker reuses a single connector (and its ssl context) for all of the nodes it visits
+		while True:
+			(host, port, depth) = await endpoint_queue.get()
+			try:
+				result = await self._crawl_node(connector, host, port, depth)
+				if self.max_depth is None or depth < self.max_depth:
+					for peer in result.peers:
+						self._try_enqueue(endpoint_queue, visited_endpoints, peer.endpoint.host, peer.endpoint.port, depth + 1)
+
+				await result_queue.put(result)
+			finally:
+				endpoint_queue.task_done()
+
+	@staticmethod
+	async def _crawl_node(connector, host, port, depth):
+		(connector.node_host, connector.node_port) = (host, port)
+		connector.node_public_key = None
+
+		try:
+			node_info = await connector.node_info()
+			chain_statistics = await connector.chain_statistics()
+			peers = await connector.peers()
+			return PeerCrawlResult(host, port, depth, node_info, chain_statistics, peers, None)
+		except (NodeException, ValueError) as ex:
+			# malformed responses (e.g. undecodable node names) only fail the node that sent them
+			return PeerCrawlResult(host, port, depth, None, None, [], ex)
+		finally:
+			await connector.close()
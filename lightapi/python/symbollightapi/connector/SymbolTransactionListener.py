@@ -0,0 +1,207 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+
+from aiohttp import ClientSession, WSMsgType, client_exceptions
+
+from ..model.Constants import TimeoutSettings
+from ..model.Exceptions import NodeException
+from .SymbolConnector import get_desired_status_groups, make_rejected_transaction_exception
+
+DEFAULT_RECENT_NOTIFICATION_COUNT = 1000
+
+CHANNEL_STATUS_GROUPS = {
+	'unconfirmedAdded': 'unconfirmed',
+	'confirmedAdded': 'confirmed',
+	'status': 'failed'
+}
+
+
+class SymbolTransactionListener:  # pylint: disable=too-many-instance-attributes
+	"""
+	Listens to the websocket channels (status, unconfirmedAdded and confirmedAdded) of a Symbol account and wakes up all tasks
+	waiting for announced transactions as notifications arrive.
+
+	Waits fall back to polling the connector when the websocket is not connected or drops. The most recent notifications are kept,
+	so a wait started after its notification arrived completes immediately.
+	"""
+
+	def __init__(self, connector, address, recent_notification_count=DEFAULT_RECENT_NOTIFICATION_COUNT):
+		"""Creates a listener for the transactions of an account using a Symbol connector."""
+
+		self.connector = connector
+		self.address = address
+		self.recent_notification_count = recent_notification_count
+
+		self.notification_count = 0
+		self.fallback_count = 0
+
+		self._session = None
+		self._websocket = None
+		self._receive_task = None
+		self._waiters = {}
+		self._recent_notifications = OrderedDict()
+
+	@property
+	def is_connected(self):
+		"""Determines if the websocket is connected."""
+
+		return self._websocket is not None
+
+	@property
+	def waiting_count(self):
+		"""Gets the number of tasks waiting for notifications."""
+
+		return sum(len(waiters) for waiters in self._waiters.values())
+
+	async def open(self):
+		"""
+		Connects to the websocket of the node and subscribes to the transaction channels of the account.
+		Raises NodeException on connection failure.
+		"""
+
+		session = ClientSession()
+		try:
+			websocket = await asyncio.wait_for(session.ws_connect(f'{self.connector.endpoint}/ws'), self.connector.timeout_seconds)
+			uid_json = await websocket.receive_json(timeout=self.connector.timeout_seconds)
+			for channel in CHANNEL_STATUS_GROUPS:
+				await websocket.send_json({'uid': uid_json['uid'], 'subscribe': f'{channel}/{self.address}'})
+		except (asyncio.TimeoutError, client_exceptions.ClientError, TypeError, KeyError) as ex:
+			await session.close()
+			raise NodeException from ex
+
+		self._session = session
+		self._websocket = websocket
+		self._receive_task = asyncio.create_task(self._receive_notifications(websocket))
+
+	async def close(self):
+		"""Closes the websocket, if any."""
+
+		if self._receive_task:
+			self._receive_task.cancel()
+			await asyncio.gather(self._receive_task, return_exceptions=True)
+			self._receive_task = None
+
+		if self._websocket:
+			await self._websocket.close()
+			self._disconnect()
+
+		if self._session:
+			await self._session.close()
+			self._session = None
+
+	async def __aenter__(self):
+		await self.open()
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.close()
+
+	async def try_wait_for_announced_transaction(self, transaction_hash, desired_status, timeout_settings):
+		"""
+		Tries to wait for a previously announced transaction to transition to a desired status.
+		The status is polled once when no notification arrives within the timeout.
+		"""
+
+		if not self.is_connected:
+			self.fallback_count += 1
+			return await self.connector.try_wait_for_announced_transaction(transaction_hash, desired_status, timeout_settings)
+
+		hash_key = str(transaction_hash).upper()
+		desired_status_groups = get_desired_status_groups(desired_status)
+		notification = self._recent_notifications.get(hash_key, None)
+		if notification and self._is_final_notification(notification, desired_status_groups):
+			return self._complete(notification, desired_status_groups)
+
+		future = asyncio.get_running_loop().create_future()
+		waiter = (desired_status_groups, future)
+		self._waiters.setdefault(hash_key, []).append(waiter)
+
+		timeout_seconds = timeout_settings.retry_count * timeout_settings.interval
+		start_time = time.monotonic()
+		try:
+			is_notified = await asyncio.wait_for(future, timeout_seconds)
+		except asyncio.TimeoutError:
+			# notification might have been missed, so check the status once
+			return await self.connector.try_wait_for_announced_transaction(transaction_hash, desired_status, TimeoutSettings(1, 0))
+		finally:
+			self._remove_waiter(hash_key, waiter)
+
+		if is_notified:
+			return True
+
+		# websocket dropped, so poll for the remaining time
+		self.fallback_count += 1
+		remaining_seconds = max(0, timeout_seconds - (time.monotonic() - start_time))
+		retry_count = max(1, math.ceil(remaining_seconds / timeout_settings.interval)) if timeout_settings.interval else 1
+		return await self.connector.try_wait_for_announced_transaction(
+			transaction_hash,
+			desired_status,
+			TimeoutSettings(retry_count, timeout_settings.interval))
+
+	async def _receive_notifications(self, websocket):
+		try:
+			async for message in websocket:
+				if WSMsgType.TEXT != message.type:
+					break
+
+				try:
+					self._process_notification(message.json())
+				except (ValueError, KeyError, TypeError):
+					pass  # ignore malformed notification
+		finally:
+			if self._websocket is websocket:
+				self._disconnect()
+
+	def _process_notification(self, notification_json):
+		channel = notification_json.get('topic', '').split('/')[0]
+		status_group = CHANNEL_STATUS_GROUPS.get(channel, None)
+		if not status_group:
+			return
+
+		data_json = notification_json['data']
+		if 'failed' == status_group:
+			notification = (data_json['hash'].upper(), status_group, data_json['code'])
+		else:
+			notification = (data_json['meta']['hash'].upper(), status_group, None)
+
+		self.notification_count += 1
+		hash_key = notification[0]
+		self._recent_notifications[hash_key] = notification
+		self._recent_notifications.move_to_end(hash_key)
+		while len(self._recent_notifications) > self.recent_notification_count:
+			self._recent_notifications.popitem(last=False)
+
+		for (desired_status_groups, future) in self._waiters.get(hash_key, []):
+			if not future.done() and self._is_final_notification(notification, desired_status_groups):
+				try:
+					future.set_result(self._complete(notification, desired_status_groups))
+				except NodeException as ex:
+					future.set_exception(ex)
+
+	def _disconnect(self):
+		self._websocket = None
+
+		# wake up all waiters, so that they can fall back to polling
+		for waiters in self._waiters.values():
+			for (_, future) in waiters:
+				if not future.done():
+					future.set_result(False)
+
+	def _remove_waiter(self, hash_key, waiter):
+		waiters = self._waiters[hash_key]
+		waiters.remove(waiter)
+		if not waiters:
+			del self._waiters[hash_key]
+
+	@staticmethod
+	def _is_final_notification(notification, desired_status_groups):
+		return notification[1] in desired_status_groups or 'failed' == notification[1]
+
+	@staticmethod
+	def _complete(notification, desired_status_groups):
+		if notification[1] in desired_status_groups:
+			return True
+
+		raise make_rejected_transaction_exception(notification[2])
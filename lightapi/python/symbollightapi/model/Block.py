@@ -1,7 +1,34 @@
+from symbolchain.CryptoTypes import PublicKey
+from symbolchain.nem.Network import Address
+
+from .LazyField import LazyField
+
+
 class Block:  # pylint: disable=too-many-instance-attributes
 	"""Block model."""
 
-	def __init__(self, height, timestamp, transactions, difficulty, block_hash, total_fee, beneficiary, signer, signature, size):
+	__slots__ = (
+		'height', 'timestamp', 'transactions', 'difficulty', 'block_hash', 'total_fee', '_beneficiary', '_signer', 'signature', 'size',
+		'previous_block_hash'
+	)
+
+	beneficiary = LazyField(Address)
+	signer = LazyField(PublicKey)
+
+	def __init__(
+		self,
+		height,
+		timestamp,
+		transactions,
+		difficulty,
+		block_hash,
+		total_fee,
+		beneficiary,
+		signer,
+		signature,
+		size,
+		previous_block_hash=None
+	):
 		"""Create a Block model."""
 
 		# pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -16,6 +43,7 @@ class Block:  # pylint: disable=too-many-instance-attributes
 		self.signer = signer
 		self.signature = signature
 		self.size = size
+		self.previous_block_hash = previous_block_hash
 
 	def __eq__(self, other):
 		return isinstance(other, Block) and all([
@@ -28,5 +56,6 @@ class Block:  # pylint: disable=too-many-instance-attributes
 			self.beneficiary == other.beneficiary,
 			self.signer == other.signer,
 			self.signature == other.signature,
-			self.size == other.size
+			self.size == other.size,
+			self.previous_block_hash == other.previous_block_hash
 		])
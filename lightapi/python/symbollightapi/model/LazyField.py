@@ -0,0 +1,35 @@
+from collections import namedtuple
+
+Encoded = namedtuple('Encoded', ['value'])
+
+
+class LazyField:
+	"""
+	Model field that stores an encoded value and decodes it on first access.
+	Values that are not wrapped in Encoded are stored and returned as is.
+	"""
+
+	__slots__ = ('decoder', 'slot_name')
+
+	def __init__(self, decoder):
+		"""Creates a lazy field that decodes values with the specified decoder."""
+
+		self.decoder = decoder
+		self.slot_name = None
+
+	def __set_name__(self, owner, name):
+		self.slot_name = f'_{name}'
+
+	def __get__(self, instance, owner=None):
+		if instance is None:
+			return self
+
+		value = getattr(instance, self.slot_name)
+		if isinstance(value, Encoded):
+			value = self.decoder(value.value)
+			setattr(instance, self.slot_name, value)
+
+		return value
+
+	def __set__(self, instance, value):
+		setattr(instance, self.slot_name, value)
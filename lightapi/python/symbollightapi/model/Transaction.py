@@ -1,3 +1,4 @@
+import warnings
 from collections import namedtuple
 
 from symbolchain.CryptoTypes import PublicKey
@@ -5,6 +6,7 @@ from symbolchain.nc import TransactionType
 from symbolchain.nem.Network import Address
 
 from ..model.Exceptions import UnknownTransactionType
+from .LazyField import Encoded, LazyField
 
 Message = namedtuple('Message', ['payload', 'is_plain'])
 Mosaic = namedtuple('Mosaic', ['namespace_name', 'quantity'])
@@ -14,6 +16,10 @@ MosaicProperties = namedtuple('MosaicProperties', ['divisibility', 'initial_supp
 
 
 class Transaction:
+	__slots__ = ('transaction_hash', 'height', '_sender', 'fee', 'timestamp', 'deadline', 'signature', 'transaction_type')
+
+	sender = LazyField(PublicKey)
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -52,6 +58,10 @@ class Transaction:
 
 
 class TransferTransaction(Transaction):
+	__slots__ = ('amount', '_recipient', 'message', 'mosaics')
+
+	recipient = LazyField(Address)
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -97,6 +107,10 @@ class TransferTransaction(Transaction):
 
 
 class AccountKeyLinkTransaction(Transaction):
+	__slots__ = ('mode', '_remote_account')
+
+	remote_account = LazyField(PublicKey)
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -136,6 +150,8 @@ class AccountKeyLinkTransaction(Transaction):
 
 
 class MultisigAccountModificationTransaction(Transaction):
+	__slots__ = ('min_cosignatories', 'modifications')
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -175,6 +191,8 @@ class MultisigAccountModificationTransaction(Transaction):
 
 
 class MultisigTransaction(Transaction):
+	__slots__ = ('signatures', 'other_transaction', 'inner_hash')
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -217,6 +235,11 @@ class MultisigTransaction(Transaction):
 
 
 class CosignSignatureTransaction():
+	__slots__ = ('transaction_type', 'timestamp', 'other_hash', '_other_account', '_sender', 'fee', 'deadline', 'signature')
+
+	other_account = LazyField(Address)
+	sender = LazyField(PublicKey)
+
 	def __init__(
 		self,
 		timestamp,
@@ -253,6 +276,10 @@ class CosignSignatureTransaction():
 
 
 class NamespaceRegistrationTransaction(Transaction):
+	__slots__ = ('_rental_fee_sink', 'rental_fee', 'parent', 'namespace')
+
+	rental_fee_sink = LazyField(Address)
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -298,6 +325,11 @@ class NamespaceRegistrationTransaction(Transaction):
 
 
 class MosaicDefinitionTransaction(Transaction):
+	__slots__ = ('creation_fee', '_creation_fee_sink', '_creator', 'description', 'namespace_name', 'properties', 'levy')
+
+	creation_fee_sink = LazyField(Address)
+	creator = LazyField(PublicKey)
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -352,6 +384,8 @@ class MosaicDefinitionTransaction(Transaction):
 
 
 class MosaicSupplyChangeTransaction(Transaction):
+	__slots__ = ('supply_type', 'delta', 'namespace_name')
+
 	def __init__(
 		self,
 		transaction_hash,
@@ -393,152 +427,172 @@ class MosaicSupplyChangeTransaction(Transaction):
 		])
 
 
-class TransactionHandler:
-	"""Transaction handle mapper."""
-	def __init__(self):
-		self.map = {
-			TransactionType.TRANSFER.value: self._map_transfer_args,
-			TransactionType.ACCOUNT_KEY_LINK.value: self._map_account_key_link_args,
-			TransactionType.MULTISIG_ACCOUNT_MODIFICATION.value: self._map_multisig_account_modification_args,
-			TransactionType.MULTISIG.value: self._map_multisig_transaction_args,
-			TransactionType.NAMESPACE_REGISTRATION.value: self._map_namespace_registration_args,
-			TransactionType.MOSAIC_DEFINITION.value: self._map_mosaic_definition_args,
-			TransactionType.MOSAIC_SUPPLY_CHANGE.value: self._map_mosaic_supply_change_args,
-		}
+# region transaction argument mappers
 
-	@staticmethod
-	def _map_transfer_args(tx_json):
-		message = tx_json['message']
+def _map_transfer_args(tx_json):
+	message = tx_json['message']
 
-		if message:
-			message = Message(
-				message['payload'],
-				message['type']
+	if message:
+		message = Message(
+			message['payload'],
+			message['type']
+		)
+	else:
+		message = None
+
+	mosaics = None
+	if 'mosaics' in tx_json:
+		mosaics = [
+			Mosaic(
+				f'{mosaic["mosaicId"]["namespaceId"]}.{mosaic["mosaicId"]["name"]}',
+				mosaic['quantity']
 			)
-		else:
-			message = None
-
-		mosaics = None
-		if 'mosaics' in tx_json:
-			mosaics = [
-				Mosaic(
-					f'{mosaic["mosaicId"]["namespaceId"]}.{mosaic["mosaicId"]["name"]}',
-					mosaic['quantity']
-				)
-				for mosaic in tx_json['mosaics']
-			]
-
-		return {
-			'amount': tx_json['amount'],
-			'recipient': Address(tx_json['recipient']),
-			'message': message,
-			'mosaics': mosaics,
-		}
+			for mosaic in tx_json['mosaics']
+		]
+
+	return {
+		'amount': tx_json['amount'],
+		'recipient': Encoded(tx_json['recipient']),
+		'message': message,
+		'mosaics': mosaics,
+	}
+
+
+def _map_account_key_link_args(tx_json):
+	return {
+		'mode': tx_json['mode'],
+		'remote_account': Encoded(tx_json['remoteAccount']),
+	}
+
+
+def _map_multisig_account_modification_args(tx_json):
+	return {
+		'min_cosignatories': tx_json.get('minCosignatories', {}).get('relativeChange', 0),
+		'modifications': [
+			Modification(
+				modification['modificationType'],
+				PublicKey(modification['cosignatoryAccount']))
+			for modification in tx_json['modifications']
+		]
+	}
+
+
+def _map_multisig_transaction_args(tx_json, inner_hash):
+	other_transaction = tx_json['otherTrans']
+
+	specific_args = TRANSACTION_ARGS_MAPPERS[other_transaction['type']](other_transaction)
+
+	common_args = {
+		'transaction_hash': None,
+		'height': None,
+		'sender': Encoded(other_transaction['signer']),
+		'fee': other_transaction['fee'],
+		'timestamp': other_transaction['timeStamp'],
+		'deadline': other_transaction['deadline'],
+		'signature': None,
+	}
+
+	return {
+		'signatures': [
+			CosignSignatureTransaction(
+				signature['timeStamp'],
+				signature['otherHash']['data'],
+				Encoded(signature['otherAccount']),
+				Encoded(signature['signer']),
+				signature['fee'],
+				signature['deadline'],
+				signature['signature']
+			)
+			for signature in tx_json['signatures']
+		],
+		'other_transaction': TransactionFactory.create_transaction(other_transaction['type'], common_args, specific_args),
+		'inner_hash': inner_hash,
+	}
+
+
+def _map_namespace_registration_args(tx_json):
+	return {
+		'rental_fee_sink': Encoded(tx_json['rentalFeeSink']),
+		'rental_fee': tx_json['rentalFee'],
+		'parent': tx_json['parent'],
+		'namespace': tx_json['newPart'],
+	}
+
+
+def _map_mosaic_definition_args(tx_json):
+	mosaic_definition = tx_json['mosaicDefinition']
+	mosaic_id = mosaic_definition['id']
+	mosaic_levy = mosaic_definition['levy']
+	mosaic_properties_json = {
+		item['name']: item['value']
+		for item in mosaic_definition['properties']
+	}
+
+	mosaic_properties = MosaicProperties(
+		int(mosaic_properties_json['divisibility']),
+		int(mosaic_properties_json['initialSupply']),
+		mosaic_properties_json['supplyMutable'] != 'false',
+		mosaic_properties_json['transferable'] != 'false'
+	)
+
+	if mosaic_levy:
+		mosaic_levy = MosaicLevy(
+			mosaic_levy['fee'],
+			Address(mosaic_levy['recipient']),
+			mosaic_levy['type'],
+			f'{mosaic_levy["mosaicId"]["namespaceId"]}.{mosaic_levy["mosaicId"]["name"]}'
+		)
 
-	@staticmethod
-	def _map_account_key_link_args(tx_json):
-		return {
-			'mode': tx_json['mode'],
-			'remote_account': PublicKey(tx_json['remoteAccount']),
-		}
+	return {
+		'creation_fee': tx_json['creationFee'],
+		'creation_fee_sink': Encoded(tx_json['creationFeeSink']),
+		'creator': Encoded(mosaic_definition['creator']),
+		'description': mosaic_definition['description'],
+		'namespace_name': f'{mosaic_id["namespaceId"]}.{mosaic_id["name"]}',
+		'properties': mosaic_properties,
+		'levy': mosaic_levy,
+	}
+
+
+def _map_mosaic_supply_change_args(tx_json):
+	mosaic_id = tx_json['mosaicId']
+	return {
+		'supply_type': tx_json['supplyType'],
+		'delta': tx_json['delta'],
+		'namespace_name': f'{mosaic_id["namespaceId"]}.{mosaic_id["name"]}',
+	}
+
+
+TRANSACTION_ARGS_MAPPERS = {
+	TransactionType.TRANSFER.value: _map_transfer_args,
+	TransactionType.ACCOUNT_KEY_LINK.value: _map_account_key_link_args,
+	TransactionType.MULTISIG_ACCOUNT_MODIFICATION.value: _map_multisig_account_modification_args,
+	TransactionType.MULTISIG.value: _map_multisig_transaction_args,
+	TransactionType.NAMESPACE_REGISTRATION.value: _map_namespace_registration_args,
+	TransactionType.MOSAIC_DEFINITION.value: _map_mosaic_definition_args,
+	TransactionType.MOSAIC_SUPPLY_CHANGE.value: _map_mosaic_supply_change_args,
+}
 
-	@staticmethod
-	def _map_multisig_account_modification_args(tx_json):
-		return {
-			'min_cosignatories': tx_json.get('minCosignatories', {}).get('relativeChange', 0),
-			'modifications': [
-				Modification(
-					modification['modificationType'],
-					PublicKey(modification['cosignatoryAccount']))
-				for modification in tx_json['modifications']
-			]
-		}
-
-	def _map_multisig_transaction_args(self, tx_json, inner_hash):
-
-		other_transaction = tx_json['otherTrans']
-
-		specific_args = self.map[other_transaction['type']](other_transaction)
-
-		common_args = {
-			'transaction_hash': None,
-			'height': None,
-			'sender': PublicKey(other_transaction['signer']),
-			'fee': other_transaction['fee'],
-			'timestamp': other_transaction['timeStamp'],
-			'deadline': other_transaction['deadline'],
-			'signature': None,
-		}
-
-		return {
-			'signatures': [
-				CosignSignatureTransaction(
-					signature['timeStamp'],
-					signature['otherHash']['data'],
-					Address(signature['otherAccount']),
-					PublicKey(signature['signer']),
-					signature['fee'],
-					signature['deadline'],
-					signature['signature']
-				)
-				for signature in tx_json['signatures']
-			],
-			'other_transaction': TransactionFactory.create_transaction(other_transaction['type'], common_args, specific_args),
-			'inner_hash': inner_hash,
-		}
 
-	@staticmethod
-	def _map_namespace_registration_args(tx_json):
-		return {
-			'rental_fee_sink': Address(tx_json['rentalFeeSink']),
-			'rental_fee': tx_json['rentalFee'],
-			'parent': tx_json['parent'],
-			'namespace': tx_json['newPart'],
-		}
+class TransactionHandler:
+	"""Transaction handle mapper (deprecated, use TRANSACTION_ARGS_MAPPERS instead)."""
 
-	@staticmethod
-	def _map_mosaic_definition_args(tx_json):
-		mosaic_definition = tx_json['mosaicDefinition']
-		mosaic_id = mosaic_definition['id']
-		mosaic_levy = mosaic_definition['levy']
-		mosaic_properties_json = {
-			item['name']: item['value']
-			for item in mosaic_definition['properties']
-		}
-
-		mosaic_properties = MosaicProperties(
-			int(mosaic_properties_json['divisibility']),
-			int(mosaic_properties_json['initialSupply']),
-			mosaic_properties_json['supplyMutable'] != 'false',
-			mosaic_properties_json['transferable'] != 'false'
-		)
+	def __init__(self):
+		warnings.warn('TransactionHandler is deprecated, use TRANSACTION_ARGS_MAPPERS instead', DeprecationWarning, stacklevel=2)
+		self.map = TRANSACTION_ARGS_MAPPERS
 
-		if mosaic_levy:
-			mosaic_levy = MosaicLevy(
-				mosaic_levy['fee'],
-				Address(mosaic_levy['recipient']),
-				mosaic_levy['type'],
-				f'{mosaic_levy["mosaicId"]["namespaceId"]}.{mosaic_levy["mosaicId"]["name"]}'
-			)
+# endregion
 
-		return {
-			'creation_fee': tx_json['creationFee'],
-			'creation_fee_sink': Address(tx_json['creationFeeSink']),
-			'creator': PublicKey(mosaic_definition['creator']),
-			'description': mosaic_definition['description'],
-			'namespace_name': f'{mosaic_id["namespaceId"]}.{mosaic_id["name"]}',
-			'properties': mosaic_properties,
-			'levy': mosaic_levy,
-		}
 
-	@staticmethod
-	def _map_mosaic_supply_change_args(tx_json):
-		mosaic_id = tx_json['mosaicId']
-		return {
-			'supply_type': tx_json['supplyType'],
-			'delta': tx_json['delta'],
-			'namespace_name': f'{mosaic_id["namespaceId"]}.{mosaic_id["name"]}',
-		}
+TRANSACTION_CLASSES = {
+	TransactionType.TRANSFER.value: TransferTransaction,
+	TransactionType.ACCOUNT_KEY_LINK.value: AccountKeyLinkTransaction,
+	TransactionType.MULTISIG_ACCOUNT_MODIFICATION.value: MultisigAccountModificationTransaction,
+	TransactionType.MULTISIG.value: MultisigTransaction,
+	TransactionType.NAMESPACE_REGISTRATION.value: NamespaceRegistrationTransaction,
+	TransactionType.MOSAIC_DEFINITION.value: MosaicDefinitionTransaction,
+	TransactionType.MOSAIC_SUPPLY_CHANGE.value: MosaicSupplyChangeTransaction,
+}
 
 
 class TransactionFactory:
@@ -546,17 +600,7 @@ class TransactionFactory:
 
 	@staticmethod
 	def create_transaction(tx_type, common_args, specific_args):
-		transaction_mapping = {
-			TransactionType.TRANSFER.value: TransferTransaction,
-			TransactionType.ACCOUNT_KEY_LINK.value: AccountKeyLinkTransaction,
-			TransactionType.MULTISIG_ACCOUNT_MODIFICATION.value: MultisigAccountModificationTransaction,
-			TransactionType.MULTISIG.value: MultisigTransaction,
-			TransactionType.NAMESPACE_REGISTRATION.value: NamespaceRegistrationTransaction,
-			TransactionType.MOSAIC_DEFINITION.value: MosaicDefinitionTransaction,
-			TransactionType.MOSAIC_SUPPLY_CHANGE.value: MosaicSupplyChangeTransaction,
-		}
-
-		transaction_class = transaction_mapping.get(tx_type)
+		transaction_class = TRANSACTION_CLASSES.get(tx_type)
 
 		if not transaction_class:
 			raise UnknownTransactionType(f'Unknown transaction type {tx_type}')
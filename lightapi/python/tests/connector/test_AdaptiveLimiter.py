@@ -0,0 +1,396 @@
+import asyncio
+
+import pytest
+
+from symbollightapi.connector.AdaptiveLimiter import AdaptiveLimiter, AdaptiveLimiterPool
+from symbollightapi.model.Exceptions import HttpException, NodeException
+
+# pylint: disable=invalid-name
+
+
+# region utils
+
+async def _run_request(limiter, delay_seconds=0, exception=None):
+	async with limiter.request():
+		await asyncio.sleep(delay_seconds)
+		if exception:
+			raise exception
+
+
+async def _run_throttled_request(limiter, status_code=429):
+	with pytest.raises(HttpException):
+		await _run_request(limiter, exception=HttpException('throttled', status_code))
+
+
+async def _start_blocked_requests(limiter, count):
+	release_event = asyncio.Event()
+
+	async def run_blocked_request():
+		async with limiter.request():
+			await release_event.wait()
+
+	tasks = [asyncio.create_task(run_blocked_request()) for _ in range(count)]
+	await asyncio.sleep(0)
+	return (tasks, release_event)
+
+# endregion
+
+
+# region constructor
+
+def test_can_create_limiter_with_default_settings():
+	# Act:
+	limiter = AdaptiveLimiter()
+
+	# Assert:
+	assert 20 == limiter.limit
+	assert 1 == limiter.min_limit
+	assert 256 == limiter.max_limit
+	assert 0.5 == limiter.backoff_ratio
+	assert 4 == limiter.latency_tolerance
+	assert 0.5 == limiter.min_congestion_latency_seconds
+	assert 100 == limiter.throttle_events.maxlen
+	assert 0 == limiter.active_count
+	assert 0 == limiter.waiting_count
+	assert 0 == limiter.request_count
+	assert 0 == limiter.throttle_count
+
+
+def test_can_create_limiter_with_custom_settings():
+	# Act:
+	limiter = AdaptiveLimiter(8, 2, 16, 0.75, 3, 0.25, 10)
+
+	# Assert:
+	assert 8 == limiter.limit
+	assert 2 == limiter.min_limit
+	assert 16 == limiter.max_limit
+	assert 0.75 == limiter.backoff_ratio
+	assert 3 == limiter.latency_tolerance
+	assert 0.25 == limiter.min_congestion_latency_seconds
+	assert 10 == limiter.throttle_events.maxlen
+
+# endregion
+
+
+# region concurrency
+
+async def test_requests_above_limit_wait_for_free_slot():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=3)
+
+	# Act:
+	(tasks, release_event) = await _start_blocked_requests(limiter, 5)
+	active_waiting_counts = (limiter.active_count, limiter.waiting_count)
+
+	release_event.set()
+	await asyncio.gather(*tasks)
+
+	# Assert:
+	assert (3, 2) == active_waiting_counts
+	assert (0, 0) == (limiter.active_count, limiter.waiting_count)
+	assert 5 == limiter.request_count
+
+
+async def test_waiting_requests_are_served_in_order():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+	order = []
+
+	async def run_request(index):
+		async with limiter.request():
+			order.append(index)
+			await asyncio.sleep(0.001)
+
+	# Act:
+	await asyncio.gather(*[run_request(index) for index in range(5)])
+
+	# Assert:
+	assert [0, 1, 2, 3, 4] == order
+
+
+async def test_cancelled_waiting_request_does_not_leak_slot():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+	(tasks, release_event) = await _start_blocked_requests(limiter, 3)
+
+	# Act:
+	tasks[1].cancel()
+	await asyncio.gather(tasks[1], return_exceptions=True)
+
+	release_event.set()
+	await asyncio.gather(tasks[0], tasks[2])
+
+	# Assert:
+	assert tasks[1].cancelled()
+	assert (0, 0) == (limiter.active_count, limiter.waiting_count)
+
+
+async def test_failed_request_releases_slot():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=1)
+
+	# Act:
+	with pytest.raises(NodeException):
+		await _run_request(limiter, exception=NodeException('connection failed'))
+
+	# Assert:
+	assert 0 == limiter.active_count
+	assert 1 == limiter.request_count
+	assert 1 == limiter.limit
+
+# endregion
+
+
+# region additive increase
+
+async def test_limit_is_increased_by_one_after_limit_successful_requests():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=4)
+
+	# Act:
+	limits = []
+	for _ in range(5):
+		await _run_request(limiter)
+		limits.append(limiter.limit)
+
+	# Assert:
+	assert [4, 4, 4, 4, 5] == limits
+	assert 0 == limiter.throttle_count
+
+
+async def test_limit_is_not_increased_above_max_limit():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=4, max_limit=5)
+
+	# Act:
+	for _ in range(20):
+		await _run_request(limiter)
+
+	# Assert:
+	assert 5 == limiter.limit
+
+# endregion
+
+
+# region multiplicative decrease
+
+async def _assert_limit_is_decreased_by_throttled_request(status_code):
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8)
+
+	# Act:
+	await _run_throttled_request(limiter, status_code)
+
+	# Assert:
+	assert 4 == limiter.limit
+	assert 1 == limiter.throttle_count
+	assert [(f'HTTP {status_code}', 4)] == [(event.reason, event.limit) for event in limiter.throttle_events]
+
+
+async def test_limit_is_decreased_by_request_throttled_with_status_code_408():
+	await _assert_limit_is_decreased_by_throttled_request(408)
+
+
+async def test_limit_is_decreased_by_request_throttled_with_status_code_429():
+	await _assert_limit_is_decreased_by_throttled_request(429)
+
+
+async def test_limit_is_decreased_by_request_throttled_with_status_code_503():
+	await _assert_limit_is_decreased_by_throttled_request(503)
+
+
+async def test_limit_is_decreased_by_request_timeout():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8)
+
+	# Act:
+	with pytest.raises(asyncio.TimeoutError):
+		await _run_request(limiter, exception=asyncio.TimeoutError())
+
+	# Assert:
+	assert 4 == limiter.limit
+	assert 1 == limiter.throttle_count
+	assert [('timeout', 4)] == [(event.reason, event.limit) for event in limiter.throttle_events]
+
+
+async def test_limit_is_decreased_by_node_exception_caused_by_timeout():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8)
+
+	async def run_timed_out_request():
+		async with limiter.request():
+			try:
+				raise asyncio.TimeoutError()
+			except asyncio.TimeoutError as ex:
+				raise NodeException from ex
+
+	# Act:
+	with pytest.raises(NodeException):
+		await run_timed_out_request()
+
+	# Assert:
+	assert 4 == limiter.limit
+	assert 1 == limiter.throttle_count
+	assert [('timeout', 4)] == [(event.reason, event.limit) for event in limiter.throttle_events]
+
+
+async def test_limit_is_not_decreased_by_other_node_failures():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8)
+
+	# Act:
+	with pytest.raises(NodeException):
+		await _run_request(limiter, exception=NodeException('connection refused'))
+
+	# Assert:
+	assert 8 == limiter.limit
+	assert 0 == limiter.throttle_count
+
+
+async def test_limit_is_not_decreased_by_other_http_failures():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8)
+
+	# Act:
+	for status_code in (400, 404, 500):
+		await _run_throttled_request(limiter, status_code)
+
+	# Assert:
+	assert 8 == limiter.limit
+	assert 0 == limiter.throttle_count
+
+
+async def test_limit_is_not_decreased_below_min_limit():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8, min_limit=3)
+
+	# Act:
+	for _ in range(3):
+		await _run_throttled_request(limiter)
+
+	# Assert:
+	assert 3 == limiter.limit
+	assert [4, 3, 3] == [event.limit for event in limiter.throttle_events]
+
+
+async def test_limit_is_decreased_once_by_concurrent_throttled_requests():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8)
+
+	# Act: all requests were started before the first decrease
+	await asyncio.gather(*[_run_throttled_request(limiter) for _ in range(8)])
+
+	# Assert:
+	assert 4 == limiter.limit
+	assert 1 == limiter.throttle_count
+
+
+async def test_limit_is_decreased_by_slow_request():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=2, min_congestion_latency_seconds=0.02)
+
+	# Act:
+	await _run_request(limiter)
+	await _run_request(limiter, 0.05)
+
+	# Assert:
+	assert 4 == limiter.limit
+	assert ['latency'] == [event.reason for event in limiter.throttle_events]
+
+
+async def test_limit_is_not_decreased_by_request_faster_than_min_congestion_latency():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=2, min_congestion_latency_seconds=0.5)
+
+	# Act:
+	await _run_request(limiter)
+	await _run_request(limiter, 0.05)
+
+	# Assert:
+	assert 8 == limiter.limit
+	assert 0 == limiter.throttle_count
+
+
+async def test_decreased_limit_is_applied_to_waiting_requests():
+	# Arrange:
+	limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+	throttle_event = asyncio.Event()
+
+	async def run_throttled_request():
+		async with limiter.request():
+			await throttle_event.wait()
+			raise HttpException('throttled', 429)
+
+	throttled_task = asyncio.create_task(run_throttled_request())
+	(tasks, release_event) = await _start_blocked_requests(limiter, 4)
+
+	# Act:
+	throttle_event.set()
+	await asyncio.gather(throttled_task, return_exceptions=True)
+	limit_active_waiting_counts = (limiter.limit, limiter.active_count, limiter.waiting_count)
+
+	release_event.set()
+	await asyncio.gather(*tasks)
+
+	# Assert: freed slot is not handed over because limit was decreased
+	assert (1, 1, 3) == limit_active_waiting_counts
+	assert (0, 0) == (limiter.active_count, limiter.waiting_count)
+
+# endregion
+
+
+# region AdaptiveLimiterPool
+
+def test_can_create_empty_pool():
+	# Act:
+	limiter_pool = AdaptiveLimiterPool()
+
+	# Assert:
+	assert 0 == limiter_pool.size
+	assert [] == limiter_pool.throttle_events()
+
+
+def test_same_limiter_is_returned_for_same_endpoint():
+	# Arrange:
+	limiter_pool = AdaptiveLimiterPool()
+
+	# Act:
+	limiter1 = limiter_pool.limiter('http://localhost:3000')
+	limiter2 = limiter_pool.limiter('http://localhost:3000')
+	limiter3 = limiter_pool.limiter('http://localhost:3001')
+
+	# Assert:
+	assert limiter1 is limiter2
+	assert limiter1 is not limiter3
+	assert 2 == limiter_pool.size
+
+
+def test_limiters_are_configured_with_pool_settings():
+	# Arrange:
+	limiter_pool = AdaptiveLimiterPool(initial_limit=7, max_limit=9)
+
+	# Act:
+	limiter = limiter_pool.limiter('http://localhost:3000')
+
+	# Assert:
+	assert 7 == limiter.limit
+	assert 9 == limiter.max_limit
+
+
+async def test_pool_collects_throttle_events_from_all_limiters():
+	# Arrange:
+	limiter_pool = AdaptiveLimiterPool(initial_limit=8)
+
+	# Act:
+	await _run_throttled_request(limiter_pool.limiter('http://localhost:3001'), 429)
+	await _run_throttled_request(limiter_pool.limiter('http://localhost:3000'), 503)
+	await _run_throttled_request(limiter_pool.limiter('http://localhost:3001'), 408)
+
+	# Assert:
+	assert [
+		('http://localhost:3001', 'HTTP 429', 4),
+		('http://localhost:3000', 'HTTP 503', 4),
+		('http://localhost:3001', 'HTTP 408', 2)
+	] == [(endpoint, event.reason, event.limit) for (endpoint, event) in limiter_pool.throttle_events()]
+
+# endregion
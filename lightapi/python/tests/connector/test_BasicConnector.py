@@ -1,10 +1,16 @@
+# pylint: disable=too-many-lines
 import asyncio
 import json
 
 import pytest
 from aiohttp import web
 
+from symbollightapi.connector.AdaptiveLimiter import DEFAULT_ADAPTIVE_LIMITER_POOL, AdaptiveLimiterPool
 from symbollightapi.connector.BasicConnector import BasicConnector
+from symbollightapi.connector.HttpSessionPool import HttpSessionPool
+from symbollightapi.connector.NodeSelector import NodeSelector
+from symbollightapi.connector.RequestMetrics import RequestMetrics
+from symbollightapi.connector.ResponseCache import CachePolicy, ResponseCache
 from symbollightapi.model.Exceptions import HttpException, NodeException
 
 # region server fixture
@@ -12,9 +18,12 @@ from symbollightapi.model.Exceptions import HttpException, NodeException
 
 @pytest.fixture
 async def server(aiohttp_client):
-	class MockHttpServer:
+	class MockHttpServer:  # pylint: disable=too-many-instance-attributes
 		def __init__(self):
 			self.urls = []
+			self.client_ports = []
+			self.active_request_count = 0
+			self.max_active_request_count = 0
 			self.simulate_long_operation = False
 			self.simulate_content_error = False
 			self.simulate_corrupt_json_response = False
@@ -23,6 +32,13 @@ async def server(aiohttp_client):
 		async def node_info(self, request):
 			return await self._process(request, {'networkIdentifier': 152})
 
+		async def block(self, request):
+			height = request.match_info['height']
+			if '0' == height:
+				return await self._process(request, {'code': 'ResourceNotFound'}, 404)
+
+			return await self._process(request, {'meta': {'height': height}})
+
 		async def echo_post(self, request):
 			request_json = await request.json()
 			return await self._process(request, {'message': request_json['message'], 'action': 'post'})
@@ -61,6 +77,12 @@ async def server(aiohttp_client):
 
 		async def _process(self, request, response_body, status_code=200):
 			self.urls.append(str(request.url))
+			self.client_ports.append(request.transport.get_extra_info('peername')[1])
+
+			self.active_request_count += 1
+			self.max_active_request_count = max(self.max_active_request_count, self.active_request_count)
+			await asyncio.sleep(0.01)  # allow concurrent requests to overlap
+			self.active_request_count -= 1
 
 			if self.simulate_long_operation:
 				await asyncio.sleep(0.25)
@@ -80,6 +102,7 @@ async def server(aiohttp_client):
 	# create an app using the server
 	app = web.Application()
 	app.router.add_get('/node/info', mock_server.node_info)
+	app.router.add_get(r'/blocks/{height}', mock_server.block)
 	app.router.add_post('/echo/post', mock_server.echo_post)
 	app.router.add_put('/echo/put', mock_server.echo_put)
 	app.router.add_get(r'/status/{status_code}', mock_server.status_code)
@@ -90,6 +113,37 @@ async def server(aiohttp_client):
 	server.mock = mock_server
 	return server
 
+
+@pytest.fixture
+async def node_servers(aiohttp_client):
+	class MockNodeServer:
+		def __init__(self, index):
+			self.index = index
+			self.request_count = 0
+			self.delay_seconds = 0
+			self.status_code = 200
+
+		async def node_info(self, _request):
+			self.request_count += 1
+			await asyncio.sleep(self.delay_seconds)
+			response_json = {'index': self.index} if 200 == self.status_code else {'code': 'SomeCode'}
+			return web.json_response(response_json, status=self.status_code)
+
+	servers = []
+	for index in range(3):
+		mock_server = MockNodeServer(index)
+
+		app = web.Application()
+		app.router.add_get('/node/info', mock_server.node_info)
+		app.router.add_post('/node/info', mock_server.node_info)
+		app.router.add_put('/transactions', mock_server.node_info)
+		node_server = await aiohttp_client(app)
+
+		node_server.mock = mock_server
+		servers.append(node_server)
+
+	return servers
+
 # endregion
 
 # pylint: disable=invalid-name
@@ -405,3 +459,723 @@ async def test_can_handle_http_failure_404_as_explicit_non_error_put(server):  #
 	await _assert_can_handle_http_failure_404_as_explicit_non_error(server, 'put', 'status', request_payload={'status_code': 404})
 
 # endregion
+
+
+# region session pool
+
+async def _assert_can_issue_request_with_session_pool(server, action, url_path, expected_response_json, **kwargs):
+	# pylint: disable=redefined-outer-name
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		connector = BasicConnector(server.make_url(''))
+		connector.session_pool = session_pool
+
+		# Act:
+		response_json = await getattr(connector, action)(url_path, **kwargs)
+
+		# Assert:
+		assert [f'{server.make_url("")}/{url_path}'] == server.mock.urls
+		assert expected_response_json == response_json
+		assert 1 == session_pool.size
+
+
+async def test_can_issue_get_with_session_pool(server):  # pylint: disable=redefined-outer-name
+	await _assert_can_issue_request_with_session_pool(server, 'get', 'node/info', {'networkIdentifier': 152})
+
+
+async def test_can_issue_post_with_session_pool(server):  # pylint: disable=redefined-outer-name
+	await _assert_can_issue_request_with_session_pool(
+		server,
+		'post',
+		'echo/post',
+		{'message': 'hello world', 'action': 'post'},
+		request_payload={'message': 'hello world'})
+
+
+async def test_can_issue_put_with_session_pool(server):  # pylint: disable=redefined-outer-name
+	await _assert_can_issue_request_with_session_pool(
+		server,
+		'put',
+		'echo/put',
+		{'message': 'hello world', 'action': 'put'},
+		request_payload={'message': 'hello world'})
+
+
+async def test_requests_without_session_pool_use_new_connections(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector(server.make_url(''))
+
+	# Act:
+	for _ in range(3):
+		await connector.get('node/info')
+
+	# Assert:
+	assert 3 == len(server.mock.client_ports)
+	assert 3 == len(set(server.mock.client_ports))
+
+
+async def test_requests_with_session_pool_reuse_connections(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		connector = BasicConnector(server.make_url(''))
+		connector.session_pool = session_pool
+
+		# Act:
+		for _ in range(3):
+			await connector.get('node/info')
+
+	# Assert:
+	assert 3 == len(server.mock.client_ports)
+	assert 1 == len(set(server.mock.client_ports))
+
+
+async def test_requests_with_session_pool_reuse_connections_across_connectors(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		connectors = [BasicConnector(server.make_url('')) for _ in range(3)]
+		for connector in connectors:
+			connector.session_pool = session_pool
+
+		# Act:
+		for connector in connectors:
+			await connector.get('node/info')
+			await connector.post('echo/post', {'message': 'hello world'})
+
+		# Assert:
+		assert 1 == session_pool.size
+
+	assert 6 == len(server.mock.client_ports)
+	assert 1 == len(set(server.mock.client_ports))
+
+
+async def test_can_handle_timeout_with_session_pool(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.mock.simulate_long_operation = True
+
+	async with HttpSessionPool() as session_pool:
+		connector = BasicConnector(server.make_url(''))
+		connector.timeout_seconds = 0.25
+		connector.session_pool = session_pool
+
+		# Act + Assert:
+		with pytest.raises(NodeException) as ex_info:
+			await connector.get('node/info')
+
+		assert not isinstance(ex_info.value, HttpException)
+
+
+async def test_can_handle_stopped_node_with_session_pool():
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		connector = BasicConnector('http://localhost:1234')
+		connector.session_pool = session_pool
+
+		# Act + Assert:
+		with pytest.raises(NodeException) as ex_info:
+			await connector.get('node/info')
+
+		assert not isinstance(ex_info.value, HttpException)
+
+
+async def test_can_propagate_http_failure_results_with_session_pool(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		connector = BasicConnector(server.make_url(''))
+		connector.session_pool = session_pool
+
+		# Act + Assert:
+		with pytest.raises(NodeException, match='HTTP request failed with code 500\nSomeCode\nsome message') as ex_info:
+			await connector.get('status/500')
+
+		assert isinstance(ex_info.value, HttpException)
+		assert 500 == ex_info.value.http_status_code
+
+# endregion
+
+
+# region adaptive limiter
+
+async def test_connectors_share_default_limiter_for_same_endpoint(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connectors = [BasicConnector(server.make_url('')) for _ in range(2)]
+	other_connector = BasicConnector(server.make_url('other'))
+
+	# Act + Assert:
+	assert DEFAULT_ADAPTIVE_LIMITER_POOL == connectors[0].limiter_pool
+	assert connectors[0].limiter is connectors[1].limiter
+	assert connectors[0].limiter is not other_connector.limiter
+
+
+async def test_requests_are_limited_across_connectors(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	limiter_pool = AdaptiveLimiterPool(initial_limit=2, max_limit=2)
+	connectors = [BasicConnector(server.make_url('')) for _ in range(3)]
+	for connector in connectors:
+		connector.limiter_pool = limiter_pool
+
+	# Act:
+	await asyncio.gather(*[connector.get('node/info') for connector in connectors for _ in range(4)])
+
+	# Assert:
+	assert 12 == len(server.mock.urls)
+	assert 2 == server.mock.max_active_request_count
+	assert 12 == connectors[0].limiter.request_count
+	assert 1 == limiter_pool.size
+
+
+async def test_requests_are_not_limited_without_limiter_pool(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector(server.make_url(''))
+	connector.limiter_pool = None
+
+	# Act:
+	await asyncio.gather(*[connector.get('node/info') for _ in range(12)])
+
+	# Assert:
+	assert connector.limiter is None
+	assert 12 == len(server.mock.urls)
+	assert 12 == server.mock.max_active_request_count
+
+
+async def _assert_limit_is_decreased_by_http_status_code(server, status_code):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector(server.make_url(''))
+	connector.limiter_pool = AdaptiveLimiterPool(initial_limit=8)
+
+	# Act:
+	with pytest.raises(HttpException):
+		await connector.get(f'status/{status_code}')
+
+	# Assert:
+	assert 4 == connector.limiter.limit
+	assert 1 == connector.limiter.throttle_count
+	assert [f'HTTP {status_code}'] == [event.reason for event in connector.limiter.throttle_events]
+
+
+async def test_limit_is_decreased_by_http_status_code_408(server):  # pylint: disable=redefined-outer-name
+	await _assert_limit_is_decreased_by_http_status_code(server, 408)
+
+
+async def test_limit_is_decreased_by_http_status_code_429(server):  # pylint: disable=redefined-outer-name
+	await _assert_limit_is_decreased_by_http_status_code(server, 429)
+
+
+async def test_limit_is_decreased_by_http_status_code_503(server):  # pylint: disable=redefined-outer-name
+	await _assert_limit_is_decreased_by_http_status_code(server, 503)
+
+
+async def test_limit_is_decreased_by_timeout(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.mock.simulate_long_operation = True
+
+	connector = BasicConnector(server.make_url(''))
+	connector.timeout_seconds = 0.25
+	connector.limiter_pool = AdaptiveLimiterPool(initial_limit=8)
+
+	# Act:
+	with pytest.raises(NodeException):
+		await connector.get('node/info')
+
+	# Assert:
+	assert 4 == connector.limiter.limit
+	assert 1 == connector.limiter.throttle_count
+	assert ['timeout'] == [event.reason for event in connector.limiter.throttle_events]
+
+
+async def test_limit_is_not_decreased_by_other_http_failures(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector(server.make_url(''))
+	connector.limiter_pool = AdaptiveLimiterPool(initial_limit=8)
+
+	# Act:
+	for status_code in (400, 404, 500):
+		with pytest.raises(HttpException):
+			await connector.get(f'status/{status_code}')
+
+	# Assert:
+	assert 8 == connector.limiter.limit
+	assert 0 == connector.limiter.throttle_count
+
+# endregion
+
+
+# region node selector
+
+def _endpoint(node_server):
+	return str(node_server.make_url(''))
+
+
+def _create_connector_with_node_selector(node_servers, **kwargs):  # pylint: disable=redefined-outer-name
+	endpoints = [_endpoint(node_server) for node_server in node_servers]
+	connector = BasicConnector(endpoints[0])
+	connector.limiter_pool = None
+	connector.node_selector = NodeSelector(endpoints, **kwargs)
+	return connector
+
+
+async def test_can_issue_get_with_node_selector(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_node_selector(node_servers)
+
+	# Act:
+	response_json = await connector.get('node/info')
+
+	# Assert:
+	assert {'index': 0} == response_json
+	assert [1, 0, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 1 == connector.node_selector.statistics(_endpoint(node_servers[0])).request_count
+	assert 0 == connector.node_selector.hedge_count
+
+
+async def test_requests_are_sent_to_fastest_node(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_node_selector(node_servers)
+	for (node_server, latency_seconds) in zip(node_servers, [0.3, 0.1, 0.2]):
+		connector.node_selector.record_success(_endpoint(node_server), latency_seconds)
+
+	# Act:
+	response_jsons = [await connector.get('node/info') for _ in range(3)]
+
+	# Assert:
+	assert [{'index': 1}] * 3 == response_jsons
+	assert [0, 3, 0] == [node_server.mock.request_count for node_server in node_servers]
+
+
+async def test_request_is_hedged_to_next_best_node_when_slow(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.delay_seconds = 1
+	connector = _create_connector_with_node_selector(node_servers, initial_hedge_delay_seconds=0.05)
+
+	# Act:
+	start_time = asyncio.get_running_loop().time()
+	response_json = await connector.get('node/info')
+	elapsed_seconds = asyncio.get_running_loop().time() - start_time
+
+	# Assert: abandoned slow request contributes its elapsed time to node latency
+	assert {'index': 1} == response_json
+	assert 0.5 > elapsed_seconds
+	assert [1, 1, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 1 == connector.node_selector.hedge_count
+	assert 0.05 <= connector.node_selector.statistics(_endpoint(node_servers[0])).latency_seconds
+	assert [_endpoint(node_servers[2]), _endpoint(node_servers[1]), _endpoint(node_servers[0])] == connector.node_selector.ranked_endpoints()
+
+
+async def test_request_is_hedged_at_most_once(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.delay_seconds = 0.3
+	node_servers[1].mock.delay_seconds = 0.3
+	connector = _create_connector_with_node_selector(node_servers, initial_hedge_delay_seconds=0.05)
+
+	# Act:
+	response_json = await connector.get('node/info')
+
+	# Assert:
+	assert {'index': 0} == response_json
+	assert [1, 1, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 1 == connector.node_selector.hedge_count
+
+
+async def test_idempotent_post_is_hedged_to_next_best_node_when_slow(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.delay_seconds = 1
+	connector = _create_connector_with_node_selector(node_servers, initial_hedge_delay_seconds=0.05)
+
+	# Act:
+	response_json = await connector.post('node/info', {}, is_idempotent=True)
+
+	# Assert:
+	assert {'index': 1} == response_json
+	assert [1, 1, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 1 == connector.node_selector.hedge_count
+
+
+async def _assert_announce_is_sent_only_to_primary_node_when_slow(node_servers, announce):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.delay_seconds = 0.3
+	connector = _create_connector_with_node_selector(node_servers, initial_hedge_delay_seconds=0.05)
+	for (node_server, latency_seconds) in zip(node_servers, [0.3, 0.1, 0.2]):
+		connector.node_selector.record_success(_endpoint(node_server), latency_seconds)
+
+	# Act:
+	response_json = await announce(connector)
+
+	# Assert: announce is sent to primary node even though it is slower than the other nodes and is never duplicated
+	assert {'index': 0} == response_json
+	assert [1, 0, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 0 == connector.node_selector.hedge_count
+
+
+async def test_non_idempotent_post_is_sent_only_to_primary_node_when_slow(node_servers):  # pylint: disable=redefined-outer-name
+	await _assert_announce_is_sent_only_to_primary_node_when_slow(node_servers, lambda connector: connector.post('node/info', {}))
+
+
+async def test_put_is_sent_only_to_primary_node_when_slow(node_servers):  # pylint: disable=redefined-outer-name
+	await _assert_announce_is_sent_only_to_primary_node_when_slow(node_servers, lambda connector: connector.put('transactions', {}))
+
+
+async def _assert_announce_does_not_fail_over_on_node_failure(node_servers, announce):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.status_code = 503
+	connector = _create_connector_with_node_selector(node_servers)
+
+	# Act:
+	with pytest.raises(HttpException) as ex_info:
+		await announce(connector)
+
+	# Assert:
+	assert 503 == ex_info.value.http_status_code
+	assert [1, 0, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 0 == connector.node_selector.hedge_count
+
+
+async def test_non_idempotent_post_does_not_fail_over_on_node_failure(node_servers):  # pylint: disable=redefined-outer-name
+	await _assert_announce_does_not_fail_over_on_node_failure(node_servers, lambda connector: connector.post('node/info', {}))
+
+
+async def test_put_does_not_fail_over_on_node_failure(node_servers):  # pylint: disable=redefined-outer-name
+	await _assert_announce_does_not_fail_over_on_node_failure(node_servers, lambda connector: connector.put('transactions', {}))
+
+
+async def test_request_fails_over_to_next_best_node_on_node_failure(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.status_code = 503
+	connector = _create_connector_with_node_selector(node_servers)
+
+	# Act:
+	response_json = await connector.get('node/info')
+
+	# Assert:
+	assert {'index': 1} == response_json
+	assert [1, 1, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 1 == connector.node_selector.statistics(_endpoint(node_servers[0])).failure_count
+	assert 0 == connector.node_selector.hedge_count
+
+
+async def test_request_fails_over_to_next_best_node_on_connection_failure(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector('http://localhost:1234')
+	connector.node_selector = NodeSelector(['http://localhost:1234', _endpoint(node_servers[1])])
+
+	# Act:
+	response_json = await connector.get('node/info')
+
+	# Assert:
+	assert {'index': 1} == response_json
+	assert 1 == connector.node_selector.statistics('http://localhost:1234').failure_count
+
+
+async def test_request_does_not_fail_over_on_client_error(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.status_code = 404
+	connector = _create_connector_with_node_selector(node_servers)
+
+	# Act:
+	with pytest.raises(HttpException) as ex_info:
+		await connector.get('node/info')
+
+	# Assert:
+	assert 404 == ex_info.value.http_status_code
+	assert [1, 0, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert 0 == connector.node_selector.statistics(_endpoint(node_servers[0])).failure_count
+
+
+async def test_request_fails_when_all_nodes_fail(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	for (node_server, status_code) in zip(node_servers, [503, 500, 429]):
+		node_server.mock.status_code = status_code
+
+	connector = _create_connector_with_node_selector(node_servers)
+
+	# Act:
+	with pytest.raises(HttpException) as ex_info:
+		await connector.get('node/info')
+
+	# Assert:
+	assert 429 == ex_info.value.http_status_code
+	assert [1, 1, 1] == [node_server.mock.request_count for node_server in node_servers]
+
+
+async def test_unhealthy_node_is_taken_out_of_rotation(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.status_code = 503
+	connector = _create_connector_with_node_selector(node_servers[:2])
+
+	# Act:
+	response_jsons = [await connector.get('node/info') for _ in range(4)]
+
+	# Assert: node 0 is unmeasured (preferred) until its second failure
+	assert [{'index': 1}] * 4 == response_jsons
+	assert [2, 4, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert [_endpoint(node_servers[1])] == connector.node_selector.healthy_endpoints
+
+
+async def test_unhealthy_node_is_returned_to_rotation_after_answering_probe(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.status_code = 503
+	connector = _create_connector_with_node_selector(node_servers[:2], probe_interval_seconds=0)
+	for _ in range(2):
+		await connector.get('node/info')
+
+	node_servers[0].mock.status_code = 200
+
+	# Act:
+	response_json = await connector.get('node/info')
+	await asyncio.gather(*connector.node_selector.probe_tasks)
+
+	# Assert: probe is sent in addition to the request
+	assert {'index': 1} == response_json
+	assert [3, 3, 0] == [node_server.mock.request_count for node_server in node_servers]
+	assert [_endpoint(node_server) for node_server in node_servers[:2]] == connector.node_selector.healthy_endpoints
+
+# endregion
+
+
+# region metrics
+
+def _create_connector_with_metrics(server):  # pylint: disable=redefined-outer-name
+	connector = BasicConnector(server.make_url(''))
+	connector.metrics = RequestMetrics()
+	return connector
+
+
+async def test_metrics_are_disabled_by_default(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector(server.make_url(''))
+
+	# Act:
+	response_json = await connector.get('node/info')
+
+	# Assert:
+	assert connector.metrics is None
+	assert {'networkIdentifier': 152} == response_json
+
+
+async def test_metrics_record_successful_requests_per_endpoint_and_path_template(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_metrics(server)
+
+	# Act:
+	await connector.get('node/info')
+	await connector.get('node/info', 'networkIdentifier')
+	response_json = await connector.post('echo/post', {'message': 'hello world'})
+
+	# Assert:
+	assert {'message': 'hello world', 'action': 'post'} == response_json
+
+	statistics = connector.metrics.request_statistics(server.make_url(''), 'GET /node/info')
+	assert 2 == statistics.request_count
+	assert 2 * len(json.dumps({'networkIdentifier': 152})) == statistics.response_byte_count
+	assert 0.01 < statistics.latency_seconds
+	assert 0 < statistics.decode_seconds < statistics.latency_seconds
+	assert {} == statistics.error_counts
+
+	assert 1 == connector.metrics.request_statistics(server.make_url(''), 'POST /echo/post').request_count
+
+
+async def test_metrics_record_failed_requests_by_exception_type(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_metrics(server)
+
+	# Act:
+	for status_code in (404, 500):
+		with pytest.raises(HttpException):
+			await connector.get(f'status/{status_code}')
+
+	server.mock.simulate_corrupt_json_response = True
+	with pytest.raises(NodeException):
+		await connector.get('status/200')
+
+	# Assert:
+	statistics = connector.metrics.request_statistics(server.make_url(''), 'GET /status/{id}')
+	assert 3 == statistics.request_count
+	assert {'HttpException': 2, 'NodeException': 1} == statistics.error_counts
+
+
+async def test_metrics_record_requests_sent_with_session_pool(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_metrics(server)
+
+	# Act:
+	async with HttpSessionPool() as session_pool:
+		connector.session_pool = session_pool
+		await connector.get('node/info')
+
+	# Assert:
+	statistics = connector.metrics.request_statistics(server.make_url(''), 'GET /node/info')
+	assert 1 == statistics.request_count
+	assert 0 < statistics.response_byte_count
+
+
+async def test_metrics_record_requests_to_each_node_of_node_selector(node_servers):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	node_servers[0].mock.status_code = 503
+	connector = _create_connector_with_node_selector(node_servers[:2])
+	connector.metrics = RequestMetrics()
+
+	# Act:
+	response_json = await connector.get('node/info')
+
+	# Assert:
+	assert {'index': 1} == response_json
+	assert {'HttpException': 1} == connector.metrics.request_statistics(_endpoint(node_servers[0]), 'GET /node/info').error_counts
+	assert {} == connector.metrics.request_statistics(_endpoint(node_servers[1]), 'GET /node/info').error_counts
+
+# endregion
+
+
+# region response cache
+
+class FinalizedBasicConnector(BasicConnector):
+	def __init__(self, endpoint, finalized_chain_height):
+		super().__init__(endpoint)
+		self.finalized_chain_height_value = finalized_chain_height
+		self.finalized_chain_height_request_count = 0
+
+	async def finalized_chain_height(self):
+		self.finalized_chain_height_request_count += 1
+		return self.finalized_chain_height_value
+
+
+def _create_connector_with_response_cache(server, finalized_chain_height=100):  # pylint: disable=redefined-outer-name
+	connector = FinalizedBasicConnector(server.make_url(''), finalized_chain_height)
+	connector.response_cache = ResponseCache('symbol:testnet')
+	return connector
+
+
+BLOCK_CACHE_POLICY = CachePolicy.immutable(height_of=lambda response: response['meta']['height'])
+
+
+async def test_responses_are_not_cached_without_response_cache(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector(server.make_url(''))
+
+	# Act:
+	for _ in range(2):
+		await connector.get('node/info', cache_policy=CachePolicy.immutable())
+
+	# Assert:
+	assert connector.response_cache is None
+	assert 2 == len(server.mock.urls)
+
+
+async def test_responses_are_not_cached_without_cache_policy(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_response_cache(server)
+
+	# Act:
+	for _ in range(2):
+		await connector.get('node/info')
+
+	# Assert:
+	assert 2 == len(server.mock.urls)
+	assert 0 == len(connector.response_cache)
+
+
+async def test_immutable_responses_are_cached(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_response_cache(server)
+
+	# Act:
+	response_json1 = await connector.get('node/info', cache_policy=CachePolicy.immutable())
+	response_json1['networkIdentifier'] = 0
+	response_json2 = await connector.get('node/info', cache_policy=CachePolicy.immutable())
+	property_value = await connector.get('node/info', 'networkIdentifier', cache_policy=CachePolicy.immutable())
+
+	# Assert: responses are keyed by property name too
+	assert {'networkIdentifier': 152} == response_json2
+	assert 152 == property_value
+	assert 2 == len(server.mock.urls)
+	assert 1 == connector.response_cache.hit_count
+	assert 0 == connector.finalized_chain_height_request_count
+
+
+async def test_height_dependent_responses_are_not_cached_when_connector_has_no_finality(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = BasicConnector(server.make_url(''))
+	connector.response_cache = ResponseCache('symbol:testnet')
+
+	# Act:
+	for _ in range(2):
+		response_json = await connector.get('blocks/1', cache_policy=BLOCK_CACHE_POLICY)
+		assert {'meta': {'height': '1'}} == response_json
+
+	# Assert:
+	assert 2 == len(server.mock.urls)
+	assert 0 == connector.response_cache.finalized_chain_height
+	assert 0 == len(connector.response_cache)
+
+
+async def test_post_responses_are_cached_by_request_payload(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_response_cache(server)
+
+	# Act:
+	responses = [
+		await connector.post('echo/post', {'message': message}, cache_policy=CachePolicy.immutable())
+		for message in ('alpha', 'beta', 'alpha')
+	]
+
+	# Assert:
+	assert ['alpha', 'beta', 'alpha'] == [response['message'] for response in responses]
+	assert 2 == len(server.mock.urls)
+
+
+async def test_finalized_responses_are_cached(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_response_cache(server)
+
+	# Act:
+	for height in (99, 100, 99, 100):
+		response_json = await connector.get(f'blocks/{height}', cache_policy=BLOCK_CACHE_POLICY)
+		assert {'meta': {'height': str(height)}} == response_json
+
+	# Assert:
+	assert 2 == len(server.mock.urls)
+	assert 1 == connector.finalized_chain_height_request_count
+	assert 100 == connector.response_cache.finalized_chain_height
+
+
+async def test_unfinalized_responses_are_not_cached(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_response_cache(server)
+
+	# Act:
+	for _ in range(3):
+		await connector.get('blocks/101', cache_policy=BLOCK_CACHE_POLICY)
+
+	# Assert: finalized chain height is only refreshed once within refresh interval
+	assert 3 == len(server.mock.urls)
+	assert 3 == connector.response_cache.unfinalized_count
+	assert 1 == connector.finalized_chain_height_request_count
+
+
+async def test_responses_are_cached_once_finalized(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_response_cache(server)
+	connector.response_cache.finalized_height_refresh_seconds = 0
+	await connector.get('blocks/101', cache_policy=BLOCK_CACHE_POLICY)
+
+	# Act:
+	connector.finalized_chain_height_value = 101
+	for _ in range(2):
+		await connector.get('blocks/101', cache_policy=BLOCK_CACHE_POLICY)
+
+	# Assert:
+	assert 2 == len(server.mock.urls)
+	assert 2 == connector.finalized_chain_height_request_count
+
+
+async def test_responses_without_height_are_not_cached(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_response_cache(server)
+
+	# Act:
+	for _ in range(2):
+		response_json = await connector.get('blocks/0', not_found_as_error=False, cache_policy=BLOCK_CACHE_POLICY)
+
+	# Assert:
+	assert {'code': 'ResourceNotFound'} == response_json
+	assert 2 == len(server.mock.urls)
+	assert 0 == len(connector.response_cache)
+
+# endregion
@@ -0,0 +1,136 @@
+from symbollightapi.connector.BlockTimestampCache import BlockTimestampCache
+
+# pylint: disable=invalid-name
+
+
+# region constructor
+
+def test_can_create_cache_with_default_settings():
+	# Act:
+	with BlockTimestampCache('symbol:testnet') as cache:
+		# Assert:
+		assert 'symbol:testnet' == cache.network_name
+		assert 10000 == cache.max_size
+		assert 0 == cache.hit_count
+		assert 0 == cache.miss_count
+
+
+def test_can_create_cache_with_custom_settings():
+	# Act:
+	with BlockTimestampCache('nem:mainnet', 50) as cache:
+		# Assert:
+		assert 'nem:mainnet' == cache.network_name
+		assert 50 == cache.max_size
+		assert 0 == cache.hit_count
+		assert 0 == cache.miss_count
+
+# endregion
+
+
+# region in memory
+
+def test_timestamp_is_none_when_not_cached():
+	# Arrange:
+	with BlockTimestampCache('symbol:testnet') as cache:
+		# Act:
+		timestamp = cache.timestamp(100)
+
+		# Assert:
+		assert timestamp is None
+		assert 0 == cache.hit_count
+		assert 1 == cache.miss_count
+
+
+def test_can_add_and_lookup_finalized_timestamps():
+	# Arrange:
+	with BlockTimestampCache('symbol:testnet') as cache:
+		# Act:
+		count = cache.add_all([(100, 1000), (101, 1010)], 101)
+		timestamps = [cache.timestamp(height) for height in (100, 101)]
+
+		# Assert:
+		assert 2 == count
+		assert [1000, 1010] == timestamps
+		assert 2 == cache.hit_count
+		assert 0 == cache.miss_count
+
+
+def test_cannot_add_unfinalized_timestamps():
+	# Arrange:
+	with BlockTimestampCache('symbol:testnet') as cache:
+		# Act:
+		count = cache.add_all([(100, 1000), (101, 1010), (102, 1020)], 100)
+		timestamps = [cache.timestamp(height) for height in (100, 101, 102)]
+
+		# Assert:
+		assert 1 == count
+		assert [1000, None, None] == timestamps
+		assert 1 == cache.hit_count
+		assert 2 == cache.miss_count
+
+
+def test_least_recently_used_timestamps_are_evicted():
+	# Arrange:
+	with BlockTimestampCache('symbol:testnet', 3) as cache:
+		cache.add_all([(100, 1000), (101, 1010), (102, 1020)], 200)
+		cache.timestamp(100)
+
+		# Act:
+		cache.add_all([(103, 1030)], 200)
+		timestamps = [cache.timestamp(height) for height in (100, 101, 102, 103)]
+
+		# Assert:
+		assert [1000, None, 1020, 1030] == timestamps
+
+# endregion
+
+
+# region on disk
+
+def test_timestamps_are_persisted_across_instances(tmp_path):
+	# Arrange:
+	database_filepath = tmp_path / 'cache.db'
+	with BlockTimestampCache('symbol:testnet', database_filepath=database_filepath) as cache:
+		cache.add_all([(100, 1000), (101, 1010), (102, 1020)], 101)
+
+	# Act:
+	with BlockTimestampCache('symbol:testnet', database_filepath=database_filepath) as cache:
+		timestamps = [cache.timestamp(height) for height in (100, 101, 102)]
+
+		# Assert:
+		assert [1000, 1010, None] == timestamps
+		assert 2 == cache.hit_count
+		assert 1 == cache.miss_count
+
+
+def test_persisted_timestamps_are_isolated_by_network(tmp_path):
+	# Arrange:
+	database_filepath = tmp_path / 'cache.db'
+	with BlockTimestampCache('symbol:testnet', database_filepath=database_filepath) as cache:
+		cache.add_all([(100, 1000)], 101)
+
+	with BlockTimestampCache('nem:testnet', database_filepath=database_filepath) as cache:
+		cache.add_all([(101, 2010)], 101)
+
+	# Act:
+	with BlockTimestampCache('symbol:testnet', database_filepath=database_filepath) as cache:
+		timestamps = [cache.timestamp(height) for height in (100, 101)]
+
+		# Assert:
+		assert [1000, None] == timestamps
+
+
+def test_evicted_timestamps_are_read_from_disk(tmp_path):
+	# Arrange:
+	with BlockTimestampCache('symbol:testnet', 1, tmp_path / 'cache.db') as cache:
+		cache.add_all([(100, 1000), (101, 1010)], 200)
+
+		# Act:
+		timestamps = [cache.timestamp(height) for height in (100, 101)]
+
+		# Assert:
+		assert [1000, 1010] == timestamps
+		assert 2 == cache.hit_count
+		assert 0 == cache.miss_count
+
+# endregion
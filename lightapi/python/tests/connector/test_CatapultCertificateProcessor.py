@@ -2,6 +2,7 @@ import unittest
 
 from symbollightapi.bindings.openssl import lib
 from symbollightapi.connector.CatapultCertificateProcessor import CatapultCertificateProcessor
+from symbollightapi.connector.CertificateInfoCache import CertificateInfoCache
 
 from ..test.CertificateTestUtils import (
 	CertificateBuilder,
@@ -284,3 +285,31 @@ class CatapultCertificateProcessorTest(unittest.TestCase):
 		self.assert_self_signed_root_certificate_error('Alice', 'Alice', 0, False)
 
 	# endregion
+
+	# region certificate info cache
+
+	def test_can_verify_chains_with_shared_certificate_info_cache(self):
+		# Arrange:
+		certificate_store_context, certificates = create_certificate_store_context(['Alice', 'Bob'])
+		certificate_info_cache = CertificateInfoCache()
+		processors = [CatapultCertificateProcessor(certificate_info_cache) for _ in range(3)]
+
+		# Act:
+		verify_results = []
+		for processor in processors:
+			set_active_certificate(certificate_store_context, certificates, 0)
+			lib.X509_STORE_CTX_set_error(certificate_store_context, lib.X509_V_ERR_SELF_SIGNED_CERT_IN_CHAIN)
+			verify_results.append(processor.verify(False, certificate_store_context))
+			verify_results += self._preverify_multiple(processor, certificate_store_context, certificates, 2)
+
+		# Assert:
+		self.assertEqual([True] * 9, verify_results)
+		for processor in processors:
+			self.assertEqual(2, processor.size)
+			self.assertEqual('CN=Alice,O=NEM,C=JP', processor.certificate(0).subject)
+			self.assertEqual('CN=Bob,O=NEM,C=JP', processor.certificate(1).subject)
+
+		self.assertEqual(3, certificate_info_cache.miss_count)  # verify Alice, parse Alice, parse Bob
+		self.assertEqual(6, certificate_info_cache.hit_count)
+
+	# endregion
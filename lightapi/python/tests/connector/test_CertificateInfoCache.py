@@ -0,0 +1,103 @@
+import unittest
+
+from symbollightapi.connector.CertificateInfoCache import CertificateInfoCache
+from symbollightapi.connector.CertificateUtils import try_parse_certificate
+
+from ..test.CertificateTestUtils import CertificateBuilder, generate_random_certificate_private_key
+
+
+def create_certificate(common_name, issuer_common_name=None):
+	builder = CertificateBuilder()
+	builder.set_subject('JP', 'NEM', common_name)
+	builder.set_issuer('JP', 'NEM', issuer_common_name or common_name)
+	builder.set_public_key(generate_random_certificate_private_key())
+	return builder.build_and_sign()
+
+
+class CertificateInfoCacheTest(unittest.TestCase):
+	def test_can_create_cache(self):
+		# Act:
+		cache = CertificateInfoCache()
+
+		# Assert:
+		self.assertEqual(10000, cache.max_size)
+		self.assertEqual(0, len(cache))
+		self.assertEqual(0, cache.hit_count)
+		self.assertEqual(0, cache.miss_count)
+
+	def test_try_parse_certificate_parses_certificate_on_miss(self):
+		# Arrange:
+		cache = CertificateInfoCache()
+		certificate = create_certificate('Alice')
+
+		# Act:
+		certificate_info = cache.try_parse_certificate(certificate)
+
+		# Assert:
+		self.assertEqual(try_parse_certificate(certificate), certificate_info)
+		self.assertEqual(1, len(cache))
+		self.assertEqual(0, cache.hit_count)
+		self.assertEqual(1, cache.miss_count)
+
+	def test_try_parse_certificate_returns_cached_info_on_hit(self):
+		# Arrange:
+		cache = CertificateInfoCache()
+		certificate = create_certificate('Alice')
+		certificate_info = cache.try_parse_certificate(certificate)
+
+		# Act:
+		cached_certificate_info = cache.try_parse_certificate(certificate)
+
+		# Assert:
+		self.assertIs(certificate_info, cached_certificate_info)
+		self.assertEqual(1, len(cache))
+		self.assertEqual(1, cache.hit_count)
+		self.assertEqual(1, cache.miss_count)
+
+	def test_verify_self_signed_caches_results(self):
+		# Arrange:
+		cache = CertificateInfoCache()
+		self_signed_certificate = create_certificate('Alice')
+		other_certificate = create_certificate('Bob', 'Charlie')
+
+		# Act:
+		results = [cache.verify_self_signed(certificate) for certificate in [self_signed_certificate, other_certificate] * 2]
+
+		# Assert:
+		self.assertEqual([True, False, True, False], results)
+		self.assertEqual(2, len(cache))
+		self.assertEqual(2, cache.hit_count)
+		self.assertEqual(2, cache.miss_count)
+
+	def test_parse_and_verify_results_are_cached_independently(self):
+		# Arrange:
+		cache = CertificateInfoCache()
+		certificate = create_certificate('Alice')
+
+		# Act:
+		certificate_info = cache.try_parse_certificate(certificate)
+		is_verified = cache.verify_self_signed(certificate)
+
+		# Assert:
+		self.assertEqual('CN=Alice,O=NEM,C=JP', certificate_info.subject)
+		self.assertTrue(is_verified)
+		self.assertEqual(2, len(cache))
+		self.assertEqual(2, cache.miss_count)
+
+	def test_least_recently_used_results_are_evicted(self):
+		# Arrange:
+		cache = CertificateInfoCache(max_size=2)
+		certificates = [create_certificate(name) for name in ('Alice', 'Bob', 'Charlie')]
+		cache.try_parse_certificate(certificates[0])
+		cache.try_parse_certificate(certificates[1])
+		cache.try_parse_certificate(certificates[0])
+
+		# Act:
+		cache.try_parse_certificate(certificates[2])
+		cache.try_parse_certificate(certificates[0])
+		cache.try_parse_certificate(certificates[1])
+
+		# Assert: Bob was evicted when Charlie was added
+		self.assertEqual(2, len(cache))
+		self.assertEqual(2, cache.hit_count)
+		self.assertEqual(4, cache.miss_count)
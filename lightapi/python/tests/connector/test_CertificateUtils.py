@@ -4,7 +4,7 @@ from symbolchain.CryptoTypes import PrivateKey
 from symbolchain.symbol.KeyPair import KeyPair
 
 from symbollightapi.bindings.openssl import ffi, lib
-from symbollightapi.connector.CertificateUtils import try_parse_certificate, verify_self_signed
+from symbollightapi.connector.CertificateUtils import calculate_certificate_digest, try_parse_certificate, verify_self_signed
 
 from ..test.CertificateTestUtils import CertificateBuilder, generate_certificate_private_key, generate_random_certificate_private_key
 
@@ -106,6 +106,42 @@ class CertificateUtilsTest(unittest.TestCase):
 
 	# endregion
 
+	# region calculate_certificate_digest
+
+	@staticmethod
+	def _create_signed_certificate(common_name, certificate_private_key):
+		builder = CertificateBuilder()
+		builder.set_subject('JP', 'NEM', common_name)
+		builder.set_issuer('JP', 'NEM', common_name)
+		builder.set_public_key(certificate_private_key)
+		return builder.build_and_sign()
+
+	def test_calculate_certificate_digest_returns_sha256_digest(self):
+		# Arrange:
+		certificate = self._create_signed_certificate('Alice', generate_random_certificate_private_key())
+
+		# Act:
+		digest = calculate_certificate_digest(certificate)
+
+		# Assert:
+		self.assertEqual(32, len(digest))
+		self.assertEqual(digest, calculate_certificate_digest(certificate))
+
+	def test_calculate_certificate_digest_returns_different_digests_for_different_certificates(self):
+		# Arrange:
+		certificate_private_key = generate_random_certificate_private_key()
+		certificate1 = self._create_signed_certificate('Alice', certificate_private_key)
+		certificate2 = self._create_signed_certificate('Bob', certificate_private_key)
+
+		# Act:
+		digest1 = calculate_certificate_digest(certificate1)
+		digest2 = calculate_certificate_digest(certificate2)
+
+		# Assert:
+		self.assertNotEqual(digest1, digest2)
+
+	# endregion
+
 	# region verify_self_signed
 
 	def test_verify_self_signed_returns_true_for_properly_signed_certificate(self):
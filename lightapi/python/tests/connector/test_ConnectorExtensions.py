@@ -1,12 +1,18 @@
 import asyncio
 
+import pytest
 from symbolchain.CryptoTypes import Hash256
 
+from symbollightapi.connector.BlockTimestampCache import BlockTimestampCache
 from symbollightapi.connector.ConnectorExtensions import (
+	FinalizedTransactionCache,
 	filter_finalized_transactions,
 	get_incoming_transactions_from,
-	query_block_timestamps
+	query_block_timestamps,
+	resolve_confirmed_transactions
 )
+from symbollightapi.connector.RequestMetrics import RequestMetrics
+from symbollightapi.model.Exceptions import NodeException
 
 from ..test.LightApiTestUtils import HASHES
 
@@ -18,6 +24,8 @@ class MockConnector:
 		self._incoming_transactions_map = incoming_transactions_map
 		self._finalized_chain_height = finalized_chain_height
 		self._status_start_height = status_start_height
+		self.block_headers_heights = []
+		self.metrics = None
 
 	@staticmethod
 	def extract_transaction_id(transaction):
@@ -32,6 +40,7 @@ class MockConnector:
 		return self._finalized_chain_height
 
 	async def block_headers(self, height):
+		self.block_headers_heights.append(height)
 		await self._pause()
 		return {'_timestamp': str(height * height)}
 
@@ -47,6 +56,58 @@ class MockConnector:
 	async def _pause():
 		await asyncio.sleep(0.01)
 
+
+class MockRangeConnector:
+	def __init__(self, heights, page_size=2, error_height=None):
+		self._heights = sorted(heights, reverse=True)
+		self._page_size = page_size
+		self._error_height = error_height
+		self.requests = []
+		self.metrics = None
+
+	@staticmethod
+	def extract_transaction_id(transaction):
+		return transaction['meta']['id']
+
+	async def incoming_transactions(self, address, start_id=None):
+		return await self.incoming_transactions_in_range(address, 1, 1000000, start_id)
+
+	async def incoming_transactions_in_range(self, address, start_height, end_height, start_id=None):
+		self.requests.append((address, start_height, end_height, start_id))
+		await asyncio.sleep(0.01)
+
+		heights = [height for height in self._heights if start_height <= height < end_height and (not start_id or height < start_id)]
+		if self._error_height and self._error_height in heights[:self._page_size]:
+			raise NodeException('simulated failure')
+
+		return [{'meta': {'height': height, 'id': height}} for height in heights[:self._page_size]]
+
+
+class MockStatusConnector:
+	def __init__(self, transaction_hash_to_height, finalized_chain_height=None):
+		self._transaction_hash_to_height = transaction_hash_to_height
+		self._finalized_chain_height = finalized_chain_height
+		self.requests = []
+		self.active_request_count = 0
+		self.max_active_request_count = 0
+		self.metrics = None
+
+	async def finalized_chain_height(self):
+		return self._finalized_chain_height
+
+	async def filter_confirmed_transactions(self, transaction_hashes):
+		self.requests.append(transaction_hashes)
+		self.active_request_count += 1
+		self.max_active_request_count = max(self.max_active_request_count, self.active_request_count)
+		await asyncio.sleep(0.01)
+		self.active_request_count -= 1
+
+		return [
+			(transaction_hash, self._transaction_hash_to_height[transaction_hash])
+			for transaction_hash in transaction_hashes
+			if transaction_hash in self._transaction_hash_to_height
+		]
+
 # endregion
 
 
@@ -162,6 +223,204 @@ async def test_get_incoming_transactions_from_supports_string_heights_and_ids():
 # endregion
 
 
+# region get_incoming_transactions_from (prefetch)
+
+async def test_get_incoming_transactions_from_with_prefetch_can_return_none():
+	# Arrange:
+	connector = MockConnector({
+		('foo_address', None): []
+	})
+
+	# Act:
+	transactions = [
+		transaction async for transaction in get_incoming_transactions_from(connector, 'foo_address', prefetch_page_count=2)
+	]
+
+	# Assert:
+	assert [] == transactions
+
+
+async def test_get_incoming_transactions_from_with_prefetch_can_complete_in_single_remote_call():
+	await _assert_get_incoming_transactions_from_can_complete_in_single_remote_call(
+		[176, 130, 125, 101, 100, 99, 75],
+		prefetch_page_count=2)
+
+
+async def test_get_incoming_transactions_from_with_prefetch_can_complete_in_single_remote_call_with_start_and_end_height_filter():
+	await _assert_get_incoming_transactions_from_can_complete_in_single_remote_call(
+		[125, 101, 100],
+		start_height=100,
+		end_height=130,
+		prefetch_page_count=2)
+
+
+async def test_get_incoming_transactions_from_with_prefetch_can_complete_in_multiple_remote_calls():
+	await _assert_get_incoming_transactions_from_can_complete_in_multiple_remote_calls(
+		[176, 130, 125, 101, 100, 99, 75],
+		prefetch_page_count=2)
+
+
+async def test_get_incoming_transactions_from_with_prefetch_can_complete_in_multiple_remote_calls_with_start_height_filter():
+	await _assert_get_incoming_transactions_from_can_complete_in_multiple_remote_calls(
+		[176, 130, 125, 101, 100],
+		start_height=100,
+		prefetch_page_count=1)
+
+
+async def test_get_incoming_transactions_from_with_prefetch_can_complete_in_multiple_remote_calls_with_end_height_filter():
+	await _assert_get_incoming_transactions_from_can_complete_in_multiple_remote_calls(
+		[100, 99, 75],
+		end_height=101,
+		prefetch_page_count=3)
+
+
+async def test_get_incoming_transactions_from_with_prefetch_stops_fetching_pages_below_start_height():
+	# Arrange:
+	connector = MockRangeConnector([90, 80, 70, 60, 50, 40, 30, 20, 10])
+
+	# Act:
+	transactions = [
+		transaction async for transaction in get_incoming_transactions_from(connector, 'foo_address', 65, prefetch_page_count=4)
+	]
+
+	# Assert: fetching stops after first page containing a height below start height
+	assert [90, 80, 70] == [transaction['meta']['height'] for transaction in transactions]
+	assert [None, 80] == [request[3] for request in connector.requests]
+
+
+async def test_get_incoming_transactions_from_with_prefetch_propagates_errors():
+	# Arrange:
+	connector = MockRangeConnector([90, 80, 70, 60, 50], error_height=50)
+
+	# Act:
+	heights = []
+	with pytest.raises(NodeException, match='simulated failure'):
+		async for transaction in get_incoming_transactions_from(connector, 'foo_address', prefetch_page_count=2):
+			heights.append(transaction['meta']['height'])
+
+	# Assert: all transactions before failure are returned
+	assert [90, 80, 70, 60] == heights
+
+
+async def test_get_incoming_transactions_from_with_prefetch_stops_producer_when_closed():
+	# Arrange:
+	connector = MockRangeConnector([90, 80, 70, 60, 50], page_size=1)
+	transaction_iterator = get_incoming_transactions_from(connector, 'foo_address', prefetch_page_count=2)
+	await anext(transaction_iterator)
+
+	# Act:
+	await transaction_iterator.aclose()
+
+	# Assert: producer task has finished
+	assert {asyncio.current_task()} == asyncio.all_tasks()
+
+# endregion
+
+
+# region get_incoming_transactions_from (sharded)
+
+async def _assert_get_incoming_transactions_from_sharded(start_height, end_height, shard_count, expected_shard_ranges, **kwargs):
+	# Arrange:
+	heights = [199, 180, 180, 150, 120, 101, 100, 99, 75, 50, 25, 1]
+	connector = MockRangeConnector(heights)
+
+	# Act:
+	transactions = [
+		transaction async for transaction in get_incoming_transactions_from(
+			connector,
+			'foo_address',
+			start_height,
+			end_height,
+			shard_count=shard_count,
+			**kwargs)
+	]
+
+	# Assert: transactions are merged in descending height order
+	expected_heights = [height for height in heights if start_height <= height < end_height]
+	assert sorted(set(expected_heights), reverse=True) == [transaction['meta']['height'] for transaction in transactions]
+
+	shard_ranges = sorted(set((request[1], request[2]) for request in connector.requests), reverse=True)
+	assert expected_shard_ranges == shard_ranges
+
+
+async def test_get_incoming_transactions_from_sharded_can_split_range_evenly():
+	await _assert_get_incoming_transactions_from_sharded(1, 201, 4, [(151, 201), (101, 151), (51, 101), (1, 51)])
+
+
+async def test_get_incoming_transactions_from_sharded_can_split_range_unevenly():
+	await _assert_get_incoming_transactions_from_sharded(100, 200, 3, [(168, 200), (134, 168), (100, 134)])
+
+
+async def test_get_incoming_transactions_from_sharded_can_split_range_smaller_than_shard_count():
+	await _assert_get_incoming_transactions_from_sharded(99, 102, 5, [(101, 102), (100, 101), (99, 100)])
+
+
+async def test_get_incoming_transactions_from_sharded_can_prefetch_multiple_pages_per_shard():
+	await _assert_get_incoming_transactions_from_sharded(1, 201, 2, [(101, 201), (1, 101)], prefetch_page_count=3)
+
+
+async def test_get_incoming_transactions_from_sharded_pages_shards_concurrently():
+	# Arrange:
+	connector = MockRangeConnector([199, 150, 101, 100, 50, 1], page_size=1)
+
+	# Act:
+	transaction_iterator = get_incoming_transactions_from(connector, 'foo_address', 1, 201, shard_count=2)
+	first_transaction = await anext(transaction_iterator)
+	await asyncio.sleep(0.05)
+	await transaction_iterator.aclose()
+
+	# Assert: lower shard was requested before higher shard was exhausted
+	assert 199 == first_transaction['meta']['height']
+	assert any(1 == request[1] for request in connector.requests)
+
+
+async def test_get_incoming_transactions_from_sharded_stops_producers_when_closed():
+	# Arrange:
+	connector = MockRangeConnector([199, 150, 101, 100, 50, 1], page_size=1)
+	transaction_iterator = get_incoming_transactions_from(connector, 'foo_address', 1, 201, shard_count=2)
+	await anext(transaction_iterator)
+
+	# Act:
+	await transaction_iterator.aclose()
+
+	# Assert: all producer tasks have finished
+	assert {asyncio.current_task()} == asyncio.all_tasks()
+
+
+async def test_get_incoming_transactions_from_sharded_falls_back_when_range_is_unbounded():
+	# Arrange:
+	connector = MockRangeConnector([90, 80, 70])
+
+	# Act:
+	transactions = [
+		transaction async for transaction in get_incoming_transactions_from(connector, 'foo_address', 75, shard_count=4)
+	]
+
+	# Assert: single unsharded search was performed
+	assert [90, 80] == [transaction['meta']['height'] for transaction in transactions]
+	assert all((1, 1000000) == (request[1], request[2]) for request in connector.requests)
+
+
+async def test_get_incoming_transactions_from_sharded_falls_back_when_connector_does_not_support_height_filter():
+	await _assert_get_incoming_transactions_from_can_complete_in_multiple_remote_calls(
+		[125, 101, 100],
+		start_height=100,
+		end_height=130,
+		shard_count=4)
+
+
+async def test_get_incoming_transactions_from_sharded_propagates_errors():
+	# Arrange:
+	connector = MockRangeConnector([199, 150, 101, 100, 50, 1], error_height=50)
+
+	# Act + Assert:
+	with pytest.raises(NodeException, match='simulated failure'):
+		async for _ in get_incoming_transactions_from(connector, 'foo_address', 1, 201, shard_count=2):
+			pass
+
+# endregion
+
+
 # region filter_finalized_transactions
 
 async def test_filter_finalized_transactions_can_return_none():
@@ -204,6 +463,177 @@ async def test_filter_finalized_transactions_can_return_all():
 # endregion
 
 
+# region FinalizedTransactionCache
+
+def test_finalized_transaction_cache_is_initially_empty():
+	# Act:
+	cache = FinalizedTransactionCache()
+
+	# Assert:
+	assert 0 == len(cache)
+	assert Hash256(HASHES[0]) not in cache
+	assert cache.height(Hash256(HASHES[0])) is None
+
+
+def test_finalized_transaction_cache_can_add_finalized_transactions():
+	# Arrange:
+	cache = FinalizedTransactionCache()
+
+	# Act:
+	results = [
+		cache.add(Hash256(HASHES[0]), 999, 1000),
+		cache.add(Hash256(HASHES[1]), 1000, 1000)
+	]
+
+	# Assert:
+	assert [True, True] == results
+	assert 2 == len(cache)
+	assert Hash256(HASHES[0]) in cache
+	assert 999 == cache.height(Hash256(HASHES[0]))
+	assert 1000 == cache.height(Hash256(HASHES[1]))
+
+
+def test_finalized_transaction_cache_cannot_add_unfinalized_transactions():
+	# Arrange:
+	cache = FinalizedTransactionCache()
+
+	# Act:
+	result = cache.add(Hash256(HASHES[0]), 1001, 1000)
+
+	# Assert:
+	assert not result
+	assert 0 == len(cache)
+	assert Hash256(HASHES[0]) not in cache
+
+# endregion
+
+
+# region resolve_confirmed_transactions
+
+def _make_hash_to_height_map(count):
+	return {f'hash_{i}': 100 + i for i in range(count) if i % 3}
+
+
+async def test_resolve_confirmed_transactions_can_resolve_none():
+	# Arrange:
+	connector = MockStatusConnector({})
+
+	# Act:
+	transaction_hash_height_pairs = await resolve_confirmed_transactions(connector, [])
+
+	# Assert:
+	assert [] == transaction_hash_height_pairs
+	assert [] == connector.requests
+
+
+async def test_resolve_confirmed_transactions_can_resolve_single_chunk():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10))
+
+	# Act:
+	transaction_hash_height_pairs = await resolve_confirmed_transactions(connector, [f'hash_{i}' for i in range(10)])
+
+	# Assert:
+	assert [(f'hash_{i}', 100 + i) for i in (1, 2, 4, 5, 7, 8)] == transaction_hash_height_pairs
+	assert [[f'hash_{i}' for i in range(10)]] == connector.requests
+
+
+async def test_resolve_confirmed_transactions_can_resolve_multiple_chunks():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10))
+
+	# Act:
+	transaction_hash_height_pairs = await resolve_confirmed_transactions(connector, [f'hash_{i}' for i in range(10)], chunk_size=4)
+
+	# Assert: results are returned in chunk order
+	assert [(f'hash_{i}', 100 + i) for i in (1, 2, 4, 5, 7, 8)] == transaction_hash_height_pairs
+	assert [
+		[f'hash_{i}' for i in range(0, 4)],
+		[f'hash_{i}' for i in range(4, 8)],
+		[f'hash_{i}' for i in range(8, 10)]
+	] == connector.requests
+
+
+async def test_resolve_confirmed_transactions_removes_duplicates():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10))
+
+	# Act:
+	transaction_hash_height_pairs = await resolve_confirmed_transactions(
+		connector,
+		[f'hash_{i}' for i in (1, 3, 1, 2, 3, 3)],
+		chunk_size=2)
+
+	# Assert:
+	assert [('hash_1', 101), ('hash_2', 102)] == transaction_hash_height_pairs
+	assert [['hash_1', 'hash_3'], ['hash_2']] == connector.requests
+
+
+async def test_resolve_confirmed_transactions_limits_concurrent_chunks():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(100))
+
+	# Act:
+	await resolve_confirmed_transactions(connector, [f'hash_{i}' for i in range(100)], chunk_size=5, max_concurrent_chunk_count=3)
+
+	# Assert:
+	assert 20 == len(connector.requests)
+	assert 3 == connector.max_active_request_count
+
+
+async def test_resolve_confirmed_transactions_does_not_query_cached_transactions():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10))
+	cache = FinalizedTransactionCache()
+	cache.add('hash_2', 50, 100)
+	cache.add('hash_3', 60, 100)
+
+	# Act:
+	transaction_hash_height_pairs = await resolve_confirmed_transactions(
+		connector,
+		[f'hash_{i}' for i in range(5)],
+		finalized_cache=cache)
+
+	# Assert: cached results are returned first
+	assert [('hash_2', 50), ('hash_3', 60), ('hash_1', 101), ('hash_4', 104)] == transaction_hash_height_pairs
+	assert [['hash_0', 'hash_1', 'hash_4']] == connector.requests
+
+# endregion
+
+
+# region filter_finalized_transactions (cache)
+
+async def test_filter_finalized_transactions_adds_only_finalized_transactions_to_cache():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10), finalized_chain_height=104)
+	cache = FinalizedTransactionCache()
+
+	# Act:
+	transaction_hash_height_pairs = await filter_finalized_transactions(connector, [f'hash_{i}' for i in range(10)], cache)
+
+	# Assert:
+	assert [('hash_1', 101), ('hash_2', 102), ('hash_4', 104)] == transaction_hash_height_pairs
+	assert 3 == len(cache)
+	assert all(f'hash_{i}' in cache for i in (1, 2, 4))
+
+
+async def test_filter_finalized_transactions_only_queries_pending_transactions_when_repeated():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10), finalized_chain_height=104)
+	cache = FinalizedTransactionCache()
+	await filter_finalized_transactions(connector, [f'hash_{i}' for i in range(10)], cache)
+
+	# Act:
+	transaction_hash_height_pairs = await filter_finalized_transactions(connector, [f'hash_{i}' for i in range(10)], cache)
+
+	# Assert:
+	assert [('hash_1', 101), ('hash_2', 102), ('hash_4', 104)] == transaction_hash_height_pairs
+	assert 2 == len(connector.requests)
+	assert [f'hash_{i}' for i in (0, 3, 5, 6, 7, 8, 9)] == connector.requests[1]
+
+# endregion
+
+
 # region query_block_timestamps
 
 async def test_query_block_timestamps_can_query_none():
@@ -233,4 +663,167 @@ async def test_query_block_timestamps_can_query_multiple():
 		(2, 4)
 	] == height_timestamp_pairs
 
+
+async def test_query_block_timestamps_can_query_multiple_with_cache():
+	# Arrange:
+	connector = MockConnector(finalized_chain_height=4)
+
+	with BlockTimestampCache('foo') as cache:
+		# Act:
+		height_timestamp_pairs = await query_block_timestamps(connector, [4, 5, 1, 3, 2], timestamp_cache=cache)
+
+		# Assert:
+		assert [(4, 16), (5, 25), (1, 1), (3, 9), (2, 4)] == height_timestamp_pairs
+		assert [4, 5, 1, 3, 2] == connector.block_headers_heights
+		assert 0 == cache.hit_count
+		assert 5 == cache.miss_count
+
+
+async def test_query_block_timestamps_only_queries_uncached_heights():
+	# Arrange:
+	connector = MockConnector(finalized_chain_height=4)
+
+	with BlockTimestampCache('foo') as cache:
+		await query_block_timestamps(connector, [4, 5, 1], timestamp_cache=cache)
+		connector.block_headers_heights = []
+
+		# Act:
+		height_timestamp_pairs = await query_block_timestamps(connector, [4, 5, 1, 3, 2], timestamp_cache=cache)
+
+		# Assert: height 5 is above finalized height, so it is not cached
+		assert [(4, 16), (5, 25), (1, 1), (3, 9), (2, 4)] == height_timestamp_pairs
+		assert [5, 3, 2] == connector.block_headers_heights
+		assert 2 == cache.hit_count
+		assert 6 == cache.miss_count
+
+
+async def test_query_block_timestamps_does_not_query_finalized_height_when_all_cached():
+	# Arrange:
+	connector = MockConnector(finalized_chain_height=10)
+
+	with BlockTimestampCache('foo') as cache:
+		cache.add_all([(1, 1), (2, 4)], 10)
+
+		# Act:
+		height_timestamp_pairs = await query_block_timestamps(connector, [2, 1], timestamp_cache=cache)
+
+		# Assert:
+		assert [(2, 4), (1, 1)] == height_timestamp_pairs
+		assert [] == connector.block_headers_heights
+		assert 2 == cache.hit_count
+
+# endregion
+
+
+# region metrics
+
+def _attach_metrics(connector):
+	metrics = RequestMetrics()
+	connector.metrics = metrics
+	return metrics
+
+
+def _assert_operation_statistics(metrics, name, expected_call_count, expected_fan_out):
+	statistics = metrics.operation_statistics(name)
+	assert expected_call_count == statistics.call_count
+	assert expected_fan_out == statistics.fan_out
+	assert 0.01 < statistics.wall_seconds
+
+
+async def test_get_incoming_transactions_from_records_operation():
+	# Arrange:
+	connector = MockRangeConnector([199, 150, 101, 50])
+	metrics = _attach_metrics(connector)
+
+	# Act:
+	transactions = [transaction async for transaction in get_incoming_transactions_from(connector, 'foo_address', 1, 201)]
+
+	# Assert:
+	assert 4 == len(transactions)
+	_assert_operation_statistics(metrics, 'get_incoming_transactions_from', 1, 1)
+
+
+async def test_get_incoming_transactions_from_sharded_records_operation_with_shard_fan_out():
+	# Arrange:
+	connector = MockRangeConnector([199, 150, 101, 50])
+	metrics = _attach_metrics(connector)
+
+	# Act:
+	transactions = [
+		transaction async for transaction in get_incoming_transactions_from(connector, 'foo_address', 1, 201, shard_count=4)
+	]
+
+	# Assert:
+	assert 4 == len(transactions)
+	_assert_operation_statistics(metrics, 'get_incoming_transactions_from', 1, 4)
+
+
+async def test_get_incoming_transactions_from_records_operation_when_closed_early():
+	# Arrange:
+	connector = MockRangeConnector([199, 150, 101, 50])
+	metrics = _attach_metrics(connector)
+
+	# Act:
+	transactions = get_incoming_transactions_from(connector, 'foo_address', 1, 201, prefetch_page_count=2)
+	first_transaction = await anext(transactions)
+	await transactions.aclose()
+
+	# Assert:
+	assert 199 == first_transaction['meta']['height']
+	_assert_operation_statistics(metrics, 'get_incoming_transactions_from', 1, 1)
+
+
+async def test_resolve_confirmed_transactions_records_operation_with_chunk_fan_out():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10))
+	metrics = _attach_metrics(connector)
+
+	# Act:
+	for _ in range(2):
+		await resolve_confirmed_transactions(connector, [f'hash_{i}' for i in range(10)], chunk_size=4)
+
+	# Assert:
+	_assert_operation_statistics(metrics, 'resolve_confirmed_transactions', 2, 6)
+	assert 3 == metrics.operation_statistics('resolve_confirmed_transactions').max_fan_out
+
+
+async def test_filter_finalized_transactions_records_operation_and_nested_operation():
+	# Arrange:
+	connector = MockStatusConnector(_make_hash_to_height_map(10), finalized_chain_height=105)
+	metrics = _attach_metrics(connector)
+
+	# Act:
+	await filter_finalized_transactions(connector, [f'hash_{i}' for i in range(10)])
+
+	# Assert:
+	_assert_operation_statistics(metrics, 'filter_finalized_transactions', 1, 1)
+	_assert_operation_statistics(metrics, 'resolve_confirmed_transactions', 1, 1)
+
+
+async def test_query_block_timestamps_records_operation():
+	# Arrange:
+	connector = MockConnector()
+	metrics = _attach_metrics(connector)
+
+	# Act:
+	await query_block_timestamps(connector, [4, 5, 1, 3, 2])
+
+	# Assert:
+	_assert_operation_statistics(metrics, 'query_block_timestamps', 1, 5)
+
+
+async def test_query_block_timestamps_with_cache_records_operation_with_uncached_fan_out():
+	# Arrange:
+	connector = MockConnector(finalized_chain_height=4)
+	metrics = _attach_metrics(connector)
+
+	with BlockTimestampCache('foo') as cache:
+		cache.add_all([(1, 1), (2, 4)], 4)
+
+		# Act:
+		await query_block_timestamps(connector, [4, 5, 1, 3, 2], timestamp_cache=cache)
+
+	# Assert:
+	_assert_operation_statistics(metrics, 'query_block_timestamps', 1, 3)
+
 # endregion
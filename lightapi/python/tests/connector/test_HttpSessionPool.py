@@ -0,0 +1,99 @@
+from symbollightapi.connector.HttpSessionPool import HttpSessionPool
+
+# pylint: disable=invalid-name
+
+
+async def test_can_create_pool_with_default_settings():
+	# Act:
+	session_pool = HttpSessionPool()
+
+	# Assert:
+	assert 20 == session_pool.connection_limit_per_host
+	assert 300 == session_pool.dns_cache_ttl_seconds
+	assert 15 == session_pool.keepalive_timeout_seconds
+	assert 0 == session_pool.size
+
+
+async def test_can_create_pool_with_custom_settings():
+	# Act:
+	session_pool = HttpSessionPool(5, 60, 30)
+
+	# Assert:
+	assert 5 == session_pool.connection_limit_per_host
+	assert 60 == session_pool.dns_cache_ttl_seconds
+	assert 30 == session_pool.keepalive_timeout_seconds
+	assert 0 == session_pool.size
+
+
+async def test_session_is_configured_with_pool_settings():
+	# Arrange:
+	async with HttpSessionPool(5, 60, 30) as session_pool:
+		# Act:
+		session = session_pool.session('http://localhost:3000')
+
+		# Assert:
+		assert 5 == session.connector.limit_per_host
+		assert 0 == session.connector.limit
+		assert session.connector.use_dns_cache
+
+
+async def test_same_session_is_returned_for_same_endpoint():
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		# Act:
+		session1 = session_pool.session('http://localhost:3000')
+		session2 = session_pool.session('http://localhost:3000')
+
+		# Assert:
+		assert session1 is session2
+		assert 1 == session_pool.size
+
+
+async def test_different_sessions_are_returned_for_different_endpoints():
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		# Act:
+		session1 = session_pool.session('http://localhost:3000')
+		session2 = session_pool.session('http://localhost:3001')
+
+		# Assert:
+		assert session1 is not session2
+		assert 2 == session_pool.size
+
+
+async def test_closed_session_is_replaced():
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		session1 = session_pool.session('http://localhost:3000')
+		await session1.close()
+
+		# Act:
+		session2 = session_pool.session('http://localhost:3000')
+
+		# Assert:
+		assert session1 is not session2
+		assert not session2.closed
+		assert 1 == session_pool.size
+
+
+async def test_close_closes_all_sessions():
+	# Arrange:
+	session_pool = HttpSessionPool()
+	sessions = [session_pool.session(f'http://localhost:{port}') for port in (3000, 3001, 3002)]
+
+	# Act:
+	await session_pool.close()
+
+	# Assert:
+	assert all(session.closed for session in sessions)
+	assert 0 == session_pool.size
+
+
+async def test_context_manager_closes_all_sessions_on_exit():
+	# Arrange:
+	async with HttpSessionPool() as session_pool:
+		sessions = [session_pool.session(f'http://localhost:{port}') for port in (3000, 3001)]
+
+	# Assert:
+	assert all(session.closed for session in sessions)
+	assert 0 == session_pool.size
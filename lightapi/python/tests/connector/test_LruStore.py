@@ -0,0 +1,144 @@
+import sqlite3
+import time
+
+from symbollightapi.connector.LruStore import LruStore, LruStoreTable
+
+# pylint: disable=invalid-name
+
+
+TABLE = LruStoreTable('test_store', ('key', 'text'), ('value', 'integer'))
+
+
+# region constructor
+
+def test_can_create_store_in_memory():
+	# Act:
+	with LruStore('symbol:testnet', 50, TABLE) as store:
+		# Assert:
+		assert 'symbol:testnet' == store.network_name
+		assert 50 == store.max_size
+		assert 0 == store.eviction_count
+		assert 0 == len(store)
+
+
+def test_can_create_store_on_disk(tmp_path):
+	# Arrange:
+	database_filepath = tmp_path / 'store.db'
+
+	# Act:
+	with LruStore('symbol:testnet', 50, TABLE, database_filepath):
+		pass
+
+	# Assert:
+	with sqlite3.connect(database_filepath) as connection:
+		cursor = connection.execute('''PRAGMA table_info(test_store)''')
+		assert ['network', 'key', 'value'] == [row[1] for row in cursor]
+
+# endregion
+
+
+# region in memory
+
+def test_get_returns_none_when_not_stored():
+	# Arrange:
+	with LruStore('symbol:testnet', 50, TABLE) as store:
+		# Act:
+		value = store.get('foo')
+
+		# Assert:
+		assert value is None
+
+
+def test_can_add_and_get_values():
+	# Arrange:
+	with LruStore('symbol:testnet', 50, TABLE) as store:
+		# Act:
+		store.add('foo', 123)
+		store.add_all([('bar', 234), ('baz', 345)])
+		values = [store.get(key) for key in ('foo', 'bar', 'baz')]
+
+		# Assert:
+		assert [123, 234, 345] == values
+		assert 3 == len(store)
+
+
+def test_value_with_expiry_time_expires():
+	# Arrange:
+	with LruStore('symbol:testnet', 50, TABLE) as store:
+		store.add('foo', 123, time.monotonic() + 0.05)
+		value_before_expiry = store.get('foo')
+
+		# Act:
+		time.sleep(0.06)
+		value_after_expiry = store.get('foo')
+
+		# Assert:
+		assert 123 == value_before_expiry
+		assert value_after_expiry is None
+		assert 0 == len(store)
+
+
+def test_least_recently_used_values_are_evicted():
+	# Arrange:
+	with LruStore('symbol:testnet', 3, TABLE) as store:
+		store.add_all([('a', 1), ('b', 2), ('c', 3)])
+		store.get('a')
+
+		# Act:
+		store.add('d', 4)
+		values = [store.get(key) for key in ('a', 'b', 'c', 'd')]
+
+		# Assert:
+		assert [1, None, 3, 4] == values
+		assert 1 == store.eviction_count
+
+# endregion
+
+
+# region on disk
+
+def test_permanent_values_are_persisted_across_instances(tmp_path):
+	# Arrange:
+	database_filepath = tmp_path / 'store.db'
+	with LruStore('symbol:testnet', 50, TABLE, database_filepath) as store:
+		store.add('foo', 123)
+		store.add('bar', 234, time.monotonic() + 60)
+
+	# Act:
+	with LruStore('symbol:testnet', 50, TABLE, database_filepath) as store:
+		values = [store.get(key) for key in ('foo', 'bar')]
+
+		# Assert: only the permanent value was persisted
+		assert [123, None] == values
+
+
+def test_persisted_values_are_isolated_by_network(tmp_path):
+	# Arrange:
+	database_filepath = tmp_path / 'store.db'
+	with LruStore('symbol:testnet', 50, TABLE, database_filepath) as store:
+		store.add('foo', 123)
+
+	with LruStore('nem:testnet', 50, TABLE, database_filepath) as store:
+		store.add('bar', 234)
+
+	# Act:
+	with LruStore('symbol:testnet', 50, TABLE, database_filepath) as store:
+		values = [store.get(key) for key in ('foo', 'bar')]
+
+		# Assert:
+		assert [123, None] == values
+
+
+def test_evicted_values_are_read_from_disk(tmp_path):
+	# Arrange:
+	with LruStore('symbol:testnet', 1, TABLE, tmp_path / 'store.db') as store:
+		store.add_all([('foo', 123), ('bar', 234)])
+
+		# Act:
+		values = [store.get(key) for key in ('foo', 'bar')]
+
+		# Assert:
+		assert [123, 234] == values
+		assert 1 == len(store)
+
+# endregion
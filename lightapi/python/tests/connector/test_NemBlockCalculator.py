@@ -1,4 +1,7 @@
+import pytest
+
 from symbollightapi.connector.NemBlockCalculator import NemBlockCalculator
+from symbollightapi.model.Exceptions import NodeException
 
 transaction_base = {
 	"timeStamp": 0,
@@ -27,8 +30,9 @@ def _assert_transaction_size(tx_json, expected_size):
 	nem_calculator = NemBlockCalculator()
 	transaction_size = nem_calculator.calculate_transaction_size(tx_json)
 
-	# Assert:
+	# Assert: arithmetic size matches expected size and size of transaction built by SDK (oracle)
 	assert expected_size == transaction_size
+	assert expected_size == nem_calculator.build_transaction(tx_json).size
 
 
 def test_can_calculate_transfer_transaction_v1():
@@ -71,6 +75,74 @@ def test_can_calculate_transfer_transaction_v2():
 	_assert_transaction_size(tx_json, 235)
 
 
+def test_can_calculate_transfer_transaction_v1_with_message():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"amount": 100000,
+		"recipient": "TD3FGWIQR7GIOJSFG52JMCJYCVP2PC7ZNDZYDN4H",
+		"type": 257,
+		"message": {
+			"payload": "e4bda0e5a5bd2c20776f726c6421",
+			"type": 1
+		},
+		"version": -1744830463,
+	}
+
+	_assert_transaction_size(tx_json, 206)
+
+
+def test_can_calculate_transfer_transaction_v1_with_empty_message_payload():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"amount": 100000,
+		"recipient": "TD3FGWIQR7GIOJSFG52JMCJYCVP2PC7ZNDZYDN4H",
+		"type": 257,
+		"message": {
+			"payload": "",
+			"type": 1
+		},
+		"version": -1744830463,
+	}
+
+	_assert_transaction_size(tx_json, 184)
+
+
+def test_can_calculate_transfer_transaction_v2_with_multiple_mosaics():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"amount": 1000000,
+		"recipient": "TDDRMIUIHSQIFPMIX4Z4FDBARSLVO5TASFV2UQSJ",
+		"mosaics": [
+			{"quantity": 1, "mosaicId": {"namespaceId": "nem", "name": "xem"}},
+			{"quantity": 2, "mosaicId": {"namespaceId": "alice.tokens", "name": "gold"}},
+			{"quantity": 3, "mosaicId": {"namespaceId": "bob", "name": "silver_coin"}}
+		],
+		"type": 257,
+		"message": {},
+		"version": -1744830462,
+	}
+
+	_assert_transaction_size(tx_json, 296)
+
+
+def test_can_calculate_transfer_transaction_v2_without_mosaics():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"amount": 1000000,
+		"recipient": "TDDRMIUIHSQIFPMIX4Z4FDBARSLVO5TASFV2UQSJ",
+		"mosaics": [],
+		"type": 257,
+		"message": {},
+		"version": -1744830462,
+	}
+
+	_assert_transaction_size(tx_json, 188)
+
+
 def test_can_calculate_account_key_link_transaction_v1():
 	# Arrange:
 	tx_json = {
@@ -121,6 +193,30 @@ def test_can_calculate_multisig_account_modification_transaction_v2():
 	_assert_transaction_size(tx_json, 184)
 
 
+def test_can_calculate_multisig_account_modification_transaction_v2_with_multiple_modifications():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"minCosignatories": {
+			"relativeChange": -1
+		},
+		"modifications": [
+			{
+				"modificationType": 1,
+				"cosignatoryAccount": "00112233445566778899AABBCCDDEEFF00112233445566778899AABBCCDDEEFF"
+			},
+			{
+				"modificationType": 2,
+				"cosignatoryAccount": "FFEEDDCCBBAA99887766554433221100FFEEDDCCBBAA99887766554433221100"
+			}
+		],
+		"type": 4097,
+		"version": -1744830462,
+	}
+
+	_assert_transaction_size(tx_json, 228)
+
+
 def test_can_calculate_namespace_registration_with_root_transaction_v1():
 	# Arrange:
 	tx_json = {
@@ -222,6 +318,34 @@ def test_can_calculate_mosaic_definition_transaction_v1():
 	_assert_transaction_size(tx_json, 469)
 
 
+def test_can_calculate_mosaic_definition_with_multibyte_description_transaction_v1():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"creationFeeSink": "TBMOSAICOD4F54EE5CDMR23CCBGOAM2XSJBR5OLC",
+		"creationFee": 100000000,
+		"mosaicDefinition": {
+			"creator": "55c9ad5388652e38a72a0f7792b6ee9091404680f864c908401734e98755c9b4",
+			"description": "\u30c6\u30b9\u30c8 mosaic",
+			"id": {
+				"namespaceId": "test_namespace_1",
+				"name": "test_mosaic_2"
+			},
+			"properties": [
+				{
+					"name": "divisibility",
+					"value": "0"
+				}
+			],
+			"levy": None
+		},
+		"type": 16385,
+		"version": -1744830463,
+	}
+
+	_assert_transaction_size(tx_json, 314)
+
+
 def test_can_calculate_mosaic_supply_change_transaction_v1():
 	# Arrange:
 	tx_json = {
@@ -269,3 +393,60 @@ def test_can_calculate_multisig_transaction_v1():
 	}
 
 	_assert_transaction_size(tx_json, 472)
+
+
+def test_can_calculate_multisig_transaction_v1_with_multiple_cosignatures():
+	# Arrange:
+	inner_tx_json = {
+		**transaction_base,
+		"modifications": [
+			{
+				"modificationType": 1,
+				"cosignatoryAccount": "00112233445566778899AABBCCDDEEFF00112233445566778899AABBCCDDEEFF"
+			}
+		],
+		"minCosignatories": {
+			"relativeChange": 1
+		},
+		"type": 4097,
+		"version": -1744830462,
+	}
+
+	tx_json = {
+		**transaction_base,
+		"otherTrans": inner_tx_json,
+		"signatures": [
+			cosignature_transaction,
+			cosignature_transaction
+		],
+		"type": 4100,
+		"version": -1744830463,
+	}
+
+	_assert_transaction_size(tx_json, 684)
+
+
+def test_cannot_calculate_unsupported_transaction():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"type": 9999,
+		"version": -1744830463,
+	}
+
+	# Act + Assert:
+	with pytest.raises(NodeException, match='Failed to calculate transaction size for type 9999'):
+		NemBlockCalculator().calculate_transaction_size(tx_json)
+
+
+def test_cannot_calculate_transaction_with_missing_fields():
+	# Arrange:
+	tx_json = {
+		**transaction_base,
+		"type": 16386,
+		"version": -1744830463,
+	}
+
+	# Act + Assert:
+	with pytest.raises(NodeException, match='Failed to calculate transaction size for type 16386'):
+		NemBlockCalculator().calculate_transaction_size(tx_json)
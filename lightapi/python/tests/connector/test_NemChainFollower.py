@@ -0,0 +1,282 @@
+import asyncio
+from collections import namedtuple
+
+import pytest
+
+from symbollightapi.connector.NemChainFollower import ChainRollback, NemChainFollower
+from symbollightapi.model.Exceptions import NodeException
+
+MockBlock = namedtuple('MockBlock', ['height', 'block_hash', 'previous_block_hash'])
+
+# region MockChainConnector
+
+
+class MockChainConnector:
+	def __init__(self, chain_height, max_window_size=10, error_height=None, fork_on_blocks_after=None):
+		self.block_hashes = {height: f'hash_{height}' for height in range(1, chain_height + 1)}
+		self.max_window_size = max_window_size
+		self.error_height = error_height
+		self.fork_on_blocks_after = fork_on_blocks_after
+		self.blocks_after_heights = []
+		self.block_heights = []
+		self.active_request_count = 0
+		self.max_active_request_count = 0
+
+	def extend(self, count):
+		chain_height = max(self.block_hashes)
+		for height in range(chain_height + 1, chain_height + count + 1):
+			self.block_hashes[height] = f'hash_{height}'
+
+	def fork(self, fork_height, chain_height):
+		for height in list(self.block_hashes):
+			if height >= fork_height:
+				del self.block_hashes[height]
+
+		for height in range(fork_height, chain_height + 1):
+			self.block_hashes[height] = f'fork_hash_{height}'
+
+	def _create_block(self, height):
+		return MockBlock(height, self.block_hashes[height], self.block_hashes.get(height - 1, None))
+
+	async def get_blocks_after(self, height):
+		self.blocks_after_heights.append(height)
+		self.active_request_count += 1
+		self.max_active_request_count = max(self.max_active_request_count, self.active_request_count)
+
+		if self.fork_on_blocks_after and self.fork_on_blocks_after[0] == height:
+			self.fork(*self.fork_on_blocks_after[1:])
+
+		heights = [block_height for block_height in sorted(self.block_hashes) if block_height > height][:self.max_window_size]
+		blocks = [self._create_block(block_height) for block_height in heights]
+
+		# complete later windows first to check ordering
+		await asyncio.sleep(0.01 / (1 + len(self.blocks_after_heights) % 3))
+		self.active_request_count -= 1
+
+		if self.error_height == height:
+			raise NodeException('simulated failure')
+
+		return blocks
+
+	async def get_block(self, height):
+		self.block_heights.append(height)
+		await asyncio.sleep(0)
+		return self._create_block(height)
+
+
+def _create_follower(connector, checkpoint_height=0, **kwargs):
+	return NemChainFollower(connector, checkpoint_height, **{'window_count': 3, 'window_size': 10, 'poll_interval_seconds': 0, **kwargs})
+
+
+async def _take(follower_iterator, count):
+	return [await anext(follower_iterator) for _ in range(count)]
+
+# endregion
+
+
+# region catch up
+
+async def test_can_deliver_blocks_in_height_order():
+	# Arrange:
+	connector = MockChainConnector(45)
+	follower = _create_follower(connector)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	blocks = await _take(follower_iterator, 45)
+	await follower_iterator.aclose()
+
+	# Assert:
+	assert list(range(1, 46)) == [block.height for block in blocks]
+	assert [f'hash_{height}' for height in range(1, 46)] == [block.block_hash for block in blocks]
+	assert 3 == connector.max_active_request_count
+	assert [0, 10, 20] == connector.blocks_after_heights[:3]
+
+
+async def test_can_resume_from_checkpoint_height():
+	# Arrange:
+	connector = MockChainConnector(45)
+	follower = _create_follower(connector, checkpoint_height=30)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	blocks = await _take(follower_iterator, 15)
+	await follower_iterator.aclose()
+
+	# Assert:
+	assert list(range(31, 46)) == [block.height for block in blocks]
+	assert 30 == connector.blocks_after_heights[0]
+
+
+async def test_can_realign_after_short_windows():
+	# Arrange:
+	connector = MockChainConnector(25, max_window_size=4)
+	follower = _create_follower(connector)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	blocks = await _take(follower_iterator, 25)
+	await follower_iterator.aclose()
+
+	# Assert:
+	assert list(range(1, 26)) == [block.height for block in blocks]
+
+
+async def test_checkpoint_height_tracks_consumed_blocks():
+	# Arrange:
+	connector = MockChainConnector(25)
+	follower = _create_follower(connector, checkpoint_height=5)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	checkpoint_heights = [follower.checkpoint_height]
+	for _ in range(3):
+		await anext(follower_iterator)
+		checkpoint_heights.append(follower.checkpoint_height)
+
+	await follower_iterator.aclose()
+
+	# Assert: checkpoint is advanced when the consumer requests the next block
+	assert [5, 5, 6, 7] == checkpoint_heights
+
+
+async def test_queue_applies_back_pressure():
+	# Arrange:
+	connector = MockChainConnector(1000)
+	follower = _create_follower(connector, queue_size=5)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	await anext(follower_iterator)
+	await asyncio.sleep(0.1)
+	await follower_iterator.aclose()
+
+	# Assert: producer is blocked after filling the queue instead of downloading the whole chain
+	assert 10 > len(connector.blocks_after_heights)
+
+
+async def test_can_roll_back_to_common_ancestor_while_catching_up():
+	# Arrange: chain is forked at height 8 after the first window is served
+	connector = MockChainConnector(30, fork_on_blocks_after=(10, 8, 30))
+	follower = _create_follower(connector)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	blocks = await _take(follower_iterator, 10)
+	items = await _take(follower_iterator, 24)
+	await follower_iterator.aclose()
+
+	# Assert:
+	assert [f'hash_{height}' for height in range(1, 11)] == [block.block_hash for block in blocks]
+	assert ChainRollback(7) == items[0]
+	assert [f'fork_hash_{height}' for height in range(8, 31)] == [block.block_hash for block in items[1:]]
+	assert [10, 9, 8, 7] == connector.block_heights
+
+
+async def test_failure_is_propagated_to_consumer():
+	# Arrange:
+	connector = MockChainConnector(45, error_height=20)
+	follower = _create_follower(connector)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	blocks = await _take(follower_iterator, 20)
+	with pytest.raises(NodeException):
+		await anext(follower_iterator)
+
+	# Assert:
+	assert list(range(1, 21)) == [block.height for block in blocks]
+	assert 20 == follower.checkpoint_height
+
+# endregion
+
+
+# region tip following
+
+async def test_can_follow_tip():
+	# Arrange:
+	connector = MockChainConnector(12)
+	follower = _create_follower(connector, poll_interval_seconds=0.01)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	blocks = await _take(follower_iterator, 12)
+	connector.extend(3)
+	blocks += await _take(follower_iterator, 3)
+	await follower_iterator.aclose()
+
+	# Assert:
+	assert list(range(1, 16)) == [block.height for block in blocks]
+	assert not connector.block_heights
+
+
+async def test_can_roll_back_to_common_ancestor():
+	# Arrange:
+	connector = MockChainConnector(12)
+	follower = _create_follower(connector, poll_interval_seconds=0.01)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	await _take(follower_iterator, 12)
+	connector.fork(10, 14)
+	items = await _take(follower_iterator, 6)
+	await follower_iterator.aclose()
+
+	# Assert:
+	assert [
+		ChainRollback(9),
+		MockBlock(10, 'fork_hash_10', 'hash_9'),
+		MockBlock(11, 'fork_hash_11', 'fork_hash_10'),
+		MockBlock(12, 'fork_hash_12', 'fork_hash_11'),
+		MockBlock(13, 'fork_hash_13', 'fork_hash_12'),
+		MockBlock(14, 'fork_hash_14', 'fork_hash_13')
+	] == items
+	assert [12, 11, 10, 9] == connector.block_heights
+
+
+async def test_can_roll_back_to_checkpoint_block():
+	# Arrange:
+	connector = MockChainConnector(12)
+	follower = _create_follower(connector, checkpoint_height=10, checkpoint_block_hash='hash_10', poll_interval_seconds=0.01)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	await _take(follower_iterator, 2)
+	connector.fork(11, 13)
+	items = await _take(follower_iterator, 4)
+	await follower_iterator.aclose()
+
+	# Assert:
+	assert [ChainRollback(10), 'fork_hash_11', 'fork_hash_12', 'fork_hash_13'] == [items[0]] + [item.block_hash for item in items[1:]]
+	assert [12, 11, 10] == connector.block_heights
+
+
+async def test_cannot_resume_from_checkpoint_block_not_in_chain():
+	# Arrange:
+	connector = MockChainConnector(12)
+	follower = _create_follower(connector, checkpoint_height=10, checkpoint_block_hash='other_hash_10')
+	follower_iterator = aiter(follower)
+
+	# Act + Assert:
+	with pytest.raises(NodeException):
+		await anext(follower_iterator)
+
+	await follower_iterator.aclose()
+
+
+async def test_cannot_roll_back_beyond_rollback_window():
+	# Arrange:
+	connector = MockChainConnector(12)
+	follower = _create_follower(connector, poll_interval_seconds=0.01, max_rollback_depth=2)
+	follower_iterator = aiter(follower)
+
+	# Act:
+	await _take(follower_iterator, 12)
+	connector.fork(5, 14)
+	with pytest.raises(NodeException):
+		await anext(follower_iterator)
+
+	# Assert:
+	assert [12, 11] == connector.block_heights
+
+# endregion
@@ -4,12 +4,14 @@ from binascii import unhexlify
 
 import pytest
 from aiohttp import web
+from symbolchain import nc
 from symbolchain.CryptoTypes import Hash256, PublicKey
 from symbolchain.facade.NemFacade import NemFacade
 from symbolchain.nc import Signature
 from symbolchain.nem.Network import Address, Network
 
-from symbollightapi.connector.NemConnector import NemConnector
+from symbollightapi.connector.NemConnector import NemConnector, calculate_transaction_hash
+from symbollightapi.connector.ResponseCache import ResponseCache
 from symbollightapi.model.Block import Block
 from symbollightapi.model.Constants import TimeoutSettings, TransactionStatus
 from symbollightapi.model.Endpoint import Endpoint
@@ -623,6 +625,7 @@ async def server(aiohttp_client):  # pylint: disable=too-many-statements
 			return await self._process(request, CHAIN_BLOCK_1)
 
 		async def transactions_unconfirmed(self, request):
+			self.request_json_payloads.append(await request.json())
 			return await self._process(request, {
 				'signature': '0' * 128,
 				'entity': {
@@ -752,6 +755,24 @@ async def test_can_get_block_headers(server):  # pylint: disable=redefined-outer
 	assert [f'{server.make_url("")}/block/at/public'] == server.mock.urls
 	assert {'type': 1, 'signer': PUBLIC_KEYS[0], 'timeStamp': 201000} == headers
 
+
+async def test_unfinalized_block_headers_are_not_cached(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = NemConnector(server.make_url(''))
+	connector.response_cache = ResponseCache('nem:mainnet')
+
+	# Act:
+	headers = [await connector.block_headers(1000) for _ in range(2)]
+
+	# Assert: block height (1000) is above finalized height (1234 - 360)
+	assert [
+		f'{server.make_url("")}/block/at/public',
+		f'{server.make_url("")}/chain/height',
+		f'{server.make_url("")}/block/at/public'
+	] == server.mock.urls
+	assert headers[0] == headers[1]
+	assert 874 == connector.response_cache.finalized_chain_height
+
 # endregion
 
 
@@ -1012,6 +1033,20 @@ async def test_can_query_mosaic_fee_information_without_divisibility(server):  #
 	assert 1234_000000 == fee_information.supply
 	assert 0 == fee_information.divisibility  # default divisibility is zero
 
+
+async def test_can_query_mosaic_fee_information_from_response_cache(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = NemConnector(server.make_url(''))
+	connector.response_cache = ResponseCache('nem:mainnet')
+
+	# Act:
+	fee_informations = [await connector.mosaic_fee_information(('foo', 'bar')) for _ in range(2)]
+
+	# Assert:
+	assert 2 == len(server.mock.urls)
+	assert fee_informations[0] == fee_informations[1]
+	assert 3 == fee_informations[1].divisibility
+
 # endregion
 
 
@@ -1363,7 +1398,8 @@ EXPECTED_BLOCK_2 = Block(
 		'fdf6a9830e9320af79123f467fcb03d6beab735575ff50eab363d812c5581436'
 		'2ad7be0503db2ee70e60ac3408d83cdbcbd941067a6df703e0c21c7bf389f105'
 	),
-	2052
+	2052,
+	'438cf6375dab5a0d32f9b7bf151d4539e00a590f7c022d5572c7d41815a24be4'
 )
 
 
@@ -1393,7 +1429,8 @@ async def test_can_query_blocks_after(server):  # pylint: disable=redefined-oute
 			'919ae66a34119b49812b335827b357f86884ab08b628029fd6e8db3572faeb4f'
 			'323a7bf9488c76ef8faa5b513036bbcce2d949ba3e41086d95a54c0007403c0b'
 		),
-		168
+		168,
+		'1dd9d4d7b6af603d29c082f9aa4e123f07d18154ddbcd7ddc6702491b854c5e4'
 	) == blocks[1]
 
 # endregion
@@ -1426,9 +1463,10 @@ async def test_unconfirmed_transactions(server):  # pylint: disable=redefined-ou
 
 	# Assert:
 	assert [f'{server.make_url("")}/transactions/unconfirmed'] == server.mock.urls
+	assert [] == server.mock.request_json_payloads[0]['entity']['hashShortIds']
 	assert [
 		TransferTransaction(
-			transaction_hash=None,
+			transaction_hash='88e45d8d678df30386d220816e4a3fbd9962db1c9bb1314dbe5e41777a1539d5',
 			height=0,
 			sender=PublicKey('8d07f90fb4bbe7715fa327c926770166a11be2e494a970605f2e12557f66c9b9'),
 			fee=150000,
@@ -1442,4 +1480,93 @@ async def test_unconfirmed_transactions(server):  # pylint: disable=redefined-ou
 		),
 	] == unconfirmed_transactions
 
+
+async def test_unconfirmed_transactions_excludes_known_hash_short_ids(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = NemConnector(server.make_url(''))
+
+	# Act:
+	await connector.get_unconfirmed_transactions([-1234, 5678])
+
+	# Assert:
+	assert [f'{server.make_url("")}/transactions/unconfirmed'] == server.mock.urls
+	assert [{'id': -1234}, {'id': 5678}] == server.mock.request_json_payloads[0]['entity']['hashShortIds']
+
+
+def _create_transfer_transaction_json(version, **kwargs):
+	return {
+		'timeStamp': 73397,
+		'amount': 1000000,
+		'signature': '0' * 128,
+		'fee': 150000,
+		'recipient': 'TCOPERAWEWCD4A34NP5UQCCKEX44MW4SL3QYJYS5',
+		'type': 257,
+		'deadline': 83397,
+		'message': {},
+		'version': version,
+		'signer': '8d07f90fb4bbe7715fa327c926770166a11be2e494a970605f2e12557f66c9b9',
+		**kwargs
+	}
+
+
+def _calculate_expected_transfer_transaction_hash(transaction):
+	transaction.network = nc.NetworkType.TESTNET
+	transaction.timestamp = nc.Timestamp(73397)
+	transaction.signer_public_key = nc.PublicKey(PublicKey('8d07f90fb4bbe7715fa327c926770166a11be2e494a970605f2e12557f66c9b9').bytes)
+	transaction.fee = nc.Amount(150000)
+	transaction.deadline = nc.Timestamp(83397)
+	transaction.recipient_address = nc.Address(b'TCOPERAWEWCD4A34NP5UQCCKEX44MW4SL3QYJYS5')
+	transaction.amount = nc.Amount(1000000)
+	return str(NemFacade.hash_transaction(transaction)).lower()
+
+
+def test_can_calculate_transfer_transaction_hash_with_message():
+	# Arrange:
+	transaction_json = _create_transfer_transaction_json(-1744830463, message={'payload': '476f6f64206c75636b21', 'type': 1})
+
+	expected_transaction = nc.TransferTransactionV1()
+	expected_transaction.message = nc.Message()
+	expected_transaction.message.message_type = nc.MessageType.PLAIN
+	expected_transaction.message.message = b'Good luck!'
+
+	# Act:
+	transaction_hash = calculate_transaction_hash(transaction_json)
+
+	# Assert:
+	assert _calculate_expected_transfer_transaction_hash(expected_transaction) == transaction_hash
+
+
+def test_can_calculate_transfer_transaction_hash_with_mosaics():
+	# Arrange:
+	transaction_json = _create_transfer_transaction_json(-1744830462, mosaics=[
+		{'mosaicId': {'namespaceId': 'nem', 'name': 'xem'}, 'quantity': 12000},
+		{'mosaicId': {'namespaceId': 'magic', 'name': 'hat'}, 'quantity': 3}
+	])
+
+	expected_transaction = nc.TransferTransactionV2()
+	expected_transaction.mosaics = []
+	for (namespace_name, name, amount) in [(b'nem', b'xem', 12000), (b'magic', b'hat', 3)]:
+		mosaic = nc.SizePrefixedMosaic()
+		mosaic.mosaic.mosaic_id.namespace_id.name = namespace_name
+		mosaic.mosaic.mosaic_id.name = name
+		mosaic.mosaic.amount = nc.Amount(amount)
+		expected_transaction.mosaics.append(mosaic)
+
+	# Act:
+	transaction_hash = calculate_transaction_hash(transaction_json)
+
+	# Assert:
+	assert _calculate_expected_transfer_transaction_hash(expected_transaction) == transaction_hash
+
+
+def test_cannot_calculate_hash_of_other_transaction_types():
+	# Arrange:
+	transaction_json = _create_transfer_transaction_json(-1744830463, type=2049, mode=1, remoteAccount='00' * 32)
+
+	# Act:
+	transaction_hash = calculate_transaction_hash(transaction_json)
+
+	# Assert:
+	assert transaction_hash is None
+
 # endregion
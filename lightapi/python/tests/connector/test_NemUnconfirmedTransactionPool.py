@@ -0,0 +1,205 @@
+import asyncio
+from collections import namedtuple
+
+from symbolchain.nem.Network import NetworkTimestamp
+
+from symbollightapi.connector.NemUnconfirmedTransactionPool import NemUnconfirmedTransactionPool, UnconfirmedPoolChanges, make_hash_short_id
+
+MockTransaction = namedtuple('MockTransaction', ['transaction_hash', 'signature', 'deadline'])
+
+HASHES = [f'{index:02x}' * 32 for index in range(1, 7)]
+
+# region MockPoolConnector
+
+
+class MockPoolConnector:
+	def __init__(self, network_time=1000):
+		self.network_time_value = network_time
+		self.transactions = []
+		self.known_hash_short_ids_requests = []
+
+	def add(self, transaction_hash, deadline=2000):
+		transaction = MockTransaction(transaction_hash, f'signature_{len(self.transactions)}', deadline)
+		self.transactions.append(transaction)
+		return transaction
+
+	def confirm(self, transaction):
+		self.transactions.remove(transaction)
+
+	async def network_time(self):
+		await asyncio.sleep(0)
+		return NetworkTimestamp(self.network_time_value)
+
+	async def get_unconfirmed_transactions(self, known_hash_short_ids=None):
+		self.known_hash_short_ids_requests.append(known_hash_short_ids)
+		await asyncio.sleep(0)
+		return [
+			transaction for transaction in self.transactions
+			if not transaction.transaction_hash or make_hash_short_id(transaction.transaction_hash) not in known_hash_short_ids
+		]
+
+
+def _create_pool(connector, **kwargs):
+	return NemUnconfirmedTransactionPool(connector, **{'full_sync_interval': 3, 'poll_interval_seconds': 0, **kwargs})
+
+# endregion
+
+
+# region make_hash_short_id
+
+def test_can_make_hash_short_id():
+	assert 0x0102030405060708 == make_hash_short_id('0102030405060708' + '00' * 24)
+	assert -0x0102030405060709 == make_hash_short_id('FEFDFCFBFAF9F8F7' + 'FF' * 24)
+
+# endregion
+
+
+# region sync
+
+async def test_first_sync_adds_all_transactions():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(transaction_hash) for transaction_hash in HASHES[:3]]
+	pool = _create_pool(connector)
+
+	# Act:
+	changes = await pool.sync()
+
+	# Assert:
+	assert UnconfirmedPoolChanges(transactions, []) == changes
+	assert transactions == pool.transactions
+	assert 3 == len(pool)
+	assert [[]] == connector.known_hash_short_ids_requests
+
+
+async def test_incremental_sync_sends_known_hash_short_ids_and_adds_only_new_transactions():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(transaction_hash) for transaction_hash in HASHES[:2]]
+	pool = _create_pool(connector)
+	await pool.sync()
+
+	transactions.append(connector.add(HASHES[2]))
+
+	# Act:
+	changes = await pool.sync()
+
+	# Assert:
+	assert UnconfirmedPoolChanges(transactions[2:], []) == changes
+	assert transactions == pool.transactions
+	assert [make_hash_short_id(transaction_hash) for transaction_hash in HASHES[:2]] == connector.known_hash_short_ids_requests[1]
+
+
+async def test_incremental_sync_keeps_transactions_not_returned_by_node():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(transaction_hash) for transaction_hash in HASHES[:2]]
+	pool = _create_pool(connector)
+	await pool.sync()
+
+	connector.confirm(transactions[0])
+
+	# Act:
+	changes = await pool.sync()
+
+	# Assert: node does not report removals, so nothing is dropped until the next full sync
+	assert UnconfirmedPoolChanges([], []) == changes
+	assert transactions == pool.transactions
+
+
+async def test_full_sync_removes_transactions_not_returned_by_node():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(transaction_hash) for transaction_hash in HASHES[:3]]
+	pool = _create_pool(connector)
+	await pool.sync()
+	await pool.sync()
+
+	connector.confirm(transactions[1])
+	await pool.sync()
+
+	# Act:
+	changes = await pool.sync()
+
+	# Assert:
+	assert UnconfirmedPoolChanges([], [transactions[1]]) == changes
+	assert [transactions[0], transactions[2]] == pool.transactions
+	assert [] == connector.known_hash_short_ids_requests[3]
+
+
+async def test_sync_removes_expired_transactions():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(HASHES[0], 1500), connector.add(HASHES[1], 1499), connector.add(HASHES[2], 1000)]
+	pool = _create_pool(connector)
+	await pool.sync()
+
+	connector.network_time_value = 1500
+
+	# Act:
+	changes = await pool.sync()
+
+	# Assert:
+	assert UnconfirmedPoolChanges([], transactions[1:]) == changes
+	assert transactions[:1] == pool.transactions
+
+
+async def test_sync_removes_transactions_without_hash_as_soon_as_they_are_not_returned():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(None), connector.add(HASHES[0]), connector.add(None)]
+	pool = _create_pool(connector)
+	await pool.sync()
+
+	connector.confirm(transactions[0])
+
+	# Act:
+	changes = await pool.sync()
+
+	# Assert: only hashed transactions are known by the node
+	assert UnconfirmedPoolChanges([], [transactions[0]]) == changes
+	assert transactions[1:] == pool.transactions
+	assert [make_hash_short_id(HASHES[0])] == connector.known_hash_short_ids_requests[1]
+
+# endregion
+
+
+# region remove_confirmed
+
+async def test_can_remove_confirmed_transactions():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(HASHES[0]), connector.add(None), connector.add(HASHES[1]), connector.add(HASHES[2])]
+	pool = _create_pool(connector)
+	await pool.sync()
+
+	# Act:
+	removed = pool.remove_confirmed([HASHES[2].upper(), HASHES[0], HASHES[5]])
+
+	# Assert:
+	assert [transactions[0], transactions[3]] == removed
+	assert transactions[1:3] == pool.transactions
+
+# endregion
+
+
+# region iteration
+
+async def test_iteration_yields_only_nonempty_changes():
+	# Arrange:
+	connector = MockPoolConnector()
+	transactions = [connector.add(HASHES[0])]
+	pool = _create_pool(connector)
+	pool_iterator = aiter(pool)
+
+	# Act:
+	first_changes = await anext(pool_iterator)
+
+	transactions.append(connector.add(HASHES[1]))
+	second_changes = await anext(pool_iterator)
+
+	# Assert:
+	assert UnconfirmedPoolChanges(transactions[:1], []) == first_changes
+	assert UnconfirmedPoolChanges(transactions[1:], []) == second_changes
+
+# endregion
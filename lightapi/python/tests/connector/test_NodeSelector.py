@@ -0,0 +1,263 @@
+import pytest
+
+from symbollightapi.connector.NodeSelector import NodeSelector
+from symbollightapi.model.Exceptions import CorruptDataException, HttpException, NodeException
+
+# pylint: disable=invalid-name
+
+ENDPOINTS = ['http://node1:3000', 'http://node2:3000', 'http://node3:3000']
+
+
+def _record_successes(selector, endpoint, latencies):
+	for latency in latencies:
+		selector.record_success(endpoint, latency)
+
+
+# region constructor
+
+def test_can_create_selector_with_default_settings():
+	# Act:
+	selector = NodeSelector(ENDPOINTS)
+
+	# Assert:
+	assert ENDPOINTS == selector.endpoints
+	assert 0.3 == selector.latency_smoothing_factor
+	assert 0.3 == selector.error_smoothing_factor
+	assert 0.5 == selector.max_error_rate
+	assert 0.95 == selector.hedge_percentile
+	assert 1 == selector.initial_hedge_delay_seconds
+	assert 0.05 == selector.min_hedge_delay_seconds
+	assert 30 == selector.probe_interval_seconds
+	assert 0 == selector.hedge_count
+	assert ENDPOINTS == selector.healthy_endpoints
+
+	for endpoint in ENDPOINTS:
+		statistics = selector.statistics(endpoint)
+		assert statistics.latency_seconds is None
+		assert 0 == statistics.error_rate
+		assert 0 == statistics.request_count
+		assert statistics.is_healthy
+
+
+def test_cannot_create_selector_without_endpoints():
+	with pytest.raises(ValueError):
+		NodeSelector([])
+
+# endregion
+
+
+# region ranked_endpoints
+
+def test_unmeasured_nodes_are_ranked_first_in_configured_order():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS)
+	selector.record_success(ENDPOINTS[0], 0.1)
+
+	# Act:
+	endpoints = selector.ranked_endpoints()
+
+	# Assert:
+	assert [ENDPOINTS[1], ENDPOINTS[2], ENDPOINTS[0]] == endpoints
+
+
+def test_nodes_are_ranked_by_smoothed_latency():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS)
+	_record_successes(selector, ENDPOINTS[0], [0.3, 0.3])
+	_record_successes(selector, ENDPOINTS[1], [0.5, 0.1, 0.1, 0.1, 0.1])
+	_record_successes(selector, ENDPOINTS[2], [0.2])
+
+	# Act:
+	endpoints = selector.ranked_endpoints()
+
+	# Assert:
+	assert pytest.approx(0.19604) == selector.statistics(ENDPOINTS[1]).latency_seconds
+	assert [ENDPOINTS[1], ENDPOINTS[2], ENDPOINTS[0]] == endpoints
+
+
+def test_nodes_are_ranked_by_latency_penalized_by_error_rate():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS)
+	_record_successes(selector, ENDPOINTS[0], [0.1])
+	_record_successes(selector, ENDPOINTS[1], [0.12])
+	_record_successes(selector, ENDPOINTS[2], [0.2])
+	selector.record_failure(ENDPOINTS[0])  # score = 0.1 / 0.7 = 0.143
+
+	# Act:
+	endpoints = selector.ranked_endpoints()
+
+	# Assert:
+	assert [ENDPOINTS[0], ENDPOINTS[1], ENDPOINTS[2]] == selector.healthy_endpoints
+	assert [ENDPOINTS[1], ENDPOINTS[0], ENDPOINTS[2]] == endpoints
+
+
+def test_unhealthy_nodes_are_not_ranked():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS)
+	for _ in range(2):
+		selector.record_failure(ENDPOINTS[1])
+
+	# Act:
+	endpoints = selector.ranked_endpoints()
+
+	# Assert:
+	assert not selector.statistics(ENDPOINTS[1]).is_healthy
+	assert pytest.approx(0.51) == selector.statistics(ENDPOINTS[1]).error_rate
+	assert 2 == selector.statistics(ENDPOINTS[1]).failure_count
+	assert [ENDPOINTS[0], ENDPOINTS[2]] == endpoints
+
+
+def test_all_nodes_are_ranked_when_no_nodes_are_healthy():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS[:2])
+	for endpoint in ENDPOINTS[:2]:
+		for _ in range(2):
+			selector.record_failure(endpoint)
+
+	# Act:
+	endpoints = selector.ranked_endpoints()
+
+	# Assert:
+	assert [] == selector.healthy_endpoints
+	assert ENDPOINTS[:2] == endpoints
+
+# endregion
+
+
+# region hedge_delay_seconds
+
+def test_hedge_delay_is_initial_delay_when_there_are_too_few_latency_samples():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS, initial_hedge_delay_seconds=0.7)
+	_record_successes(selector, ENDPOINTS[0], [0.1] * 9)
+
+	# Act:
+	hedge_delay_seconds = selector.hedge_delay_seconds(ENDPOINTS[0])
+
+	# Assert:
+	assert 0.7 == hedge_delay_seconds
+
+
+def test_hedge_delay_is_latency_percentile_of_node():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS, hedge_percentile=0.9)
+	_record_successes(selector, ENDPOINTS[0], [(i + 1) / 100 for i in reversed(range(20))])
+	_record_successes(selector, ENDPOINTS[1], [1] * 20)
+
+	# Act:
+	hedge_delay_seconds = selector.hedge_delay_seconds(ENDPOINTS[0])
+
+	# Assert:
+	assert 0.19 == hedge_delay_seconds
+
+
+def test_hedge_delay_is_at_least_min_hedge_delay():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS, min_hedge_delay_seconds=0.25)
+	_record_successes(selector, ENDPOINTS[0], [0.1] * 20)
+
+	# Act:
+	hedge_delay_seconds = selector.hedge_delay_seconds(ENDPOINTS[0])
+
+	# Assert:
+	assert 0.25 == hedge_delay_seconds
+
+# endregion
+
+
+# region probes
+
+def _create_selector_with_unhealthy_node(probe_interval_seconds):
+	selector = NodeSelector(ENDPOINTS, probe_interval_seconds=probe_interval_seconds)
+	for _ in range(2):
+		selector.record_failure(ENDPOINTS[1])
+
+	return selector
+
+
+def test_no_probe_is_due_when_all_nodes_are_healthy():
+	# Arrange:
+	selector = NodeSelector(ENDPOINTS, probe_interval_seconds=0)
+
+	# Act + Assert:
+	assert selector.try_begin_probe() is None
+
+
+def test_no_probe_is_due_before_probe_interval_elapses():
+	# Arrange:
+	selector = _create_selector_with_unhealthy_node(30)
+
+	# Act + Assert:
+	assert selector.try_begin_probe() is None
+
+
+def test_probe_is_due_after_probe_interval_elapses():
+	# Arrange:
+	selector = _create_selector_with_unhealthy_node(0)
+
+	# Act:
+	probe_endpoint = selector.try_begin_probe()
+
+	# Assert: only one probe per node is in flight
+	assert ENDPOINTS[1] == probe_endpoint
+	assert selector.statistics(ENDPOINTS[1]).is_probing
+	assert selector.try_begin_probe() is None
+
+
+def test_answered_probe_returns_node_to_rotation():
+	# Arrange:
+	selector = _create_selector_with_unhealthy_node(0)
+	probe_endpoint = selector.try_begin_probe()
+
+	# Act:
+	selector.record_success(probe_endpoint, 0.1)
+	selector.end_probe(probe_endpoint)
+
+	# Assert:
+	statistics = selector.statistics(ENDPOINTS[1])
+	assert statistics.is_healthy
+	assert not statistics.is_probing
+	assert 0 == statistics.error_rate
+	assert ENDPOINTS == selector.healthy_endpoints
+
+
+def test_failed_probe_schedules_next_probe():
+	# Arrange:
+	selector = _create_selector_with_unhealthy_node(0)
+	probe_endpoint = selector.try_begin_probe()
+
+	# Act:
+	selector.record_failure(probe_endpoint)
+	selector.probe_interval_seconds = 30
+	selector.end_probe(probe_endpoint)
+
+	# Assert:
+	statistics = selector.statistics(ENDPOINTS[1])
+	assert not statistics.is_healthy
+	assert not statistics.is_probing
+	assert selector.try_begin_probe() is None
+
+# endregion
+
+
+# region is_node_failure
+
+def test_connection_failures_are_node_failures():
+	assert NodeSelector.is_node_failure(NodeException('connection failed'))
+	assert NodeSelector.is_node_failure(CorruptDataException('corrupt'))
+
+
+def test_throttling_and_server_errors_are_node_failures():
+	for status_code in (408, 429, 500, 502, 503, 504):
+		assert NodeSelector.is_node_failure(HttpException('failed', status_code)), status_code
+
+
+def test_client_errors_are_not_node_failures():
+	for status_code in (400, 401, 403, 404, 409):
+		assert not NodeSelector.is_node_failure(HttpException('failed', status_code)), status_code
+
+
+def test_other_exceptions_are_not_node_failures():
+	assert not NodeSelector.is_node_failure(ValueError('bad value'))
+
+# endregion
@@ -0,0 +1,225 @@
+import json
+
+import pytest
+
+from symbollightapi.connector.RequestMetrics import RequestMetrics, ResponseSample, make_path_template
+from symbollightapi.model.Exceptions import HttpException, NodeException
+
+# pylint: disable=invalid-name
+
+
+ENDPOINT = 'http://localhost:3000'
+
+
+def _create_response_sample(byte_count, decode_seconds):
+	response_sample = ResponseSample()
+	response_sample.byte_count = byte_count
+	response_sample.decode_seconds = decode_seconds
+	return response_sample
+
+
+def _create_metrics_with_requests():
+	metrics = RequestMetrics(latency_buckets_seconds=(0.1, 1))
+	metrics.record_request(ENDPOINT, 'GET /chain/info', 0.05, _create_response_sample(100, 0.001))
+	metrics.record_request(ENDPOINT, 'GET /chain/info', 0.5, _create_response_sample(120, 0.002))
+	metrics.record_request(ENDPOINT, 'GET /chain/info', 2, None, NodeException('connection failed'))
+	metrics.record_request('peer "a":7900', 'PACKET PEERS', 0.1, _create_response_sample(8, 0.004))
+	return metrics
+
+
+# region make_path_template
+
+def test_path_template_preserves_path_without_identifiers():
+	assert 'chain/info' == make_path_template('chain/info')
+	assert 'transactionStatus' == make_path_template('transactionStatus')
+
+
+def test_path_template_replaces_numeric_segments():
+	assert 'blocks/{id}' == make_path_template('blocks/1234')
+
+
+def test_path_template_replaces_hash_and_key_segments():
+	assert 'transactions/confirmed/{id}' == make_path_template(
+		'transactions/confirmed/57F7DA205008026C776CB6AED843393F04CD458E0AA2D9F1D5F31A402072B2D6')
+	assert 'accounts/{id}' == make_path_template('accounts/D8F4FE47F1F5B1046748067E52725AEBAA1ED9F3CE45D02054011A39671DD9AA')
+
+
+def test_path_template_replaces_address_segments():
+	assert 'accounts/{id}' == make_path_template('accounts/TBLTMPKCXA7SKRQBI2YFTOGBV3JUMQ3EKB4HSMA')
+	assert 'accounts/{id}' == make_path_template('accounts/TALICEROONSJCPHC63F52V6FY3SDMSVAEUGHMB7C')
+
+
+def test_path_template_strips_query_string():
+	assert 'transactions/confirmed' == make_path_template('transactions/confirmed?recipientAddress=TBLTMPKC&pageSize=100')
+
+# endregion
+
+
+# region record_request
+
+def test_can_create_metrics_with_default_settings():
+	# Act:
+	metrics = RequestMetrics()
+
+	# Assert:
+	assert (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10) == metrics.latency_buckets_seconds
+	assert metrics.request_statistics(ENDPOINT, 'GET /chain/info') is None
+	assert {'requests': [], 'operations': []} == metrics.snapshot()
+
+
+def test_can_record_requests():
+	# Act:
+	metrics = _create_metrics_with_requests()
+
+	# Assert:
+	statistics = metrics.request_statistics(ENDPOINT, 'GET /chain/info')
+	assert 3 == statistics.request_count
+	assert [1, 1] == statistics.latency_bucket_counts
+	assert pytest.approx(2.55) == statistics.latency_seconds
+	assert 220 == statistics.response_byte_count
+	assert pytest.approx(0.003) == statistics.decode_seconds
+	assert {'NodeException': 1} == statistics.error_counts
+
+
+def test_requests_are_recorded_per_endpoint_and_operation():
+	# Act:
+	metrics = _create_metrics_with_requests()
+
+	# Assert:
+	assert metrics.request_statistics(ENDPOINT, 'PACKET PEERS') is None
+	assert 1 == metrics.request_statistics('peer "a":7900', 'PACKET PEERS').request_count
+
+
+def test_latency_buckets_include_upper_bound():
+	# Arrange:
+	metrics = RequestMetrics(latency_buckets_seconds=(1, 0.1))
+
+	# Act:
+	for latency_seconds in (0.1, 0.10001, 1, 1.5):
+		metrics.record_request(ENDPOINT, 'GET /chain/info', latency_seconds)
+
+	# Assert:
+	assert (0.1, 1) == metrics.latency_buckets_seconds
+	assert [1, 2] == metrics.request_statistics(ENDPOINT, 'GET /chain/info').latency_bucket_counts
+
+
+def test_errors_are_counted_by_exception_type():
+	# Arrange:
+	metrics = RequestMetrics()
+
+	# Act:
+	for exception in (NodeException('failed'), HttpException('failed', 500), HttpException('failed', 429)):
+		metrics.record_request(ENDPOINT, 'GET /chain/info', 0.1, None, exception)
+
+	# Assert:
+	assert {'NodeException': 1, 'HttpException': 2} == metrics.request_statistics(ENDPOINT, 'GET /chain/info').error_counts
+
+# endregion
+
+
+# region record_operation
+
+def test_can_record_operations():
+	# Arrange:
+	metrics = RequestMetrics()
+
+	# Act:
+	metrics.record_operation('resolve_confirmed_transactions', 4, 0.5)
+	metrics.record_operation('resolve_confirmed_transactions', 2, 0.25)
+	metrics.record_operation('query_block_timestamps', 10, 1)
+
+	# Assert:
+	statistics = metrics.operation_statistics('resolve_confirmed_transactions')
+	assert 2 == statistics.call_count
+	assert 6 == statistics.fan_out
+	assert 4 == statistics.max_fan_out
+	assert 0.75 == statistics.wall_seconds
+
+	assert 1 == metrics.operation_statistics('query_block_timestamps').call_count
+	assert metrics.operation_statistics('filter_finalized_transactions') is None
+
+# endregion
+
+
+# region snapshot
+
+def test_can_create_snapshot():
+	# Arrange:
+	metrics = _create_metrics_with_requests()
+	metrics.record_operation('query_block_timestamps', 10, 1)
+
+	# Act:
+	snapshot = json.loads(metrics.to_json())
+
+	# Assert:
+	assert 2 == len(snapshot['requests'])
+	assert {
+		'endpoint': 'peer "a":7900',
+		'operation': 'PACKET PEERS',
+		'request_count': 1,
+		'latency_seconds': 0.1,
+		'latency_buckets': {'0.1': 1, '1': 1, '+Inf': 1},
+		'response_byte_count': 8,
+		'decode_seconds': 0.004,
+		'error_counts': {}
+	} == snapshot['requests'][1]
+	assert {'0.1': 1, '1': 2, '+Inf': 3} == snapshot['requests'][0]['latency_buckets']
+	assert {'NodeException': 1} == snapshot['requests'][0]['error_counts']
+	assert [
+		{'name': 'query_block_timestamps', 'call_count': 1, 'fan_out': 10, 'max_fan_out': 10, 'wall_seconds': 1}
+	] == snapshot['operations']
+
+# endregion
+
+
+# region to_prometheus_text
+
+def test_can_format_empty_metrics_as_prometheus_text():
+	# Act:
+	text = RequestMetrics().to_prometheus_text()
+
+	# Assert: only headers are present
+	lines = text.splitlines()
+	assert 16 == len(lines)
+	assert all(line.startswith('# ') for line in lines)
+	assert '# TYPE lightapi_request_latency_seconds histogram' in lines
+
+
+def test_can_format_metrics_as_prometheus_text():
+	# Arrange:
+	metrics = _create_metrics_with_requests()
+	metrics.record_operation('query_block_timestamps', 10, 1)
+
+	# Act:
+	text = metrics.to_prometheus_text('bridge')
+
+	# Assert:
+	assert text.endswith('\n')
+	samples = [line for line in text.splitlines() if not line.startswith('#')]
+
+	labels = 'endpoint="http://localhost:3000",operation="GET /chain/info"'
+	peer_labels = 'endpoint="peer \\"a\\":7900",operation="PACKET PEERS"'
+	assert [
+		f'bridge_requests_total{{{labels}}} 3',
+		f'bridge_requests_total{{{peer_labels}}} 1',
+		f'bridge_request_latency_seconds_bucket{{{labels},le="0.1"}} 1',
+		f'bridge_request_latency_seconds_bucket{{{labels},le="1"}} 2',
+		f'bridge_request_latency_seconds_bucket{{{labels},le="+Inf"}} 3',
+		f'bridge_request_latency_seconds_sum{{{labels}}} 2.55',
+		f'bridge_request_latency_seconds_count{{{labels}}} 3',
+		f'bridge_request_latency_seconds_bucket{{{peer_labels},le="0.1"}} 1',
+		f'bridge_request_latency_seconds_bucket{{{peer_labels},le="1"}} 1',
+		f'bridge_request_latency_seconds_bucket{{{peer_labels},le="+Inf"}} 1',
+		f'bridge_request_latency_seconds_sum{{{peer_labels}}} 0.1',
+		f'bridge_request_latency_seconds_count{{{peer_labels}}} 1',
+		f'bridge_response_bytes_total{{{labels}}} 220',
+		f'bridge_response_bytes_total{{{peer_labels}}} 8',
+		f'bridge_response_decode_seconds_total{{{labels}}} 0.003',
+		f'bridge_response_decode_seconds_total{{{peer_labels}}} 0.004',
+		f'bridge_request_errors_total{{{labels},exception="NodeException"}} 1',
+		'bridge_operations_total{operation="query_block_timestamps"} 1',
+		'bridge_operation_fan_out_total{operation="query_block_timestamps"} 10',
+		'bridge_operation_wall_seconds_total{operation="query_block_timestamps"} 1'
+	] == samples
+
+# endregion
@@ -0,0 +1,268 @@
+import time
+
+import pytest
+
+from symbollightapi.connector.ResponseCache import CachePolicy, ResponseCache
+
+# pylint: disable=invalid-name
+
+
+# region CachePolicy
+
+def test_can_create_immutable_policy():
+	# Act:
+	cache_policy = CachePolicy.immutable()
+
+	# Assert:
+	assert cache_policy.is_immutable
+	assert cache_policy.response_height({'height': '123'}) is None
+
+
+def test_can_create_immutable_policy_with_height():
+	# Act:
+	cache_policy = CachePolicy.immutable(123)
+
+	# Assert:
+	assert cache_policy.is_immutable
+	assert 123 == cache_policy.response_height({'height': '456'})
+
+
+def test_can_create_immutable_policy_with_height_extracted_from_response():
+	# Act:
+	cache_policy = CachePolicy.immutable(height_of=lambda response: response['meta']['height'])
+
+	# Assert:
+	assert cache_policy.is_immutable
+	assert 456 == cache_policy.response_height({'meta': {'height': '456'}})
+
+	for response in ({'code': 'ResourceNotFound'}, {'meta': None}):
+		with pytest.raises(ValueError):
+			cache_policy.response_height(response)
+
+
+def test_can_create_time_to_live_policy():
+	# Act:
+	cache_policy = CachePolicy.time_to_live(5)
+	default_cache_policy = CachePolicy.time_to_live()
+
+	# Assert:
+	assert not cache_policy.is_immutable
+	assert 5 == cache_policy.ttl_seconds
+	assert 60 == default_cache_policy.ttl_seconds
+	assert cache_policy.response_height({'height': '123'}) is None
+
+# endregion
+
+
+# region constructor
+
+def test_can_create_cache_with_default_settings():
+	# Act:
+	with ResponseCache('symbol:testnet') as cache:
+		# Assert:
+		assert 'symbol:testnet' == cache.network_name
+		assert 10000 == cache.max_size
+		assert 10 == cache.finalized_height_refresh_seconds
+		assert 0 == len(cache)
+		assert {
+			'size': 0,
+			'hit_count': 0,
+			'miss_count': 0,
+			'unfinalized_count': 0,
+			'eviction_count': 0,
+			'finalized_chain_height': 0
+		} == cache.statistics()
+
+# endregion
+
+
+# region lookup / add
+
+def test_lookup_misses_when_not_cached():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		# Act:
+		result = cache.lookup('key')
+
+		# Assert:
+		assert (False, None) == result
+		assert 1 == cache.miss_count
+
+
+def test_can_add_and_lookup_immutable_response():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		# Act:
+		is_added = cache.add('key', {'name': 'alpha'}, CachePolicy.immutable())
+		result = cache.lookup('key')
+
+		# Assert:
+		assert is_added
+		assert (True, {'name': 'alpha'}) == result
+		assert 1 == cache.hit_count
+		assert 0 == cache.miss_count
+
+
+def test_lookup_returns_independent_copies():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		cache.add('key', {'names': ['alpha']}, CachePolicy.immutable())
+
+		# Act:
+		(_, response1) = cache.lookup('key')
+		response1['names'].append('beta')
+		(_, response2) = cache.lookup('key')
+
+		# Assert:
+		assert {'names': ['alpha']} == response2
+
+
+def test_can_add_response_at_finalized_height():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		cache.update_finalized_chain_height(100)
+
+		# Act:
+		is_added = cache.add('key', {'height': 100}, CachePolicy.immutable(100), 100)
+
+		# Assert:
+		assert is_added
+		assert (True, {'height': 100}) == cache.lookup('key')
+
+
+def test_cannot_add_response_above_finalized_height():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		cache.update_finalized_chain_height(100)
+
+		# Act:
+		is_added = cache.add('key', {'height': 101}, CachePolicy.immutable(101), 101)
+
+		# Assert:
+		assert not is_added
+		assert 1 == cache.unfinalized_count
+		assert (False, None) == cache.lookup('key')
+
+
+def test_time_to_live_response_expires():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		cache.add('key', {'supply': 100}, CachePolicy.time_to_live(0.05))
+
+		# Act:
+		result1 = cache.lookup('key')
+		time.sleep(0.06)
+		result2 = cache.lookup('key')
+
+		# Assert:
+		assert (True, {'supply': 100}) == result1
+		assert (False, None) == result2
+		assert 0 == len(cache)
+
+
+def test_least_recently_used_responses_are_evicted():
+	# Arrange:
+	with ResponseCache('symbol:testnet', 2) as cache:
+		cache.add('key1', 1, CachePolicy.immutable())
+		cache.add('key2', 2, CachePolicy.immutable())
+		cache.lookup('key1')
+
+		# Act:
+		cache.add('key3', 3, CachePolicy.immutable())
+
+		# Assert:
+		assert 2 == len(cache)
+		assert 1 == cache.eviction_count
+		assert (True, 1) == cache.lookup('key1')
+		assert (False, None) == cache.lookup('key2')
+		assert (True, 3) == cache.lookup('key3')
+
+# endregion
+
+
+# region finalized chain height
+
+def test_finalized_chain_height_never_decreases():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		# Act:
+		cache.update_finalized_chain_height(100)
+		cache.update_finalized_chain_height(90)
+
+		# Assert:
+		assert 100 == cache.finalized_chain_height
+
+
+def test_finalized_height_is_stale_only_for_higher_heights_before_first_update():
+	# Arrange:
+	with ResponseCache('symbol:testnet') as cache:
+		# Act + Assert:
+		assert not cache.is_finalized_height_stale(0)
+		assert cache.is_finalized_height_stale(1)
+
+
+def test_finalized_height_is_not_stale_within_refresh_interval():
+	# Arrange:
+	with ResponseCache('symbol:testnet', finalized_height_refresh_seconds=0.05) as cache:
+		cache.update_finalized_chain_height(100)
+
+		# Act + Assert:
+		assert not cache.is_finalized_height_stale(100)
+		assert not cache.is_finalized_height_stale(101)
+
+		time.sleep(0.06)
+		assert not cache.is_finalized_height_stale(100)
+		assert cache.is_finalized_height_stale(101)
+
+# endregion
+
+
+# region on disk
+
+def test_immutable_responses_are_persisted_across_instances(tmp_path):
+	# Arrange:
+	database_filepath = tmp_path / 'cache.db'
+	with ResponseCache('symbol:testnet', database_filepath=database_filepath) as cache:
+		cache.add('key1', {'name': 'alpha'}, CachePolicy.immutable())
+		cache.add('key2', {'supply': 100}, CachePolicy.time_to_live())
+
+	# Act:
+	with ResponseCache('symbol:testnet', database_filepath=database_filepath) as cache:
+		result1 = cache.lookup('key1')
+		result2 = cache.lookup('key2')
+
+		# Assert: only immutable responses are persisted
+		assert (True, {'name': 'alpha'}) == result1
+		assert (False, None) == result2
+		assert 1 == len(cache)
+
+
+def test_persisted_responses_are_isolated_by_network(tmp_path):
+	# Arrange:
+	database_filepath = tmp_path / 'cache.db'
+	with ResponseCache('symbol:testnet', database_filepath=database_filepath) as cache:
+		cache.add('key', {'name': 'alpha'}, CachePolicy.immutable())
+
+	# Act:
+	with ResponseCache('symbol:mainnet', database_filepath=database_filepath) as cache:
+		result = cache.lookup('key')
+
+		# Assert:
+		assert (False, None) == result
+
+
+def test_evicted_responses_are_read_from_disk(tmp_path):
+	# Arrange:
+	with ResponseCache('symbol:testnet', 1, tmp_path / 'cache.db') as cache:
+		cache.add('key1', 1, CachePolicy.immutable())
+		cache.add('key2', 2, CachePolicy.immutable())
+
+		# Act:
+		result = cache.lookup('key1')
+
+		# Assert: response read from disk evicts key2 from memory
+		assert (True, 1) == result
+		assert 2 == cache.eviction_count
+		assert 1 == cache.hit_count
+
+# endregion
@@ -6,6 +6,7 @@ from aiohttp import web
 from symbolchain.CryptoTypes import Hash256, PublicKey
 from symbolchain.symbol.Network import Address
 
+from symbollightapi.connector.ResponseCache import ResponseCache
 from symbollightapi.connector.SymbolConnector import SymbolConnector
 from symbollightapi.model.Constants import TimeoutSettings, TransactionStatus
 from symbollightapi.model.Endpoint import Endpoint
@@ -423,6 +424,20 @@ async def test_can_get_block_headers(server):  # pylint: disable=redefined-outer
 		}
 	} == headers
 
+
+async def test_can_get_finalized_block_headers_from_response_cache(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = SymbolConnector(server.make_url(''))
+	connector.response_cache = ResponseCache('symbol:testnet')
+
+	# Act:
+	headers = [await connector.block_headers(1001) for _ in range(3)]
+
+	# Assert: finalized height (1198) is queried once
+	assert [f'{server.make_url("")}/blocks/1001', f'{server.make_url("")}/chain/info'] == server.mock.urls
+	assert all(headers[0] == block_headers for block_headers in headers[1:])
+	assert 2 == connector.response_cache.hit_count
+
 # endregion
 
 
@@ -729,10 +744,24 @@ async def test_transaction_confirmed(server):  # pylint: disable=redefined-outer
 	assert [f'{server.make_url("")}/transactions/confirmed/{HASHES[0]}'] == server.mock.urls
 	assert {'meta': {'height': 1234}, 'transaction': {'message': 'foo'}} == transaction
 
+
+async def test_unfinalized_transaction_confirmed_is_not_cached(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = SymbolConnector(server.make_url(''))
+	connector.response_cache = ResponseCache('symbol:testnet')
+
+	# Act:
+	for _ in range(2):
+		await connector.transaction_confirmed(Hash256(HASHES[0]))
+
+	# Assert: transaction height (1234) is above finalized height (1198)
+	assert 2 == server.mock.urls.count(f'{server.make_url("")}/transactions/confirmed/{HASHES[0]}')
+	assert 2 == connector.response_cache.unfinalized_count
+
 # endregion
 
 
-# region GET (incoming_transactions)
+# region GET (incoming_transactions, incoming_transactions_in_range)
 
 def assert_message(message, transaction):
 	assert hexlify(message.encode('utf8')).decode('utf8') == transaction['transaction']['message']
@@ -756,6 +785,40 @@ async def test_incoming_transactions(server):  # pylint: disable=redefined-outer
 	assert_message('gamma', transactions[2])
 	assert_message('sigma', transactions[3])
 
+
+async def test_incoming_transactions_in_range(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = SymbolConnector(server.make_url(''))
+
+	# Act:
+	transactions = await connector.incoming_transactions_in_range(Address(SYMBOL_ADDRESSES[0]), 1000, 2000)
+
+	# Assert:
+	assert [
+		''.join([
+			f'{server.make_url("")}/transactions/confirmed?recipientAddress={Address(SYMBOL_ADDRESSES[0])}',
+			'&fromHeight=1000&toHeight=1999&embedded=true&pageSize=100&order=desc'
+		])
+	] == server.mock.urls
+	assert 4 == len(transactions)
+
+
+async def test_incoming_transactions_in_range_with_start_id(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = SymbolConnector(server.make_url(''))
+
+	# Act:
+	transactions = await connector.incoming_transactions_in_range(Address(SYMBOL_ADDRESSES[0]), 1000, 2000, 'abc')
+
+	# Assert:
+	assert [
+		''.join([
+			f'{server.make_url("")}/transactions/confirmed?recipientAddress={Address(SYMBOL_ADDRESSES[0])}',
+			'&fromHeight=1000&toHeight=1999&embedded=true&pageSize=100&order=desc&offset=abc'
+		])
+	] == server.mock.urls
+	assert 4 == len(transactions)
+
 # endregion
 
 
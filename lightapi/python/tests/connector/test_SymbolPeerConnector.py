@@ -1,19 +1,20 @@
 import asyncio
-import ssl
 from binascii import unhexlify
-from pathlib import Path
 
 import pytest
 from symbolchain.BufferWriter import BufferWriter
 from symbolchain.CryptoTypes import Hash256, PublicKey
 from symbolchain.symbol.Network import NetworkTimestamp
 
+from symbollightapi.connector.RequestMetrics import RequestMetrics
 from symbollightapi.connector.SymbolPeerConnector import SymbolPeerConnector
 from symbollightapi.model.Endpoint import Endpoint
 from symbollightapi.model.Exceptions import NodeException
 from symbollightapi.model.NodeInfo import NodeInfo
 from symbollightapi.model.PacketHeader import PacketHeader, PacketType
 
+from ..test.PeerTestUtils import load_server_ssl_context, locate_certificate_directory, serialize_node_info
+
 # region test data
 
 
@@ -52,95 +53,76 @@ NODE_INFO_3 = NodeInfo(
 # endregion
 
 
-# region ssl helpers
-
-def locate_certificate_directory(cert_id):
-	return Path(f'tests/resources/cert{cert_id}').absolute()
-
-
-def load_server_ssl_context(cert_id):
-	certificate_directory = locate_certificate_directory(cert_id)
-
-	ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-	ssl_context.check_hostname = False
-	ssl_context.verify_mode = ssl.CERT_NONE
-	ssl_context.load_cert_chain(
-		certificate_directory / 'node.full.crt.pem',
-		keyfile=certificate_directory / 'node.key.pem')
-	return ssl_context
-
-# endregion
-
-
 # region server fixture
 
 @pytest.fixture
 async def server():  # pylint: disable=too-many-statements
-	def serialize_node_info(writer, node_info):
-		writer.write_int(81 + len(node_info.endpoint.host) + len(node_info.name), 4)
-		writer.write_int(node_info.version, 4)
-		writer.write_bytes(node_info.main_public_key.bytes)
-		writer.write_bytes(node_info.network_generation_hash_seed.bytes)
-		writer.write_int(node_info.roles, 4)
-		writer.write_int(node_info.endpoint.port, 2)
-		writer.write_int(node_info.network_identifier, 1)
-		writer.write_int(len(node_info.endpoint.host), 1)
-		writer.write_int(len(node_info.name), 1)
-		writer.write_bytes(node_info.endpoint.host.encode('utf8'))
-		writer.write_bytes(node_info.name.encode('utf8'))
-
-	async def handle_packet(reader, writer):
+	async def handle_connection(reader, writer):
+		server.connection_count += 1
 		try:
-			header = await reader.readexactly(8)
-			packet_header = PacketHeader.deserialize_from_buffer(header)
-
-			if server.simulate_long_operation:
-				server.sleep_task = asyncio.create_task(asyncio.sleep(0.25))
-				await server.sleep_task
-
-			response_header = PacketHeader()
-			response_buffer_writer = BufferWriter()
-			if PacketType.CHAIN_STATISTICS == packet_header.packet_type:
-				response_header = PacketHeader(40, PacketType.CHAIN_STATISTICS)
-
-				response_buffer_writer.write_int(1234, 8)
-				response_buffer_writer.write_int(0, 8)
-				response_buffer_writer.write_int(888999, 8)
-				response_buffer_writer.write_int(111222, 8)
-			elif PacketType.FINALIZATION_STATISTICS == packet_header.packet_type:
-				response_header = PacketHeader(56, PacketType.FINALIZATION_STATISTICS)
-
-				response_buffer_writer.write_int(222, 4)
-				response_buffer_writer.write_int(10, 4)
-				response_buffer_writer.write_int(1198, 8)
-				response_buffer_writer.write_bytes(unhexlify('C49C566E4CF60856BC127C9E4748C89E3D38566DE0DAFE1A491012CC27A1C043'))
-			elif PacketType.NETWORK_TIME == packet_header.packet_type:
-				response_header = PacketHeader(24, PacketType.NETWORK_TIME)
-
-				response_buffer_writer.write_int(123456789, 8)
-				response_buffer_writer.write_int(123457890, 8)
-			elif PacketType.NODE_INFORMATION == packet_header.packet_type:
-				serialize_node_info(response_buffer_writer, NODE_INFO_1)
-				response_header = PacketHeader(8 + len(response_buffer_writer.buffer), PacketType.NODE_INFORMATION)
-			elif PacketType.PEERS == packet_header.packet_type:
-				serialize_node_info(response_buffer_writer, NODE_INFO_2)
-				serialize_node_info(response_buffer_writer, NODE_INFO_3)
-				response_header = PacketHeader(8 + len(response_buffer_writer.buffer), PacketType.PEERS)
-
-			if server.simulate_corrupt_packet_type:
-				response_header = PacketHeader(response_header.size, PacketType.UNDEFINED)
-
-			if server.simulate_corrupt_packet:
-				response_buffer_writer.buffer = response_buffer_writer.buffer[:-2]
-
-			writer.write(response_header.serialize())
-			writer.write(response_buffer_writer.buffer)
-			await writer.drain()
+			while True:
+				await handle_packet(reader, writer)
+				server.packet_count += 1
+				if not server.keep_alive or server.packet_count in server.close_after_packet_counts:
+					break
+		except asyncio.exceptions.IncompleteReadError:
+			pass  # client closed connection
 		finally:
 			writer.close()
 
+	async def handle_packet(reader, writer):
+		header = await reader.readexactly(8)
+		packet_header = PacketHeader.deserialize_from_buffer(header)
+
+		if server.simulate_long_operation:
+			server.sleep_task = asyncio.create_task(asyncio.sleep(0.25))
+			await server.sleep_task
+
+		response_header = PacketHeader()
+		response_buffer_writer = BufferWriter()
+		if PacketType.CHAIN_STATISTICS == packet_header.packet_type:
+			response_header = PacketHeader(40, PacketType.CHAIN_STATISTICS)
+
+			response_buffer_writer.write_int(1234, 8)
+			response_buffer_writer.write_int(0, 8)
+			response_buffer_writer.write_int(888999, 8)
+			response_buffer_writer.write_int(111222, 8)
+		elif PacketType.FINALIZATION_STATISTICS == packet_header.packet_type:
+			response_header = PacketHeader(56, PacketType.FINALIZATION_STATISTICS)
+
+			response_buffer_writer.write_int(222, 4)
+			response_buffer_writer.write_int(10, 4)
+			response_buffer_writer.write_int(1198, 8)
+			response_buffer_writer.write_bytes(unhexlify('C49C566E4CF60856BC127C9E4748C89E3D38566DE0DAFE1A491012CC27A1C043'))
+		elif PacketType.NETWORK_TIME == packet_header.packet_type:
+			response_header = PacketHeader(24, PacketType.NETWORK_TIME)
+
+			response_buffer_writer.write_int(123456789, 8)
+			response_buffer_writer.write_int(123457890, 8)
+		elif PacketType.NODE_INFORMATION == packet_header.packet_type:
+			serialize_node_info(response_buffer_writer, NODE_INFO_1)
+			response_header = PacketHeader(8 + len(response_buffer_writer.buffer), PacketType.NODE_INFORMATION)
+		elif PacketType.PEERS == packet_header.packet_type:
+			serialize_node_info(response_buffer_writer, NODE_INFO_2)
+			serialize_node_info(response_buffer_writer, NODE_INFO_3)
+			response_header = PacketHeader(8 + len(response_buffer_writer.buffer), PacketType.PEERS)
+
+		if server.simulate_corrupt_packet_type:
+			response_header = PacketHeader(response_header.size, PacketType.UNDEFINED)
+
+		if server.simulate_corrupt_packet:
+			response_buffer_writer.buffer = response_buffer_writer.buffer[:-2]
+
+		writer.write(response_header.serialize())
+		writer.write(response_buffer_writer.buffer)
+		await writer.drain()
+
 	server_ssl_context = load_server_ssl_context(1)
-	server = await asyncio.start_server(handle_packet, '127.0.0.1', 8888, ssl=server_ssl_context)  # pylint: disable=redefined-outer-name
+	server = await asyncio.start_server(handle_connection, '127.0.0.1', 8888, ssl=server_ssl_context)  # pylint: disable=redefined-outer-name
+	server.keep_alive = False
+	server.close_after_packet_counts = []
+	server.connection_count = 0
+	server.packet_count = 0
 	server.simulate_long_operation = False
 	server.simulate_corrupt_packet = False
 	server.simulate_corrupt_packet_type = False
@@ -292,3 +274,217 @@ async def test_can_query_peers(server):  # pylint: disable=redefined-outer-name
 	assert [NODE_INFO_2, NODE_INFO_3] == peers
 
 # endregion
+
+
+# region kept alive connection
+
+def _create_kept_alive_connector(server, keep_alive_seconds=5):  # pylint: disable=redefined-outer-name
+	server.keep_alive = True
+
+	connector = SymbolPeerConnector(server.host, server.port, locate_certificate_directory(2))
+	connector.keep_alive_seconds = keep_alive_seconds
+	return connector
+
+
+async def test_opens_new_connection_for_each_request_by_default(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.keep_alive = True
+	connector = SymbolPeerConnector(server.host, server.port, locate_certificate_directory(2))
+
+	# Act:
+	for _ in range(3):
+		await connector.chain_height()
+
+	# Assert:
+	assert 3 == server.connection_count
+	assert 3 == connector.handshake_count
+	assert 0 == connector.reused_request_count
+	assert 0 == connector.saved_handshake_seconds
+
+
+async def test_can_send_multiple_requests_over_kept_alive_connection(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _create_kept_alive_connector(server) as connector:
+		# Act:
+		chain_statistics = await connector.chain_statistics()
+		finalization_statistics = await connector.finalization_statistics()
+		node_info = await connector.node_info()
+		peers = await connector.peers()
+		network_time = await connector.network_time()
+
+	# Assert:
+	assert 1234 == chain_statistics.height
+	assert 1198 == finalization_statistics.height
+	assert NODE_INFO_1 == node_info
+	assert [NODE_INFO_2, NODE_INFO_3] == peers
+	assert NetworkTimestamp(123456789) == network_time
+
+	assert 1 == server.connection_count
+	assert 5 == server.packet_count
+	assert 1 == connector.handshake_count
+	assert 4 == connector.reused_request_count
+	assert 4 * connector.handshake_seconds == pytest.approx(connector.saved_handshake_seconds)
+
+
+async def test_can_reconnect_when_kept_alive_connection_is_closed_by_node(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.close_after_packet_counts = [2]
+
+	async with _create_kept_alive_connector(server) as connector:
+		# Act:
+		heights = [await connector.chain_height() for _ in range(4)]
+
+	# Assert:
+	assert [1234] * 4 == heights
+	assert 2 == server.connection_count
+	assert 2 == connector.handshake_count
+	assert 2 == connector.reused_request_count
+
+
+async def test_can_expire_idle_kept_alive_connection(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _create_kept_alive_connector(server, 0.05) as connector:
+		# Act:
+		await connector.chain_height()
+		await connector.chain_height()
+		await asyncio.sleep(0.1)
+		await connector.chain_height()
+
+	# Assert:
+	assert 2 == server.connection_count
+	assert 2 == connector.handshake_count
+	assert 1 == connector.reused_request_count
+
+
+async def test_can_close_kept_alive_connection(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_kept_alive_connector(server)
+	await connector.chain_height()
+
+	# Act:
+	await connector.close()
+	await connector.chain_height()
+	await connector.close()
+
+	# Assert:
+	assert 2 == server.connection_count
+	assert 0 == connector.reused_request_count
+
+
+async def test_kept_alive_connection_is_closed_after_corrupt_packet(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _create_kept_alive_connector(server) as connector:
+		await connector.chain_height()
+
+		# Act:
+		server.simulate_corrupt_packet_type = True
+		with pytest.raises(NodeException):
+			await connector.chain_height()
+
+		server.simulate_corrupt_packet_type = False
+		height = await connector.chain_height()
+
+	# Assert:
+	assert 1234 == height
+	assert 2 == server.connection_count
+
+
+async def test_kept_alive_connection_can_handle_timeout(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _create_kept_alive_connector(server) as connector:
+		connector.timeout_seconds = 0.1
+		await connector.chain_height()
+
+		# Act + Assert:
+		server.simulate_long_operation = True
+		with pytest.raises(NodeException):
+			await connector.chain_height()
+
+
+async def test_kept_alive_connection_can_handle_stopped_node():
+	# Arrange:
+	connector = SymbolPeerConnector('127.0.0.1', 8888, locate_certificate_directory(2))
+	connector.keep_alive_seconds = 5
+
+	# Act + Assert:
+	with pytest.raises(NodeException):
+		await connector.chain_height()
+
+	assert 0 == connector.handshake_count
+
+# endregion
+
+
+# region metrics
+
+def _create_connector_with_metrics(server):  # pylint: disable=redefined-outer-name
+	connector = SymbolPeerConnector(server.host, server.port, locate_certificate_directory(2))
+	connector.metrics = RequestMetrics()
+	return connector
+
+
+async def test_metrics_are_disabled_by_default(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = SymbolPeerConnector(server.host, server.port, locate_certificate_directory(2))
+
+	# Act:
+	height = await connector.chain_height()
+
+	# Assert:
+	assert connector.metrics is None
+	assert 1234 == height
+
+
+async def test_metrics_record_successful_requests_per_packet_type(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	connector = _create_connector_with_metrics(server)
+
+	# Act:
+	for _ in range(2):
+		await connector.chain_height()
+
+	peers = await connector.peers()
+
+	# Assert:
+	assert [NODE_INFO_2, NODE_INFO_3] == peers
+
+	statistics = connector.metrics.request_statistics('127.0.0.1:8888', 'PACKET CHAIN_STATISTICS')
+	assert 2 == statistics.request_count
+	assert 2 * 40 == statistics.response_byte_count
+	assert 0 < statistics.decode_seconds < statistics.latency_seconds
+	assert {} == statistics.error_counts
+
+	assert 1 == connector.metrics.request_statistics('127.0.0.1:8888', 'PACKET PEERS').request_count
+
+
+async def test_metrics_record_failed_requests_by_exception_type(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.simulate_corrupt_packet = True
+	connector = _create_connector_with_metrics(server)
+
+	# Act:
+	with pytest.raises(NodeException):
+		await connector.chain_height()
+
+	# Assert:
+	statistics = connector.metrics.request_statistics('127.0.0.1:8888', 'PACKET CHAIN_STATISTICS')
+	assert 1 == statistics.request_count
+	assert 0 == statistics.response_byte_count
+	assert {'NodeException': 1} == statistics.error_counts
+
+
+async def test_metrics_record_requests_sent_over_kept_alive_connection(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _create_kept_alive_connector(server) as connector:
+		connector.metrics = RequestMetrics()
+
+		# Act:
+		for _ in range(3):
+			await connector.network_time()
+
+	# Assert:
+	statistics = connector.metrics.request_statistics('127.0.0.1:8888', 'PACKET NETWORK_TIME')
+	assert 3 == statistics.request_count
+	assert 3 * 24 == statistics.response_byte_count
+
+# endregion
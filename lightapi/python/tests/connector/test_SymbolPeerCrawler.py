@@ -0,0 +1,207 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from symbollightapi.connector.CertificateInfoCache import CertificateInfoCache
+from symbollightapi.connector.SymbolPeerCrawler import SymbolPeerCrawler
+from symbollightapi.model.Exceptions import NodeException
+
+from ..test.PeerTestUtils import locate_certificate_directory, start_mock_peer_nodes
+
+# region fixture
+
+
+@pytest.fixture
+async def nodes():
+	mock_nodes = await start_mock_peer_nodes(10, 2)
+	yield mock_nodes
+
+	for node in mock_nodes:
+		await node.stop()
+
+
+def _seed(node):
+	return ('127.0.0.1', node.port)
+
+
+async def _crawl(crawler, seeds):
+	return [result async for result in crawler.crawl(seeds)]
+
+# endregion
+
+# pylint: disable=redefined-outer-name
+
+
+# region crawl
+
+async def test_can_crawl_all_reachable_nodes_breadth_first(nodes):
+	# Arrange:
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), max_concurrency=4)
+
+	# Act:
+	results = await _crawl(crawler, [_seed(nodes[0])])
+
+	# Assert:
+	assert 10 == len(results)
+
+	results = sorted(results, key=lambda result: result.port)
+	for (node, result) in zip(sorted(nodes, key=lambda node: node.port), results):
+		assert node.port == result.port
+		assert (node.index + 1) // 2 == result.depth
+		assert node.node_info.main_public_key == result.node_info.main_public_key
+		assert node.node_info.name == result.node_info.name
+		assert node.chain_height == result.chain_statistics.height
+		assert [peer.node_info.endpoint for peer in node.peers] == [peer.endpoint for peer in result.peers]
+		assert result.node_info.node_public_key is not None
+		assert result.error is None
+
+	# - one connection per node
+	assert [1] * 10 == [node.connection_count for node in nodes]
+
+
+async def test_can_crawl_from_multiple_seeds_without_visiting_nodes_twice(nodes):
+	# Arrange:
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2))
+
+	# Act:
+	results = await _crawl(crawler, [_seed(nodes[0]), _seed(nodes[5]), _seed(nodes[0])])
+
+	# Assert:
+	assert 10 == len(results)
+	assert 10 == len(set(result.port for result in results))
+	assert [0, 0] == sorted(result.depth for result in results)[:2]
+
+
+async def test_can_limit_crawl_depth(nodes):
+	# Arrange:
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), max_depth=1)
+
+	# Act:
+	results = await _crawl(crawler, [_seed(nodes[0])])
+
+	# Assert:
+	assert {nodes[0].port: 0, nodes[1].port: 1, nodes[2].port: 1} == {result.port: result.depth for result in results}
+
+
+async def test_can_limit_crawl_node_count(nodes):
+	# Arrange:
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), max_node_count=4)
+
+	# Act:
+	results = await _crawl(crawler, [_seed(nodes[0])])
+
+	# Assert:
+	assert 4 == len(results)
+
+
+async def test_can_crawl_past_unreachable_nodes(nodes):
+	# Arrange:
+	nodes[1].is_offline = True
+	await nodes[2].stop()
+
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), timeout_seconds=1)
+
+	# Act:
+	results = await _crawl(crawler, [_seed(nodes[0])])
+
+	# Assert: nodes 1 and 2 are unreachable, so nodes 3+ are never discovered
+	port_to_result = {result.port: result for result in results}
+	assert 3 == len(results)
+	assert port_to_result[nodes[0].port].error is None
+
+	for node in nodes[1:3]:
+		result = port_to_result[node.port]
+		assert isinstance(result.error, NodeException)
+		assert result.node_info is None
+		assert result.chain_statistics is None
+		assert [] == result.peers
+
+
+async def test_can_crawl_past_nodes_with_malformed_responses(nodes):
+	# Arrange:
+	nodes[1].is_node_name_corrupt = True
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), max_depth=1)
+
+	# Act:
+	results = await _crawl(crawler, [_seed(nodes[0])])
+
+	# Assert:
+	port_to_result = {result.port: result for result in results}
+	assert 3 == len(results)
+	assert port_to_result[nodes[0].port].error is None
+	assert port_to_result[nodes[2].port].error is None
+
+	result = port_to_result[nodes[1].port]
+	assert isinstance(result.error, UnicodeDecodeError)
+	assert result.node_info is None
+	assert [] == result.peers
+
+
+async def test_crawl_fails_when_certificate_directory_is_invalid(nodes):
+	# Arrange:
+	crawler = SymbolPeerCrawler(Path('missing_certificate_directory'), max_concurrency=2)
+
+	# Act + Assert:
+	with pytest.raises(FileNotFoundError):
+		await asyncio.wait_for(_crawl(crawler, [_seed(node) for node in nodes[:3]]), 5)
+
+
+async def test_crawl_fails_when_worker_fails(nodes):
+	# Arrange:
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), max_concurrency=2)
+
+	async def crawl_node_failure(*_args):
+		raise RuntimeError('unexpected worker failure')
+
+	crawler._crawl_node = crawl_node_failure  # pylint: disable=protected-access
+
+	# Act + Assert: crawl is aborted instead of waiting forever for the unprocessed endpoint
+	with pytest.raises(RuntimeError, match='unexpected worker failure'):
+		await asyncio.wait_for(_crawl(crawler, [_seed(node) for node in nodes[:3]]), 5)
+
+
+async def test_can_stop_consuming_results_early(nodes):
+	# Arrange:
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), max_concurrency=2)
+
+	# Act:
+	results = []
+	async for result in crawler.crawl([_seed(nodes[0])]):
+		results.append(result)
+		if 2 == len(results):
+			break
+
+	# Assert:
+	assert 2 == len(results)
+
+
+async def test_can_crawl_zero_seeds():
+	# Arrange:
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2))
+
+	# Act:
+	results = await _crawl(crawler, [])
+
+	# Assert:
+	assert [] == results
+
+# endregion
+
+
+# region certificate info cache
+
+async def test_certificates_are_parsed_once_across_nodes(nodes):
+	# Arrange: all nodes share the same certificate chain
+	certificate_info_cache = CertificateInfoCache()
+	crawler = SymbolPeerCrawler(locate_certificate_directory(2), certificate_info_cache=certificate_info_cache)
+
+	# Act:
+	results = await _crawl(crawler, [_seed(nodes[0])])
+
+	# Assert:
+	assert 10 == len(results)
+	assert 3 == certificate_info_cache.miss_count  # verify root, parse root, parse node
+	assert 27 == certificate_info_cache.hit_count
+
+# endregion
@@ -0,0 +1,366 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from symbolchain.CryptoTypes import Hash256
+
+from symbollightapi.connector.SymbolConnector import SymbolConnector
+from symbollightapi.connector.SymbolTransactionListener import SymbolTransactionListener
+from symbollightapi.model.Constants import TimeoutSettings, TransactionStatus
+from symbollightapi.model.Exceptions import InsufficientBalanceException, NodeException
+
+from ..test.LightApiTestUtils import HASHES, SYMBOL_ADDRESSES
+
+# region server fixture
+
+
+@pytest.fixture
+async def server(aiohttp_client):
+	class MockSymbolServer:
+		def __init__(self):
+			self.websockets = []
+			self.subscribe_messages = []
+			self.status_request_count = 0
+			self.hash_to_status_group = {}
+			self.simulate_missing_uid = False
+
+		async def websocket(self, request):
+			websocket = web.WebSocketResponse()
+			await websocket.prepare(request)
+			self.websockets.append(websocket)
+
+			await websocket.send_json({} if self.simulate_missing_uid else {'uid': 'test_uid'})
+			async for message in websocket:
+				self.subscribe_messages.append(message.json())
+
+			return websocket
+
+		async def transaction_status(self, request):
+			self.status_request_count += 1
+			transaction_hash = request.match_info['transaction_hash']
+			if transaction_hash not in self.hash_to_status_group:
+				return web.json_response({'code': 'ResourceNotFound', 'message': 'no resource exists'}, status=404)
+
+			return web.json_response({'group': self.hash_to_status_group[transaction_hash], 'code': 'Success'})
+
+		async def wait_for_subscriptions(self, count):
+			while len(self.subscribe_messages) < count:
+				await asyncio.sleep(0.001)
+
+		async def notify(self, channel, data_json):
+			for websocket in self.websockets:
+				await websocket.send_json({'topic': f'{channel}/{SYMBOL_ADDRESSES[0]}', 'data': data_json})
+
+		async def notify_added(self, channel, transaction_hash):
+			await self.notify(channel, {'transaction': {}, 'meta': {'hash': transaction_hash}})
+
+		async def notify_status(self, transaction_hash, code):
+			await self.notify('status', {'hash': transaction_hash, 'code': code, 'deadline': '1'})
+
+		async def drop(self):
+			for websocket in self.websockets:
+				await websocket.close()
+
+	# create a mock server
+	mock_server = MockSymbolServer()
+
+	# create an app using the server
+	app = web.Application()
+	app.router.add_get('/ws', mock_server.websocket)
+	app.router.add_get(r'/transactionStatus/{transaction_hash}', mock_server.transaction_status)
+	server = await aiohttp_client(app)  # pylint: disable=redefined-outer-name
+
+	server.mock = mock_server
+	return server
+
+# endregion
+
+# pylint: disable=invalid-name
+
+
+# region utils
+
+def _create_listener(server):  # pylint: disable=redefined-outer-name
+	return SymbolTransactionListener(SymbolConnector(server.make_url('')), SYMBOL_ADDRESSES[0])
+
+
+@asynccontextmanager
+async def _open_listener(server):  # pylint: disable=redefined-outer-name
+	async with _create_listener(server) as listener:
+		await server.mock.wait_for_subscriptions(3)
+		yield listener
+
+
+async def _start_waits(listener, transaction_hashes, desired_status, timeout_settings=TimeoutSettings(50, 0.1)):
+	tasks = [
+		asyncio.create_task(listener.try_wait_for_announced_transaction(Hash256(transaction_hash), desired_status, timeout_settings))
+		for transaction_hash in transaction_hashes
+	]
+
+	while listener.waiting_count < len(transaction_hashes):
+		await asyncio.sleep(0.001)
+
+	return tasks
+
+# endregion
+
+
+# region open / close
+
+async def test_can_create_listener(server):  # pylint: disable=redefined-outer-name
+	# Act:
+	listener = _create_listener(server)
+
+	# Assert:
+	assert SYMBOL_ADDRESSES[0] == listener.address
+	assert 1000 == listener.recent_notification_count
+	assert not listener.is_connected
+	assert 0 == listener.waiting_count
+	assert 0 == listener.notification_count
+	assert 0 == listener.fallback_count
+
+
+async def test_can_open_listener_and_subscribe_to_account_channels(server):  # pylint: disable=redefined-outer-name
+	# Act:
+	async with _create_listener(server) as listener:
+		await server.mock.wait_for_subscriptions(3)
+
+		# Assert:
+		assert listener.is_connected
+		assert [
+			{'uid': 'test_uid', 'subscribe': f'unconfirmedAdded/{SYMBOL_ADDRESSES[0]}'},
+			{'uid': 'test_uid', 'subscribe': f'confirmedAdded/{SYMBOL_ADDRESSES[0]}'},
+			{'uid': 'test_uid', 'subscribe': f'status/{SYMBOL_ADDRESSES[0]}'}
+		] == server.mock.subscribe_messages
+
+	assert not listener.is_connected
+
+
+async def test_cannot_open_listener_when_node_does_not_send_uid(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.mock.simulate_missing_uid = True
+	listener = _create_listener(server)
+
+	# Act + Assert:
+	with pytest.raises(NodeException):
+		await listener.open()
+
+	assert not listener.is_connected
+
+
+async def test_cannot_open_listener_when_node_is_stopped():
+	# Arrange:
+	listener = SymbolTransactionListener(SymbolConnector('http://localhost:1234'), SYMBOL_ADDRESSES[0])
+
+	# Act + Assert:
+	with pytest.raises(NodeException):
+		await listener.open()
+
+	assert not listener.is_connected
+
+# endregion
+
+
+# region try_wait_for_announced_transaction - notifications
+
+async def test_unconfirmed_wait_completes_on_unconfirmed_added_notification(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		tasks = await _start_waits(listener, HASHES[:1], TransactionStatus.UNCONFIRMED)
+
+		# Act:
+		await server.mock.notify_added('unconfirmedAdded', HASHES[0])
+		results = await asyncio.gather(*tasks)
+
+	# Assert: status was not polled
+	assert [True] == results
+	assert 1 == listener.notification_count
+	assert 0 == server.mock.status_request_count
+
+
+async def test_unconfirmed_wait_completes_on_confirmed_added_notification(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		tasks = await _start_waits(listener, HASHES[:1], TransactionStatus.UNCONFIRMED)
+
+		# Act:
+		await server.mock.notify_added('confirmedAdded', HASHES[0])
+		results = await asyncio.gather(*tasks)
+
+	# Assert:
+	assert [True] == results
+	assert 0 == server.mock.status_request_count
+
+
+async def test_confirmed_wait_does_not_complete_on_unconfirmed_added_notification(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		tasks = await _start_waits(listener, HASHES[:1], TransactionStatus.CONFIRMED)
+
+		# Act:
+		await server.mock.notify_added('unconfirmedAdded', HASHES[0])
+		await asyncio.sleep(0.01)
+		is_done_after_unconfirmed = tasks[0].done()
+
+		await server.mock.notify_added('confirmedAdded', HASHES[0])
+		results = await asyncio.gather(*tasks)
+
+	# Assert:
+	assert not is_done_after_unconfirmed
+	assert [True] == results
+	assert 2 == listener.notification_count
+
+
+async def test_many_waits_are_completed_by_notifications(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		tasks = await _start_waits(listener, HASHES + HASHES[:2], TransactionStatus.UNCONFIRMED)
+
+		# Act:
+		for transaction_hash in reversed(HASHES):
+			await server.mock.notify_added('unconfirmedAdded', transaction_hash)
+
+		results = await asyncio.gather(*tasks)
+
+	# Assert:
+	assert [True] * 7 == results
+	assert 0 == listener.waiting_count
+	assert 0 == server.mock.status_request_count
+
+
+async def test_notifications_for_other_transactions_are_ignored(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		tasks = await _start_waits(listener, HASHES[:1], TransactionStatus.UNCONFIRMED)
+
+		# Act:
+		await server.mock.notify_added('unconfirmedAdded', HASHES[1])
+		await server.mock.notify('unknownChannel', {'meta': {'hash': HASHES[0]}})
+		await asyncio.sleep(0.01)
+		is_done_after_other_notifications = tasks[0].done()
+
+		await server.mock.notify_added('unconfirmedAdded', HASHES[0])
+		await asyncio.gather(*tasks)
+
+	# Assert:
+	assert not is_done_after_other_notifications
+	assert 2 == listener.notification_count
+
+
+async def test_wait_started_after_notification_completes_immediately(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		await server.mock.notify_added('unconfirmedAdded', HASHES[0])
+		while not listener.notification_count:
+			await asyncio.sleep(0.001)
+
+		# Act:
+		result = await listener.try_wait_for_announced_transaction(Hash256(HASHES[0]), TransactionStatus.UNCONFIRMED, TimeoutSettings(5, 1))
+
+	# Assert:
+	assert result
+	assert 0 == server.mock.status_request_count
+
+
+async def test_oldest_notifications_are_forgotten(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	listener = _create_listener(server)
+	listener.recent_notification_count = 2
+	async with listener:
+		await server.mock.wait_for_subscriptions(3)
+		for transaction_hash in HASHES[:3]:
+			await server.mock.notify_added('unconfirmedAdded', transaction_hash)
+
+		while 3 > listener.notification_count:
+			await asyncio.sleep(0.001)
+
+		# Act:
+		results = [
+			await listener.try_wait_for_announced_transaction(Hash256(transaction_hash), TransactionStatus.UNCONFIRMED, TimeoutSettings(1, 0))
+			for transaction_hash in HASHES[:3]
+		]
+
+	# Assert: forgotten notification is polled once
+	assert [False, True, True] == results
+	assert 1 == server.mock.status_request_count
+
+
+async def _assert_wait_fails_on_status_notification(server, code, expected_exception_type):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		tasks = await _start_waits(listener, HASHES[:2], TransactionStatus.UNCONFIRMED)
+
+		# Act:
+		await server.mock.notify_status(HASHES[0], code)
+		await server.mock.notify_added('unconfirmedAdded', HASHES[1])
+		results = await asyncio.gather(*tasks, return_exceptions=True)
+
+	# Assert:
+	assert expected_exception_type is type(results[0])
+	assert f'transaction was rejected with error {code}' == str(results[0])
+	assert results[1]
+
+
+async def test_wait_fails_on_status_notification(server):  # pylint: disable=redefined-outer-name
+	await _assert_wait_fails_on_status_notification(server, 'Failure_Core_Past_Deadline', NodeException)
+
+
+async def test_wait_fails_on_insufficient_balance_status_notification(server):  # pylint: disable=redefined-outer-name
+	await _assert_wait_fails_on_status_notification(server, 'Failure_Core_Insufficient_Balance', InsufficientBalanceException)
+
+# endregion
+
+
+# region try_wait_for_announced_transaction - fallback
+
+async def test_wait_polls_once_when_no_notification_arrives(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.mock.hash_to_status_group[HASHES[0]] = 'unconfirmed'
+
+	async with _open_listener(server) as listener:
+		# Act:
+		result = await listener.try_wait_for_announced_transaction(Hash256(HASHES[0]), TransactionStatus.UNCONFIRMED, TimeoutSettings(2, 0.01))
+
+	# Assert:
+	assert result
+	assert 1 == server.mock.status_request_count
+	assert 0 == listener.fallback_count
+
+
+async def test_wait_polls_when_listener_is_not_connected(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	server.mock.hash_to_status_group[HASHES[0]] = 'unconfirmed'
+	listener = _create_listener(server)
+
+	# Act:
+	result = await listener.try_wait_for_announced_transaction(Hash256(HASHES[0]), TransactionStatus.UNCONFIRMED, TimeoutSettings(2, 0.01))
+
+	# Assert:
+	assert result
+	assert 1 == server.mock.status_request_count
+	assert 1 == listener.fallback_count
+
+
+async def test_waits_fall_back_to_polling_when_websocket_drops(server):  # pylint: disable=redefined-outer-name
+	# Arrange:
+	async with _open_listener(server) as listener:
+		tasks = await _start_waits(listener, HASHES[:2], TransactionStatus.UNCONFIRMED, TimeoutSettings(50, 0.01))
+
+		# Act:
+		server.mock.hash_to_status_group[HASHES[0]] = 'confirmed'
+		await server.mock.drop()
+		results = await asyncio.gather(*tasks)
+
+		# Assert:
+		assert not listener.is_connected
+		assert [True, False] == results
+		assert 2 == listener.fallback_count
+		assert 1 + 10 <= server.mock.status_request_count
+
+		# - subsequent waits poll too
+		result = await listener.try_wait_for_announced_transaction(Hash256(HASHES[0]), TransactionStatus.UNCONFIRMED, TimeoutSettings(1, 0))
+		assert result
+		assert 3 == listener.fallback_count
+
+# endregion
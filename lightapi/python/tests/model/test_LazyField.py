@@ -0,0 +1,89 @@
+import unittest
+
+from symbollightapi.model.LazyField import Encoded, LazyField
+
+
+class CountingDecoder:
+	def __init__(self):
+		self.encoded_values = []
+
+	def __call__(self, encoded_value):
+		self.encoded_values.append(encoded_value)
+		return f'decoded {encoded_value}'
+
+
+DECODER = CountingDecoder()
+
+
+class Model:
+	__slots__ = ('_value',)
+
+	value = LazyField(DECODER)
+
+	def __init__(self, value):
+		self.value = value
+
+
+class LazyFieldTest(unittest.TestCase):
+	def setUp(self):
+		DECODER.encoded_values.clear()
+
+	def test_encoded_value_is_not_decoded_on_assignment(self):
+		# Act:
+		Model(Encoded('alpha'))
+
+		# Assert:
+		self.assertEqual([], DECODER.encoded_values)
+
+	def test_encoded_value_is_decoded_on_first_access(self):
+		# Arrange:
+		model = Model(Encoded('alpha'))
+
+		# Act:
+		value = model.value
+
+		# Assert:
+		self.assertEqual('decoded alpha', value)
+		self.assertEqual(['alpha'], DECODER.encoded_values)
+
+	def test_encoded_value_is_decoded_at_most_once(self):
+		# Arrange:
+		model = Model(Encoded('alpha'))
+
+		# Act:
+		values = [model.value, model.value, model.value]
+
+		# Assert:
+		self.assertEqual(['decoded alpha'] * 3, values)
+		self.assertEqual(['alpha'], DECODER.encoded_values)
+
+	def test_plain_value_is_returned_as_is(self):
+		# Arrange:
+		model = Model('alpha')
+
+		# Act:
+		value = model.value
+
+		# Assert:
+		self.assertEqual('alpha', value)
+		self.assertEqual([], DECODER.encoded_values)
+
+	def test_assignment_replaces_value(self):
+		# Arrange:
+		model = Model(Encoded('alpha'))
+
+		# Act:
+		model.value = Encoded('beta')
+
+		# Assert:
+		self.assertEqual('decoded beta', model.value)
+		self.assertEqual(['beta'], DECODER.encoded_values)
+
+	def test_class_access_returns_field(self):
+		# Act:
+		field = Model.value
+
+		# Assert:
+		self.assertIsInstance(field, LazyField)
+		self.assertEqual(DECODER, field.decoder)
+		self.assertEqual('_value', field.slot_name)
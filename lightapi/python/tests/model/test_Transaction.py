@@ -1,9 +1,13 @@
 import unittest
 
+from symbolchain.CryptoTypes import PublicKey
 from symbolchain.nc import TransactionType
+from symbolchain.nem.Network import Address
 
 from symbollightapi.model.Exceptions import UnknownTransactionType
+from symbollightapi.model.LazyField import Encoded
 from symbollightapi.model.Transaction import (
+	TRANSACTION_ARGS_MAPPERS,
 	AccountKeyLinkTransaction,
 	CosignSignatureTransaction,
 	Message,
@@ -17,6 +21,7 @@ from symbollightapi.model.Transaction import (
 	MultisigTransaction,
 	NamespaceRegistrationTransaction,
 	TransactionFactory,
+	TransactionHandler,
 	TransferTransaction
 )
 
@@ -123,6 +128,13 @@ class BaseTransactionTest(unittest.TestCase):
 
 		return transaction
 
+	def _test_does_not_have_instance_dictionary(self):
+		# Act:
+		transaction = self._create_default_transaction()
+
+		# Assert:
+		self.assertFalse(hasattr(transaction, '__dict__'))
+
 	def _test_eq_is_supported(self):
 		# Arrange:
 		transaction = self._create_default_transaction()
@@ -149,6 +161,19 @@ class TransferTransactionTest(BaseTransactionTest):
 	def test_eq_is_supported(self):
 		self._test_eq_is_supported()
 
+	def test_does_not_have_instance_dictionary(self):
+		self._test_does_not_have_instance_dictionary()
+
+	def test_encoded_keys_are_decoded_on_access(self):
+		# Arrange:
+		transaction = self._create_default_transaction()
+		transaction.sender = Encoded(COMMON_ARGS['sender'])
+		transaction.recipient = Encoded('TALIC367CZIV55GIQT35HDZAZ53CN3VPB3G55BMU')
+
+		# Act + Assert:
+		self.assertEqual(PublicKey(COMMON_ARGS['sender']), transaction.sender)
+		self.assertEqual(Address('TALIC367CZIV55GIQT35HDZAZ53CN3VPB3G55BMU'), transaction.recipient)
+
 
 class AccountKeyLinkTransactionTest(BaseTransactionTest):
 	TRANSACTION_CLASS = AccountKeyLinkTransaction
@@ -169,6 +194,9 @@ class AccountKeyLinkTransactionTest(BaseTransactionTest):
 	def test_eq_is_supported(self):
 		self._test_eq_is_supported()
 
+	def test_does_not_have_instance_dictionary(self):
+		self._test_does_not_have_instance_dictionary()
+
 
 class MultisigAccountModificationTest(BaseTransactionTest):
 	TRANSACTION_CLASS = MultisigAccountModificationTransaction
@@ -189,6 +217,9 @@ class MultisigAccountModificationTest(BaseTransactionTest):
 	def test_eq_is_supported(self):
 		self._test_eq_is_supported()
 
+	def test_does_not_have_instance_dictionary(self):
+		self._test_does_not_have_instance_dictionary()
+
 
 class MultisigTransactionTest(BaseTransactionTest):
 	TRANSACTION_CLASS = MultisigTransaction
@@ -202,6 +233,9 @@ class MultisigTransactionTest(BaseTransactionTest):
 	def test_eq_is_supported(self):
 		self._test_eq_is_supported()
 
+	def test_does_not_have_instance_dictionary(self):
+		self._test_does_not_have_instance_dictionary()
+
 
 class NamespaceRegistrationTest(BaseTransactionTest):
 	TRANSACTION_CLASS = NamespaceRegistrationTransaction
@@ -216,6 +250,9 @@ class NamespaceRegistrationTest(BaseTransactionTest):
 	def test_eq_is_supported(self):
 		self._test_eq_is_supported()
 
+	def test_does_not_have_instance_dictionary(self):
+		self._test_does_not_have_instance_dictionary()
+
 
 class MosaicDefinitionTest(BaseTransactionTest):
 	TRANSACTION_CLASS = MosaicDefinitionTransaction
@@ -233,6 +270,9 @@ class MosaicDefinitionTest(BaseTransactionTest):
 	def test_eq_is_supported(self):
 		self._test_eq_is_supported()
 
+	def test_does_not_have_instance_dictionary(self):
+		self._test_does_not_have_instance_dictionary()
+
 
 class MosaicSupplyChangeTest(BaseTransactionTest):
 	TRANSACTION_CLASS = MosaicSupplyChangeTransaction
@@ -246,6 +286,9 @@ class MosaicSupplyChangeTest(BaseTransactionTest):
 	def test_eq_is_supported(self):
 		self._test_eq_is_supported()
 
+	def test_does_not_have_instance_dictionary(self):
+		self._test_does_not_have_instance_dictionary()
+
 
 class CosignSignatureTransactionTest(unittest.TestCase):
 	@staticmethod
@@ -399,3 +442,28 @@ class TransactionFactoryTest(unittest.TestCase):
 		# Arrange + Act:
 		with self.assertRaises(UnknownTransactionType):
 			TransactionFactory.create_transaction(123, COMMON_ARGS, {})
+
+
+class TransactionHandlerTest(unittest.TestCase):
+	def test_can_create_deprecated_handler_with_args_mappers(self):
+		# Act:
+		with self.assertWarns(DeprecationWarning):
+			handler = TransactionHandler()
+
+		# Assert:
+		self.assertIs(TRANSACTION_ARGS_MAPPERS, handler.map)
+
+	def test_deprecated_handler_maps_transaction_args(self):
+		# Arrange:
+		with self.assertWarns(DeprecationWarning):
+			handler = TransactionHandler()
+
+		# Act:
+		args = handler.map[TransactionType.MOSAIC_SUPPLY_CHANGE.value]({
+			'supplyType': 1,
+			'delta': 100,
+			'mosaicId': {'namespaceId': 'foo', 'name': 'bar'}
+		})
+
+		# Assert:
+		self.assertEqual({'supply_type': 1, 'delta': 100, 'namespace_name': 'foo.bar'}, args)
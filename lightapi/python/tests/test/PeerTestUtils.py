@@ -0,0 +1,134 @@
+import asyncio
+import ssl
+from pathlib import Path
+
+from symbolchain.BufferWriter import BufferWriter
+from symbolchain.CryptoTypes import Hash256, PublicKey
+
+from symbollightapi.model.Endpoint import Endpoint
+from symbollightapi.model.NodeInfo import NodeInfo
+from symbollightapi.model.PacketHeader import PacketHeader, PacketType
+
+# region ssl helpers
+
+
+def locate_certificate_directory(cert_id):
+	return Path(__file__).parent.parent / 'resources' / f'cert{cert_id}'
+
+
+def load_server_ssl_context(cert_id):
+	certificate_directory = locate_certificate_directory(cert_id)
+
+	ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+	ssl_context.check_hostname = False
+	ssl_context.verify_mode = ssl.CERT_NONE
+	ssl_context.load_cert_chain(
+		certificate_directory / 'node.full.crt.pem',
+		keyfile=certificate_directory / 'node.key.pem')
+	return ssl_context
+
+# endregion
+
+
+# region serialize_node_info
+
+def serialize_node_info(writer, node_info):
+	writer.write_int(81 + len(node_info.endpoint.host) + len(node_info.name), 4)
+	writer.write_int(node_info.version, 4)
+	writer.write_bytes(node_info.main_public_key.bytes)
+	writer.write_bytes(node_info.network_generation_hash_seed.bytes)
+	writer.write_int(node_info.roles, 4)
+	writer.write_int(node_info.endpoint.port, 2)
+	writer.write_int(node_info.network_identifier, 1)
+	writer.write_int(len(node_info.endpoint.host), 1)
+	writer.write_int(len(node_info.name), 1)
+	writer.write_bytes(node_info.endpoint.host.encode('utf8'))
+	writer.write_bytes(node_info.name.encode('utf8'))
+
+# endregion
+
+
+# region MockPeerNode
+
+class MockPeerNode:  # pylint: disable=too-many-instance-attributes
+	"""Simulated Symbol peer node that answers node information, chain statistics and peers packets over TLS."""
+
+	def __init__(self, index, chain_height):
+		self.index = index
+		self.chain_height = chain_height
+		self.peers = []
+		self.is_offline = False
+		self.is_node_name_corrupt = False
+		self.response_delay_seconds = 0
+		self.connection_count = 0
+
+		self.server = None
+		self.port = None
+
+	@property
+	def node_info(self):
+		return NodeInfo(
+			104,
+			Hash256.zero(),
+			PublicKey(f'{self.index + 1:064X}'),
+			None,
+			Endpoint('http', '127.0.0.1', self.port),
+			f'peer {self.index}',
+			16777989,
+			3)
+
+	async def start(self, ssl_context):
+		self.server = await asyncio.start_server(self._handle_connection, '127.0.0.1', 0, ssl=ssl_context)
+		self.port = self.server.sockets[0].getsockname()[1]
+
+	async def stop(self):
+		self.server.close()
+		await self.server.wait_closed()
+
+	async def _handle_connection(self, reader, writer):
+		self.connection_count += 1
+		try:
+			while not self.is_offline:
+				header = await reader.readexactly(8)
+				packet_header = PacketHeader.deserialize_from_buffer(header)
+				if self.response_delay_seconds:
+					await asyncio.sleep(self.response_delay_seconds)
+
+				response_buffer_writer = BufferWriter()
+				if PacketType.CHAIN_STATISTICS == packet_header.packet_type:
+					response_buffer_writer.write_int(self.chain_height, 8)
+					response_buffer_writer.write_int(0, 8)
+					response_buffer_writer.write_int(0, 8)
+					response_buffer_writer.write_int(self.chain_height, 8)
+				elif PacketType.NODE_INFORMATION == packet_header.packet_type:
+					serialize_node_info(response_buffer_writer, self.node_info)
+					if self.is_node_name_corrupt:
+						response_buffer_writer.buffer = response_buffer_writer.buffer[:-1] + bytes([0xFF])  # not valid utf8
+				elif PacketType.PEERS == packet_header.packet_type:
+					for peer in self.peers:
+						serialize_node_info(response_buffer_writer, peer.node_info)
+
+				writer.write(PacketHeader(8 + len(response_buffer_writer.buffer), packet_header.packet_type).serialize())
+				writer.write(response_buffer_writer.buffer)
+				await writer.drain()
+		except (asyncio.exceptions.IncompleteReadError, ConnectionResetError):
+			pass  # client closed connection
+		finally:
+			writer.close()
+
+
+async def start_mock_peer_nodes(count, peer_count, cert_id=1, response_delay_seconds=0):
+	"""Starts simulated peer nodes, where each node knows the next peer_count nodes (wrapping around)."""
+
+	ssl_context = load_server_ssl_context(cert_id)
+	nodes = [MockPeerNode(index, 1000 + index) for index in range(count)]
+	for node in nodes:
+		node.response_delay_seconds = response_delay_seconds
+		await node.start(ssl_context)
+
+	for node in nodes:
+		node.peers = [nodes[(node.index + i) % count] for i in range(1, peer_count + 1)]
+
+	return nodes
+
+# endregion